@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+import path_util  # noqa: F401
+
+from hummingbot import init_logging
+from hummingbot.client.backtest_application import BacktestApplication
+from hummingbot.client.config.config_helpers import (
+    ClientConfigAdapter,
+    all_configs_complete,
+    create_yml_files_legacy,
+    load_client_config_map_from_file,
+    load_strategy_config_map_from_file,
+    read_system_configs_from_yml,
+)
+from hummingbot.client.settings import STRATEGIES_CONF_DIR_PATH
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Runs a strategy config over the market data recorded in data/market_data, "
+                                     "from the start date to the end date.")
+        self.add_argument("--config-file-name", "-f",
+                          type=str,
+                          required=True,
+                          help="Specify a file in `conf/strategies` to load as the strategy config file.")
+        self.add_argument("--start", "-s",
+                          type=str,
+                          required=True,
+                          help="Start date or time of the backtest in UTC, in ISO format (e.g. 2023-01-01).")
+        self.add_argument("--end", "-e",
+                          type=str,
+                          required=True,
+                          help="End date or time of the backtest in UTC, in ISO format (e.g. 2023-01-08).")
+        self.add_argument("--tick-size",
+                          type=float,
+                          default=1.0,
+                          help="Interval between the ticks of the strategy, in seconds.")
+        self.add_argument("--market-data-path",
+                          type=str,
+                          required=False,
+                          help="Directory of the recorded market data (data/market_data by default).")
+        self.add_argument("--log-level",
+                          type=str,
+                          default="WARNING",
+                          help="Log level of the strategy and the connectors during the backtest.")
+
+
+def timestamp_from_iso_format(value: str) -> float:
+    date_time = datetime.fromisoformat(value)
+    if date_time.tzinfo is None:
+        date_time = date_time.replace(tzinfo=timezone.utc)
+    return date_time.timestamp()
+
+
+async def backtest(args: argparse.Namespace):
+    client_config_map = load_client_config_map_from_file()
+    await create_yml_files_legacy()
+    init_logging("hummingbot_logs.yml", client_config_map, override_log_level=args.log_level)
+    await read_system_configs_from_yml()
+    # The trading pairs of the strategy config are validated without a client application
+    TradingPairFetcher.get_instance(client_config_map)
+
+    strategy_config = await load_strategy_config_map_from_file(STRATEGIES_CONF_DIR_PATH / args.config_file_name)
+    strategy_name = (
+        strategy_config.strategy
+        if isinstance(strategy_config, ClientConfigAdapter)
+        else strategy_config.get("strategy").value
+    )
+    if not all_configs_complete(strategy_config, client_config_map):
+        logging.getLogger().error(f"The strategy config {args.config_file_name} is not complete.")
+        return
+
+    application = BacktestApplication(
+        client_config_map=client_config_map,
+        strategy_file_name=args.config_file_name,
+        strategy_name=strategy_name,
+        strategy_config_map=strategy_config,
+        start_time=timestamp_from_iso_format(args.start),
+        end_time=timestamp_from_iso_format(args.end),
+        tick_size=args.tick_size,
+        market_data_path=args.market_data_path,
+    )
+    if not await application.run():
+        logging.getLogger().error("The strategy could not be created:\n" + "\n".join(application.notifications))
+        return
+    print(application.report())
+
+
+def main():
+    args = CmdlineParser().parse_args()
+    asyncio.get_event_loop().run_until_complete(backtest(args))
+
+
+if __name__ == "__main__":
+    main()
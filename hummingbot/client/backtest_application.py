@@ -0,0 +1,174 @@
+import asyncio
+import logging
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_strategy_starter_file
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.connector.exchange.paper_trade.backtest_order_book_data_source import BacktestOrderBookDataSource
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+s_decimal_0 = Decimal("0")
+
+
+class BacktestApplication:
+    """
+    Runs a strategy config over the market data recorded for its markets (see MarketDataFile), as fast as the market
+    data can be replayed. The markets are backtesting connectors, ticked with the strategy by a clock in backtest mode
+    from the start time to the end time.
+
+    The strategy is created by the start function of the strategy, as in the client, so the application provides the
+    attributes and methods of HummingbotApplication used by the start functions, and it is registered as the main
+    application for the notifications of the strategy. The strategies that only use one exchange (e.g. pure market
+    making and Avellaneda market making) can be backtested; the price sources of other exchanges are not replayed.
+    The initial balances of the markets are the paper trade account balances of the client config.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 client_config_map: ClientConfigAdapter,
+                 strategy_file_name: str,
+                 strategy_name: str,
+                 strategy_config_map: Union[ClientConfigAdapter, Dict[str, ConfigVar]],
+                 start_time: float,
+                 end_time: float,
+                 tick_size: float = 1.0,
+                 market_data_path: Optional[str] = None):
+        """
+        :param strategy_file_name: the name of the strategy config file
+        :param strategy_name: the name of the strategy of the config
+        :param strategy_config_map: the strategy config, loaded from the config file
+        :param start_time: the timestamp the backtest starts at
+        :param end_time: the timestamp the backtest ends at
+        :param tick_size: the interval between the ticks of the clock, in seconds
+        :param market_data_path: the directory of the market data files (data/market_data by default)
+        """
+        self.client_config_map = client_config_map
+        self.strategy_file_name = strategy_file_name
+        self.strategy_name = strategy_name
+        self.strategy_config_map = strategy_config_map
+        self.start_time = start_time
+        self.end_time = end_time
+        self.market_data_path = market_data_path
+        self.clock: Clock = Clock(ClockMode.BACKTEST, tick_size, start_time, end_time)
+        self.markets: Dict[str, ExchangeBase] = {}
+        self.market_trading_pairs_map: Dict[str, List[str]] = {}
+        self.market_trading_pair_tuples: List[MarketTradingPairTuple] = []
+        self.strategy: Optional[StrategyBase] = None
+        # Not recorded in backtests, the strategies using past trades (e.g. the inventory cost price type) can't run
+        self.trade_fill_db = None
+        self.notifications: List[str] = []
+        self.initial_balances: Dict[str, Dict[str, Decimal]] = {}
+        self.fill_loggers: Dict[str, EventLogger] = {}
+
+    _initialize_market_assets = staticmethod(HummingbotApplication._initialize_market_assets)
+
+    def notify(self, msg: str):
+        self.notifications.append(msg)
+        self.logger().info(msg)
+
+    def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
+        for market_name, trading_pairs in market_names:
+            self.market_trading_pairs_map.setdefault(market_name, []).extend(trading_pairs)
+
+        for market_name, trading_pairs in self.market_trading_pairs_map.items():
+            # The paper trade connectors replay the market data of the exchange they simulate
+            connector_name = market_name[:-len("_paper_trade")] if market_name.endswith("_paper_trade") else market_name
+            data_source = BacktestOrderBookDataSource(trading_pairs=list(dict.fromkeys(trading_pairs)),
+                                                      connector_name=connector_name,
+                                                      start_time=self.start_time,
+                                                      end_time=self.end_time,
+                                                      market_data_path=self.market_data_path)
+            market = BacktestExchange(self.client_config_map, data_source, exchange_name=connector_name)
+            for asset, balance in (self.client_config_map.paper_trade.paper_trade_account_balance or {}).items():
+                market.set_balance(asset, Decimal(str(balance)))
+            self.markets[market_name] = market
+
+    async def run(self) -> bool:
+        """
+        Creates the strategy and runs it over the market data from the start time to the end time. The ticks of the
+        clock are run one at a time, yielding to the event loop between them to deliver the events of the markets.
+
+        :return: False if the strategy could not be created
+        """
+        main_application = HummingbotApplication._main_app
+        HummingbotApplication._main_app = self
+        try:
+            get_strategy_starter_file(self.strategy_name)(self)
+            if self.strategy is None:
+                return False
+
+            for market_name, market in self.markets.items():
+                self.initial_balances[market_name] = market.get_all_balances()
+                self.fill_loggers[market_name] = EventLogger()
+                market.add_listener(MarketEvent.OrderFilled, self.fill_loggers[market_name])
+                self.clock.add_iterator(market)
+            self.clock.add_iterator(self.strategy)
+
+            with self.clock:
+                timestamp = self.start_time
+                while timestamp < self.end_time:
+                    timestamp = min(timestamp + self.clock.tick_size, self.end_time)
+                    self.clock.backtest_til(timestamp)
+                    await asyncio.sleep(0)
+            return True
+        finally:
+            HummingbotApplication._main_app = main_application
+
+    def report(self) -> str:
+        """
+        Returns the trades, balances and returns of each market traded by the strategy. The portfolio values are
+        calculated with the mid price of the market at the end of the backtest.
+        """
+        lines = []
+        for market_info in self.market_trading_pair_tuples:
+            market_name = next(name for name, market in self.markets.items() if market is market_info.market)
+            mid_price = market_info.market.get_price_by_type(market_info.trading_pair, PriceType.MidPrice)
+            if mid_price.is_nan():
+                lines.extend([f"{market_name} / {market_info.trading_pair}",
+                              "  No market data recorded in the backtest range"])
+                continue
+            base, quote = market_info.base_asset, market_info.quote_asset
+            fills: List[OrderFilledEvent] = [fill for fill in self.fill_loggers[market_name].event_log
+                                             if fill.trading_pair == market_info.trading_pair]
+            buys = [fill for fill in fills if fill.trade_type is TradeType.BUY]
+            sells = [fill for fill in fills if fill.trade_type is TradeType.SELL]
+            start_balances = self.initial_balances[market_name]
+            end_balances = market_info.market.get_all_balances()
+            start_base, start_quote = start_balances.get(base, s_decimal_0), start_balances.get(quote, s_decimal_0)
+            end_base, end_quote = end_balances.get(base, s_decimal_0), end_balances.get(quote, s_decimal_0)
+            hold_value = start_base * mid_price + start_quote
+            end_value = end_base * mid_price + end_quote
+            return_pct = (end_value - hold_value) / hold_value * 100 if hold_value > 0 else s_decimal_0
+            lines.extend([
+                f"{market_name} / {market_info.trading_pair}",
+                f"  Trades: {len(fills)} ({len(buys)} buys, {len(sells)} sells)",
+                f"  Volume: {self._format_number(sum(fill.amount for fill in buys))} {base} bought, "
+                f"{self._format_number(sum(fill.amount for fill in sells))} {base} sold",
+                f"  {base} balance: {self._format_number(start_base)} -> {self._format_number(end_base)}",
+                f"  {quote} balance: {self._format_number(start_quote)} -> {self._format_number(end_quote)}",
+                f"  Mid price at the end: {self._format_number(mid_price)} {quote}",
+                f"  Portfolio value: {self._format_number(end_value)} {quote} "
+                f"({self._format_number(hold_value)} {quote} holding the initial balances)",
+                f"  Return vs holding: {return_pct:.4f}%",
+            ])
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_number(value: Decimal) -> str:
+        return f"{Decimal(f'{value:.8g}').normalize():f}"
@@ -17,6 +17,7 @@ from .silly_commands import SillyCommands
 from .start_command import StartCommand
 from .status_command import StatusCommand
 from .stop_command import StopCommand
+from .tick_profile_command import TickProfileCommand
 from .ticker_command import TickerCommand
 
 __all__ = [
@@ -39,5 +40,6 @@ __all__ = [
     StatusCommand,
     StopCommand,
     TickerCommand,
+    TickProfileCommand,
     MQTTCommand,
 ]
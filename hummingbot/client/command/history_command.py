@@ -3,11 +3,11 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -40,6 +40,15 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        accumulators = self._recorded_performance_accumulators(start_time)
+        if accumulators is not None:
+            if len(accumulators) == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.performance_report(start_time, accumulators, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -69,12 +78,24 @@ class HistoryCommand:
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        for trade in trades:
+            accumulator = accumulators.get((trade.market, trade.symbol))
+            if accumulator is None:
+                accumulator = PerformanceAccumulator(trade.symbol)
+                accumulators[(trade.market, trade.symbol)] = accumulator
+            accumulator.add_trade(trade)
+        return await self.performance_report(start_time, accumulators, precision, display_report)
+
+    async def performance_report(self,  # type: HummingbotApplication
+                                 start_time: float,
+                                 accumulators: Dict[Tuple[str, str], PerformanceAccumulator],
+                                 precision: Optional[int] = None,
+                                 display_report: bool = True) -> Decimal:
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        for (market, symbol), accumulator in accumulators.items():
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -83,7 +104,7 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create_from_accumulator(accumulator, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -92,6 +113,17 @@ class HistoryCommand:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _recorded_performance_accumulators(
+            self,  # type: HummingbotApplication
+            start_time: float) -> Optional[Dict[Tuple[str, str], PerformanceAccumulator]]:
+        """
+        Returns the performance aggregates updated by the markets recorder as the trades are filled, if it aggregates
+        the trades since the start time, so that the trades do not need to be read again
+        """
+        if self.markets_recorder is None or self.markets_recorder.config_file_path != self.strategy_file_name:
+            return None
+        return self.markets_recorder.performance_accumulators(start_time)
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -203,6 +235,9 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        accumulators = self._recorded_performance_accumulators(start_time)
+        if accumulators is not None:
+            return await self.performance_report(start_time, accumulators, display_report=False)
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
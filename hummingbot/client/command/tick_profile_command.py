@@ -0,0 +1,93 @@
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+import pandas as pd
+
+from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class TickProfileCommand:
+    def tick_profile(self,  # type: HummingbotApplication
+                     option: Optional[str] = None,
+                     overrun_threshold: Optional[float] = None,
+                     live: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.tick_profile, option, overrun_threshold, live)
+            return
+        safe_ensure_future(self.show_tick_profile(option, overrun_threshold, live))
+
+    async def show_tick_profile(self,  # type: HummingbotApplication
+                                option: Optional[str] = None,
+                                overrun_threshold: Optional[float] = None,
+                                live: bool = False):
+        if self.clock is None:
+            self.notify("\n This command can only be used while a strategy is running")
+            return
+        if option == "enable":
+            profiler = self.clock.enable_profiling(overrun_threshold=overrun_threshold)
+            self.notify(f"\n Tick profiling enabled (overrun threshold: {profiler.overrun_threshold}s).")
+            return
+        if option == "disable":
+            self.clock.disable_profiling()
+            self.notify("\n Tick profiling disabled.")
+            return
+
+        profiler: Optional[ClockProfiler] = self.clock.profiler
+        if profiler is None:
+            self.notify("\n Tick profiling is disabled. Use `tick_profile enable` to enable it.")
+            return
+        if option == "export":
+            self.export_tick_profile(profiler)
+        elif live:
+            await self.stop_live_update()
+            self.app.live_updates = True
+            while self.app.live_updates:
+                await self.cls_display_delay(self.tick_profile_str(profiler) + "\n\n Press escape key to stop update.",
+                                             1)
+            self.notify("Stopped live tick profile display update.")
+        else:
+            self.notify(self.tick_profile_str(profiler))
+
+    def tick_profile_str(self,  # type: HummingbotApplication
+                         profiler: ClockProfiler) -> str:
+        duration = profiler.tick_durations.summary()
+        jitter = profiler.tick_start_jitter.summary()
+        lines = [
+            f"\n  Ticks: {profiler.ticks}, overruns (> {profiler.overrun_threshold * 1e3:.1f}ms): {profiler.overruns}",
+            f"  Tick duration (ms): mean {duration['mean'] * 1e3:.2f}, p99 {duration['p99'] * 1e3:.2f}, "
+            f"max {duration['max'] * 1e3:.2f}",
+            f"  Tick start jitter (ms): mean {jitter['mean'] * 1e3:.2f}, p99 {jitter['p99'] * 1e3:.2f}, "
+            f"max {jitter['max'] * 1e3:.2f}",
+        ]
+        columns = ["Iterator", "Ticks", "Mean (ms)", "Max (ms)", "Last (ms)"]
+        data = [
+            [stats.name, stats.ticks,
+             round(stats.mean_time * 1e3, 3), round(stats.max_time * 1e3, 3), round(stats.last_time * 1e3, 3)]
+            for stats in sorted(profiler.iterator_stats, key=lambda stats: stats.total_time, reverse=True)
+        ]
+        if len(data) > 0:
+            iterators_df = pd.DataFrame(data=data, columns=columns)
+            lines.extend(["", format_df_for_printout(iterators_df, self.client_config_map.tables_format)])
+        return "\n".join(lines)
+
+    def export_tick_profile(self,  # type: HummingbotApplication
+                            profiler: ClockProfiler):
+        path = self.client_config_map.log_file_path
+        if path is None:
+            path = str(DEFAULT_LOG_FILE_PATH)
+        file_path = os.path.join(path, f"tick_profile_{int(time.time())}.json")
+        try:
+            with open(file_path, "w") as export_file:
+                json.dump(profiler.snapshot(), export_file, indent=2)
+            self.notify(f"Successfully exported the tick profile to {file_path}")
+        except Exception as e:
+            self.notify(f"Error exporting the tick profile to {path}: {e}")
@@ -982,6 +982,14 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     paper_trade: PaperTradeConfigMap = Field(default=PaperTradeConfigMap())
+    market_data_recording: bool = Field(
+        default=False,
+        description=("Whether to record the order book snapshots, diffs and trades of the markets of the strategies"
+                     "\nin data/market_data, to be replayed by bin/hummingbot_backtest.py"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to record the market data of your strategies for backtesting? (Yes/No)",
+        ),
+    )
     color: ColorConfigMap = Field(default=ColorConfigMap())
     tick_size: float = Field(
         default=1.0,
@@ -28,6 +28,7 @@ from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
 from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.market_data_recorder import MarketDataRecorder
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
@@ -104,6 +105,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.market_data_recorder: Optional[MarketDataRecorder] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -321,8 +323,13 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            flush_interval=1.0,
+            performance_start_timestamp=self.init_time,
         )
         self.markets_recorder.start()
+        if self.client_config_map.market_data_recording:
+            self.market_data_recorder = MarketDataRecorder(self.markets)
+            self.market_data_recorder.start()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
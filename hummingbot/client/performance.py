@@ -6,7 +6,6 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
-from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.trade_fill import TradeFill
@@ -15,6 +14,207 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+def trade_fees(trade: Any, quote: str, is_trade_fill: bool) -> List[Tuple[str, Decimal]]:
+    """
+    Returns the fees paid by a trade, as (token, amount) pairs. Percent fees are expressed in the quote token.
+    :param trade: a TradeFill (with its fee serialized to JSON) or a Trade object
+    :param quote: the quote token of the trade
+    :param is_trade_fill: whether the trade is a TradeFill
+    """
+    fees = []
+    if is_trade_fill:
+        if trade.trade_fee.get("percent") is not None and Decimal(trade.trade_fee["percent"]) > 0:
+            fee_percent = Decimal(str(trade.trade_fee["percent"]))
+            fees.append((quote, Decimal(str(trade.price)) * Decimal(str(trade.amount)) * fee_percent))
+        fees.extend((flat_fee["token"], Decimal(flat_fee["amount"]))
+                    for flat_fee in trade.trade_fee.get("flat_fees", []))
+    else:  # assume this is Trade object
+        if trade.trade_fee.percent is not None and trade.trade_fee.percent > 0:
+            fees.append((quote, Decimal(trade.price) * Decimal(trade.amount) * Decimal(trade.trade_fee.percent)))
+        fees.extend((flat_fee.token, flat_fee.amount) for flat_fee in trade.trade_fee.flat_fees)
+    return fees
+
+
+class PerformanceAccumulator:
+    """
+    Running aggregates of the trades of a trading pair in a market, updated one trade at a time, from which
+    PerformanceMetrics are calculated without going through the trades again.
+
+    For derivatives the fills of each position order are aggregated (as in PerformanceMetrics.aggregate_orders), and
+    the open and close orders are paired in the order they were first filled (as in PerformanceMetrics.position_order).
+    The PnL of each pair is updated when one of its orders gets a new fill.
+    """
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair = trading_pair
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.first_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Whether the buys/sells are derivative trades, i.e. trade fills and none of them without a position action
+        self.buys_are_derivatives: Optional[bool] = None
+        self.sells_are_derivatives: Optional[bool] = None
+        # Aggregated position orders, by order id:
+        # [position, trade type, sum of fill prices, fills, amount, index in the position order ids]
+        self._position_orders: Dict[str, List[Any]] = {}
+        # Ids of the position orders by (position, trade type), in the order they were first filled
+        self._position_order_ids: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        # PnL of each pair of open and close position orders, by (open trade type, pair index)
+        self._pair_pnls: Dict[Tuple[str, int], Decimal] = {}
+        self.derivative_pnl: Decimal = s_decimal_0
+        # Timestamp of the last trade added, and the ids of the trades added with that timestamp
+        self.last_timestamp: int = -1
+        self.last_trade_ids: List[str] = []
+
+    @property
+    def quote(self) -> str:
+        return split_hb_trading_pair(self.trading_pair)[1]
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return bool(self.buys_are_derivatives) or bool(self.sells_are_derivatives)
+
+    def contains(self, trade: Any) -> bool:
+        """
+        Whether the trade (a TradeFill) was already added, assuming the trades are added in timestamp order
+        """
+        return (trade.timestamp < self.last_timestamp
+                or (trade.timestamp == self.last_timestamp and trade.exchange_trade_id in self.last_trade_ids))
+
+    def add_trade(self, trade: Any, is_trade_fill: bool = True):
+        """
+        :param trade: the TradeFill or Trade object
+        :param is_trade_fill: whether the trade is a TradeFill
+        """
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        trade_type = trade.trade_type.upper()
+        if trade_type == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+            self.buys_are_derivatives = self._are_derivatives(self.buys_are_derivatives, trade, is_trade_fill)
+        elif trade_type == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+            self.sells_are_derivatives = self._are_derivatives(self.sells_are_derivatives, trade, is_trade_fill)
+        else:
+            return
+        if self.first_price is None:
+            self.first_price = price
+        self.last_price = price
+        for token, fee_amount in trade_fees(trade, self.quote, is_trade_fill):
+            self.fees[token] += fee_amount
+        if is_trade_fill and trade.position in (PositionAction.OPEN.value, PositionAction.CLOSE.value):
+            self._add_position_fill(trade.order_id, trade.position, trade_type, amount, price)
+        if is_trade_fill:
+            if trade.timestamp > self.last_timestamp:
+                self.last_timestamp = trade.timestamp
+                self.last_trade_ids = []
+            if trade.timestamp == self.last_timestamp:
+                self.last_trade_ids.append(trade.exchange_trade_id)
+
+    @staticmethod
+    def _are_derivatives(are_derivatives: Optional[bool], trade: Any, is_trade_fill: bool) -> bool:
+        if are_derivatives is None:
+            # The first trade of the side decides whether they are trade fills
+            are_derivatives = is_trade_fill
+        return are_derivatives and trade.position != PositionAction.NIL.value
+
+    def _add_position_fill(self, order_id: str, position: str, trade_type: str, amount: Decimal, price: Decimal):
+        order = self._position_orders.get(order_id)
+        if order is None:
+            order_ids = self._position_order_ids[(position, trade_type)]
+            order = [position, trade_type, s_decimal_0, 0, s_decimal_0, len(order_ids)]
+            self._position_orders[order_id] = order
+            order_ids.append(order_id)
+        order[2] += price
+        order[3] += 1
+        order[4] += amount
+
+        open_type = trade_type if position == PositionAction.OPEN.value else self._opposite(trade_type)
+        self._update_pair_pnl(open_type, order[5])
+
+    @staticmethod
+    def _opposite(trade_type: str) -> str:
+        return TradeType.SELL.name if trade_type == TradeType.BUY.name else TradeType.BUY.name
+
+    def _update_pair_pnl(self, open_type: str, index: int):
+        open_ids = self._position_order_ids[(PositionAction.OPEN.value, open_type)]
+        close_ids = self._position_order_ids[(PositionAction.CLOSE.value, self._opposite(open_type))]
+        if index >= len(open_ids) or index >= len(close_ids):
+            return
+        _, _, open_price_sum, open_fills, _, _ = self._position_orders[open_ids[index]]
+        _, _, close_price_sum, close_fills, close_amount, _ = self._position_orders[close_ids[index]]
+        open_price = open_price_sum / open_fills
+        close_price = close_price_sum / close_fills
+        if open_type == TradeType.BUY.name:
+            pnl = (close_price - open_price) * close_amount
+        else:
+            pnl = (open_price - close_price) * close_amount
+        self.derivative_pnl += pnl - self._pair_pnls.get((open_type, index), s_decimal_0)
+        self._pair_pnls[(open_type, index)] = pnl
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "first_price": str(self.first_price) if self.first_price is not None else None,
+            "last_price": str(self.last_price) if self.last_price is not None else None,
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "buys_are_derivatives": self.buys_are_derivatives,
+            "sells_are_derivatives": self.sells_are_derivatives,
+            "position_orders": {order_id: [position, trade_type, str(price_sum), fills, str(amount)]
+                                for order_id, (position, trade_type, price_sum, fills, amount, _)
+                                in self._position_orders.items()},
+            "last_timestamp": self.last_timestamp,
+            "last_trade_ids": list(self.last_trade_ids),
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceAccumulator":
+        accumulator = PerformanceAccumulator(data["trading_pair"])
+        accumulator.num_buys = data["num_buys"]
+        accumulator.num_sells = data["num_sells"]
+        accumulator.b_vol_base = Decimal(data["b_vol_base"])
+        accumulator.s_vol_base = Decimal(data["s_vol_base"])
+        accumulator.b_vol_quote = Decimal(data["b_vol_quote"])
+        accumulator.s_vol_quote = Decimal(data["s_vol_quote"])
+        accumulator.first_price = Decimal(data["first_price"]) if data["first_price"] is not None else None
+        accumulator.last_price = Decimal(data["last_price"]) if data["last_price"] is not None else None
+        accumulator.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        accumulator.buys_are_derivatives = data["buys_are_derivatives"]
+        accumulator.sells_are_derivatives = data["sells_are_derivatives"]
+        for order_id, (position, trade_type, price_sum, fills, amount) in data["position_orders"].items():
+            order_ids = accumulator._position_order_ids[(position, trade_type)]
+            accumulator._position_orders[order_id] = [
+                position, trade_type, Decimal(price_sum), fills, Decimal(amount), len(order_ids)]
+            order_ids.append(order_id)
+        for open_type in (TradeType.BUY.name, TradeType.SELL.name):
+            pairs = min(len(accumulator._position_order_ids[(PositionAction.OPEN.value, open_type)]),
+                        len(accumulator._position_order_ids[(PositionAction.CLOSE.value, cls._opposite(open_type))]))
+            for index in range(pairs):
+                accumulator._update_pair_pnl(open_type, index)
+        accumulator.last_timestamp = data["last_timestamp"]
+        accumulator.last_trade_ids = list(data["last_trade_ids"])
+        return accumulator
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +271,14 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_accumulator(cls,
+                                      accumulator: PerformanceAccumulator,
+                                      current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_accumulator(accumulator, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -174,62 +382,13 @@ class PerformanceMetrics:
     def _is_trade_fill(self, trade):
         return type(trade) == TradeFill
 
-    def _are_derivatives(self, trades: List[Any]) -> bool:
-        return (
-            trades
-            and self._is_trade_fill(trades[0])
-            and PositionAction.NIL.value not in [t.position for t in trades]
-        )
-
-    def _preprocess_trades_and_group_by_type(self, trades: List[Any]) -> Tuple[List[Any], List[Any]]:
-        buys = []
-        sells = []
-        for trade in trades:
-            if trade.trade_type.upper() == TradeType.BUY.name.upper():
-                buys.append(trade)
-                self.b_vol_base += Decimal(str(trade.amount))
-                self.b_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price)) * Decimal("-1")
-            elif trade.trade_type.upper() == TradeType.SELL.name.upper():
-                sells.append(trade)
-                self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
-                self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
-
-        self.tot_vol_base = self.b_vol_base + self.s_vol_base
-        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
-
-        self.avg_b_price = self.divide(self.b_vol_quote, self.b_vol_base)
-        self.avg_s_price = self.divide(self.s_vol_quote, self.s_vol_base)
-        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
-                                         abs(self.b_vol_base) + abs(self.s_vol_base))
-        self.avg_b_price = abs(self.avg_b_price)
-        self.avg_s_price = abs(self.avg_s_price)
-
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None and Decimal(trade.trade_fee["percent"]) > 0:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None and trade.trade_fee.percent > 0:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
-
-            if fee_percent is not None and fee_percent > 0:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
+            for fee_token, fee_amount in trade_fees(trade, quote, self._is_trade_fill(trade)):
+                self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
 
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -244,28 +403,6 @@ class PerformanceMetrics:
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
 
-    def _calculate_trade_pnl(self, buys: list, sells: list):
-        self.trade_pnl = self.cur_value - self.hold_value
-
-        # Handle trade_pnl differently for derivatives
-        if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
-            long = []
-            short = []
-
-            while True:
-                lng = self.position_order(buys_copy, sells_copy)
-                if lng is not None:
-                    long.append(lng)
-
-                sht = self.position_order(sells_copy, buys_copy)
-                if sht is not None:
-                    short.append(sht)
-                if lng is None and sht is None:
-                    break
-
-            self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
-
     async def _initialize_metrics(self,
                                   trading_pair: str,
                                   trades: List[Any],
@@ -276,23 +413,52 @@ class PerformanceMetrics:
         :param trades: the list of TradeFill or Trade object
         :param current_balances: current user account balance
         """
+        accumulator = PerformanceAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade, is_trade_fill=self._is_trade_fill(trade))
+        await self._initialize_metrics_from_accumulator(accumulator, current_balances)
 
+    async def _initialize_metrics_from_accumulator(self,
+                                                   accumulator: PerformanceAccumulator,
+                                                   current_balances: Dict[str, Decimal]):
+        """
+        Calculates PnL, fees, Return % and etc... from the aggregates of the trades
+        :param accumulator: the aggregates of the trades of the trading market to get performance metrics
+        :param current_balances: current user account balance
+        """
+        trading_pair = accumulator.trading_pair
         base, quote = split_hb_trading_pair(trading_pair)
-        buys, sells = self._preprocess_trades_and_group_by_type(trades)
 
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
-        self.num_trades = self.num_buys + self.num_sells
+        # The accumulator can be updated by new trades while waiting for the rates, everything is read from it first
+        self.num_buys = accumulator.num_buys
+        self.num_sells = accumulator.num_sells
+        self.num_trades = accumulator.num_trades
+
+        self.b_vol_base = accumulator.b_vol_base
+        self.s_vol_base = accumulator.s_vol_base
+        self.b_vol_quote = accumulator.b_vol_quote
+        self.s_vol_quote = accumulator.s_vol_quote
+        self.tot_vol_base = self.b_vol_base + self.s_vol_base
+        self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
+
+        self.avg_b_price = abs(self.divide(self.b_vol_quote, self.b_vol_base))
+        self.avg_s_price = abs(self.divide(self.s_vol_quote, self.s_vol_base))
+        self.avg_tot_price = self.divide(abs(self.b_vol_quote) + abs(self.s_vol_quote),
+                                         abs(self.b_vol_base) + abs(self.s_vol_base))
 
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = accumulator.first_price
+        last_price = accumulator.last_price
+        derivative_pnl = accumulator.derivative_pnl if accumulator.are_derivatives else None
+        self.fees.update(accumulator.fees)
+
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -300,9 +466,13 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
+        # Handle trade_pnl differently for derivatives
+        if derivative_pnl is not None:
+            self.trade_pnl = derivative_pnl
+        else:
+            self.trade_pnl = self.cur_value - self.hold_value
 
-        await self._calculate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -2,14 +2,14 @@ import importlib
 import json
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
+from os import DirEntry, scandir, stat
 from os.path import exists, join, realpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
+from hummingbot import data_path, get_strategy_list, root_path
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
@@ -61,6 +61,7 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 ]
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+CONNECTOR_MANIFEST_VERSION = 2
 
 
 class ConnectorType(Enum):
@@ -343,75 +344,76 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    Connector setting created from the connector manifest. The config keys field stores where the config map is
+    defined, as (utils module path, attribute name, domain), and the utils module is imported the first time the
+    config keys are requested.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys_spec = tuple.__getitem__(self, ConnectorSetting._fields.index("config_keys"))
+        if config_keys_spec is None:
+            return None
+        module_path, attribute_name, domain = config_keys_spec
+        config_keys = getattr(importlib.import_module(module_path), attribute_name, None)
+        if domain is not None:
+            config_keys = config_keys[domain]
+        return config_keys
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
+    @staticmethod
+    def connector_manifest_path() -> str:
+        return realpath(join(data_path(), "connector_manifest.json"))
+
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Create a dictionary of exchange names to ConnectorSetting.
+        The settings of the connectors in the hummingbot/connector directories are read from the connector manifest,
+        which is generated (importing every connector utils module) only when the connector utils files changed.
+        The connectors skipped because their utils module imports a module that is not installed are recorded in the
+        manifest, and scanned again every time, so that they are added once the missing dependency is installed.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
-
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
-                continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+        connector_utils: List[Tuple[str, str]] = cls._find_connector_utils()
+        fingerprint: List[List[Any]] = cls._connector_utils_fingerprint(connector_utils)
+        manifest: Optional[Dict[str, Any]] = cls._load_connector_manifest()
+        if (
+            manifest is None
+            or manifest.get("version") != CONNECTOR_MANIFEST_VERSION
+            or manifest.get("fingerprint") != fingerprint
+        ):
+            entries, skipped_connector_utils = cls._scan_connector_utils(connector_utils)
+            manifest = {
+                "version": CONNECTOR_MANIFEST_VERSION,
+                "fingerprint": fingerprint,
+                "connectors": entries,
+                "skipped": skipped_connector_utils,
+            }
+            cls._save_connector_manifest(manifest)
+        elif len(manifest["skipped"]) > 0:
+            cls._scan_skipped_connector_utils(manifest)
+
+        for entry in manifest["connectors"]:
+            cls.all_connector_settings[entry["name"]] = LazyConnectorSetting(
+                name=entry["name"],
+                type=ConnectorType[entry["type"]],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=TradeFeeSchema.from_json(entry["trade_fee_schema"]),
+                config_keys=tuple(entry["config_keys"]) if entry["config_keys"] is not None else None,
+                is_sub_domain=entry["is_sub_domain"],
+                parent_name=entry["parent_name"],
+                domain_parameter=entry["domain_parameter"],
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -441,18 +443,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the base connector settings unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -530,6 +526,151 @@ class AllConnectorSettings:
     def get_example_assets(cls) -> Dict[str, str]:
         return {name: cs.example_pair.split("-")[0] for name, cs in cls.get_connector_settings().items()}
 
+    @staticmethod
+    def _find_connector_utils() -> List[Tuple[str, str]]:
+        """
+        Lists the (connector type directory, connector directory) pairs of the connectors, without importing them.
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        connector_utils: List[Tuple[str, str]] = []
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in sorted(type_dirs, key=lambda d: d.name):
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in sorted(connector_dirs, key=lambda d: d.name):
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                connector_utils.append((type_dir.name, connector_dir.name))
+        return connector_utils
+
+    @staticmethod
+    def _connector_utils_fingerprint(connector_utils: List[Tuple[str, str]]) -> List[List[Any]]:
+        fingerprint: List[List[Any]] = []
+        for type_dir_name, connector_dir_name in connector_utils:
+            utils_file_path = join(
+                root_path(), "hummingbot", "connector", type_dir_name, connector_dir_name, f"{connector_dir_name}_utils.py"
+            )
+            try:
+                utils_file_stat = stat(utils_file_path)
+                fingerprint.append(
+                    [f"{type_dir_name}/{connector_dir_name}", utils_file_stat.st_size, utils_file_stat.st_mtime_ns]
+                )
+            except OSError:
+                fingerprint.append([f"{type_dir_name}/{connector_dir_name}", None, None])
+        return fingerprint
+
+    @classmethod
+    def _scan_connector_utils(
+        cls, connector_utils: List[Tuple[str, str]]
+    ) -> Tuple[List[Dict[str, Any]], List[List[str]]]:
+        """
+        Imports the connector utils modules to create the connector manifest entries. Returns the entries, and the
+        connectors skipped because their utils module imports a module that is not installed.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        skipped_connector_utils: List[List[str]] = []
+        for type_dir_name, connector_dir_name in connector_utils:
+            if connector_dir_name in entries:
+                raise Exception(f"Multiple connectors with the same {connector_dir_name} name.")
+            connector_entries = cls._connector_utils_entries(type_dir_name, connector_dir_name)
+            if connector_entries is None:
+                skipped_connector_utils.append([type_dir_name, connector_dir_name])
+                continue
+            entries.update((entry["name"], entry) for entry in connector_entries)
+        return list(entries.values()), skipped_connector_utils
+
+    @classmethod
+    def _scan_skipped_connector_utils(cls, manifest: Dict[str, Any]):
+        """
+        Scans again the connectors skipped in the manifest, and updates it if any of them can be imported now.
+        """
+        skipped_connector_utils: List[List[str]] = []
+        for type_dir_name, connector_dir_name in manifest["skipped"]:
+            connector_entries = cls._connector_utils_entries(type_dir_name, connector_dir_name)
+            if connector_entries is None:
+                skipped_connector_utils.append([type_dir_name, connector_dir_name])
+            else:
+                manifest["connectors"].extend(connector_entries)
+        if len(skipped_connector_utils) < len(manifest["skipped"]):
+            manifest["skipped"] = skipped_connector_utils
+            cls._save_connector_manifest(manifest)
+
+    @classmethod
+    def _connector_utils_entries(cls, type_dir_name: str, connector_dir_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns the manifest entries of the connector and its other domains, or None if its utils module imports a
+        module that is not installed.
+        """
+        try:
+            util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                    f"{connector_dir_name}.{connector_dir_name}_utils"
+            util_module = importlib.import_module(util_module_path)
+        except ModuleNotFoundError:
+            return None
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_dir_name, trade_fee_settings)
+        parent = {
+            "name": connector_dir_name,
+            "type": ConnectorType[type_dir_name.capitalize()].name,
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "trade_fee_schema": trade_fee_schema.to_json(),
+            "config_keys": (
+                [util_module_path, "KEYS", None] if getattr(util_module, "KEYS", None) is not None else None
+            ),
+            "is_sub_domain": False,
+            "parent_name": None,
+            "domain_parameter": None,
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+        }
+        entries = [parent]
+        # Adds other domains of connector
+        other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+        for domain in other_domains:
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+            entries.append({
+                "name": domain,
+                "type": parent["type"],
+                "centralised": parent["centralised"],
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "use_ethereum_wallet": parent["use_ethereum_wallet"],
+                "trade_fee_schema": trade_fee_schema.to_json(),
+                "config_keys": (
+                    [util_module_path, "OTHER_DOMAINS_KEYS", domain]
+                    if getattr(util_module, "OTHER_DOMAINS_KEYS")[domain] is not None else None
+                ),
+                "is_sub_domain": True,
+                "parent_name": parent["name"],
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                "use_eth_gas_lookup": parent["use_eth_gas_lookup"],
+            })
+        return entries
+
+    @classmethod
+    def _load_connector_manifest(cls) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cls.connector_manifest_path()) as fd:
+                return json.load(fd)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def _save_connector_manifest(cls, manifest: Dict[str, Any]):
+        try:
+            with open(cls.connector_manifest_path(), "w") as fd:
+                json.dump(manifest, fd)
+        except OSError:
+            # The manifest is only a cache, the connector utils modules will be scanned again next time
+            pass
+
     @staticmethod
     def _validate_trade_fee_schema(
         exchange_name: str, trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]
@@ -589,6 +730,7 @@ def gateway_connector_trading_pairs(connector: str) -> List[str]:
 
 MAXIMUM_OUTPUT_PANE_LINE_COUNT = 1000
 MAXIMUM_LOG_PANE_LINE_COUNT = 1000
+LOG_PANE_REFRESH_INTERVAL = 1 / 30
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 STRATEGIES: List[str] = get_strategy_list()
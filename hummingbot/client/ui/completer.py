@@ -52,6 +52,8 @@ class HummingbotCompleter(Completer):
         self._derivative_exchange_completer = WordCompleter(AllConnectorSettings.get_derivative_names().difference(AllConnectorSettings.get_derivative_dex_names()), ignore_case=True)
         self._connect_option_completer = WordCompleter(CONNECT_OPTIONS, ignore_case=True)
         self._export_completer = WordCompleter(["keys", "trades"], ignore_case=True)
+        self._tick_profile_completer = WordCompleter(["enable", "disable", "export", "--threshold", "--live"],
+                                                     ignore_case=True)
         self._balance_completer = WordCompleter(["limit", "paper"], ignore_case=True)
         self._history_completer = WordCompleter(["--days", "--verbose", "--precision"], ignore_case=True)
         self._gateway_completer = WordCompleter(["config", "connect", "connector-tokens", "generate-certs", "status", "test-connection", "list", "approve-tokens"], ignore_case=True)
@@ -109,7 +111,10 @@ class HummingbotCompleter(Completer):
             if exchange in self.prompt_text:
                 market = exchange
                 break
-        trading_pairs = trading_pair_fetcher.trading_pairs.get(market, []) if trading_pair_fetcher.ready and market else []
+        trading_pairs = []
+        if market:
+            trading_pair_fetcher.fetch_trading_pairs(market)
+            trading_pairs = trading_pair_fetcher.trading_pairs.get(market, [])
         return WordCompleter(trading_pairs, ignore_case=True, sentence=True)
 
     @property
@@ -179,6 +184,10 @@ class HummingbotCompleter(Completer):
         return any(x for x in ("trading timeframe", "execution timeframe")
                    if x in self.prompt_text.lower())
 
+    def _complete_tick_profile_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("tick_profile ")
+
     def _complete_export_options(self, document: Document) -> bool:
         text_before_cursor: str = document.text_before_cursor
         return "export" in text_before_cursor
@@ -322,6 +331,10 @@ class HummingbotCompleter(Completer):
             for c in self._connect_option_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_tick_profile_arguments(document):
+            for c in self._tick_profile_completer.get_completions(document, complete_event):
+                yield c
+
         elif self._complete_export_options(document):
             for c in self._export_completer.get_completions(document, complete_event):
                 yield c
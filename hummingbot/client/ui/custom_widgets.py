@@ -1,8 +1,11 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
 from collections import deque
-from typing import Callable, Deque, Dict, List, Tuple
+from functools import lru_cache
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import six
 from prompt_toolkit.auto_suggest import DynamicAutoSuggest
@@ -35,9 +38,43 @@ class CustomBuffer(Buffer):
                 self.reset()
 
 
+class LogBuffer:
+    """
+    Keeps the last `max_line_count` lines of a log pane.
+
+    Adding lines only appends them to a bounded deque, the oldest lines being dropped by it. The text of the pane is
+    joined when a document is created with `document()`, which the text area does at most once per refresh interval.
+    """
+
+    def __init__(self, max_line_count: int):
+        self._lines: Deque[str] = deque(maxlen=max_line_count)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    @property
+    def lines(self) -> List[str]:
+        return list(self._lines)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._lines)
+
+    def extend(self, new_lines: Sequence[str]):
+        self._lines.extend(new_lines)
+
+    def document(self) -> Document:
+        """
+        Returns a document with the text, and the cursor at the end of it
+        """
+        text = self.text
+        return Document(text=text, cursor_position=len(text))
+
+
 class FormattedTextLexer(Lexer):
 
     PROMPT_TEXT = ">>> "
+    LINE_FRAGMENTS_CACHE_SIZE = 4096
 
     def __init__(self, client_config_map: ClientConfigAdapter) -> None:
         super().__init__()
@@ -53,6 +90,10 @@ class FormattedTextLexer(Lexer):
         # Maps specific text to its corresponding UI styles
         self.text_style_tag_map: Dict[str, str] = text_ui_style
 
+        # Only the visible lines are lexed, and the log lines are rendered on every redraw while they are visible, so
+        # the fragments of the recent lines are cached
+        self._cached_line_fragments = lru_cache(maxsize=self.LINE_FRAGMENTS_CACHE_SIZE)(self._line_fragments)
+
     def get_css_style(self, tag: str) -> str:
         style = self.html_tag_css_style_map.get(tag, "")
         return style
@@ -63,37 +104,38 @@ class FormattedTextLexer(Lexer):
         def get_line(lineno: int) -> StyleAndTextTuples:
             "Return the tokens for the given line."
             try:
-                current_line = lines[lineno]
-
-                # Apply styling to command prompt
-                if current_line.startswith(self.PROMPT_TEXT):
-                    return [(self.get_css_style("primary_label"), current_line)]
-
-                matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
-                                                               for special_word, style in self.text_style_tag_map.items()
-                                                               for match in list(re.finditer(special_word, current_line))
-                                                               ]
-                if len(matched_indexes) == 0:
-                    return [("", current_line)]
-
-                previous_idx = 0
-                line_fragments = []
-                for start_idx, end_idx, style in matched_indexes:
-                    line_fragments.extend([
-                        ("", current_line[previous_idx:start_idx]),
-                        (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
-                        (self.get_css_style(style), current_line[start_idx + 2:end_idx])
-                    ])
-                    previous_idx = end_idx
-
-                line_fragments.append(("", current_line[previous_idx:]))
-
-                return line_fragments
+                return list(self._cached_line_fragments(lines[lineno]))
             except IndexError:
                 return []
 
         return get_line
 
+    def _line_fragments(self, current_line: str) -> Tuple[Tuple[str, str], ...]:
+        # Apply styling to command prompt
+        if current_line.startswith(self.PROMPT_TEXT):
+            return ((self.get_css_style("primary_label"), current_line),)
+
+        matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
+                                                       for special_word, style in self.text_style_tag_map.items()
+                                                       for match in list(re.finditer(special_word, current_line))
+                                                       ]
+        if len(matched_indexes) == 0:
+            return (("", current_line),)
+
+        previous_idx = 0
+        line_fragments = []
+        for start_idx, end_idx, style in matched_indexes:
+            line_fragments.extend([
+                ("", current_line[previous_idx:start_idx]),
+                (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
+                (self.get_css_style(style), current_line[start_idx + 2:end_idx])
+            ])
+            previous_idx = end_idx
+
+        line_fragments.append(("", current_line[previous_idx:]))
+
+        return tuple(line_fragments)
+
 
 class CustomTextArea:
     def __init__(self, text='', multiline=True, password=False,
@@ -104,7 +146,12 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 refresh_interval: Optional[float] = None):
+        """
+        :param refresh_interval: if set, the lines logged are shown at most once every refresh_interval seconds (the
+        lines logged in between are shown together), to redraw the text area at most once per frame
+        """
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -182,7 +229,13 @@ class CustomTextArea:
             get_line_prefix=get_line_prefix,
             align=align)
 
-        self.log_lines: Deque[str] = deque()
+        self.log_lines: LogBuffer = LogBuffer(max_line_count)
+        self.refresh_interval = refresh_interval
+        self._log_lock = threading.Lock()
+        self._refresh_scheduled = False
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        if refresh_interval is not None:
+            self._ev_loop = asyncio.get_event_loop()
         self.log(initial_text)
 
     @property
@@ -244,11 +297,21 @@ class CustomTextArea:
             new_lines.append(line)
 
         if save_log:
-            self.log_lines.extend(new_lines)
-            while len(self.log_lines) > self.max_line_count:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-        else:
+            with self._log_lock:
+                self.log_lines.extend(new_lines)
+                if silent:
+                    return
+                if self._ev_loop is None:
+                    self.buffer.document = self.log_lines.document()
+                elif not self._refresh_scheduled:
+                    self._refresh_scheduled = True
+                    self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, self.refresh_interval,
+                                                       self._refresh_document)
+        elif not silent:
             new_text: str = "\n".join(new_lines)
-        if not silent:
             self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    def _refresh_document(self):
+        with self._log_lock:
+            self._refresh_scheduled = False
+            self.buffer.document = self.log_lines.document()
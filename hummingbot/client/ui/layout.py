@@ -19,7 +19,11 @@ from prompt_toolkit.layout.menus import CompletionsMenu
 from prompt_toolkit.widgets import Box, Button, SearchToolbar
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.client.settings import MAXIMUM_LOG_PANE_LINE_COUNT, MAXIMUM_OUTPUT_PANE_LINE_COUNT
+from hummingbot.client.settings import (
+    LOG_PANE_REFRESH_INTERVAL,
+    MAXIMUM_LOG_PANE_LINE_COUNT,
+    MAXIMUM_OUTPUT_PANE_LINE_COUNT,
+)
 from hummingbot.client.tab.data_types import CommandTab
 from hummingbot.client.ui.custom_widgets import CustomTextArea as TextArea, FormattedTextLexer
 
@@ -156,6 +160,7 @@ def create_log_field(search_field: SearchToolbar):
         initial_text="Running Logs \n",
         search_field=search_field,
         preview_search=False,
+        refresh_interval=LOG_PANE_REFRESH_INTERVAL,
     )
 
 
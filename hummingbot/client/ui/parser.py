@@ -139,6 +139,16 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    tick_profile_parser = subparsers.add_parser("tick_profile",
+                                                help="Show the time spent by the connectors and the strategy per tick")
+    tick_profile_parser.add_argument("option", nargs="?", choices=("enable", "disable", "export"), default=None,
+                                     help="Enable or disable the tick profiling, or export the collected metrics")
+    tick_profile_parser.add_argument("--threshold", type=float, dest="overrun_threshold",
+                                     help="Tick duration (in seconds) considered an overrun (tick size by default)")
+    tick_profile_parser.add_argument("--live", default=False, action="store_true", dest="live",
+                                     help="Show tick profile updates")
+    tick_profile_parser.set_defaults(func=hummingbot.tick_profile)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -3,7 +3,7 @@ import logging
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -29,6 +29,66 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersView(Mapping):
+    """
+    Read-only view of the orders in several buckets of the ClientOrderTracker (e.g. active and cached orders), by
+    client order id. Lookups check each bucket directly, while iterating (and len) works on a snapshot of the orders,
+    so the buckets can change during the iteration.
+    """
+
+    def __init__(self, *buckets: Mapping[str, InFlightOrder]):
+        self._buckets = buckets
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        # The last buckets take precedence, like when merging the buckets in a dictionary
+        for bucket in reversed(self._buckets):
+            order = bucket.get(client_order_id)
+            if order is not None:
+                return order
+        raise KeyError(client_order_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._snapshot())
+
+    def __len__(self) -> int:
+        return len(self._snapshot())
+
+    def keys(self):
+        return self._snapshot().keys()
+
+    def values(self):
+        return self._snapshot().values()
+
+    def items(self):
+        return self._snapshot().items()
+
+    def _snapshot(self) -> Dict[str, InFlightOrder]:
+        snapshot = {}
+        for bucket in self._buckets:
+            snapshot.update(bucket.items())
+        return snapshot
+
+
+class OrdersByExchangeOrderIdView(OrdersView):
+    """
+    Same as OrdersView, but the orders are accessed by exchange order id, using the exchange order id index of the
+    ClientOrderTracker.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", *buckets: Mapping[str, InFlightOrder]):
+        super().__init__(*buckets)
+        self._tracker = tracker
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._order_with_exchange_order_id(exchange_order_id)
+        if order is None or not any(bucket.get(order.client_order_id) is order for bucket in self._buckets):
+            raise KeyError(exchange_order_id)
+        return order
+
+    def _snapshot(self) -> Dict[str, InFlightOrder]:
+        return {order.exchange_order_id: order for bucket in self._buckets for order in list(bucket.values())}
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -61,6 +121,13 @@ class ClientOrderTracker:
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
+        # Identity and state version of each updatable order when tracking_states_updates was last called
+        self._reported_order_versions: Dict[str, Tuple[int, int]] = {}
+        # Index of the tracked orders by exchange order id. Orders without exchange order id are kept apart until
+        # their exchange order id is known. Entries of orders no longer tracked are discarded when found during a
+        # lookup or when the index is rebuilt.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
 
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
@@ -77,46 +144,39 @@ class ClientOrderTracker:
         return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns both active and cached order.
         """
-        return {**self.active_orders, **self.cached_orders}
+        return OrdersView(self._in_flight_orders, self._cached_orders)
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._cached_orders, self._lost_orders)
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(self, self._in_flight_orders, self._cached_orders, self._lost_orders)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        return OrdersView(self._in_flight_orders, self._lost_orders)
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderIdView(self, self._in_flight_orders, self._lost_orders)
 
     @property
     def current_timestamp(self) -> int:
@@ -142,6 +202,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -162,6 +223,32 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
+
+    def tracking_states_updates(self, reset: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Returns the changes in the tracking states (the serialized updatable orders) since the previous call.
+        Only the orders that changed are serialized.
+        :param reset: if True, all the updatable orders are returned as changed
+        :return: a dictionary associating the ids of the orders that changed with the serialized order (JSON format),
+        and the ids of the orders that are no longer updatable
+        """
+        if reset:
+            self._reported_order_versions.clear()
+        updatable_orders = self.all_updatable_orders
+        updated_states = {}
+        order_versions = {}
+        for client_order_id, order in updatable_orders.items():
+            order_version = (id(order), order.state_version)
+            order_versions[client_order_id] = order_version
+            if self._reported_order_versions.get(client_order_id) != order_version:
+                updated_states[client_order_id] = order.to_json()
+        removed_order_ids = [
+            client_order_id for client_order_id in self._reported_order_versions
+            if client_order_id not in updatable_orders
+        ]
+        self._reported_order_versions = order_versions
+        return updated_states, removed_order_ids
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -173,13 +260,13 @@ class ClientOrderTracker:
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
         found_order = None
+        all_orders = self.all_orders
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
+        if client_order_id in all_orders:
+            found_order = all_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+            found_order = OrdersByExchangeOrderIdView(self, self._in_flight_orders, self._cached_orders).get(
+                exchange_order_id)
 
         return found_order
 
@@ -191,9 +278,7 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = OrdersByExchangeOrderIdView(self, self._lost_orders).get(exchange_order_id)
 
         return found_order
 
@@ -291,6 +376,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._index_order(tracked_order)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -437,6 +523,51 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+            if len(self._orders_by_exchange_order_id) > 2 * (len(self._in_flight_orders)
+                                                             + len(self._lost_orders)
+                                                             + self.MAX_CACHE_SIZE):
+                self._rebuild_exchange_order_id_index()
+
+    def _rebuild_exchange_order_id_index(self):
+        self._orders_by_exchange_order_id = {}
+        self._orders_without_exchange_order_id = {}
+        for order in chain(self._in_flight_orders.values(), self._cached_orders.values(), self._lost_orders.values()):
+            if order.exchange_order_id is None:
+                self._orders_without_exchange_order_id[order.client_order_id] = order
+            else:
+                self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    def _order_with_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Looks up the index by exchange order id. The order returned might not be tracked anymore.
+        """
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is not None and order.exchange_order_id != exchange_order_id:
+            del self._orders_by_exchange_order_id[exchange_order_id]
+            self._index_order(order)
+            order = None
+        if order is None and len(self._orders_without_exchange_order_id) > 0:
+            # The exchange order id might have been assigned to the order without going through the tracker
+            for pending_order in list(self._orders_without_exchange_order_id.values()):
+                if pending_order.exchange_order_id is not None:
+                    self._index_order(pending_order)
+                elif not self._is_tracked(pending_order):
+                    del self._orders_without_exchange_order_id[pending_order.client_order_id]
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        return order
+
+    def _is_tracked(self, order: InFlightOrder) -> bool:
+        client_order_id = order.client_order_id
+        return (self._in_flight_orders.get(client_order_id) is order
+                or self._cached_orders.get(client_order_id) is order
+                or self._lost_orders.get(client_order_id) is order)
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
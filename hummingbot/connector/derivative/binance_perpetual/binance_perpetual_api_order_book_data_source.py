@@ -8,7 +8,7 @@ import hummingbot.connector.derivative.binance_perpetual.binance_perpetual_const
 import hummingbot.connector.derivative.binance_perpetual.binance_perpetual_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.funding_info import FundingInfo, FundingInfoUpdate
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -77,7 +77,7 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
         snapshot_response: Dict[str, Any] = await self._request_order_book_snapshot(trading_pair)
         snapshot_timestamp: float = time.time()
         snapshot_response.update({"trading_pair": trading_pair})
-        snapshot_msg: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(OrderBookMessageType.SNAPSHOT, {
             "trading_pair": snapshot_response["trading_pair"],
             "update_id": snapshot_response["lastUpdateId"],
             "bids": snapshot_response["bids"],
@@ -138,7 +138,7 @@ class BinancePerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
         raw_message["data"]["s"] = await self._connector.trading_pair_associated_to_exchange_symbol(
             raw_message["data"]["s"])
         data = raw_message["data"]
-        order_book_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, {
+        order_book_message: OrderBookMessage = NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
             "trading_pair": data["s"],
             "update_id": data["u"],
             "bids": data["b"],
@@ -32,6 +32,8 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    STATUS_UPDATE_MAX_CONCURRENCY = 5
+    ORDER_BOOK_DIRECT_DISPATCH = True
 
     web_utils = web_utils
 
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.gate_io import gate_io_constants as CONSTANTS, gate_io_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -40,7 +40,7 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
         snapshot_response: Dict[str, Any] = await self._request_order_book_snapshot(trading_pair)
         snapshot_timestamp: float = self._time()
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             {
                 "trading_pair": trading_pair,
@@ -108,7 +108,7 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "bids": diff_data["b"],
             "asks": diff_data["a"],
         }
-        diff_message: OrderBookMessage = OrderBookMessage(
+        diff_message: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.DIFF,
             order_book_message_content,
             timestamp)
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS, kucoin_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -48,7 +48,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "bids": snapshot_response["data"]["bids"],
             "asks": snapshot_response["data"]["asks"]
         }
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             order_book_message_content,
             snapshot_timestamp)
@@ -111,7 +111,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "bids": diff_data["changes"]["bids"],
             "asks": diff_data["changes"]["asks"],
         }
-        diff_message: OrderBookMessage = OrderBookMessage(
+        diff_message: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.DIFF,
             order_book_message_content,
             timestamp)
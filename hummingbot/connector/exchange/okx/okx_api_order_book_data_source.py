@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS, okx_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest, WSPlainTextRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -40,10 +40,10 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(bid[0], bid[1]) for bid in snapshot_data["bids"]],
-            "asks": [(ask[0], ask[1]) for ask in snapshot_data["asks"]],
+            "bids": snapshot_data["bids"],
+            "asks": snapshot_data["asks"],
         }
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             order_book_message_content,
             snapshot_timestamp)
@@ -82,10 +82,10 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         order_book_message_content = {
             "trading_pair": trading_pair,
             "update_id": update_id,
-            "bids": [(bid[0], bid[1]) for bid in snapshot_data["bids"]],
-            "asks": [(ask[0], ask[1]) for ask in snapshot_data["asks"]],
+            "bids": snapshot_data["bids"],
+            "asks": snapshot_data["asks"],
         }
-        snapshot_msg: OrderBookMessage = OrderBookMessage(
+        snapshot_msg: OrderBookMessage = NumpyOrderBookMessage(
             OrderBookMessageType.SNAPSHOT,
             order_book_message_content,
             snapshot_timestamp)
@@ -124,10 +124,10 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             order_book_message_content = {
                 "trading_pair": trading_pair,
                 "update_id": update_id,
-                "bids": [(bid[0], bid[1]) for bid in diff_data["bids"]],
-                "asks": [(ask[0], ask[1]) for ask in diff_data["asks"]],
+                "bids": diff_data["bids"],
+                "asks": diff_data["asks"],
             }
-            diff_message: OrderBookMessage = OrderBookMessage(
+            diff_message: OrderBookMessage = NumpyOrderBookMessage(
                 OrderBookMessageType.DIFF,
                 order_book_message_content,
                 timestamp)
@@ -0,0 +1,82 @@
+from typing import Tuple, TYPE_CHECKING
+
+from hummingbot.connector.exchange.paper_trade.backtest_order_book_data_source import BacktestOrderBookDataSource
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange cimport PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.trading_pair import TradingPair
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.network_iterator import NetworkStatus
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+cdef class BacktestExchange(PaperTradeExchange):
+    """
+    Paper trade exchange whose order books replay the market data recorded from an exchange, synchronized to the
+    clock in backtest mode. On each tick the messages recorded up to the tick timestamp are applied to the order books
+    (see BacktestOrderBookDataSource) before the orders are processed, so the limit orders are filled by the recorded
+    trades and the market orders are executed against the recorded order books.
+    """
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 data_source: BacktestOrderBookDataSource,
+                 exchange_name: str):
+        """
+        :param data_source: the data source of the recorded market data of the trading pairs
+        :param exchange_name: the name of the exchange the market data was recorded from, used for the trading fees
+        """
+        PaperTradeExchange.__init__(
+            self,
+            client_config_map,
+            OrderBookTracker(data_source=data_source, trading_pairs=data_source._trading_pairs),
+            BacktestExchange,
+            exchange_name=exchange_name,
+        )
+        self._data_source = data_source
+        for trading_pair in data_source._trading_pairs:
+            order_book = CompositeOrderBook()
+            order_book.c_add_listener(self.ORDER_BOOK_TRADE_EVENT_TAG, self._order_book_trade_listener)
+            base_asset, quote_asset = self.split_trading_pair(trading_pair)
+            self._trading_pairs[trading_pair] = TradingPair(trading_pair, base_asset, quote_asset)
+            self.order_book_tracker._order_books[trading_pair] = order_book
+
+    @property
+    def data_source(self) -> BacktestOrderBookDataSource:
+        return self._data_source
+
+    @property
+    def ready(self):
+        return True
+
+    def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
+        return split_hb_trading_pair(trading_pair)
+
+    cdef c_start(self, Clock clock, double timestamp):
+        PaperTradeExchange.c_start(self, clock, timestamp)
+        self._network_status = NetworkStatus.CONNECTED
+        self._data_source.load()
+        self._data_source.replay_until(timestamp, self.order_books)
+
+    cdef c_tick(self, double timestamp):
+        # The orders filled by the replayed trades are filled at the tick timestamp
+        self._current_timestamp = timestamp
+        self._data_source.replay_until(timestamp, self.order_books)
+        PaperTradeExchange.c_tick(self, timestamp)
+
+    async def _check_network_loop(self):
+        # There is no network connection to check in backtests
+        self._network_status = NetworkStatus.CONNECTED
+
+    async def start_network(self):
+        pass
+
+    async def stop_network(self):
+        pass
+
+    async def trigger_event_async(self, event_tag, event):
+        # The events are triggered as soon as the backtest yields to the event loop, without waiting
+        self.c_trigger_event(event_tag, event)
@@ -0,0 +1,153 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+SNAPSHOT = float(OrderBookMessageType.SNAPSHOT.value)
+DIFF = float(OrderBookMessageType.DIFF.value)
+TRADE = float(OrderBookMessageType.TRADE.value)
+BUY_SIDE = float(TradeType.BUY.value)
+SELL_SIDE = float(TradeType.SELL.value)
+
+
+class TradingPairReplay:
+    """
+    The market data of a trading pair loaded for a backtest, with the position of the next row to replay
+    """
+
+    def __init__(self, trading_pair: str, rows: np.ndarray):
+        self.trading_pair = trading_pair
+        self.rows = rows
+        self.timestamps = np.ascontiguousarray(rows[:, MarketDataFile.TIMESTAMP])
+        self.position = 0
+        # The first row of each message, to find the beginning of the last snapshot of a window
+        message_keys = rows[:, [MarketDataFile.TIMESTAMP, MarketDataFile.TYPE, MarketDataFile.UPDATE_ID]]
+        changes = np.any(message_keys[1:] != message_keys[:-1], axis=1) if len(rows) > 1 else np.empty(0, dtype=bool)
+        self.message_starts = np.concatenate(([0], np.flatnonzero(changes) + 1)) if len(rows) > 0 else np.empty(0)
+
+
+class BacktestOrderBookDataSource(OrderBookTrackerDataSource):
+    """
+    Data source of the backtesting connector. It loads the market data recorded for the trading pairs (see
+    MarketDataFile) and replays it into the order books, synchronized to the backtest clock: on each tick the
+    connector calls `replay_until` with the tick timestamp, and all the messages recorded up to it are applied.
+
+    The messages of a tick are applied in batches: only the last snapshot is applied, followed by all the diffs
+    recorded after it with a single `apply_numpy_diffs` call (the diffs are applied in the recorded order, so the
+    resulting order book is the same). The trades are applied one by one, and trigger the order book trade events
+    that fill the limit orders of the paper trade exchange.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 start_time: float,
+                 end_time: float,
+                 market_data_path: Optional[str] = None):
+        """
+        :param trading_pairs: the trading pairs to replay
+        :param connector_name: the name of the connector the market data was recorded from
+        :param start_time: the timestamp the backtest starts at. The messages recorded before it (since the beginning
+        of its UTC day) are applied without triggering trade events, to build the order books at start time
+        :param end_time: the timestamp the backtest ends at
+        :param market_data_path: the directory of the market data files (data/market_data by default)
+        """
+        super().__init__(trading_pairs=trading_pairs)
+        self._connector_name = connector_name
+        self._start_time = start_time
+        self._end_time = end_time
+        self._market_data_path = market_data_path
+        self._replays: Dict[str, TradingPairReplay] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @property
+    def end_time(self) -> float:
+        return self._end_time
+
+    @property
+    def replays(self) -> Dict[str, TradingPairReplay]:
+        return self._replays
+
+    def load(self):
+        """
+        Loads the market data of all the trading pairs
+        """
+        for trading_pair in self._trading_pairs:
+            market_data_file = MarketDataFile(self._connector_name, trading_pair, self._market_data_path)
+            rows = market_data_file.load(self._start_time, self._end_time)
+            if len(rows) == 0:
+                self.logger().warning(f"No market data recorded for {trading_pair} in {market_data_file.directory} "
+                                      f"between {self._start_time} and {self._end_time}.")
+            self._replays[trading_pair] = TradingPairReplay(trading_pair, rows)
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    def replay_until(self, timestamp: float, order_books: Dict[str, OrderBook]):
+        """
+        Applies the messages recorded up to the timestamp (included) to the order books. The trades recorded before
+        the start time of the backtest don't trigger trade events.
+        """
+        for trading_pair, replay in self._replays.items():
+            end = int(np.searchsorted(replay.timestamps, timestamp, side="right"))
+            if end > replay.position:
+                self._replay_rows(replay, end, order_books[trading_pair])
+
+    def _replay_rows(self, replay: TradingPairReplay, end: int, order_book: OrderBook):
+        start = replay.position
+        rows = replay.rows[start:end]
+        types = rows[:, MarketDataFile.TYPE]
+        replay.position = end
+
+        diffs_start = 0
+        snapshot_rows = np.flatnonzero(types == SNAPSHOT)
+        if len(snapshot_rows) > 0:
+            snapshot_end = int(snapshot_rows[-1]) + 1
+            message_index = int(np.searchsorted(replay.message_starts, start + snapshot_end - 1, side="right")) - 1
+            snapshot_start = max(int(replay.message_starts[message_index]) - start, 0)
+            self._apply_levels(order_book, rows[snapshot_start:snapshot_end], is_snapshot=True)
+            diffs_start = snapshot_end
+
+        diffs_mask = types[diffs_start:] == DIFF
+        diffs = rows[diffs_start:][diffs_mask & (rows[diffs_start:, MarketDataFile.UPDATE_ID] > order_book.snapshot_uid)]
+        if len(diffs) > 0:
+            self._apply_levels(order_book, diffs, is_snapshot=False)
+
+        trades = rows[(types == TRADE) & (rows[:, MarketDataFile.TIMESTAMP] >= self._start_time)]
+        for trade_timestamp, _, side, price, amount, trade_id in trades.tolist():
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=replay.trading_pair,
+                timestamp=trade_timestamp,
+                type=TradeType.SELL if side == SELL_SIDE else TradeType.BUY,
+                price=price,
+                amount=amount,
+                trade_id=None if np.isnan(trade_id) else str(int(trade_id)),
+            ))
+        if len(trades) > 0:
+            self._last_traded_prices[replay.trading_pair] = trades[-1, MarketDataFile.PRICE]
+        else:
+            trade_prices = rows[types == TRADE, MarketDataFile.PRICE]
+            if len(trade_prices) > 0:
+                order_book.last_trade_price = trade_prices[-1]
+                self._last_traded_prices[replay.trading_pair] = trade_prices[-1]
+
+    @staticmethod
+    def _apply_levels(order_book: OrderBook, rows: np.ndarray, is_snapshot: bool):
+        is_bid = rows[:, MarketDataFile.SIDE] == BUY_SIDE
+        levels = rows[:, [MarketDataFile.PRICE, MarketDataFile.AMOUNT, MarketDataFile.UPDATE_ID]]
+        if is_snapshot:
+            order_book.apply_numpy_snapshot(levels[is_bid], levels[~is_bid])
+        else:
+            order_book.apply_numpy_diffs(levels[is_bid], levels[~is_bid])
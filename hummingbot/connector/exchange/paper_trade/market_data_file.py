@@ -0,0 +1,157 @@
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from os.path import join, realpath
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataFile:
+    """
+    On-disk record of the order book snapshots, order book diffs and public trades of a trading pair, replayed by the
+    backtesting connector.
+
+    The messages are stored as rows of float64 values with the columns [timestamp, type, side, price, amount,
+    update_id], one row per price level of the snapshots and diffs (the bid levels have the side TradeType.BUY and the
+    ask levels TradeType.SELL) and one row per trade (with the taker side and the trade id as update id, or NaN if the
+    trade id is not numeric). The type is the value of the OrderBookMessageType of the message. The rows of a message
+    share its timestamp, type and update id.
+
+    The rows are appended to one raw binary file per UTC day, named after the day, in the directory of the connector
+    and trading pair. Each message is appended with a single write, so several processes can record the same trading
+    pair. The replay starts from the last snapshot recorded before the start of the backtest, so a snapshot should be
+    recorded at least once a day.
+    """
+    TIMESTAMP = 0
+    TYPE = 1
+    SIDE = 2
+    PRICE = 3
+    AMOUNT = 4
+    UPDATE_ID = 5
+    N_COLUMNS = 6
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @staticmethod
+    def market_data_path() -> str:
+        return realpath(join(data_path(), "market_data"))
+
+    def __init__(self, connector_name: str, trading_pair: str, market_data_path: Optional[str] = None):
+        """
+        :param connector_name: the name of the connector the messages are received from
+        :param trading_pair: the trading pair of the messages
+        :param market_data_path: the directory of the market data files (data/market_data by default)
+        """
+        self._connector_name = connector_name
+        self._trading_pair = trading_pair
+        self._directory = join(market_data_path or self.market_data_path(), connector_name, trading_pair)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def day_file_path(self, timestamp: float) -> str:
+        day = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return join(self._directory, f"{day.strftime('%Y-%m-%d')}.bin")
+
+    @classmethod
+    def message_rows(cls, message: OrderBookMessage) -> np.ndarray:
+        """
+        Returns the rows recording the message
+        """
+        if message.type is OrderBookMessageType.TRADE:
+            rows = np.empty((1, cls.N_COLUMNS), dtype=np.float64)
+            rows[0, cls.SIDE] = float(message.content["trade_type"])
+            rows[0, cls.PRICE] = float(message.content["price"])
+            rows[0, cls.AMOUNT] = float(message.content["amount"])
+            try:
+                rows[0, cls.UPDATE_ID] = float(message.trade_id)
+            except (TypeError, ValueError):
+                rows[0, cls.UPDATE_ID] = np.nan
+        else:
+            bids = NumpyOrderBookMessage.levels_array(message.content["bids"], message.update_id)
+            asks = NumpyOrderBookMessage.levels_array(message.content["asks"], message.update_id)
+            rows = np.empty((len(bids) + len(asks), cls.N_COLUMNS), dtype=np.float64)
+            rows[:len(bids), cls.SIDE] = float(TradeType.BUY.value)
+            rows[len(bids):, cls.SIDE] = float(TradeType.SELL.value)
+            rows[:, cls.PRICE:cls.AMOUNT + 1] = np.concatenate((bids[:, :2], asks[:, :2]))
+            rows[:, cls.UPDATE_ID] = message.update_id
+        rows[:, cls.TIMESTAMP] = message.timestamp
+        rows[:, cls.TYPE] = float(message.type.value)
+        return rows
+
+    def append_message(self, message: OrderBookMessage):
+        """
+        Appends the message to the file of its day. The errors writing the file are logged and ignored.
+        """
+        self.append_rows(self.message_rows(message))
+
+    def append_rows(self, rows: np.ndarray):
+        """
+        Appends the rows to the files of their days, with a single write for each run of consecutive rows of the same
+        day. The errors writing the files are logged and ignored.
+        """
+        if len(rows) == 0:
+            return
+        days = (rows[:, self.TIMESTAMP] // 86400).astype(np.int64)
+        for day_rows in np.split(rows, np.flatnonzero(np.diff(days)) + 1):
+            self._write_rows(self.day_file_path(day_rows[0, self.TIMESTAMP]), day_rows)
+
+    def _write_rows(self, path: str, rows: np.ndarray):
+        row_size = self.N_COLUMNS * np.dtype(np.float64).itemsize
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                file_size = os.fstat(fd).st_size
+                if file_size % row_size != 0:
+                    os.ftruncate(fd, file_size - file_size % row_size)
+                os.write(fd, np.ascontiguousarray(rows, dtype=np.float64).tobytes())
+            finally:
+                os.close(fd)
+        except OSError:
+            self.logger().warning(f"Could not record the {self._trading_pair} market data in {path}.", exc_info=True)
+
+    def append_messages(self, messages: Iterable[OrderBookMessage]):
+        for message in messages:
+            self.append_message(message)
+
+    def load(self, start_time: float, end_time: float) -> np.ndarray:
+        """
+        Returns the rows recorded from the beginning of the UTC day of start_time to end_time, sorted by timestamp
+        (the rows with the same timestamp are kept in the order they were recorded).
+        """
+        day = datetime.fromtimestamp(start_time, tz=timezone.utc).date()
+        last_day = datetime.fromtimestamp(end_time, tz=timezone.utc).date()
+        arrays: List[np.ndarray] = []
+        while day <= last_day:
+            path = join(self._directory, f"{day.strftime('%Y-%m-%d')}.bin")
+            day += timedelta(days=1)
+            try:
+                values = np.fromfile(path, dtype=np.float64)
+            except (FileNotFoundError, ValueError):
+                continue
+            # A row partially written by a process that crashed while appending it is ignored
+            rows_count = values.size // self.N_COLUMNS
+            arrays.append(values[:rows_count * self.N_COLUMNS].reshape(rows_count, self.N_COLUMNS))
+        if len(arrays) == 0:
+            return np.empty((0, self.N_COLUMNS), dtype=np.float64)
+
+        rows = np.concatenate(arrays)
+        rows = rows[rows[:, self.TIMESTAMP] <= end_time]
+        timestamps = rows[:, self.TIMESTAMP]
+        if len(rows) > 1 and not np.all(timestamps[1:] >= timestamps[:-1]):
+            rows = rows[np.argsort(timestamps, kind="stable")]
+        return rows
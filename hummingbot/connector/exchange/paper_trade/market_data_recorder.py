@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookMessageListener, OrderBookTracker
+from hummingbot.logger import HummingbotLogger
+
+
+class MarketDataRecorder:
+    """
+    Records the order book snapshots, order book diffs and public trades received by the connectors in MarketDataFiles,
+    to be replayed later by the backtesting connector.
+
+    The recorder listens to the messages applied by the order book tracker of each connector. The paper trade
+    connectors are recorded under the name of the exchange they trade on, since the backtest of a paper trade market
+    replays the data of its exchange. A paper trade connector is not recorded if its exchange connector is also
+    recorded, the order books of both would be recorded in the same files.
+
+    The rows of the messages are buffered and written to the files every FLUSH_INTERVAL seconds, with a single write
+    per file, to keep the file writes off the path of each order book update. The buffered rows are written when the
+    recorder is stopped.
+    """
+    FLUSH_INTERVAL = 1.0
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connectors: Dict[str, ConnectorBase], market_data_path: Optional[str] = None):
+        """
+        :param connectors: the connectors to record, by connector name
+        :param market_data_path: the directory of the market data files (data/market_data by default)
+        """
+        self._connectors = connectors
+        self._market_data_path = market_data_path
+        self._files: Dict[Tuple[str, str], MarketDataFile] = {}
+        self._pending_rows: Dict[Tuple[str, str], List[np.ndarray]] = {}
+        self._listeners: Dict[str, Tuple[OrderBookTracker, OrderBookMessageListener]] = {}
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        self._ev_loop = asyncio.get_event_loop()
+        for connector_name, connector in self._connectors.items():
+            order_book_tracker: Optional[OrderBookTracker] = getattr(connector, "order_book_tracker", None)
+            if order_book_tracker is None:
+                self.logger().warning(f"The market data of {connector_name} can't be recorded, the connector doesn't "
+                                      f"track order books.")
+                continue
+            exchange_name = connector_name
+            if connector_name.endswith("_paper_trade"):
+                exchange_name = connector_name[:-len("_paper_trade")]
+                if exchange_name in self._connectors:
+                    self.logger().warning(f"The market data of {connector_name} is not recorded, the market data of "
+                                          f"{exchange_name} is recorded instead.")
+                    continue
+            listener = partial(self._record_message, exchange_name)
+            order_book_tracker.add_message_listener(listener)
+            self._listeners[connector_name] = (order_book_tracker, listener)
+
+    def stop(self):
+        for order_book_tracker, listener in self._listeners.values():
+            order_book_tracker.remove_message_listener(listener)
+        self._listeners.clear()
+        self._flush()
+
+    def _record_message(self, exchange_name: str, message: OrderBookMessage):
+        key = (exchange_name, message.trading_pair)
+        self._pending_rows.setdefault(key, []).append(MarketDataFile.message_rows(message))
+        if self._flush_handle is None:
+            self._flush_handle = self._ev_loop.call_later(self.FLUSH_INTERVAL, self._flush)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending_rows = self._pending_rows
+        self._pending_rows = {}
+        for (exchange_name, trading_pair), rows in pending_rows.items():
+            market_data_file = self._files.get((exchange_name, trading_pair))
+            if market_data_file is None:
+                market_data_file = MarketDataFile(exchange_name, trading_pair, self._market_data_path)
+                self._files[(exchange_name, trading_pair)] = market_data_file
+            market_data_file.append_rows(np.concatenate(rows))
@@ -2,9 +2,13 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -37,6 +41,30 @@ if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
 
+@dataclass
+class OrderStatusUpdateMetrics:
+    timestamp: float
+    orders_count: int
+    requests_count: int
+    fills_update_duration: float
+    status_update_duration: float
+
+    @property
+    def duration(self) -> float:
+        return self.fills_update_duration + self.status_update_duration
+
+
+@dataclass
+class StatusUpdateRequestsCounter:
+    count: int = 0
+
+
+# Counter of the requests of the order status update cycle running in the current task (and in the tasks it creates).
+# The lost orders updates run in their own task, so their requests are not counted in the cycle metrics.
+_status_update_requests_counter: ContextVar[Optional[StatusUpdateRequestsCounter]] = ContextVar(
+    "status_update_requests_counter", default=None)
+
+
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
 
@@ -45,6 +73,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of order status (or order fills) requests run in parallel during a status update.
+    # The default of 1 performs the requests sequentially.
+    STATUS_UPDATE_MAX_CONCURRENCY = 1
+    STATUS_UPDATE_METRICS_HISTORY_LENGTH = 100
+    # If True, the order book diffs are routed directly to the tracked order books, and all the diffs received for a
+    # trading pair since the previous update are applied at once (at the latest before the strategies tick).
+    ORDER_BOOK_DIRECT_DISPATCH = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,6 +95,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._status_update_metrics: Deque[OrderStatusUpdateMetrics] = deque(
+            maxlen=self.STATUS_UPDATE_METRICS_HISTORY_LENGTH)
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -76,7 +113,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            direct_dispatch=self.ORDER_BOOK_DIRECT_DISPATCH))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -194,6 +232,31 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return {key: value.to_json() for key, value in self._order_tracker.all_updatable_orders.items()}
 
+    def tracking_states_updates(self, reset: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Returns the changes in tracking_states since the previous call: the JSON representation of the orders that
+        changed, and the client ids of the orders no longer included. Only the orders that changed are serialized.
+        :param reset: if True, all the orders in tracking_states are returned as changed
+        """
+        return self._order_tracker.tracking_states_updates(reset=reset)
+
+    @property
+    def status_update_concurrency(self) -> int:
+        """
+        Returns the number of order status and order fills requests that can run in parallel during a status update.
+        It is bounded by STATUS_UPDATE_MAX_CONCURRENCY and by the tightest of the connector's rate limits.
+        """
+        tightest_limit = min((int(rate_limit.limit) for rate_limit in self.rate_limits_rules),
+                             default=self.STATUS_UPDATE_MAX_CONCURRENCY)
+        return max(1, min(self.STATUS_UPDATE_MAX_CONCURRENCY, tightest_limit))
+
+    @property
+    def status_update_metrics(self) -> List[OrderStatusUpdateMetrics]:
+        """
+        Returns the metrics of the latest order status update cycles, oldest first
+        """
+        return list(self._status_update_metrics)
+
     @abstractmethod
     def supported_order_types(self) -> List[OrderType]:
         raise NotImplementedError
@@ -289,6 +352,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         if current_tick > last_tick:
             self._poll_notifier.set()
         self._last_timestamp = timestamp
+        # The connectors tick before the strategies, so they see all the order book updates received until now
+        self.order_book_tracker.apply_pending_updates()
 
     # === Orders placing ===
 
@@ -974,18 +1039,39 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._in_flight_orders_snapshot_timestamp = self.current_timestamp
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        if len(orders) == 0:
+            return
+        try:
+            trade_updates = await self._request_bulk_trade_updates(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for {len(orders)} orders. Error: {request_error}",
+                exc_info=request_error,
+            )
+            trade_updates = None
+
+        if trade_updates is None:
+            await self._run_status_update_requests(self._update_order_fills, orders)
+        else:
+            self._count_status_update_request()
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            self._count_status_update_request()
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -1009,14 +1095,67 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
-            try:
-                order_update = await self._request_order_status(tracked_order=order)
+        if len(orders) == 0:
+            return
+        try:
+            order_updates = await self._request_bulk_order_status(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the status of {len(orders)} orders. Error: {request_error}",
+                exc_info=request_error,
+            )
+            order_updates = None
+
+        if order_updates is not None:
+            self._count_status_update_request()
+            for order_update in order_updates:
                 self._order_tracker.process_order_update(order_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                await error_handler(order, request_error)
+            # The orders not included in the bulk response (e.g. orders no longer open) are requested one by one
+            updated_order_ids = {order_update.client_order_id for order_update in order_updates}
+            orders = [order for order in orders if order.client_order_id not in updated_order_ids]
+
+        async def update_order(order: InFlightOrder):
+            await self._update_order_with_error_handler(order=order, error_handler=error_handler)
+
+        await self._run_status_update_requests(update_order, orders)
+
+    async def _update_order_with_error_handler(self, order: InFlightOrder, error_handler: Callable):
+        try:
+            self._count_status_update_request()
+            order_update = await self._request_order_status(tracked_order=order)
+            self._order_tracker.process_order_update(order_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            await error_handler(order, request_error)
+
+    @staticmethod
+    def _count_status_update_request():
+        requests_counter = _status_update_requests_counter.get()
+        if requests_counter is not None:
+            requests_counter.count += 1
+
+    async def _run_status_update_requests(self,
+                                          update_function: Callable[[InFlightOrder], Awaitable[None]],
+                                          orders: List[InFlightOrder]):
+        """
+        Runs the update function for each order, with up to status_update_concurrency updates in parallel.
+        Each update processes its own results, so they are applied as soon as each response arrives.
+        """
+        concurrency = self.status_update_concurrency
+        if concurrency <= 1:
+            for order in orders:
+                await update_function(order)
+        else:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded_update(order: InFlightOrder):
+                async with semaphore:
+                    await update_function(order)
+
+            await safe_gather(*[bounded_update(order) for order in orders])
 
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
@@ -1031,8 +1170,30 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        requests_counter = StatusUpdateRequestsCounter()
+        counter_token = _status_update_requests_counter.set(requests_counter)
+        try:
+            fillable_orders = list(self._order_tracker.all_fillable_orders.values())
+            start = time.perf_counter()
+            await self._update_orders_fills(orders=fillable_orders)
+            fills_update_end = time.perf_counter()
+            await self._update_orders()
+            status_update_end = time.perf_counter()
+        finally:
+            _status_update_requests_counter.reset(counter_token)
+
+        metrics = OrderStatusUpdateMetrics(
+            timestamp=self.current_timestamp,
+            orders_count=len(fillable_orders),
+            requests_count=requests_counter.count,
+            fills_update_duration=fills_update_end - start,
+            status_update_duration=status_update_end - fills_update_end,
+        )
+        self._status_update_metrics.append(metrics)
+        self.logger().debug(
+            f"Order status update for {metrics.orders_count} orders took {metrics.duration:.3f}s "
+            f"({metrics.requests_count} requests)."
+        )
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1068,6 +1229,23 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_bulk_trade_updates(self, orders: List[InFlightOrder]) -> Optional[List[TradeUpdate]]:
+        """
+        Connectors with an endpoint returning the trades of several orders in one request (e.g. a "my trades" endpoint)
+        can override this method to return the trade updates of all the orders. Returning None (the default) falls back
+        to requesting the trades of each order with _all_trade_updates_for_order.
+        """
+        return None
+
+    async def _request_bulk_order_status(self, orders: List[InFlightOrder]) -> Optional[List[OrderUpdate]]:
+        """
+        Connectors with an endpoint returning the status of several orders in one request (e.g. an "open orders"
+        endpoint) can override this method to return the updates for the orders it includes. The updates must have
+        the client order id set. The orders not included in the result are requested with _request_order_status.
+        Returning None (the default) requests the status of every order with _request_order_status.
+        """
+        return None
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
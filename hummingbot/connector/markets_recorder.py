@@ -3,14 +3,16 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import func
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -30,17 +32,29 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.append_only_csv_writer import AppendOnlyCSVWriter
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_update import MarketStateUpdate
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import (
+    SQLCommitCallback,
+    SQLWrite,
+    SQLWriteBehindQueue,
+    SQLWriteBehindQueueMetrics,
+)
 from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    MARKET_STATE_UPDATES_COMPACTION_INTERVAL = 100
+    PERFORMANCE_CHECKPOINT_INTERVAL = 100
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -50,7 +64,24 @@ class MarketsRecorder:
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 flush_interval: Optional[float] = None,
+                 max_batch_size: int = 100,
+                 max_queue_size: int = 10000,
+                 csv_max_file_size: Optional[int] = None,
+                 csv_rotate_daily: bool = False,
+                 performance_start_timestamp: Optional[float] = None):
+        """
+        :param flush_interval: if set, the records are written by a writer thread in batched transactions, waiting at
+        most this number of seconds between batches. If None, each event is written synchronously when it is received
+        :param max_batch_size: maximum number of events written in a single transaction by the writer thread
+        :param max_queue_size: maximum number of events waiting for the writer thread. Once reached, recording an
+        event blocks until the writer thread frees space in the queue
+        :param csv_max_file_size: if set, the trades CSV file is rotated when it reaches this size in bytes
+        :param csv_rotate_daily: if True, the trades CSV file is rotated every day (UTC)
+        :param performance_start_timestamp: if set, the performance of the trades recorded since this timestamp (in
+        seconds) is aggregated as they are filled, and checkpointed to the database, for the performance reports
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +90,34 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind_queue: Optional[SQLWriteBehindQueue] = None
+        if flush_interval is not None:
+            self._write_behind_queue = SQLWriteBehindQueue(sql=sql,
+                                                           flush_interval=flush_interval,
+                                                           max_batch_size=max_batch_size,
+                                                           max_queue_size=max_queue_size)
+        # Markets whose tracking states changed since they were last queued for writing (write-behind mode only)
+        self._outdated_market_states: Set[ConnectorBase] = set()
+        self._market_states_save_handle: Optional[asyncio.TimerHandle] = None
+        # Number of market state updates logged since the last compaction, by config file path and market name
+        self._market_state_updates_count: Dict[Tuple[str, str], int] = {}
+        # Last tracking states of the markets not based on ExchangePyBase, used to calculate their updates
+        self._previous_tracking_states: Dict[str, Dict[str, Any]] = {}
+        self._csv_max_file_size: Optional[int] = csv_max_file_size
+        self._csv_rotate_daily: bool = csv_rotate_daily
+        self._csv_writers: Dict[str, AppendOnlyCSVWriter] = {}
+        # Performance of the trades since the start timestamp (in milliseconds), by market name and trading pair
+        self._performance_start_timestamp: Optional[int] = None
+        self._performance_accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        # Performance of all the trades of the config file, by market name and trading pair. Unlike the start
+        # timestamp, which changes with every run of the client, it is checkpointed and restored across runs
+        self._all_trades_accumulators: Dict[Tuple[str, str], PerformanceAccumulator] = {}
+        self._first_trade_timestamp: Optional[int] = None
+        # Number of trades added to each accumulator of all the trades since it was last checkpointed
+        self._performance_fills_since_checkpoint: Dict[Tuple[str, str], int] = {}
+        if performance_start_timestamp is not None:
+            self._performance_start_timestamp = int(performance_start_timestamp * 1e3)
+            self._load_performance_accumulators()
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,7 +173,13 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind_metrics(self) -> Optional[SQLWriteBehindQueueMetrics]:
+        return self._write_behind_queue.metrics if self._write_behind_queue is not None else None
+
     def start(self):
+        if self._write_behind_queue is not None:
+            self._write_behind_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -123,6 +188,14 @@ class MarketsRecorder:
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        self._save_performance_checkpoints()
+        if self._write_behind_queue is not None:
+            # Queue the latest market states and wait until everything queued has been written
+            self._save_outdated_market_states()
+            self._write_behind_queue.stop()
+        for csv_writer in self._csv_writers.values():
+            csv_writer.close()
+        self._csv_writers.clear()
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
@@ -152,26 +225,38 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
-    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+    def performance_accumulators(self,
+                                 start_timestamp: float) -> Optional[Dict[Tuple[str, str], PerformanceAccumulator]]:
+        """
+        Returns the performance aggregates of the trades recorded since the start timestamp (in seconds), by market
+        name and trading pair, or None if the recorder does not aggregate the trades since that timestamp: only the
+        start timestamp of the recorder, or any timestamp before the first trade of the config file, are aggregated.
+        """
+        if self._performance_start_timestamp is None:
+            return None
+        start_timestamp_ms: int = int(start_timestamp * 1e3)
+        if start_timestamp_ms == self._performance_start_timestamp:
+            return dict(self._performance_accumulators)
+        if self._first_trade_timestamp is None or start_timestamp_ms <= self._first_trade_timestamp:
+            return dict(self._all_trades_accumulators)
+        return None
 
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
-        else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
+    def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
+        write: Optional[SQLWrite] = self._market_states_write(config_file_path, market)
+        if write is not None:
+            write(session)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+            saved_state: Optional[Dict[str, Any]] = self._merge_market_state_updates(
+                session=session,
+                config_file_path=config_file_path,
+                market_name=market.display_name,
+                market_states=market_states)
 
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            if saved_state is not None:
+                market.restore_tracking_states(saved_state)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -184,6 +269,304 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def _tracking_states_updates(self,
+                                 market: ConnectorBase,
+                                 reset: bool = False) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Returns the orders that changed in the market tracking states since the previous call, and the ids of the
+        orders removed from them. Connectors based on ExchangePyBase only serialize the orders that changed, for the
+        others the complete tracking states are compared with the previous ones.
+        """
+        if isinstance(market, ExchangePyBase):
+            return market.tracking_states_updates(reset=reset)
+
+        tracking_states: Dict[str, Any] = market.tracking_states
+        previous_tracking_states: Dict[str, Any] = (
+            {} if reset else self._previous_tracking_states.get(market.display_name, {}))
+        updated_states = {order_id: state for order_id, state in tracking_states.items()
+                          if previous_tracking_states.get(order_id) != state}
+        removed_order_ids = [order_id for order_id in previous_tracking_states if order_id not in tracking_states]
+        self._previous_tracking_states[market.display_name] = tracking_states
+        return updated_states, removed_order_ids
+
+    def _market_states_write(self, config_file_path: str, market: ConnectorBase) -> Optional[SQLWrite]:
+        """
+        Serializes the changes in the market tracking states since they were last saved, and returns the write that
+        persists them (or None if nothing changed).
+        The first time the states of a market are saved the complete tracking states replace the saved market state.
+        After that, only the changes are appended to the MarketStateUpdate log, which is compacted into the saved
+        market state every MARKET_STATE_UPDATES_COMPACTION_INTERVAL updates.
+        """
+        market_name: str = market.display_name
+        timestamp: int = self.db_timestamp
+        key: Tuple[str, str] = (config_file_path, market_name)
+
+        if key not in self._market_state_updates_count:
+            saved_state, _ = self._tracking_states_updates(market, reset=True)
+            self._market_state_updates_count[key] = 0
+
+            def write(session: Session):
+                self._save_market_states_snapshot(session, config_file_path, market_name, saved_state, timestamp)
+        else:
+            updated_states, removed_order_ids = self._tracking_states_updates(market)
+            if len(updated_states) == 0 and len(removed_order_ids) == 0:
+                return None
+            self._market_state_updates_count[key] += 1
+            compact: bool = self._market_state_updates_count[key] >= self.MARKET_STATE_UPDATES_COMPACTION_INTERVAL
+            if compact:
+                self._market_state_updates_count[key] = 0
+
+            def write(session: Session):
+                session.add(MarketStateUpdate(config_file_path=config_file_path,
+                                              market=market_name,
+                                              timestamp=timestamp,
+                                              updated_states=updated_states,
+                                              removed_order_ids=removed_order_ids))
+                if compact:
+                    market_states: Optional[MarketState] = self._market_states_query(
+                        session, config_file_path, market_name).one_or_none()
+                    saved_state: Dict[str, Any] = self._merge_market_state_updates(
+                        session, config_file_path, market_name, market_states)
+                    self._save_market_states_snapshot(session, config_file_path, market_name, saved_state, timestamp)
+
+        return write
+
+    @staticmethod
+    def _market_states_query(session: Session, config_file_path: str, market_name: str) -> Query:
+        return (session
+                .query(MarketState)
+                .filter(MarketState.config_file_path == config_file_path,
+                        MarketState.market == market_name))
+
+    @staticmethod
+    def _market_state_updates_query(session: Session, config_file_path: str, market_name: str) -> Query:
+        return (session
+                .query(MarketStateUpdate)
+                .filter(MarketStateUpdate.config_file_path == config_file_path,
+                        MarketStateUpdate.market == market_name))
+
+    def _merge_market_state_updates(self,
+                                    session: Session,
+                                    config_file_path: str,
+                                    market_name: str,
+                                    market_states: Optional[MarketState]) -> Optional[Dict[str, Any]]:
+        """
+        Applies the logged market state updates, in order, to the saved market state.
+        :return: the resulting tracking states, or None if neither a saved state nor updates exist
+        """
+        updates: List[MarketStateUpdate] = (self._market_state_updates_query(session, config_file_path, market_name)
+                                            .order_by(MarketStateUpdate.id)
+                                            .all())
+        if market_states is None and len(updates) == 0:
+            return None
+        saved_state: Dict[str, Any] = dict(market_states.saved_state) if market_states is not None else {}
+        for update in updates:
+            saved_state.update(update.updated_states)
+            for order_id in update.removed_order_ids:
+                saved_state.pop(order_id, None)
+        return saved_state
+
+    def _save_market_states_snapshot(self,
+                                     session: Session,
+                                     config_file_path: str,
+                                     market_name: str,
+                                     saved_state: Dict[str, Any],
+                                     timestamp: int):
+        """
+        Replaces the saved market state with the given tracking states, and clears the market state updates log
+        """
+        market_states: Optional[MarketState] = self._market_states_query(
+            session, config_file_path, market_name).one_or_none()
+        if market_states is not None:
+            market_states.saved_state = saved_state
+            market_states.timestamp = timestamp
+        else:
+            market_states = MarketState(config_file_path=config_file_path,
+                                        market=market_name,
+                                        timestamp=timestamp,
+                                        saved_state=saved_state)
+            session.add(market_states)
+        self._market_state_updates_query(session, config_file_path, market_name).delete(synchronize_session=False)
+
+    def _write(self,
+               write: SQLWrite,
+               market: Optional[ConnectorBase] = None,
+               on_commit: Optional[SQLCommitCallback] = None):
+        """
+        Executes the write in its own transaction, or queues it for the writer thread in write-behind mode.
+        :param market: if set, the tracking states of the market are also saved
+        :param on_commit: if set, called once the write has been committed (by the writer thread in write-behind mode)
+        """
+        if self._write_behind_queue is None:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    write(session)
+                    if market is not None:
+                        self.save_market_states(self._config_file_path, market, session=session)
+            if on_commit is not None:
+                on_commit()
+        else:
+            self._write_behind_queue.submit(write, on_commit)
+            if market is not None:
+                self._outdated_market_states.add(market)
+                if self._market_states_save_handle is None:
+                    self._market_states_save_handle = self._ev_loop.call_later(
+                        self._write_behind_queue.flush_interval, self._save_outdated_market_states)
+
+    def _save_outdated_market_states(self):
+        """
+        Queues the changes in the tracking states of the markets updated since the last call. Serializing the
+        tracking states is done in the main thread, at most once per flush interval for each market.
+        """
+        if self._market_states_save_handle is not None:
+            self._market_states_save_handle.cancel()
+            self._market_states_save_handle = None
+        for market in self._outdated_market_states:
+            write: Optional[SQLWrite] = self._market_states_write(self._config_file_path, market)
+            if write is not None:
+                self._write_behind_queue.submit(write)
+        self._outdated_market_states.clear()
+
+    def _performance_checkpoint_query(self, session: Session, market_name: str, trading_pair: str) -> Query:
+        return (session
+                .query(PerformanceCheckpoint)
+                .filter(PerformanceCheckpoint.config_file_path == self._config_file_path,
+                        PerformanceCheckpoint.start_timestamp == PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP,
+                        PerformanceCheckpoint.market == market_name,
+                        PerformanceCheckpoint.symbol == trading_pair))
+
+    def _trades_query(self, session: Session, start_timestamp: Optional[int] = None, *filters) -> Query:
+        if start_timestamp is not None:
+            filters += (TradeFill.timestamp >= start_timestamp,)
+        return (session
+                .query(TradeFill)
+                .filter(TradeFill.config_file_path == self._config_file_path, *filters)
+                .order_by(TradeFill.timestamp)
+                .yield_per(1000))
+
+    def _load_performance_accumulators(self):
+        """
+        Restores the performance accumulators of all the trades from their last checkpoints, and adds the trades
+        recorded after them. Every trading pair with trades has a checkpoint once its trades have been aggregated (see
+        _add_to_performance), so all the trades are only read the first time, and then only the trades of each pair
+        after its checkpoint. The trades since the start timestamp are aggregated too. The trades are streamed from
+        the database.
+        """
+        with self._sql_manager.get_new_session() as session:
+            checkpoints: List[PerformanceCheckpoint] = (
+                session
+                .query(PerformanceCheckpoint)
+                .filter(PerformanceCheckpoint.config_file_path == self._config_file_path,
+                        PerformanceCheckpoint.start_timestamp == PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP)
+                .all())
+            for checkpoint in checkpoints:
+                self._all_trades_accumulators[(checkpoint.market, checkpoint.symbol)] = (
+                    PerformanceAccumulator.from_json(checkpoint.state))
+            self._first_trade_timestamp = (session
+                                           .query(func.min(TradeFill.timestamp))
+                                           .filter(TradeFill.config_file_path == self._config_file_path)
+                                           .scalar())
+
+            if len(checkpoints) == 0:
+                backfill_queries: List[Query] = [self._trades_query(session)]
+            else:
+                backfill_queries: List[Query] = [
+                    self._trades_query(session, accumulator.last_timestamp,
+                                       TradeFill.market == market_name, TradeFill.symbol == trading_pair)
+                    for (market_name, trading_pair), accumulator in self._all_trades_accumulators.items()]
+            for query in backfill_queries:
+                for trade in query:
+                    key: Tuple[str, str] = (trade.market, trade.symbol)
+                    accumulator: Optional[PerformanceAccumulator] = self._all_trades_accumulators.get(key)
+                    if accumulator is None:
+                        accumulator = PerformanceAccumulator(trade.symbol)
+                        self._all_trades_accumulators[key] = accumulator
+                    elif accumulator.contains(trade):
+                        continue
+                    accumulator.add_trade(trade)
+                    self._performance_fills_since_checkpoint[key] = (
+                        self._performance_fills_since_checkpoint.get(key, 0) + 1)
+
+            for trade in self._trades_query(session, self._performance_start_timestamp):
+                self._add_to_accumulators(self._performance_accumulators, (trade.market, trade.symbol), trade)
+
+        # The checkpoints of the older versions, started at the start timestamp of each run, are superseded
+        self._write(self._delete_superseded_checkpoints_write)
+        # The trades aggregated are checkpointed right away, so that they are not read again on the next run
+        self._save_performance_checkpoints()
+
+    def _delete_superseded_checkpoints_write(self, session: Session):
+        (session
+         .query(PerformanceCheckpoint)
+         .filter(PerformanceCheckpoint.config_file_path == self._config_file_path,
+                 PerformanceCheckpoint.start_timestamp != PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP)
+         .delete(synchronize_session=False))
+
+    @staticmethod
+    def _add_to_accumulators(accumulators: Dict[Tuple[str, str], PerformanceAccumulator],
+                             key: Tuple[str, str],
+                             trade: TradeFill) -> bool:
+        """
+        Adds the trade to the accumulator of its trading pair, and returns True if it is the first trade of the pair
+        """
+        accumulator: Optional[PerformanceAccumulator] = accumulators.get(key)
+        is_first_trade: bool = accumulator is None
+        if is_first_trade:
+            accumulator = PerformanceAccumulator(trade.symbol)
+            accumulators[key] = accumulator
+        accumulator.add_trade(trade)
+        return is_first_trade
+
+    def _add_to_performance(self, market_name: str, trade: TradeFill) -> Optional[SQLWrite]:
+        """
+        Adds the trade to the performance accumulators of its trading pair. Returns the write of the checkpoint of
+        the accumulator of all the trades when one is due: for the first trade of the pair, then every
+        PERFORMANCE_CHECKPOINT_INTERVAL trades.
+        """
+        if self._performance_start_timestamp is None:
+            return None
+        key: Tuple[str, str] = (market_name, trade.symbol)
+        if trade.timestamp >= self._performance_start_timestamp:
+            self._add_to_accumulators(self._performance_accumulators, key, trade)
+        if self._first_trade_timestamp is None or trade.timestamp < self._first_trade_timestamp:
+            self._first_trade_timestamp = trade.timestamp
+        is_first_trade: bool = self._add_to_accumulators(self._all_trades_accumulators, key, trade)
+        fills_since_checkpoint: int = self._performance_fills_since_checkpoint.get(key, 0) + 1
+        if is_first_trade or fills_since_checkpoint >= self.PERFORMANCE_CHECKPOINT_INTERVAL:
+            self._performance_fills_since_checkpoint[key] = 0
+            return self._performance_checkpoint_write(key, self._all_trades_accumulators[key])
+        self._performance_fills_since_checkpoint[key] = fills_since_checkpoint
+        return None
+
+    def _performance_checkpoint_write(self, key: Tuple[str, str], accumulator: PerformanceAccumulator) -> SQLWrite:
+        # The accumulator is serialized in the main thread, the writer thread only stores the result
+        market_name, trading_pair = key
+        state: Dict[str, Any] = accumulator.to_json()
+        timestamp: int = self.db_timestamp
+
+        def write(session: Session):
+            checkpoint: Optional[PerformanceCheckpoint] = self._performance_checkpoint_query(
+                session, market_name, trading_pair).one_or_none()
+            if checkpoint is None:
+                checkpoint = PerformanceCheckpoint(config_file_path=self._config_file_path,
+                                                   market=market_name,
+                                                   symbol=trading_pair,
+                                                   start_timestamp=PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP,
+                                                   timestamp=timestamp,
+                                                   state=state)
+                session.add(checkpoint)
+            else:
+                checkpoint.timestamp = timestamp
+                checkpoint.state = state
+
+        return write
+
+    def _save_performance_checkpoints(self):
+        for key, fills_since_checkpoint in self._performance_fills_since_checkpoint.items():
+            if fills_since_checkpoint > 0:
+                self._write(self._performance_checkpoint_write(key, self._all_trades_accumulators[key]))
+                self._performance_fills_since_checkpoint[key] = 0
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
@@ -196,31 +579,31 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market.display_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._write(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -234,48 +617,58 @@ class MarketsRecorder:
         timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else self.db_timestamp
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=Decimal(
+                evt.price) if evt.price == evt.price else Decimal(0),
+            amount=Decimal(evt.amount),
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        # The checkpoint is written in the same transaction as the trade fill, so that the trades after the last
+        # checkpoint of each trading pair are always found in the trade fills table
+        checkpoint_write: Optional[SQLWrite] = self._add_to_performance(market.display_name, trade_fill_record)
+        # The CSV row is built in the transaction, where the order of the trade can be loaded, but it is only appended
+        # once the transaction is committed: a write retried by the write-behind queue must not append it twice
+        csv_row: Optional[Tuple[Tuple[str, ...], Tuple[Any, ...]]] = None
+
+        def write(session: Session):
+            nonlocal csv_row
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_status)
+            session.add(trade_fill_record)
+            if checkpoint_write is not None:
+                checkpoint_write(session)
+            csv_row = self._csv_row(trade_fill_record)
+
+        def on_commit():
+            self._append_csv_row(self._config_file_path, *csv_row)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        self._write(write, market, on_commit)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -287,29 +680,26 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market.display_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     def append_to_csv(self, trade: TradeFill):
-        csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
-        csv_path = os.path.join(data_path(), csv_filename)
+        self._append_csv_row(trade.config_file_path, *self._csv_row(trade))
 
+    @staticmethod
+    def _csv_row(trade: TradeFill) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
         field_names = tuple(trade.attribute_names_for_file_export())
         field_data = tuple(getattr(trade, attr) for attr in field_names)
 
@@ -319,15 +709,18 @@ class MarketsRecorder:
             '%H:%M:%S') if (trade.order is not None and "//" not in trade.order_id) else "n/a"
         field_names += ("age",)
         field_data += (age,)
+        return field_names, field_data
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+    def _append_csv_row(self, config_file_path: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        csv_filename = "trades_" + config_file_path[:-4] + ".csv"
+        csv_path = os.path.join(data_path(), csv_filename)
+        csv_writer: Optional[AppendOnlyCSVWriter] = self._csv_writers.get(csv_path)
+        if csv_writer is None:
+            csv_writer = AppendOnlyCSVWriter(file_path=csv_path,
+                                             max_file_size=self._csv_max_file_size,
+                                             rotate_daily=self._csv_rotate_daily)
+            self._csv_writers[csv_path] = csv_writer
+        csv_writer.write_row(header=field_names, row=field_data)
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +738,18 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +785,15 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=evt.trade_fee.to_json())
+            session.add(rp_update)
+
+        self._write(write, connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +803,14 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._write(write, connector)
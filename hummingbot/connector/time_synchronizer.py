@@ -2,9 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
-
-import numpy
+from typing import Awaitable, Deque, Optional
 
 from hummingbot.logger import HummingbotLogger
 
@@ -15,13 +13,28 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+
+    The offset is calculated as the mean of the median and the weighted average (favoring the newest samples) of the
+    offset samples. It is cached and only recalculated when the samples change, since `time()` is called to sign every
+    authenticated request.
+
+    With `drift_correction` enabled the drift of the local clock against the server's clock is estimated from the
+    samples (least squares slope of the offsets against the local time, bounded by `MAX_DRIFT_PPM`), and the offset is
+    interpolated from the time of the samples to the current time.
     """
 
     NaN = float("nan")
+    MAX_DRIFT_PPM = 500
     _logger = None
 
-    def __init__(self):
+    def __init__(self, drift_correction: bool = False):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        # Local time (seconds counter) of each offset sample, only registered when drift correction is enabled
+        self._sample_times: Deque[float] = deque(maxlen=5)
+        self._drift_correction = drift_correction
+        self._cached_offset_ms: Optional[float] = None
+        self._cached_reference_time: float = 0
+        self._cached_drift_ms_per_s: float = 0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -33,24 +46,49 @@ class TimeSynchronizer:
     def time_offset_ms(self) -> float:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
+        elif self._drift_correction:
+            offset = self._offset_ms_at(self._current_seconds_counter())
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            offset = self._sampled_offset_ms()
 
         return offset
 
-    def add_time_offset_ms_sample(self, offset: float):
+    @property
+    def drift_ppm(self) -> float:
+        """
+        The estimated drift of the server's clock against the local clock, in parts per million (always 0 when drift
+        correction is disabled)
+        """
+        self._sampled_offset_ms()
+        return self._cached_drift_ms_per_s * 1e3
+
+    def add_time_offset_ms_sample(self, offset: float, local_time: Optional[float] = None):
+        """
+        Registers a new offset sample.
+
+        :param offset: The difference between the server's time and the local time, in milliseconds
+        :param local_time: The local time (seconds counter) the offset was measured at, used for the drift correction.
+        The current time is used if not specified
+        """
+        if self._drift_correction:
+            self._sample_times.append(self._current_seconds_counter() if local_time is None else local_time)
         self._time_offset_ms.append(offset)
+        self._cached_offset_ms = None
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._sample_times.clear()
+        self._cached_offset_ms = None
+        self._cached_drift_ms_per_s = 0
 
     def time(self) -> float:
         """
         Returns the current time in seconds calculated base on the deviation samples.
         :return: Calculated current time considering the registered deviations
         """
+        if self._drift_correction and self._time_offset_ms:
+            seconds_counter = self._current_seconds_counter()
+            return seconds_counter + self._offset_ms_at(seconds_counter) * 1e-3
         return self._current_seconds_counter() + self.time_offset_ms * 1e-3
 
     async def update_server_time_offset_with_time_provider(self, time_provider: Awaitable):
@@ -66,7 +104,7 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
-            self.add_time_offset_ms_sample(time_offset_ms)
+            self.add_time_offset_ms_sample(time_offset_ms, local_time=local_server_time_pre_image_ms * 1e-3)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -86,6 +124,56 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _sampled_offset_ms(self) -> float:
+        if self._cached_offset_ms is None and self._time_offset_ms:
+            self._cached_offset_ms = self._blended_average(self._time_offset_ms)
+            self._cached_reference_time = 0
+            self._cached_drift_ms_per_s = 0
+            if self._drift_correction:
+                # The blended average of the sample times is the local time the blended offset corresponds to (exactly
+                # when the offset changes linearly with the local time)
+                self._cached_reference_time = self._blended_average(self._sample_times)
+                self._cached_drift_ms_per_s = self._estimate_drift_ms_per_s()
+        return self._cached_offset_ms
+
+    def _offset_ms_at(self, seconds_counter: float) -> float:
+        offset = self._sampled_offset_ms()
+        return offset + self._cached_drift_ms_per_s * (seconds_counter - self._cached_reference_time)
+
+    def _estimate_drift_ms_per_s(self) -> float:
+        samples_count = len(self._sample_times)
+        if samples_count < 2:
+            return 0
+        mean_time = sum(self._sample_times) / samples_count
+        mean_offset = sum(self._time_offset_ms) / samples_count
+        covariance = 0
+        variance = 0
+        for sample_time, offset in zip(self._sample_times, self._time_offset_ms):
+            covariance += (sample_time - mean_time) * (offset - mean_offset)
+            variance += (sample_time - mean_time) ** 2
+        if variance == 0:
+            return 0
+        max_drift_ms_per_s = self.MAX_DRIFT_PPM * 1e-3
+        return max(-max_drift_ms_per_s, min(max_drift_ms_per_s, covariance / variance))
+
+    @staticmethod
+    def _blended_average(values: Deque[float]) -> float:
+        """
+        Calculates the mean of the median and the weighted average (with weights 1, 3, 5...) of the values
+        """
+        sorted_values = sorted(values)
+        values_count = len(sorted_values)
+        middle = values_count // 2
+        if values_count % 2 == 1:
+            median = sorted_values[middle]
+        else:
+            median = (sorted_values[middle - 1] + sorted_values[middle]) / 2
+        weighted_sum = 0
+        for index, value in enumerate(values):
+            weighted_sum += value * (2 * index + 1)
+        weighted_average = weighted_sum / (values_count * values_count)
+        return (median + weighted_average) / 2
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+
+# Timestamps are tracked as integer microseconds, so that comparisons at the window boundaries are exact without
+# having to go through Decimal conversions for every logged task.
+MICROSECONDS_PER_SECOND = 1_000_000
+
+
+def to_microseconds(seconds: float) -> int:
+    return round(seconds * MICROSECONDS_PER_SECOND)
+
+
+class SlidingWindow:
+    """
+    Log of the tasks consuming capacity of a single rate limit, ordered by time, with the running sum of their weights.
+    """
+
+    __slots__ = ("_timestamps", "_weights", "_capacity_used")
+
+    def __init__(self):
+        self._timestamps: Deque[int] = deque()
+        self._weights: Deque[int] = deque()
+        self._capacity_used: int = 0
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    @property
+    def capacity_used(self) -> int:
+        return self._capacity_used
+
+    def add(self, timestamp_us: int, weight: int):
+        self._timestamps.append(timestamp_us)
+        self._weights.append(weight)
+        self._capacity_used += weight
+
+    def flush(self, now_us: int, window_us: int):
+        """
+        Removes the tasks that are older than the window (the oldest tasks are always at the left of the log)
+        """
+        cutoff_us = now_us - window_us
+        timestamps = self._timestamps
+        weights = self._weights
+        while timestamps and timestamps[0] < cutoff_us:
+            timestamps.popleft()
+            self._capacity_used -= weights.popleft()
+
+    def release_time_us(self, weight: int, limit: int, window_us: int) -> Optional[int]:
+        """
+        Calculates the time at which enough tasks will have left a full window to fit a new task of the given weight.
+        :return: the timestamp in microseconds, or None if the task does not fit even in an empty window
+        """
+        excess = self._capacity_used + weight - limit
+        if weight > limit:
+            return None
+        released = 0
+        for timestamp_us, task_weight in zip(self._timestamps, self._weights):
+            released += task_weight
+            if released >= excess:
+                # A task leaves the window once it is strictly older than the window
+                return timestamp_us + window_us + 1
+        return None
+
+
+class AsyncSlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks the sliding windows of the rate limits associated with
+    the request and, when there is no capacity left, sleeps until the exact time at which the capacity is released.
+    """
+
+    def __init__(self,
+                 windows: Dict[str, SlidingWindow],
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 ):
+        """
+        :param windows: Shared sliding windows of all the rate limits, by limit id
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param lock: A shared asyncio.Lock used between all instances of AsyncSlidingWindowRequestContext
+        :param safety_margin_pct: Percentage of the time interval added to the rate limit windows
+        :param retry_interval: Time between each limit check when the wake up time can not be calculated
+        """
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=related_limits,
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval)
+        self._windows: Dict[str, SlidingWindow] = windows
+        self._limits_with_weights: List[Tuple[RateLimit, int]] = (
+            [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_limits
+        )
+
+    def flush(self):
+        """
+        Remove the tasks that have passed the rate limit periods from the windows of this request's limits
+        """
+        now_us = to_microseconds(self._time())
+        for rate_limit, _ in self._limits_with_weights:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is not None:
+                window.flush(now_us, self._window_us(rate_limit))
+
+    def within_capacity(self) -> bool:
+        return self._time_until_capacity(self._time()) <= 0
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                now = self._time()
+                wait_time = self._time_until_capacity(now)
+                if wait_time <= 0:
+                    self._register_task(now)
+                    return
+            await asyncio.sleep(wait_time)
+
+    def _time_until_capacity(self, now: float) -> float:
+        """
+        Flushes the windows and calculates for how long the request has to wait to be within all its rate limits.
+        Logs a warning message if a limit is reached.
+        :return: 0 if the request can be executed immediately, otherwise the waiting time in seconds
+        """
+        now_us = to_microseconds(now)
+        release_time_us = now_us
+        for rate_limit, weight in self._limits_with_weights:
+            window = self._windows.get(rate_limit.limit_id)
+            if window is None:
+                window = self._windows[rate_limit.limit_id] = SlidingWindow()
+            window_us = self._window_us(rate_limit)
+            window.flush(now_us, window_us)
+
+            if window.capacity_used + weight > rate_limit.limit:
+                self._warn_capacity_reached(rate_limit, window.capacity_used, now)
+                limit_release_time_us = window.release_time_us(weight, rate_limit.limit, window_us)
+                if limit_release_time_us is None:
+                    return self._retry_interval
+                release_time_us = max(release_time_us, limit_release_time_us)
+        return (release_time_us - now_us) / MICROSECONDS_PER_SECOND
+
+    def _register_task(self, now: float):
+        now_us = to_microseconds(now)
+        for rate_limit, weight in self._limits_with_weights:
+            self._windows[rate_limit.limit_id].add(now_us, weight)
+
+    def _window_us(self, rate_limit: RateLimit) -> int:
+        return to_microseconds(rate_limit.time_interval * (1 + self._safety_margin_pct))
+
+    def _warn_capacity_reached(self, rate_limit: RateLimit, capacity_used: int, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {capacity_used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self):
+        return time.time()
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler that keeps one sliding window of timestamps per rate limit, with the running
+    sum of the weights in the window. Checking the capacity for a request only looks at the windows of the limits
+    associated with it, and requests without capacity sleep until the capacity is released instead of polling.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._windows: Dict[str, SlidingWindow] = {}
+
+    def execute_task(self, limit_id: str) -> AsyncSlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return AsyncSlidingWindowRequestContext(
+            windows=self._windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+        )
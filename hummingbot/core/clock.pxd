@@ -1,5 +1,8 @@
 # distutils: language=c++
 
+from hummingbot.core.event.event_listener cimport EventListener
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +13,19 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _min_tick_interval
+        double _last_tick_time
+        dict _tick_triggers
+        dict _tick_requests
+        object _tick_requested
+        object _scheduled_tick_latency
+        object _triggered_tick_latency
+        object _profiler
+
+    cdef c_request_tick(self, object iterator)
+
+
+cdef class TickTriggerListener(EventListener):
+    cdef:
+        Clock _clock
+        object _iterator
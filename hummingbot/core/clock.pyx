@@ -3,11 +3,16 @@
 import asyncio
 import logging
 import time
-from typing import List
+from enum import Enum
+from typing import Dict, List, Optional
 
+from hummingbot.core.event.event_listener cimport EventListener
+from hummingbot.core.pubsub import PubSub
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -21,12 +26,19 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 min_tick_interval: float = 0.1):
         """
         :param clock_mode: either real time mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param min_tick_interval: (real time mode only) minimum time between two ticks when child iterators request
+        to be ticked early (see add_tick_trigger)
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +48,14 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._min_tick_interval = min_tick_interval
+        self._last_tick_time = 0
+        self._tick_triggers = {}
+        self._tick_requests = {}
+        self._tick_requested = None
+        self._scheduled_tick_latency = LatencyHistogram()
+        self._triggered_tick_latency = LatencyHistogram()
+        self._profiler = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +77,40 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def min_tick_interval(self) -> float:
+        return self._min_tick_interval
+
+    @property
+    def tick_latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Returns the histograms of the tick latencies in real time mode:
+        - scheduled: delay between the tick_size boundary and the moment the child iterators are ticked
+        - triggered: delay between the first tick request (see request_tick) and the moment the requesting child
+        iterators are ticked
+        """
+        return {
+            "scheduled": self._scheduled_tick_latency,
+            "triggered": self._triggered_tick_latency,
+        }
+
+    @property
+    def profiler(self) -> Optional[ClockProfiler]:
+        return self._profiler
+
+    def enable_profiling(self, overrun_threshold: Optional[float] = None) -> ClockProfiler:
+        """
+        Starts recording the time spent by each child iterator in each tick, the tick start jitter and the tick
+        overruns. Profiling is disabled by default, as it measures the time of every child iterator tick.
+
+        :param overrun_threshold: tick duration considered an overrun (tick_size by default)
+        """
+        self._profiler = ClockProfiler(overrun_threshold=overrun_threshold or self._tick_size)
+        return self._profiler
+
+    def disable_profiling(self):
+        self._profiler = None
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +135,37 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self.remove_tick_triggers(iterator)
+
+    def add_tick_trigger(self, iterator: TimeIterator, publisher: PubSub, event_tag: Enum):
+        """
+        Ticks the iterator as soon as the publisher triggers the event (e.g. an order book triggering
+        OrderBookEvent.UpdateEvent), instead of waiting for the next tick_size boundary. Early ticks are
+        debounced: they happen at least min_tick_interval seconds after the previous tick. All child iterators are
+        still ticked at every tick_size boundary.
+        """
+        listener = TickTriggerListener(self, iterator)
+        publisher.add_listener(event_tag, listener)
+        self._tick_triggers.setdefault(iterator, []).append((publisher, event_tag, listener))
+
+    def remove_tick_triggers(self, iterator: TimeIterator):
+        for publisher, event_tag, listener in self._tick_triggers.pop(iterator, []):
+            publisher.remove_listener(event_tag, listener)
+        self._tick_requests.pop(iterator, None)
+
+    def request_tick(self, iterator: TimeIterator):
+        """
+        Requests the clock to tick the iterator before the next tick_size boundary (real time mode only)
+        """
+        self.c_request_tick(iterator)
+
+    cdef c_request_tick(self, object iterator):
+        if self._clock_mode is not ClockMode.REALTIME:
+            return
+        if iterator not in self._tick_requests:
+            self._tick_requests[iterator] = time.time()
+        if self._tick_requested is not None:
+            self._tick_requested.set()
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +175,9 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double earliest_tick_time
+            double iterator_tick_start = 0
+            bint scheduled_tick
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,20 +189,55 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        if self._tick_requested is None:
+            self._tick_requested = asyncio.Event()
+
         try:
             while True:
                 now = time.time()
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
+                # Sleep until the next tick, or until a child iterator requests to be ticked earlier
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
-                self._current_tick = next_tick_time
+                if len(self._tick_requests) == 0:
+                    self._tick_requested.clear()
+                    try:
+                        await asyncio.wait_for(self._tick_requested.wait(), timeout=next_tick_time - now)
+                    except asyncio.TimeoutError:
+                        pass
 
-                # Run through all the child iterators.
-                for ci in self._current_context:
+                now = time.time()
+                scheduled_tick = len(self._tick_requests) == 0 or now >= next_tick_time
+                if not scheduled_tick and now < self._last_tick_time + self._min_tick_interval:
+                    # Debounce the early ticks, to coalesce the requests arriving in a short period of time
+                    earliest_tick_time = self._last_tick_time + self._min_tick_interval
+                    scheduled_tick = earliest_tick_time >= next_tick_time
+                    await asyncio.sleep(min(earliest_tick_time, next_tick_time) - now)
+                    now = time.time()
+
+                if scheduled_tick:
+                    # Run through all the child iterators.
+                    self._current_tick = next_tick_time
+                    self._scheduled_tick_latency.record(max(now - next_tick_time, 0))
+                    self._tick_requests.clear()
+                    iterators = self._current_context
+                else:
+                    # Run through the child iterators that requested an early tick only.
+                    self._current_tick = max(now, self._current_tick)
+                    for request_time in self._tick_requests.values():
+                        self._triggered_tick_latency.record(now - request_time)
+                    iterators = [ci for ci in self._current_context if ci in self._tick_requests]
+                    self._tick_requests.clear()
+                self._last_tick_time = now
+
+                profiler = self._profiler
+                if profiler is not None:
+                    profiler.start_tick(self._current_tick, next_tick_time if scheduled_tick else None)
+                for ci in iterators:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,13 +245,20 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    finally:
+                        if profiler is not None:
+                            profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
+                if profiler is not None:
+                    profiler.end_tick()
         finally:
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
 
     def backtest_til(self, timestamp: float):
-        cdef TimeIterator child_iterator
+        cdef:
+            TimeIterator child_iterator
+            double iterator_tick_start = 0
 
         if not self._started:
             for ci in self._child_iterators:
@@ -139,14 +269,24 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
+                profiler = self._profiler
+                if profiler is not None:
+                    profiler.start_tick(self._current_tick)
                 for ci in self._child_iterators:
                     child_iterator = ci
+                    if profiler is not None:
+                        iterator_tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
                         raise
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    finally:
+                        if profiler is not None:
+                            profiler.record_iterator_tick(child_iterator, time.perf_counter() - iterator_tick_start)
+                if profiler is not None:
+                    profiler.end_tick()
         except StopIteration:
             return
         finally:
@@ -156,3 +296,13 @@ cdef class Clock:
 
     def backtest(self):
         self.backtest_til(self._end_time)
+
+
+cdef class TickTriggerListener(EventListener):
+    def __init__(self, clock: Clock, iterator: TimeIterator):
+        super().__init__()
+        self._clock = clock
+        self._iterator = iterator
+
+    cdef c_call(self, object arg):
+        self._clock.c_request_tick(self._iterator)
@@ -0,0 +1,152 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class IteratorTickStats:
+    name: str
+    ticks: int = 0
+    total_time: float = 0
+    max_time: float = 0
+    last_time: float = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.ticks if self.ticks > 0 else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "ticks": self.ticks,
+            "total_time": self.total_time,
+            "mean_time": self.mean_time,
+            "max_time": self.max_time,
+            "last_time": self.last_time,
+        }
+
+
+class ClockProfiler:
+    """
+    Collects the tick timing metrics of a Clock while profiling is enabled (see Clock.enable_profiling):
+    - the wall time spent by each time iterator in each tick
+    - the delay between the scheduled tick time and the moment the tick starts (real time mode only)
+    - the total tick duration, and the number of ticks taking longer than the overrun threshold
+
+    Iterators ticked by other iterators (e.g. the order tracker of a strategy) can report their time with
+    record_iterator_tick too. Their time is also included in the time of the iterator ticking them.
+    """
+    SLOW_TICK_LOG_INTERVAL = 60.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, overrun_threshold: float):
+        self._overrun_threshold: float = overrun_threshold
+        self._iterator_stats: Dict[int, IteratorTickStats] = {}
+        self._tick_durations: LatencyHistogram = LatencyHistogram()
+        self._tick_start_jitter: LatencyHistogram = LatencyHistogram()
+        self._ticks: int = 0
+        self._overruns: int = 0
+        self._current_tick_start: float = 0
+        self._current_tick_timestamp: float = 0
+        self._current_tick_times: List[Tuple[IteratorTickStats, float]] = []
+        self._last_slow_tick_log_time: float = 0
+
+    @property
+    def overrun_threshold(self) -> float:
+        return self._overrun_threshold
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def overruns(self) -> int:
+        return self._overruns
+
+    @property
+    def iterator_stats(self) -> List[IteratorTickStats]:
+        return list(self._iterator_stats.values())
+
+    @property
+    def tick_durations(self) -> LatencyHistogram:
+        return self._tick_durations
+
+    @property
+    def tick_start_jitter(self) -> LatencyHistogram:
+        return self._tick_start_jitter
+
+    def start_tick(self, timestamp: float, scheduled_time: Optional[float] = None):
+        """
+        :param timestamp: the clock timestamp of the tick
+        :param scheduled_time: the time the tick was scheduled to start at, to measure the tick start jitter
+        """
+        self._current_tick_start = time.perf_counter()
+        self._current_tick_timestamp = timestamp
+        self._current_tick_times.clear()
+        if scheduled_time is not None:
+            self._tick_start_jitter.record(max(time.time() - scheduled_time, 0))
+
+    def record_iterator_tick(self, iterator: Any, elapsed: float):
+        stats = self._iterator_stats.get(id(iterator))
+        if stats is None:
+            stats = IteratorTickStats(name=self._iterator_name(iterator))
+            self._iterator_stats[id(iterator)] = stats
+        stats.ticks += 1
+        stats.total_time += elapsed
+        stats.last_time = elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+        self._current_tick_times.append((stats, elapsed))
+
+    def end_tick(self):
+        duration = time.perf_counter() - self._current_tick_start
+        self._ticks += 1
+        self._tick_durations.record(duration)
+        if duration > self._overrun_threshold:
+            self._overruns += 1
+            self._log_slow_tick(duration)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns the collected metrics as a JSON serializable dictionary
+        """
+        return {
+            "ticks": self._ticks,
+            "overruns": self._overruns,
+            "overrun_threshold": self._overrun_threshold,
+            "tick_duration": self._tick_durations.summary(),
+            "tick_start_jitter": self._tick_start_jitter.summary(),
+            "iterators": [stats.to_dict() for stats in self._iterator_stats.values()],
+        }
+
+    def reset(self):
+        self._iterator_stats.clear()
+        self._tick_durations.reset()
+        self._tick_start_jitter.reset()
+        self._ticks = 0
+        self._overruns = 0
+
+    def _log_slow_tick(self, duration: float):
+        now = time.time()
+        if now - self._last_slow_tick_log_time < self.SLOW_TICK_LOG_INTERVAL:
+            return
+        self._last_slow_tick_log_time = now
+        slowest = sorted(self._current_tick_times, key=lambda stats_and_time: stats_and_time[1], reverse=True)[:3]
+        breakdown = ", ".join(f"{stats.name}: {elapsed * 1e3:.1f}ms" for stats, elapsed in slowest)
+        self.logger().warning(f"Clock tick at {self._current_tick_timestamp} took {duration * 1e3:.1f}ms "
+                              f"(threshold {self._overrun_threshold * 1e3:.1f}ms). Slowest iterators: {breakdown}")
+
+    @staticmethod
+    def _iterator_name(iterator: Any) -> str:
+        name = getattr(iterator, "name", None)
+        class_name = type(iterator).__name__
+        return f"{class_name}({name})" if isinstance(name, str) else class_name
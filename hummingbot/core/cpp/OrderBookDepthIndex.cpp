@@ -0,0 +1,116 @@
+#include "OrderBookDepthIndex.h"
+#include <algorithm>
+#include <functional>
+
+OrderBookDepthIndex::OrderBookDepthIndex() {
+    this->descending = false;
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(const OrderBookDepthIndex &other) {
+    this->prices = other.prices;
+    this->cumulativeBaseVolumes = other.cumulativeBaseVolumes;
+    this->cumulativeQuoteVolumes = other.cumulativeQuoteVolumes;
+    this->descending = other.descending;
+}
+
+OrderBookDepthIndex &OrderBookDepthIndex::operator=(const OrderBookDepthIndex &other) {
+    this->prices = other.prices;
+    this->cumulativeBaseVolumes = other.cumulativeBaseVolumes;
+    this->cumulativeQuoteVolumes = other.cumulativeQuoteVolumes;
+    this->descending = other.descending;
+    return *this;
+}
+
+void OrderBookDepthIndex::clear(bool descending) {
+    this->prices.clear();
+    this->cumulativeBaseVolumes.clear();
+    this->cumulativeQuoteVolumes.clear();
+    this->descending = descending;
+}
+
+void OrderBookDepthIndex::addLevel(double price, double amount) {
+    double baseVolume = amount;
+    double quoteVolume = amount * price;
+    if (!this->prices.empty()) {
+        baseVolume += this->cumulativeBaseVolumes.back();
+        quoteVolume += this->cumulativeQuoteVolumes.back();
+    }
+    this->prices.push_back(price);
+    this->cumulativeBaseVolumes.push_back(baseVolume);
+    this->cumulativeQuoteVolumes.push_back(quoteVolume);
+}
+
+void OrderBookDepthIndex::rebuildFromAskBook(const std::set<OrderBookEntry> &askBook) {
+    this->clear(false);
+    this->prices.reserve(askBook.size());
+    this->cumulativeBaseVolumes.reserve(askBook.size());
+    this->cumulativeQuoteVolumes.reserve(askBook.size());
+    for (std::set<OrderBookEntry>::const_iterator it = askBook.begin(); it != askBook.end(); ++it) {
+        this->addLevel(it->getPrice(), it->getAmount());
+    }
+}
+
+void OrderBookDepthIndex::rebuildFromBidBook(const std::set<OrderBookEntry> &bidBook) {
+    this->clear(true);
+    this->prices.reserve(bidBook.size());
+    this->cumulativeBaseVolumes.reserve(bidBook.size());
+    this->cumulativeQuoteVolumes.reserve(bidBook.size());
+    for (std::set<OrderBookEntry>::const_reverse_iterator it = bidBook.rbegin(); it != bidBook.rend(); ++it) {
+        this->addLevel(it->getPrice(), it->getAmount());
+    }
+}
+
+int64_t OrderBookDepthIndex::size() const {
+    return (int64_t) this->prices.size();
+}
+
+double OrderBookDepthIndex::getPrice(int64_t level) const {
+    return this->prices[level];
+}
+
+double OrderBookDepthIndex::getCumulativeBaseVolume(int64_t level) const {
+    return this->cumulativeBaseVolumes[level];
+}
+
+double OrderBookDepthIndex::getCumulativeQuoteVolume(int64_t level) const {
+    return this->cumulativeQuoteVolumes[level];
+}
+
+double OrderBookDepthIndex::getTotalBaseVolume() const {
+    return this->cumulativeBaseVolumes.empty() ? 0 : this->cumulativeBaseVolumes.back();
+}
+
+double OrderBookDepthIndex::getTotalQuoteVolume() const {
+    return this->cumulativeQuoteVolumes.empty() ? 0 : this->cumulativeQuoteVolumes.back();
+}
+
+// Returns the first level at which the cumulative volume reaches the target, or -1 if the book is too thin.
+static int64_t findCumulativeVolumeLevel(const std::vector<double> &cumulativeVolumes, double volume) {
+    std::vector<double>::const_iterator it = std::lower_bound(cumulativeVolumes.begin(),
+                                                              cumulativeVolumes.end(),
+                                                              volume);
+    // The explicit comparison also rejects NaN targets, for which lower_bound() would return the first level.
+    if (it == cumulativeVolumes.end() || !(*it >= volume)) {
+        return -1;
+    }
+    return it - cumulativeVolumes.begin();
+}
+
+int64_t OrderBookDepthIndex::findBaseVolumeLevel(double baseVolume) const {
+    return findCumulativeVolumeLevel(this->cumulativeBaseVolumes, baseVolume);
+}
+
+int64_t OrderBookDepthIndex::findQuoteVolumeLevel(double quoteVolume) const {
+    return findCumulativeVolumeLevel(this->cumulativeQuoteVolumes, quoteVolume);
+}
+
+// Returns the last level whose price is at or better than the given price, or -1 if there is none.
+int64_t OrderBookDepthIndex::findPriceLevel(double price) const {
+    std::vector<double>::const_iterator it;
+    if (this->descending) {
+        it = std::upper_bound(this->prices.begin(), this->prices.end(), price, std::greater<double>());
+    } else {
+        it = std::upper_bound(this->prices.begin(), this->prices.end(), price);
+    }
+    return (it - this->prices.begin()) - 1;
+}
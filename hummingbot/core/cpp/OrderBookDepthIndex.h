@@ -0,0 +1,40 @@
+#ifndef _ORDER_BOOK_DEPTH_INDEX_H
+#define _ORDER_BOOK_DEPTH_INDEX_H
+
+#include <stdint.h>
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// Cumulative base / quote volumes of one side of an order book, ordered from the best price outwards (i.e.
+// ascending prices for asks, descending prices for bids). Allows volume and price queries to be answered with
+// binary searches instead of walking the order book.
+class OrderBookDepthIndex {
+    std::vector<double> prices;
+    std::vector<double> cumulativeBaseVolumes;
+    std::vector<double> cumulativeQuoteVolumes;
+    bool descending;
+
+    public:
+        OrderBookDepthIndex();
+        OrderBookDepthIndex(const OrderBookDepthIndex &other);
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other);
+
+        void clear(bool descending);
+        void addLevel(double price, double amount);
+        void rebuildFromAskBook(const std::set<OrderBookEntry> &askBook);
+        void rebuildFromBidBook(const std::set<OrderBookEntry> &bidBook);
+
+        int64_t size() const;
+        double getPrice(int64_t level) const;
+        double getCumulativeBaseVolume(int64_t level) const;
+        double getCumulativeQuoteVolume(int64_t level) const;
+        double getTotalBaseVolume() const;
+        double getTotalQuoteVolume() const;
+
+        int64_t findBaseVolumeLevel(double baseVolume) const;
+        int64_t findQuoteVolumeLevel(double quoteVolume) const;
+        int64_t findPriceLevel(double price) const;
+};
+
+#endif
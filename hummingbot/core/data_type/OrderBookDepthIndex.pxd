@@ -0,0 +1,25 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthIndex.h":
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        OrderBookDepthIndex(const OrderBookDepthIndex &other)
+        OrderBookDepthIndex &operator=(const OrderBookDepthIndex &other)
+        void clear(bool descending)
+        void addLevel(double price, double amount)
+        void rebuildFromAskBook(const set[OrderBookEntry] &ask_book)
+        void rebuildFromBidBook(const set[OrderBookEntry] &bid_book)
+        int64_t size() const
+        double getPrice(int64_t level) const
+        double getCumulativeBaseVolume(int64_t level) const
+        double getCumulativeQuoteVolume(int64_t level) const
+        double getTotalBaseVolume() const
+        double getTotalQuoteVolume() const
+        int64_t findBaseVolumeLevel(double base_volume) const
+        int64_t findQuoteVolumeLevel(double quote_volume) const
+        int64_t findPriceLevel(double price) const
@@ -5,4 +5,5 @@ cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
+    cdef c_rebuild_depth_index(self, bint is_buy)
     cdef double c_get_price(self, bint is_buy) except? -1
@@ -19,6 +19,9 @@ s_decimal_0 = Decimal("0")
 
 GET_EX_ORDER_ID_TIMEOUT = 10  # seconds
 
+# Marks the attributes assigned for the first time, when tracking the changes of the order state
+_UNSET = object()
+
 
 class OrderState(Enum):
     PENDING_CREATE = 0
@@ -125,6 +128,21 @@ class InFlightOrder:
             self.exchange_order_id_update_event.set()
         self.completely_filled_event = asyncio.Event()
 
+    def __setattr__(self, name: str, value: Any):
+        previous_value = self.__dict__.get(name, _UNSET)
+        super().__setattr__(name, value)
+        # The order updates reassign the state even when it did not change (e.g. an open order polled again)
+        if previous_value is not value and previous_value != value:
+            super().__setattr__("_state_version", self.__dict__.get("_state_version", 0) + 1)
+
+    @property
+    def state_version(self) -> int:
+        """
+        Counter increased every time an attribute of the order is assigned a different value. It allows detecting the
+        orders whose state changed without having to serialize them.
+        """
+        return self._state_version
+
     @property
     def attributes(self) -> Tuple[Any]:
         return copy.deepcopy(
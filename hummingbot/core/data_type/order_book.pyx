@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepthIndex.cpp']
 import bisect
 import logging
 import time
@@ -15,13 +15,14 @@ import numpy as np
 import pandas as pd
 from aiokafka import ConsumerRecord
 
+cimport cython
 from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
 )
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -37,6 +38,32 @@ ob_logger = None
 NaN = float("nan")
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef vector[OrderBookEntry] c_entries_from_array(np.ndarray[np.float64_t, ndim=2] levels):
+    """
+    Converts an array of levels with the columns [price, amount, update_id] to order book entries
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t i
+        Py_ssize_t rows = levels.shape[0]
+    entries.reserve(rows)
+    for i in range(rows):
+        entries.push_back(OrderBookEntry(levels[i, 0], levels[i, 1], <int64_t>levels[i, 2]))
+    return entries
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int64_t c_max_update_id(np.ndarray[np.float64_t, ndim=2] levels, int64_t update_id):
+    cdef:
+        Py_ssize_t i
+    for i in range(levels.shape[0]):
+        update_id = max(update_id, <int64_t>levels[i, 2])
+    return update_id
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -56,6 +83,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -97,6 +125,8 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_invalidate_depth_index()
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -137,6 +167,8 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_invalidate_depth_index()
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -209,12 +241,16 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        If update_id is not provided, the diffs update ID is the highest one of the rows.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        if update_id is None:
+            self.c_apply_numpy_diffs(bids_array, asks_array)
+        else:
+            self.c_apply_diffs(c_entries_from_array(bids_array), c_entries_from_array(asks_array), update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -224,17 +260,8 @@ cdef class OrderBook(PubSub):
         All columns are of double type.
         """
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+            int64_t last_update_id = c_max_update_id(asks_array, c_max_update_id(bids_array, 0))
+        self.c_apply_diffs(c_entries_from_array(bids_array), c_entries_from_array(asks_array), last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
         """
@@ -251,17 +278,32 @@ cdef class OrderBook(PubSub):
         All columns are of double type.
         """
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = c_max_update_id(asks_array, c_max_update_id(bids_array, 0))
+        self.c_apply_snapshot(c_entries_from_array(bids_array), c_entries_from_array(asks_array), last_update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies the changes of a diff message. The levels of NumPy messages are converted to order book entries
+        straight from their arrays, without creating OrderBookRow instances.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_diffs(c_entries_from_array(message.bids_array),
+                               c_entries_from_array(message.asks_array),
+                               message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message. The levels of NumPy messages are converted to order book entries straight from
+        their arrays, without creating OrderBookRow instances.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.c_apply_snapshot(c_entries_from_array(message.bids_array),
+                                  c_entries_from_array(message.asks_array),
+                                  message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -319,144 +361,111 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
-        cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+    cdef c_invalidate_depth_index(self):
+        self._bid_depth_index_dirty = self._ask_depth_index_dirty = True
 
+    cdef c_rebuild_depth_index(self, bint is_buy):
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            self._ask_depth_index.rebuildFromAskBook(self._ask_book)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            self._bid_depth_index.rebuildFromBidBook(self._bid_book)
 
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy) except NULL:
+        """
+        Returns the cumulative depth index of the side of the book a buy (asks) or a sell (bids) would take liquidity
+        from. The index is rebuilt lazily on the first query after the book has changed.
+        """
+        if is_buy:
+            if self._ask_depth_index_dirty:
+                self.c_rebuild_depth_index(True)
+                self._ask_depth_index_dirty = False
+            return ref(self._ask_depth_index)
+        else:
+            if self._bid_depth_index_dirty:
+                self.c_rebuild_depth_index(False)
+                self._bid_depth_index_dirty = False
+            return ref(self._bid_depth_index)
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findBaseVolumeLevel(volume)
+
+        if level < 0:
+            return OrderBookQueryResult(NaN, volume, NaN, min(depth_index.getTotalBaseVolume(), volume))
+        return OrderBookQueryResult(NaN,
+                                    volume,
+                                    depth_index.getPrice(level),
+                                    min(depth_index.getCumulativeBaseVolume(level), volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findBaseVolumeLevel(volume)
             double total_cost = 0
             double total_volume = 0
-            double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+        if level < 0:
+            return OrderBookQueryResult(NaN, volume, NaN, min(depth_index.getTotalBaseVolume(), volume))
+        if level > 0:
+            total_cost = depth_index.getCumulativeQuoteVolume(level - 1)
+            total_volume = depth_index.getCumulativeBaseVolume(level - 1)
+        # Only the part of the last level needed to fill the volume is taken into account.
+        incremental_amount = volume - total_volume
+        total_cost += incremental_amount * depth_index.getPrice(level)
+        total_volume += incremental_amount
+        return OrderBookQueryResult(NaN, volume, total_cost / total_volume, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findQuoteVolumeLevel(quote_volume)
+
+        if level < 0:
+            return OrderBookQueryResult(NaN,
+                                        quote_volume,
+                                        NaN,
+                                        min(depth_index.getTotalQuoteVolume(), quote_volume))
+        return OrderBookQueryResult(NaN,
+                                    quote_volume,
+                                    depth_index.getPrice(level),
+                                    min(depth_index.getCumulativeQuoteVolume(level), quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findBaseVolumeLevel(base_amount)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
 
+        if level < 0:
+            return OrderBookQueryResult(NaN, base_amount, NaN, depth_index.getTotalQuoteVolume())
+        if level > 0:
+            cumulative_volume = depth_index.getCumulativeQuoteVolume(level - 1)
+            cumulative_base_amount = depth_index.getCumulativeBaseVolume(level - 1)
+        cumulative_volume += (base_amount - cumulative_base_amount) * depth_index.getPrice(level)
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findPriceLevel(price)
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        if level < 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price, NaN, depth_index.getPrice(level), depth_index.getCumulativeBaseVolume(level))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            int64_t level = depth_index.findPriceLevel(price)
 
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+        if level < 0:
+            return OrderBookQueryResult(price, NaN, NaN, 0)
+        return OrderBookQueryResult(price,
+                                    NaN,
+                                    depth_index.getPrice(level),
+                                    depth_index.getCumulativeQuoteVolume(level))
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -487,6 +496,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -95,3 +97,54 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class NumpyOrderBookMessage(OrderBookMessage):
+    """
+    Order book message whose diff and snapshot price levels are parsed once, when the message is created, into NumPy
+    float64 arrays with the columns [price, amount, update_id]. The order books apply them straight from the arrays
+    (see OrderBook.apply_diff_message), without creating OrderBookRow instances.
+
+    The content can be built with the levels as received from the exchange (e.g. [["0.1", "10.5"], ...]). Any
+    numeric column after the price and the amount is ignored.
+    """
+
+    def __new__(
+        cls,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+        *args,
+        **kwargs,
+    ):
+        if message_type in (OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT):
+            update_id = content["update_id"]
+            content["bids"] = cls.levels_array(content["bids"], update_id)
+            content["asks"] = cls.levels_array(content["asks"], update_id)
+        return super(NumpyOrderBookMessage, cls).__new__(cls, message_type, content, timestamp, *args, **kwargs)
+
+    @staticmethod
+    def levels_array(levels: Sequence[Sequence[Any]], update_id: int) -> np.ndarray:
+        if isinstance(levels, np.ndarray) and levels.ndim == 2 and levels.shape[1] == 3:
+            return levels
+        array = np.empty((len(levels), 3), dtype=np.float64)
+        if len(levels) > 0:
+            array[:, :2] = np.asarray(levels, dtype=np.float64).reshape(len(levels), -1)[:, :2]
+        array[:, 2] = update_id
+        return array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return self.content["bids"]
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return self.content["asks"]
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount, _ in self.content["asks"].tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        return [OrderBookRow(price, amount, self.update_id) for price, amount, _ in self.content["bids"].tolist()]
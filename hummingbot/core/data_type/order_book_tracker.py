@@ -2,16 +2,19 @@ import asyncio
 import logging
 import time
 from collections import defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, OrderBookUpdateEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -21,6 +24,40 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+@dataclass
+class OrderBookTrackerGauges:
+    """
+    Health gauges of the order book of a trading pair:
+    - queue_depth: number of messages received and not applied to the order book yet
+    - staleness: seconds since the oldest of those messages was received (0 when the order book is up to date)
+    - last_update_time: time of the last update applied to the order book (0 if none was applied yet)
+    """
+    trading_pair: str
+    queue_depth: int
+    staleness: float
+    last_update_time: float
+
+
+class OrderBookMessageDispatcher:
+    """
+    Queue-like entry point used by the order book tracker in direct dispatch mode. The data source puts the parsed
+    messages in it as it does with a queue, and they are routed synchronously to the pending updates of their trading
+    pair, without going through the diff stream and router tasks.
+    """
+
+    def __init__(self, tracker: "OrderBookTracker"):
+        self._tracker = tracker
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._tracker._dispatch_message(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._tracker._dispatch_message(message)
+
+
+OrderBookMessageListener = Callable[[OrderBookMessage], None]
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
     _obt_logger: Optional[HummingbotLogger] = None
@@ -31,8 +68,19 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 direct_dispatch: bool = False):
+        """
+        :param direct_dispatch: if True, the diff and snapshot messages parsed by the data source are routed directly
+        to pending updates per trading pair. All the diffs pending for a pair are then applied to its order book with
+        a single apply_diffs call, either by the update task or by apply_pending_updates (called by the connector
+        before the strategies tick).
+        """
         self._domain: Optional[str] = domain
+        self._direct_dispatch: bool = direct_dispatch
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
@@ -45,6 +93,19 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        # Reception times of the messages in the tracking queues, for the staleness gauge
+        self._tracking_message_times: Dict[str, Deque[float]] = defaultdict(deque)
+        self._last_update_times: Dict[str, float] = {}
+        self._message_listeners: List[OrderBookMessageListener] = []
+
+        # Direct dispatch mode state
+        self._message_dispatcher: OrderBookMessageDispatcher = OrderBookMessageDispatcher(self)
+        self._pending_diffs: Dict[str, List[OrderBookMessage]] = {}
+        self._pending_snapshots: Dict[str, OrderBookMessage] = {}
+        self._pending_since: Dict[str, float] = {}
+        self._pending_updates_event: asyncio.Event = asyncio.Event()
+        self._coalesced_diffs_count: int = 0
+        self._apply_diffs_calls_count: int = 0
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -55,6 +116,7 @@ class OrderBookTracker:
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
+        self._apply_pending_updates_task: Optional[asyncio.Task] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -68,6 +130,35 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def direct_dispatch(self) -> bool:
+        return self._direct_dispatch
+
+    @property
+    def gauges(self) -> Dict[str, OrderBookTrackerGauges]:
+        """
+        Returns the queue depth and staleness gauges of the tracked order books, by trading pair
+        """
+        now = time.time()
+        gauges = {}
+        for trading_pair in self._order_books:
+            saved_messages_count = len(self._saved_message_queues.get(trading_pair, ()))
+            if self._direct_dispatch:
+                queue_depth = (len(self._pending_diffs.get(trading_pair, ()))
+                               + (1 if trading_pair in self._pending_snapshots else 0))
+                pending_since = self._pending_since.get(trading_pair)
+            else:
+                message_queue = self._tracking_message_queues.get(trading_pair)
+                queue_depth = message_queue.qsize() if message_queue is not None else 0
+                message_times = self._tracking_message_times.get(trading_pair)
+                pending_since = message_times[0] if message_times else None
+            gauges[trading_pair] = OrderBookTrackerGauges(
+                trading_pair=trading_pair,
+                queue_depth=queue_depth + saved_messages_count,
+                staleness=max(now - pending_since, 0) if pending_since is not None else 0,
+                last_update_time=self._last_update_times.get(trading_pair, 0))
+        return gauges
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -75,6 +166,18 @@ class OrderBookTracker:
             for trading_pair, order_book in self._order_books.items()
         }
 
+    def add_message_listener(self, listener: OrderBookMessageListener):
+        """
+        Registers a function called with every snapshot, diff and trade message applied to the tracked order books (e.g.
+        to record them). The initial order book of each trading pair is notified as a snapshot message.
+        """
+        if listener not in self._message_listeners:
+            self._message_listeners.append(listener)
+
+    def remove_message_listener(self, listener: OrderBookMessageListener):
+        if listener in self._message_listeners:
+            self._message_listeners.remove(listener)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -83,24 +186,34 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        if self._direct_dispatch:
+            diff_output = snapshot_output = self._message_dispatcher
+        else:
+            diff_output = self._order_book_diff_stream
+            snapshot_output = self._order_book_snapshot_stream
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(self._ev_loop, snapshot_output)
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
+        if self._direct_dispatch:
+            self._apply_pending_updates_task = safe_ensure_future(
+                self._apply_pending_updates_loop()
+            )
+        else:
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
@@ -128,6 +241,9 @@ class OrderBookTracker:
         if self._order_book_snapshot_router_task is not None:
             self._order_book_snapshot_router_task.cancel()
             self._order_book_snapshot_router_task = None
+        if self._apply_pending_updates_task is not None:
+            self._apply_pending_updates_task.cancel()
+            self._apply_pending_updates_task = None
         if self._update_last_trade_prices_task is not None:
             self._update_last_trade_prices_task.cancel()
             self._update_last_trade_prices_task = None
@@ -142,6 +258,22 @@ class OrderBookTracker:
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def apply_pending_updates(self):
+        """
+        Applies the updates received in direct dispatch mode and not applied yet. For each trading pair, the pending
+        snapshot (if any) is applied first, and then all the pending diffs are coalesced in a single apply_diffs call.
+        It does nothing if the tracker is not in direct dispatch mode.
+        """
+        self._pending_updates_event.clear()
+        for trading_pair in list(self._pending_since):
+            try:
+                self._apply_pending_updates_for_pair(trading_pair)
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error applying order book updates for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error tracking order book.")
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -178,8 +310,14 @@ class OrderBookTracker:
         """
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            if len(self._message_listeners) > 0:
+                self._notify_message_listeners(self._snapshot_message(trading_pair, self._order_books[trading_pair]))
+            if self._direct_dispatch:
+                self._pending_diffs[trading_pair] = []
+                self._dispatch_saved_messages(trading_pair)
+            else:
+                self._tracking_message_queues[trading_pair] = asyncio.Queue()
+                self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
             self.logger().info(f"Initialized order book for {trading_pair}. "
                                f"{index + 1}/{len(self._trading_pairs)} completed.")
             await self._sleep(delay=1)
@@ -211,6 +349,7 @@ class OrderBookTracker:
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
                     continue
+                self._tracking_message_times[trading_pair].append(time.time())
                 await message_queue.put(ob_message)
                 messages_accepted += 1
 
@@ -246,6 +385,7 @@ class OrderBookTracker:
                 if trading_pair not in self._tracking_message_queues:
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+                self._tracking_message_times[trading_pair].append(time.time())
                 await message_queue.put(ob_message)
             except asyncio.CancelledError:
                 raise
@@ -257,6 +397,7 @@ class OrderBookTracker:
         past_diffs_window = self._past_diffs_windows[trading_pair]
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
+        message_times: Deque[float] = self._tracking_message_times[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
@@ -270,9 +411,11 @@ class OrderBookTracker:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
+                    if len(message_times) > 0:
+                        message_times.popleft()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -285,6 +428,17 @@ class OrderBookTracker:
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                else:
+                    continue
+                self._last_update_times[trading_pair] = time.time()
+                if len(self._message_listeners) > 0:
+                    self._notify_message_listeners(message)
+
+                # Signal the book change, to allow the listeners (e.g. the clock) to react without polling
+                order_book.trigger_event(
+                    OrderBookEvent.UpdateEvent,
+                    OrderBookUpdateEvent(trading_pair=trading_pair, timestamp=message.timestamp,
+                                         update_id=message.update_id))
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +449,108 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _dispatch_message(self, message: OrderBookMessage):
+        """
+        Routes a message received in direct dispatch mode to the pending updates of its trading pair
+        """
+        trading_pair: str = message.trading_pair
+        if trading_pair not in self._pending_diffs:
+            # Save diff messages received before snapshots are ready
+            if message.type is OrderBookMessageType.DIFF:
+                self._saved_message_queues[trading_pair].append(message)
+            return
+        if message.type is OrderBookMessageType.DIFF:
+            # Check the order book's initial update ID. If it's larger, don't bother.
+            if self._order_books[trading_pair].snapshot_uid > message.update_id:
+                return
+            self._pending_diffs[trading_pair].append(message)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            self._pending_snapshots[trading_pair] = message
+        else:
+            return
+        self._pending_since.setdefault(trading_pair, time.time())
+        self._pending_updates_event.set()
+
+    def _dispatch_saved_messages(self, trading_pair: str):
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        while len(saved_messages) > 0:
+            self._dispatch_message(saved_messages.popleft())
+
+    def _apply_pending_updates_for_pair(self, trading_pair: str):
+        self._pending_since.pop(trading_pair, None)
+        snapshot: Optional[OrderBookMessage] = self._pending_snapshots.pop(trading_pair, None)
+        diffs: List[OrderBookMessage] = self._pending_diffs[trading_pair]
+        self._pending_diffs[trading_pair] = []
+        order_book: OrderBook = self._order_books[trading_pair]
+        past_diffs_window: Deque[OrderBookMessage] = self._past_diffs_windows[trading_pair]
+
+        last_message: Optional[OrderBookMessage] = None
+        if snapshot is not None:
+            order_book.restore_from_snapshot_and_diffs(snapshot, list(past_diffs_window))
+            diffs = [diff for diff in diffs if diff.update_id > snapshot.update_id]
+            last_message = snapshot
+        if len(diffs) > 0:
+            last_message = max(diffs, key=lambda diff: diff.update_id)
+            if all(isinstance(diff, NumpyOrderBookMessage) for diff in diffs):
+                # The levels are applied in order, so the last change of each price level prevails
+                order_book.apply_numpy_diffs(np.concatenate([diff.bids_array for diff in diffs]),
+                                             np.concatenate([diff.asks_array for diff in diffs]),
+                                             last_message.update_id)
+            else:
+                # Only the last change of each price level is relevant, since the diffs are applied in order
+                bids: Dict[float, OrderBookRow] = {}
+                asks: Dict[float, OrderBookRow] = {}
+                for diff in diffs:
+                    for row in diff.bids:
+                        bids[row.price] = row
+                    for row in diff.asks:
+                        asks[row.price] = row
+                order_book.apply_diffs(list(bids.values()), list(asks.values()), last_message.update_id)
+            past_diffs_window.extend(diffs)
+            self._coalesced_diffs_count += len(diffs)
+            self._apply_diffs_calls_count += 1
+        if last_message is None:
+            return
+        self._last_update_times[trading_pair] = time.time()
+        if len(self._message_listeners) > 0:
+            for message in ([snapshot] if snapshot is not None else []) + diffs:
+                self._notify_message_listeners(message)
+
+        # Signal the book change, to allow the listeners (e.g. the clock) to react without polling
+        order_book.trigger_event(
+            OrderBookEvent.UpdateEvent,
+            OrderBookUpdateEvent(trading_pair=trading_pair, timestamp=last_message.timestamp,
+                                 update_id=last_message.update_id))
+
+    async def _apply_pending_updates_loop(self):
+        """
+        Applies the pending updates as soon as possible in direct dispatch mode. The messages received while the task
+        waits to be scheduled are coalesced.
+        """
+        last_message_timestamp: float = time.time()
+        while True:
+            try:
+                await self._pending_updates_event.wait()
+                self.apply_pending_updates()
+
+                # Output some statistics periodically.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                    self.logger().debug(f"Applied {self._coalesced_diffs_count} order book diffs "
+                                        f"in {self._apply_diffs_calls_count} updates.")
+                    self._coalesced_diffs_count = 0
+                    self._apply_diffs_calls_count = 0
+                last_message_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error applying order book updates.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error tracking order book. Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -318,6 +574,8 @@ class OrderBookTracker:
                     type=TradeType.SELL if
                     trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
                 ))
+                if len(self._message_listeners) > 0:
+                    self._notify_message_listeners(trade_message)
 
                 messages_accepted += 1
 
@@ -339,6 +597,23 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _notify_message_listeners(self, message: OrderBookMessage):
+        for listener in self._message_listeners:
+            try:
+                listener(message)
+            except Exception:
+                self.logger().error("Unexpected error notifying an order book message listener.", exc_info=True)
+
+    @staticmethod
+    def _snapshot_message(trading_pair: str, order_book: OrderBook) -> OrderBookMessage:
+        bids, asks = order_book.snapshot
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+            "bids": bids[["price", "amount"]].values,
+            "asks": asks[["price", "amount"]].values,
+        }, timestamp=time.time())
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
@@ -6,7 +6,7 @@ cdef class EventLogger(EventListener):
         str _event_source
         object _logged_events
         object _generic_logged_events
-        object _order_filled_logged_events
+        object _fill_ledger
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
@@ -9,22 +9,29 @@ from typing import (
 
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.fill_ledger import FillLedger
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 max_order_filled_events: Optional[int] = FillLedger.DEFAULT_MAX_EVENTS):
         super().__init__()
         self._event_source = event_source
         # We limit the amount of events we keep reference to the most recent ones
-        # But we keep all references to order fill events, because they are required for PnL calculation
+        # The order fill events are kept in a ledger that also tracks the balance changes of all the fills
         self._generic_logged_events = deque(maxlen=50)
-        self._order_filled_logged_events = deque()
-        self._logged_events = {OrderFilledEvent: self._order_filled_logged_events}
+        self._fill_ledger = FillLedger(max_events=max_order_filled_events)
+        self._logged_events = {OrderFilledEvent: self._fill_ledger}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return list(self._generic_logged_events) + list(self._order_filled_logged_events)
+        return list(self._generic_logged_events) + self._fill_ledger.events
+
+    @property
+    def fill_ledger(self) -> FillLedger:
+        return self._fill_ledger
 
     @property
     def event_source(self) -> str:
@@ -32,7 +39,7 @@ cdef class EventLogger(EventListener):
 
     def clear(self):
         self._generic_logged_events.clear()
-        self._order_filled_logged_events.clear()
+        self._fill_ledger.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
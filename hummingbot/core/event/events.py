@@ -36,6 +36,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    UpdateEvent = 902
 
 
 class OrderBookDataSourceEvent(int, Enum):
@@ -147,6 +148,12 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookUpdateEvent(NamedTuple):
+    trading_pair: str
+    timestamp: float
+    update_id: int
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -0,0 +1,129 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.event.events import OrderFilledEvent
+
+s_decimal_0 = Decimal("0")
+
+
+class FillLedger:
+    """
+    Bounded store of order filled events.
+
+    Only the most recent `max_events` events are kept as objects. The balance changes caused by the fills are kept
+    per asset as running totals, indexed by the fill timestamps, to calculate the balance changes since any timestamp
+    with a binary search instead of scanning the events. The fills older than the retained events are folded into
+    the asset totals; they are not lost, since they are also stored in the trade fills table by the MarketsRecorder.
+    """
+
+    DEFAULT_MAX_EVENTS = 10000
+
+    def __init__(self, max_events: Optional[int] = DEFAULT_MAX_EVENTS):
+        self._max_events = max_events
+        self._events: Deque[OrderFilledEvent] = deque(maxlen=max_events)
+        # Per asset: the fill timestamps (sorted) and the asset balance change accumulated up to each fill (included)
+        self._timestamps: Dict[str, array] = {}
+        self._cumulative_balances: Dict[str, List[Decimal]] = {}
+        # Per asset: the accumulated balance change of the fills folded before the first indexed one
+        self._folded_balances: Dict[str, Decimal] = {}
+        # The timestamp of the newest folded fill
+        self._folded_until: float = float("-inf")
+        self._evicted_count: int = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @property
+    def events(self) -> List[OrderFilledEvent]:
+        return list(self._events)
+
+    @property
+    def evicted_count(self) -> int:
+        """
+        The number of fill events discarded since the ledger was created (or cleared) to keep it bounded
+        """
+        return self._evicted_count
+
+    def append(self, event: OrderFilledEvent):
+        if self._max_events is not None and len(self._events) == self._max_events:
+            self._evicted_count += 1
+        self._events.append(event)
+
+        base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
+        if event.trade_type is TradeType.BUY:
+            base_value = event.amount
+            quote_value = Decimal("-1") * event.price * event.amount
+        else:
+            base_value = Decimal("-1") * event.amount
+            quote_value = event.price * event.amount
+        self._add_balance_change(base, event.timestamp, base_value)
+        self._add_balance_change(quote, event.timestamp, quote_value)
+
+        if self._max_events is not None and self._evicted_count > 0 and self._evicted_count % self._max_events == 0:
+            self._fold(until_timestamp=self._events[0].timestamp)
+
+    def clear(self):
+        self._events.clear()
+        self._timestamps.clear()
+        self._cumulative_balances.clear()
+        self._folded_balances.clear()
+        self._folded_until = float("-inf")
+        self._evicted_count = 0
+
+    def balances_since(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Calculates the asset balance changes of the fills with a timestamp greater than the starting timestamp.
+        If the starting timestamp is older than the newest fill folded to keep the ledger bounded, all the folded fills
+        are included.
+        :param starting_timestamp: The starting timestamp (excluded)
+        :returns A dictionary of tokens and their balance change
+        """
+        balances = {}
+        include_folded = starting_timestamp < self._folded_until
+        for asset, timestamps in self._timestamps.items():
+            cumulative_balances = self._cumulative_balances[asset]
+            folded_balance = self._folded_balances.get(asset)
+            index = bisect_right(timestamps, starting_timestamp)
+            if index < len(timestamps):
+                balance = cumulative_balances[-1] - (
+                    cumulative_balances[index - 1] if index > 0 else (folded_balance or s_decimal_0))
+            elif include_folded and folded_balance is not None:
+                balance = s_decimal_0
+            else:
+                continue
+            if include_folded and folded_balance is not None:
+                balance += folded_balance
+            balances[asset] = balance
+        return balances
+
+    def _add_balance_change(self, asset: str, timestamp: float, balance_change: Decimal):
+        timestamps = self._timestamps.setdefault(asset, array("d"))
+        cumulative_balances = self._cumulative_balances.setdefault(asset, [])
+        if len(timestamps) == 0 or timestamps[-1] <= timestamp:
+            previous_balance = (cumulative_balances[-1] if len(cumulative_balances) > 0
+                                else self._folded_balances.get(asset, s_decimal_0))
+            timestamps.append(timestamp)
+            cumulative_balances.append(previous_balance + balance_change)
+        else:
+            # Fills arriving out of order shift the running totals of all the later fills
+            index = bisect_right(timestamps, timestamp)
+            previous_balance = (cumulative_balances[index - 1] if index > 0
+                                else self._folded_balances.get(asset, s_decimal_0))
+            timestamps.insert(index, timestamp)
+            cumulative_balances.insert(index, previous_balance + balance_change)
+            for i in range(index + 1, len(cumulative_balances)):
+                cumulative_balances[i] += balance_change
+
+    def _fold(self, until_timestamp: float):
+        for asset, timestamps in self._timestamps.items():
+            index = bisect_left(timestamps, until_timestamp)
+            if index > 0:
+                cumulative_balances = self._cumulative_balances[asset]
+                self._folded_balances[asset] = cumulative_balances[index - 1]
+                self._folded_until = max(self._folded_until, timestamps[index - 1])
+                del timestamps[:index]
+                del cumulative_balances[:index]
@@ -13,7 +13,7 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -30,7 +30,8 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are indexed in a
+    ConversionGraph each time they are refreshed, to find the rates from them without scanning the prices.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -51,6 +52,7 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._conversion_graph: Optional[ConversionGraph] = None
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -153,7 +155,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._get_conversion_graph().rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -185,6 +187,7 @@ class RateOracle(NetworkBase):
         while True:
             try:
                 self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                self._conversion_graph = self._build_conversion_graph()
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -193,3 +196,14 @@ class RateOracle(NetworkBase):
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
             await asyncio.sleep(1)
+
+    def _build_conversion_graph(self) -> ConversionGraph:
+        bridge_tokens = [self._quote_token] + [token for token in ConversionGraph.DEFAULT_BRIDGE_TOKENS
+                                               if token != self._quote_token]
+        return ConversionGraph(self._prices, bridge_tokens=bridge_tokens)
+
+    def _get_conversion_graph(self) -> ConversionGraph:
+        # The prices can be replaced outside the fetch loop (e.g. reset when the quote token changes)
+        if self._conversion_graph is None or self._conversion_graph.is_outdated(self._prices):
+            self._conversion_graph = self._build_conversion_graph()
+        return self._conversion_graph
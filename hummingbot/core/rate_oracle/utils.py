@@ -1,9 +1,92 @@
+from collections import deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
 
+s_decimal_0 = Decimal("0")
+s_decimal_1 = Decimal("1")
+
+
+class ConversionGraph:
+    """
+    Index of the conversion rates between tokens, built once from a dictionary of prices.
+
+    Each token is linked to the tokens it has a price with (in either direction). The rates of all the tokens in a
+    given quote token are calculated with a breadth-first search from the quote token, so that the shortest chain of
+    prices is used, going through the bridge tokens first when several chains have the same length. The rates in the
+    bridge tokens are calculated when the graph is built, and the rates in any other quote token the first time they
+    are requested, so that later lookups are dictionary accesses.
+    """
+
+    DEFAULT_BRIDGE_TOKENS = ("USDT", "USDC", "BTC", "ETH", "USD")
+
+    def __init__(self, prices: Dict[str, Decimal], bridge_tokens: Iterable[str] = DEFAULT_BRIDGE_TOKENS):
+        self._prices: Dict[str, Decimal] = prices
+        self._size: int = len(prices)
+        self._bridge_tokens: List[str] = list(bridge_tokens)
+        # For each token, the price of the token in each linked token
+        self._links: Dict[str, Dict[str, Decimal]] = {}
+        for pair, price in prices.items():
+            try:
+                base, quote = split_hb_trading_pair(trading_pair=pair)
+            except ValueError:
+                continue
+            if price is None or not price > s_decimal_0:
+                continue
+            self._links.setdefault(base, {})[quote] = price
+            self._links.setdefault(quote, {}).setdefault(base, s_decimal_1 / price)
+        # Rates of the tokens by quote token
+        self._rates: Dict[str, Dict[str, Decimal]] = {}
+        for token in self._bridge_tokens:
+            self._rates_in(token)
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices
+
+    def is_outdated(self, prices: Dict[str, Decimal]) -> bool:
+        """
+        Whether the graph was built from another dictionary of prices, or from this one before trading pairs were added
+        to it
+        """
+        return prices is not self._prices or len(prices) != self._size
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate of a trading pair, or None if the tokens are not linked by any chain of prices
+        :param pair: The trading pair
+        """
+        if pair in self._prices:
+            return self._prices[pair]
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return s_decimal_1
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in self._prices:
+            return s_decimal_1 / self._prices[reverse_pair]
+        return self._rates_in(quote).get(base)
+
+    def _rates_in(self, quote: str) -> Dict[str, Decimal]:
+        rates = self._rates.get(quote)
+        if rates is None:
+            rates = {quote: s_decimal_1} if quote in self._links else {}
+            queue = deque(rates)
+            while queue:
+                token = queue.popleft()
+                token_links = self._links[token]
+                bridge_links = [link for link in self._bridge_tokens if link in token_links]
+                for link in bridge_links + [link for link in token_links if link not in rates]:
+                    if link not in rates:
+                        # The price of the linked token in the current token, times the rate of the current token
+                        rates[link] = self._links[link][token] * rates[token]
+                        queue.append(link)
+            self._rates[quote] = rates
+        return rates
+
 
 def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     '''
@@ -13,25 +96,10 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
     A rate for HBOT-AAVE will be 100 / 50
     A rate for AAVE-HBOT will be 50 / 100
     A rate for HBOT-GBP will be 100 * 0.75
+    To find several rates from the same prices, build a ConversionGraph once instead.
     :param prices: The dictionary of trading pairs and their prices
     :param pair: The trading pair
     '''
     if pair in prices:
         return prices[pair]
-    base, quote = split_hb_trading_pair(trading_pair=pair)
-    base = unwrap_token_symbol(base)
-    quote = unwrap_token_symbol(quote)
-    if base == quote:
-        return Decimal("1")
-    reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
-    if reverse_pair in prices:
-        return Decimal("1") / prices[reverse_pair]
-    base_prices = {k: v for k, v in prices.items() if k.startswith(f"{base}-")}
-    for base_pair, proxy_price in base_prices.items():
-        link_quote = split_hb_trading_pair(base_pair)[1]
-        link_pair = combine_to_hb_trading_pair(base=link_quote, quote=quote)
-        if link_pair in prices:
-            return proxy_price * prices[link_pair]
-        common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
-        if common_denom_pair in prices:
-            return proxy_price / prices[common_denom_pair]
+    return ConversionGraph(prices, bridge_tokens=()).rate(pair)
@@ -0,0 +1,119 @@
+import csv
+import datetime
+import os
+import threading
+import time
+from shutil import move
+from typing import IO, Any, Optional, Sequence
+
+
+class AppendOnlyCSVWriter:
+    """
+    Appends rows to a CSV file through a buffered file handle that is kept open between writes.
+
+    The header of an existing file is checked only once, when the file is opened, by reading its first line. If it
+    does not match the header of the rows being written, the file is moved aside and a new file is started. The
+    buffered rows are flushed to disk at most flush_interval seconds after they are written (by a timer if no other
+    row is written in the meantime), and when the writer is flushed or closed.
+
+    The rows can be written from any thread: the markets recorder writes them from its database writer thread in
+    write-behind mode, so the flush timer is a thread and the writer methods are serialized by a lock.
+
+    Optionally, the file is rotated (moved aside and replaced by a new file) when it reaches max_file_size bytes,
+    or on the first write of each new day (UTC) if rotate_daily is set.
+    """
+
+    def __init__(self,
+                 file_path: str,
+                 flush_interval: float = 5.0,
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False):
+        self._file_path: str = file_path
+        self._flush_interval: float = flush_interval
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._file: Optional[IO] = None
+        self._csv_writer = None
+        self._header: Optional[Sequence[str]] = None
+        self._file_date: Optional[datetime.date] = None
+        self._last_flush_time: float = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock: threading.RLock = threading.RLock()
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def write_row(self, header: Sequence[str], row: Sequence[Any]):
+        header = tuple(header)
+        with self._lock:
+            if self._file is not None:
+                if header != self._header:
+                    # Reopening the file moves it aside, as its header does not match anymore
+                    self.close()
+                elif self._rotation_required():
+                    self._rotate()
+            if self._file is None:
+                self._open(header)
+            self._csv_writer.writerow(row)
+            time_since_flush = time.monotonic() - self._last_flush_time
+            if time_since_flush >= self._flush_interval:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval - time_since_flush, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.flush()
+            self._last_flush_time = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._cancel_flush_timer()
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _open(self, header: Sequence[str]):
+        if os.path.exists(self._file_path) and self._read_header() != header:
+            self._move_aside("_old_")
+
+        write_header = not os.path.exists(self._file_path) or os.path.getsize(self._file_path) == 0
+        self._file = open(self._file_path, mode="a", newline="")
+        self._csv_writer = csv.writer(self._file)
+        self._header = header
+        if write_header:
+            self._csv_writer.writerow(header)
+            self._file_date = self._current_date()
+        else:
+            self._file_date = datetime.datetime.utcfromtimestamp(os.path.getmtime(self._file_path)).date()
+
+    def _read_header(self) -> Optional[Sequence[str]]:
+        with open(self._file_path, newline="") as csv_file:
+            return tuple(next(csv.reader(csv_file), ()))
+
+    def _rotation_required(self) -> bool:
+        return ((self._max_file_size is not None and self._file.tell() >= self._max_file_size)
+                or (self._rotate_daily and self._current_date() != self._file_date))
+
+    def _rotate(self):
+        self.close()
+        self._move_aside("_")
+
+    def _move_aside(self, suffix_prefix: str):
+        timestamp = datetime.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        move(self._file_path, f"{self._file_path[:-4]}{suffix_prefix}{timestamp}.csv")
+
+    @staticmethod
+    def _current_date() -> datetime.date:
+        return datetime.datetime.utcnow().date()
@@ -0,0 +1,77 @@
+import bisect
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+class LatencyHistogram:
+    """
+    Histogram of latencies (in seconds) with fixed bucket upper bounds. Latencies greater than the last bound are
+    counted in an additional overflow bucket.
+    """
+
+    def __init__(self, bucket_bounds: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self._bucket_bounds: Tuple[float, ...] = tuple(sorted(bucket_bounds))
+        self._bucket_counts: List[int] = [0] * (len(self._bucket_bounds) + 1)
+        self._count: int = 0
+        self._total: float = 0
+        self._max: float = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        Returns the (upper bound, count) pairs of the histogram buckets. The upper bound of the overflow bucket is inf.
+        """
+        return list(zip(self._bucket_bounds + (float("inf"),), self._bucket_counts))
+
+    def record(self, latency: float):
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds, latency)] += 1
+        self._count += 1
+        self._total += latency
+        self._max = max(self._max, latency)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the requested percentile (0 to 100) of the latencies
+        """
+        if self._count == 0:
+            return 0
+        target = percentile / 100 * self._count
+        accumulated = 0
+        for bound, count in self.buckets:
+            accumulated += count
+            if accumulated >= target and count > 0:
+                return min(bound, self._max)
+        return self._max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self._max,
+        }
+
+    def reset(self):
+        self._bucket_counts = [0] * (len(self._bucket_bounds) + 1)
+        self._count = 0
+        self._total = 0
+        self._max = 0
+
+    def __repr__(self) -> str:
+        return (f"LatencyHistogram(count={self._count}, mean={self.mean:.6f}, p50={self.percentile(50):.6f}, "
+                f"p99={self.percentile(99):.6f}, max={self._max:.6f})")
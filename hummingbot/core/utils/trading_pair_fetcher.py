@@ -1,17 +1,39 @@
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import os
+import time
+from os.path import join, realpath
+from typing import Any, Awaitable, Dict, List, Optional, Set
 
-from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot import data_path
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, list_connector_configs
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
-from .async_utils import safe_ensure_future
+from .async_utils import safe_ensure_future, safe_gather
 
 
 class TradingPairFetcher:
+    """
+    Keeps the trading pairs of the connectors, used for trading pairs autocompletion and validation.
+
+    The trading pairs are stored in an on-disk cache and the cached trading pairs younger than the cache TTL are
+    loaded at startup. Only the trading pairs of the configured connectors (the connectors with a config file, the
+    paper trade exchanges and the gateway connections) are refreshed eagerly, the other connectors are refreshed
+    when their trading pairs are requested with `fetch_trading_pairs`. At most `MAX_CONCURRENT_FETCHES` connectors
+    are queried at the same time.
+
+    The connectors whose trading pairs could not be fetched are not queried again for `FAILED_FETCH_TTL` seconds
+    (e.g. while typing a command when an exchange is unreachable).
+    """
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
+    CACHE_TTL = 24 * 60 * 60
+    FAILED_FETCH_TTL = 60
+    MAX_CONCURRENT_FETCHES = 5
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._tpf_logger is None:
@@ -25,49 +47,147 @@ class TradingPairFetcher:
             cls._sf_shared_instance = TradingPairFetcher(client_config_map)
         return cls._sf_shared_instance
 
+    @staticmethod
+    def trading_pairs_cache_path() -> str:
+        return realpath(join(data_path(), "trading_pairs_cache.json"))
+
     def __init__(self, client_config_map: ClientConfigAdapter):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        # The cached trading pairs and the timestamp they were fetched at, by connector name
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        # The time of the last failed fetch, by connector name (not saved in the on-disk cache)
+        self._failed_fetch_times: Dict[str, float] = {}
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
-            self,
-            connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
-        connector = connector_setting.non_trading_connector_instance_with_default_configuration()
-        safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
-
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
+        self._load_cache()
         connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
+        configured_connectors = self._configured_connector_names(client_config_map)
+        stale_connectors = [
+            name for name in connector_settings if name in configured_connectors and not self._is_cached(name)
+        ]
+        await safe_gather(*[self._fetch_connector_trading_pairs(name) for name in stale_connectors])
+        self.ready = True
+
+    def fetch_trading_pairs(self, connector_name: str):
+        """
+        Refreshes the trading pairs of the connector in the background, unless they are already cached. The refresh
+        is only started once the trading pairs of the configured connectors have been fetched.
+        """
+        if (
+            self.ready
+            and connector_name in self._all_connector_settings()
+            and not self._is_cached(connector_name)
+            and not self._fetch_failed_recently(connector_name)
+            and connector_name not in self._fetch_tasks
+        ):
+            safe_ensure_future(self._fetch_connector_trading_pairs(connector_name))
+
+    async def _fetch_connector_trading_pairs(self, connector_name: str):
+        task = self._fetch_tasks.get(connector_name)
+        if task is None:
+            task = safe_ensure_future(self._fetch_and_cache(connector_name))
+            self._fetch_tasks[connector_name] = task
+            task.add_done_callback(lambda _: self._fetch_tasks.pop(connector_name, None))
+        await asyncio.shield(task)
+
+    async def _fetch_and_cache(self, connector_name: str):
+        connector_settings = self._all_connector_settings()
+        conn_setting = connector_settings[connector_name]
+        if conn_setting.base_name().endswith("paper_trade"):
+            # Paper trade connectors share the trading pairs of the connector they simulate
+            parent_name = conn_setting.parent_name
+            if parent_name in connector_settings and not self._is_cached(parent_name):
+                await self._fetch_connector_trading_pairs(parent_name)
+            if self._is_cached(parent_name):
+                self._cache[connector_name] = self._cache[parent_name]
+                self.trading_pairs[connector_name] = self._cache[parent_name]["trading_pairs"]
+            else:
+                self.trading_pairs.setdefault(connector_name, [])
+                self._failed_fetch_times[connector_name] = time.time()
+            return
+
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        async with self._fetch_semaphore:
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
+            fetched = False
             try:
-                if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                connector = conn_setting.non_trading_connector_instance_with_default_configuration()
             except ModuleNotFoundError:
-                continue
+                pass
             except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
                                         "Please check the logs")
+            else:
+                fetched = await self.call_fetch_pairs(connector.all_trading_pairs(), connector_name)
+        if fetched:
+            self._failed_fetch_times.pop(connector_name, None)
+            self._cache[connector_name] = {"timestamp": time.time(), "trading_pairs": self.trading_pairs[connector_name]}
+            self._save_cache()
+        else:
+            self._failed_fetch_times[connector_name] = time.time()
 
-        self.ready = True
-
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    async def call_fetch_pairs(self, fetch_fn: Awaitable[List[str]], exchange_name: str) -> bool:
         try:
             pairs = await fetch_fn
             self.trading_pairs[exchange_name] = pairs
+            return True
         except Exception:
             self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
                                 f"Trading pairs autocompletion won't work.", exc_info=True)
             # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            self.trading_pairs.setdefault(exchange_name, [])
+            return False
+
+    def _is_cached(self, connector_name: str) -> bool:
+        cache_entry = self._cache.get(connector_name)
+        return cache_entry is not None and time.time() - cache_entry["timestamp"] < self.CACHE_TTL
+
+    def _fetch_failed_recently(self, connector_name: str) -> bool:
+        failed_fetch_time = self._failed_fetch_times.get(connector_name)
+        return failed_fetch_time is not None and time.time() - failed_fetch_time < self.FAILED_FETCH_TTL
+
+    def _load_cache(self):
+        try:
+            with open(self.trading_pairs_cache_path()) as fd:
+                self._cache = json.load(fd)
+        except (OSError, ValueError):
+            self._cache = {}
+        for connector_name in self._cache:
+            if self._is_cached(connector_name):
+                self.trading_pairs.setdefault(connector_name, self._cache[connector_name]["trading_pairs"])
+
+    def _save_cache(self):
+        cache_path = self.trading_pairs_cache_path()
+        temp_cache_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_cache_path, "w") as fd:
+                json.dump(self._cache, fd)
+            os.replace(temp_cache_path, cache_path)
+        except OSError:
+            self.logger().warning("Could not save the trading pairs cache.", exc_info=True)
+
+    def _configured_connector_names(self, client_config_map: ClientConfigAdapter) -> Set[str]:
+        from hummingbot.client import settings
+
+        configured_connectors = set(settings.required_exchanges)
+        try:
+            configured_connectors.update(file_path.stem for file_path in list_connector_configs())
+        except OSError:
+            pass
+        configured_connectors.update(
+            f"{exchange}_paper_trade" for exchange in client_config_map.paper_trade.paper_trade_exchanges
+        )
+        configured_connectors.update(
+            name for name, conn_setting in self._all_connector_settings().items()
+            if conn_setting.uses_gateway_generic_connector()
+        )
+        return configured_connectors
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
@@ -7,6 +7,8 @@ HEALTH_CHECK_ENDPOINT = "/fapi/v1/ping"
 CANDLES_ENDPOINT = "/fapi/v1/klines"
 
 WSS_URL = "wss://fstream.binance.com/ws"
+COMBINED_STREAM_WSS_URL = "wss://fstream.binance.com/stream"
+MAX_STREAMS_PER_CONNECTION = 200
 
 INTERVALS = bidict({
     "1s": 1,
@@ -21,13 +21,18 @@ class BinanceSpotCandles(CandlesBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
-        super().__init__(trading_pair, interval, max_records)
+    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150, store_candles: bool = False,
+                 shared_stream: bool = False):
+        super().__init__(trading_pair, interval, max_records, store_candles, shared_stream)
 
     @property
     def name(self):
         return f"binance_spot_{self._trading_pair}"
 
+    @property
+    def connector_name(self):
+        return "binance"
+
     @property
     def rest_url(self):
         return CONSTANTS.REST_URL
@@ -36,6 +41,18 @@ class BinanceSpotCandles(CandlesBase):
     def wss_url(self):
         return CONSTANTS.WSS_URL
 
+    @property
+    def combined_stream_url(self):
+        return CONSTANTS.COMBINED_STREAM_WSS_URL
+
+    @property
+    def max_streams_per_connection(self):
+        return CONSTANTS.MAX_STREAMS_PER_CONNECTION
+
+    @property
+    def stream_name(self):
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
     @property
     def health_check_url(self):
         return self.rest_url + CONSTANTS.HEALTH_CHECK_ENDPOINT
@@ -78,6 +95,7 @@ class BinanceSpotCandles(CandlesBase):
         return np.array(candles)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(np.float)
 
     async def fill_historical_candles(self):
+        await self._fill_candles_from_store()
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
         while not self.is_ready:
@@ -88,9 +106,10 @@ class BinanceSpotCandles(CandlesBase):
                     # we have to add one more since, the last row is not going to be included
                     candles = await self.fetch_candles(end_time=end_timestamp, limit=missing_records + 1)
                     # we are computing again the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
+                    # modify the buffer and if we extend it, the new observations are going to be dropped.
                     missing_records = self._candles.maxlen - len(self._candles)
-                    self._candles.extendleft(candles[-(missing_records + 1):-1][::-1])
+                    self._store_candles(candles[:-1])
+                    self._add_historical_candles(candles[-(missing_records + 1):-1])
                     requests_executed += 1
                 else:
                     self.logger().error(f"There is no data available for the quantity of "
@@ -111,7 +130,7 @@ class BinanceSpotCandles(CandlesBase):
         """
         try:
             candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
+            candle_params.append(self.stream_name)
             payload = {
                 "method": "SUBSCRIBE",
                 "params": candle_params,
@@ -130,32 +149,25 @@ class BinanceSpotCandles(CandlesBase):
             )
             raise
 
-    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                high = data["k"]["h"]
-                low = data["k"]["l"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    await self.fill_historical_candles()
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+    async def _process_candle_message(self, data: Dict[str, Any]):
+        if data.get("e") == "kline":
+            timestamp = data["k"]["t"]
+            open = data["k"]["o"]
+            high = data["k"]["h"]
+            low = data["k"]["l"]
+            close = data["k"]["c"]
+            volume = data["k"]["v"]
+            quote_asset_volume = data["k"]["q"]
+            n_trades = data["k"]["n"]
+            taker_buy_base_volume = data["k"]["V"]
+            taker_buy_quote_volume = data["k"]["Q"]
+            candle = np.array([timestamp, open, high, low, close, volume, quote_asset_volume, n_trades,
+                               taker_buy_base_volume, taker_buy_quote_volume], dtype=float)
+            if len(self._candles) == 0:
+                self._add_candle(candle)
+                await self.fill_historical_candles()
+            elif timestamp > int(self._candles[-1][0]):
+                # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+                self._add_candle(candle)
+            elif timestamp == int(self._candles[-1][0]):
+                self._update_last_candle(candle)
@@ -1,7 +1,7 @@
 import asyncio
-from collections import deque
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -10,23 +10,37 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicator
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.candles_stream_manager import CandlesStreamManager
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a NumPy buffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
+    Indicators added with add_indicator are updated incrementally with every candle update.
+    With store_candles enabled the closed candles are also kept in an on-disk CandlesStore. When the feed starts, the
+    stored candles are loaded and only the candles missing in the store are fetched.
+    With shared_stream enabled the feed receives its candles from the CandlesStreamManager of the exchange, which
+    multiplexes the streams of all the feeds over a few websocket connections, instead of opening its own connection.
     """
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
+    candles_page_size = 1000
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
+    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150, store_candles: bool = False,
+                 shared_stream: bool = False):
         super().__init__()
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
+        self._indicators: List[CandlesIndicator] = []
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -35,13 +49,28 @@ class CandlesBase(NetworkBase):
         else:
             self.logger().exception(f"Interval {interval} is not supported. Available Intervals: {self.intervals.keys()}")
             raise
+        self._candles_store: Optional[CandlesStore] = None
+        if store_candles:
+            self._candles_store = CandlesStore(connector_name=self.connector_name,
+                                               trading_pair=trading_pair,
+                                               interval_seconds=self.intervals[interval],
+                                               n_columns=len(self.columns),
+                                               max_records=max_records)
+        self._stream_manager: Optional[CandlesStreamManager] = None
+        if shared_stream:
+            self._stream_manager = CandlesStreamManager.get_instance(self.combined_stream_url,
+                                                                     self.max_streams_per_connection)
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network and starts a task for listen_for_subscriptions, or for
+        listen_for_shared_stream if the feed uses a shared stream.
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._stream_manager is None:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_shared_stream())
 
     async def stop_network(self):
         """
@@ -54,7 +83,7 @@ class CandlesBase(NetworkBase):
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -62,6 +91,10 @@ class CandlesBase(NetworkBase):
     def name(self):
         raise NotImplementedError
 
+    @property
+    def connector_name(self):
+        raise NotImplementedError
+
     @property
     def rest_url(self):
         raise NotImplementedError
@@ -78,6 +111,21 @@ class CandlesBase(NetworkBase):
     def wss_url(self):
         raise NotImplementedError
 
+    @property
+    def combined_stream_url(self):
+        raise NotImplementedError
+
+    @property
+    def max_streams_per_connection(self):
+        raise NotImplementedError
+
+    @property
+    def stream_name(self):
+        """
+        The name of the candles stream of the trading pair and interval in the exchange
+        """
+        raise NotImplementedError
+
     @property
     def rate_limits(self):
         raise NotImplementedError
@@ -92,9 +140,37 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame wrapping the read-only view of the buffer is only rebuilt when a candle is added or removed. Each
+        call returns a copy of it (a single copy of the candles array), which the caller can modify.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_version != self._candles.view_version:
+            self._candles_df = pd.DataFrame(self._candles.values, columns=self.columns, copy=False)
+            self._candles_df_version = self._candles.view_version
+        return self._candles_df.copy()
+
+    @property
+    def indicators_values(self) -> Dict[str, float]:
+        """
+        This property returns the current values of all the indicators added to the feed, by indicator name.
+        """
+        values = {}
+        for indicator in self._indicators:
+            values.update(indicator.values)
+        return values
+
+    def add_indicator(self, indicator: CandlesIndicator) -> CandlesIndicator:
+        """
+        Adds an indicator to be updated with every candle update. It is initialized with the candles already stored.
+        :param indicator: the indicator to add
+        :return: the added indicator
+        """
+        self._indicators.append(indicator)
+        indicator.reset(self._candles.values[:, self.columns.index(indicator.column)])
+        return indicator
+
+    def remove_indicator(self, indicator: CandlesIndicator):
+        self._indicators.remove(indicator)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -114,10 +190,74 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
+    async def _fill_candles_from_store(self):
+        """
+        Inserts the stored candles of the buffer window before the current candle, fetching the candles missing in the
+        store: the holes between stored candles (e.g. while the bot was stopped) and the candles between the newest
+        stored candle and the current one. The stored candles are ignored if none of them is within the buffer window,
+        or if the missing candles can't be fetched.
+        """
+        if self._candles_store is None or len(self._candles) != 1:
+            return
+        current_timestamp = self._candles[0][0]
+        interval_ms = self.intervals[self.interval] * 1000
+        window_start = current_timestamp - (self._candles.maxlen - 1) * interval_ms
+        stored_candles = self._candles_store.load(self._candles.maxlen)
+        stored_candles = stored_candles[(stored_candles[:, 0] >= window_start) &
+                                        (stored_candles[:, 0] < current_timestamp)]
+        if len(stored_candles) == 0:
+            return
+        timestamps = np.append(stored_candles[:, 0], current_timestamp)
+        holes = np.flatnonzero(np.diff(timestamps) > interval_ms)
+        if len(holes) > 0:
+            try:
+                missing_candles = [
+                    await self._fetch_candles_between(start_time=int(timestamps[hole] + interval_ms),
+                                                      end_time=int(timestamps[hole + 1] - 1))
+                    for hole in holes]
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error occurred when getting the klines missing in the candles "
+                                        "store. Fetching all the historical klines...")
+                return
+            missing_candles = np.concatenate(missing_candles)
+            self._store_candles(missing_candles)
+            stored_candles = np.concatenate((stored_candles, missing_candles))
+            stored_candles = stored_candles[np.argsort(stored_candles[:, 0], kind="stable")]
+        if len(self._candles) == 1:
+            self._add_historical_candles(stored_candles)
+
+    async def _fetch_candles_between(self, start_time: int, end_time: int) -> np.ndarray:
+        """
+        Fetches the candles between the start and the end time (both included), one page at a time.
+        """
+        pages = []
+        while start_time <= end_time:
+            candles = await self.fetch_candles(start_time=start_time, end_time=end_time, limit=self.candles_page_size)
+            page_size = len(candles)
+            candles = candles[(candles[:, 0] >= start_time) & (candles[:, 0] <= end_time)]
+            if len(candles) == 0:
+                break
+            pages.append(candles)
+            if page_size < self.candles_page_size:
+                break
+            start_time = int(candles[-1][0]) + 1
+        if len(pages) == 0:
+            return np.empty((0, len(self.columns)), dtype=float)
+        return np.concatenate(pages)
+
+    def _store_candles(self, candles: Sequence[Sequence[float]]):
+        """
+        Adds closed candles to the candles store, if enabled.
+        """
+        if self._candles_store is not None:
+            self._candles_store.append(candles)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the candlestick websocket endpoint and listens to the messages sent by the
@@ -141,6 +281,26 @@ class CandlesBase(NetworkBase):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def listen_for_shared_stream(self):
+        """
+        Subscribes to the candles stream in the shared stream manager and processes the messages received.
+        """
+        queue = self._stream_manager.subscribe(self.stream_name)
+        try:
+            while True:
+                data = await queue.get()
+                try:
+                    if data is None:  # the shared connection was interrupted
+                        await self._on_order_stream_interruption()
+                    else:
+                        await self._process_candle_message(data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    self.logger().exception("Unexpected error occurred when processing public klines.")
+        finally:
+            self._stream_manager.unsubscribe(self.stream_name, queue)
+
     async def _connected_websocket_assistant(self) -> WSAssistant:
         ws: WSAssistant = await self._api_factory.get_ws_assistant()
         await ws.connect(ws_url=self.wss_url,
@@ -155,6 +315,15 @@ class CandlesBase(NetworkBase):
         raise NotImplementedError
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data = ws_response.data
+            if data is not None:  # data will be None when the websocket is disconnected
+                await self._process_candle_message(data)
+
+    async def _process_candle_message(self, data: Dict):
+        """
+        Processes a candles stream message, received through the feed websocket connection or the shared stream.
+        """
         raise NotImplementedError
 
     async def _sleep(self, delay):
@@ -163,6 +332,37 @@ class CandlesBase(NetworkBase):
         """
         await asyncio.sleep(delay)
 
+    def _add_candle(self, candle: Sequence[float]):
+        """
+        Appends a new candle, closing the previous last candle.
+        """
+        if len(self._candles) > 0:
+            self._store_candles(self._candles[-1])
+        self._candles.append(candle)
+        for indicator in self._indicators:
+            indicator.append(self._candles[-1][self.columns.index(indicator.column)])
+
+    def _update_last_candle(self, candle: Sequence[float]):
+        """
+        Replaces the last candle with its updated version.
+        """
+        self._candles[-1] = candle
+        for indicator in self._indicators:
+            indicator.update_last(self._candles[-1][self.columns.index(indicator.column)])
+
+    def _add_historical_candles(self, candles: Sequence[Sequence[float]]):
+        """
+        Inserts the candles (sorted from the oldest to the newest one) before the stored candles, and recalculates the
+        indicators.
+        """
+        self._candles.prepend(candles)
+        self._reset_indicators()
+
+    def _reset_indicators(self):
+        for indicator in self._indicators:
+            indicator.reset(self._candles.values[:, self.columns.index(indicator.column)])
+
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
         self._candles.clear()
+        self._reset_indicators()
@@ -0,0 +1,103 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Fixed size buffer of candles stored in a preallocated NumPy array, with one column per candle field. When the
+    buffer is full, appending a candle drops the oldest one.
+
+    The array has room for twice the maximum number of candles, so that the stored candles are always contiguous and
+    can be exposed as a read-only view (values) without copying them. When the array is exhausted, the candles are
+    moved to a new array (amortized O(1) per append). Views returned before that keep pointing to the previous array,
+    so they are never overwritten by later appends. Updates of the last candle are done in place, and are visible
+    through the views containing it.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen: int = maxlen
+        self._n_columns: int = n_columns
+        self._data: np.ndarray = np.empty((2 * maxlen, n_columns), dtype=float)
+        # Start in the middle of the array, to leave room for prepending historical candles
+        self._start: int = maxlen
+        self._end: int = maxlen
+        self._view_version: int = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Returns a read-only view of the stored candles, from the oldest to the newest one
+        """
+        view = self._data[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def view_version(self) -> int:
+        """
+        Returns a number that changes every time the set of stored candles changes (the in place updates of the last
+        candle do not change it)
+        """
+        return self._view_version
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        return self.values[index]
+
+    def __setitem__(self, index: int, candle: Sequence[float]):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CandlesBuffer index out of range")
+        self._data[self._start + index] = candle
+
+    def append(self, candle: Sequence[float]):
+        if self._end == self._data.shape[0]:
+            self._move_to_new_array(start=0)
+        self._data[self._end] = candle
+        self._end += 1
+        if len(self) > self._maxlen:
+            self._start += 1
+        self._view_version += 1
+
+    def prepend(self, candles: Sequence[Sequence[float]]):
+        """
+        Inserts the candles (sorted from the oldest to the newest one) before the stored candles. If they do not fit
+        in the buffer, the oldest ones are discarded.
+        """
+        candles = np.asarray(candles, dtype=float).reshape(-1, self._n_columns)
+        candles = candles[max(len(candles) - (self._maxlen - len(self)), 0):]
+        if len(candles) == 0:
+            return
+        if len(candles) > self._start:
+            self._move_to_new_array(start=self._maxlen)
+        self._data[self._start - len(candles):self._start] = candles
+        self._start -= len(candles)
+        self._view_version += 1
+
+    def pop(self) -> np.ndarray:
+        if len(self) == 0:
+            raise IndexError("pop from an empty CandlesBuffer")
+        self._end -= 1
+        self._view_version += 1
+        return self._data[self._end].copy()
+
+    def clear(self):
+        self._start = self._end = self._maxlen
+        self._view_version += 1
+
+    def _move_to_new_array(self, start: int):
+        # The candles are copied to a new array instead of moved inside the current one, to keep the previous views valid
+        new_data = np.empty_like(self._data)
+        length = len(self)
+        new_data[start:start + length] = self._data[self._start:self._end]
+        self._data = new_data
+        self._start = start
+        self._end = start + length
@@ -8,12 +8,16 @@ class CandlesFactory:
     It has a class method, get_candle which takes in a connector, trading pair, interval, and max_records as parameters.
     Based on the connector provided, the method returns either a BinancePerpetualsCandles or a BinanceSpotCandles object.
     If an unsupported connector is provided, it raises an exception.
+    With store_candles enabled the candles are also kept in an on-disk store shared by the bots, see CandlesStore.
+    The candles feeds share the websocket connections of the exchange (see CandlesStreamManager), unless shared_stream
+    is disabled.
     """
     @classmethod
-    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500):
+    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500,
+                   store_candles: bool = False, shared_stream: bool = True):
         if connector == "binance_perpetual":
-            return BinancePerpetualCandles(trading_pair, interval, max_records)
+            return BinancePerpetualCandles(trading_pair, interval, max_records, store_candles, shared_stream)
         elif connector == "binance":
-            return BinanceSpotCandles(trading_pair, interval, max_records)
+            return BinanceSpotCandles(trading_pair, interval, max_records, store_candles, shared_stream)
         else:
             raise Exception(f"The connector {connector} is not available. Please select another one.")
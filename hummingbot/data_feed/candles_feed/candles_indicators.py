@@ -0,0 +1,216 @@
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+
+NaN = float("nan")
+
+
+class CandlesIndicator:
+    """
+    Base class of the indicators updated incrementally by CandlesBase, in O(1) per candle.
+
+    The last candle of the feed is still open, and is updated until the next candle starts. The indicators keep the
+    state computed with the closed candles, and calculate their current values from it and the last candle:
+    - append is called when a new candle starts, which closes the previous last candle
+    - update_last is called when the last candle changes
+    - reset is called when the whole history changes (e.g. when the historical candles are loaded)
+    """
+
+    def __init__(self, column: str = "close"):
+        self.column: str = column
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """
+        Returns the current values of the indicator, by name (using the pandas_ta column names)
+        """
+        raise NotImplementedError
+
+    def append(self, value: float):
+        raise NotImplementedError
+
+    def update_last(self, value: float):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def reset(self, values: Sequence[float]):
+        self.clear()
+        for value in values:
+            self.append(value)
+
+
+class EMAIndicator(CandlesIndicator):
+    """
+    Exponential moving average, equivalent to pandas' ewm(span=length, adjust=False).mean()
+    """
+
+    def __init__(self, length: int, column: str = "close"):
+        super().__init__(column=column)
+        self._length: int = length
+        self._alpha: float = 2 / (length + 1)
+        self.clear()
+
+    @property
+    def name(self) -> str:
+        return f"EMA_{self._length}"
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def values(self) -> Dict[str, float]:
+        return {self.name: self._value}
+
+    def append(self, value: float):
+        if self._has_last:
+            self._closed_value = self._value
+        self._has_last = True
+        self.update_last(value)
+
+    def update_last(self, value: float):
+        if self._closed_value is None:
+            self._value = value
+        else:
+            self._value = self._alpha * value + (1 - self._alpha) * self._closed_value
+
+    def clear(self):
+        self._has_last: bool = False
+        self._closed_value: Optional[float] = None
+        self._value: float = NaN
+
+
+class RSIIndicator(CandlesIndicator):
+    """
+    Relative strength index with Wilder's smoothing of the gains and losses, equivalent to calculating the averages
+    with pandas' ewm(alpha=1 / length, adjust=False, min_periods=length).mean() over the price changes
+    """
+
+    def __init__(self, length: int = 14, column: str = "close"):
+        super().__init__(column=column)
+        self._length: int = length
+        self._alpha: float = 1 / length
+        self.clear()
+
+    @property
+    def name(self) -> str:
+        return f"RSI_{self._length}"
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def values(self) -> Dict[str, float]:
+        return {self.name: self._value}
+
+    def append(self, value: float):
+        if self._last is not None:
+            if self._closed_last is not None:
+                self._closed_avg_gain, self._closed_avg_loss = self._averages(self._last - self._closed_last)
+                self._closed_changes += 1
+            self._closed_last = self._last
+        self.update_last(value)
+
+    def update_last(self, value: float):
+        self._last = value
+        if self._closed_last is None or self._closed_changes + 1 < self._length:
+            self._value = NaN
+            return
+        avg_gain, avg_loss = self._averages(value - self._closed_last)
+        self._value = 100 * avg_gain / (avg_gain + avg_loss) if avg_gain + avg_loss > 0 else NaN
+
+    def clear(self):
+        self._closed_last: Optional[float] = None
+        self._closed_changes: int = 0
+        self._closed_avg_gain: float = 0
+        self._closed_avg_loss: float = 0
+        self._last: Optional[float] = None
+        self._value: float = NaN
+
+    def _averages(self, change: float):
+        gain = max(change, 0)
+        loss = max(-change, 0)
+        if self._closed_changes == 0:
+            return gain, loss
+        return (self._alpha * gain + (1 - self._alpha) * self._closed_avg_gain,
+                self._alpha * loss + (1 - self._alpha) * self._closed_avg_loss)
+
+
+class BollingerBandsIndicator(CandlesIndicator):
+    """
+    Bollinger bands over the last length candles, using the population standard deviation (pandas_ta bbands default).
+    The rolling sums are recalculated from the window periodically, to avoid accumulating rounding errors.
+    """
+    RECALCULATION_INTERVAL = 1000
+
+    def __init__(self, length: int = 20, std: float = 2.0, column: str = "close"):
+        super().__init__(column=column)
+        self._length: int = length
+        self._std: float = std
+        self.clear()
+
+    @property
+    def lower(self) -> float:
+        return self._lower
+
+    @property
+    def middle(self) -> float:
+        return self._middle
+
+    @property
+    def upper(self) -> float:
+        return self._upper
+
+    @property
+    def percent(self) -> float:
+        return self._percent
+
+    @property
+    def values(self) -> Dict[str, float]:
+        suffix = f"{self._length}_{float(self._std)}"
+        return {
+            f"BBL_{suffix}": self._lower,
+            f"BBM_{suffix}": self._middle,
+            f"BBU_{suffix}": self._upper,
+            f"BBP_{suffix}": self._percent,
+        }
+
+    def append(self, value: float):
+        if self._last is not None:
+            self._closed_window.append(self._last)
+            self._closed_sum += self._last
+            self._closed_sum_of_squares += self._last * self._last
+            if len(self._closed_window) == self._length:
+                # Keep the length - 1 closed candles needed to calculate the bands with the last candle
+                removed = self._closed_window.popleft()
+                self._closed_sum -= removed
+                self._closed_sum_of_squares -= removed * removed
+            self._appended += 1
+            if self._appended % self.RECALCULATION_INTERVAL == 0:
+                self._closed_sum = sum(self._closed_window)
+                self._closed_sum_of_squares = sum(closed * closed for closed in self._closed_window)
+        self.update_last(value)
+
+    def update_last(self, value: float):
+        self._last = value
+        if len(self._closed_window) + 1 < self._length:
+            self._lower = self._middle = self._upper = self._percent = NaN
+            return
+        mean = (self._closed_sum + value) / self._length
+        variance = max((self._closed_sum_of_squares + value * value) / self._length - mean * mean, 0)
+        deviation = self._std * math.sqrt(variance)
+        self._middle = mean
+        self._lower = mean - deviation
+        self._upper = mean + deviation
+        self._percent = (value - self._lower) / (self._upper - self._lower) if deviation > 0 else NaN
+
+    def clear(self):
+        self._closed_window: Deque[float] = deque()
+        self._closed_sum: float = 0
+        self._closed_sum_of_squares: float = 0
+        self._appended: int = 0
+        self._last: Optional[float] = None
+        self._lower = self._middle = self._upper = self._percent = NaN
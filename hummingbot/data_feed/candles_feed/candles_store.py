@@ -0,0 +1,146 @@
+import logging
+import os
+from contextlib import contextmanager
+from os.path import join, realpath
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class CandlesStore:
+    """
+    On-disk store of the closed candles of a trading pair, keyed by connector, trading pair and interval, shared by the
+    candles feeds of all the bot processes using the same data directory.
+
+    The candles are stored as rows of float64 values (one value per candle column) in a raw binary file, and new
+    candles are appended at the end of the file with a single write. Rows may be duplicated or out of order (e.g. when
+    two processes store the same candle, or when older candles are backfilled), so the candles are sorted and
+    deduplicated by timestamp when they are loaded. Once the file holds more than twice the retained number of candles
+    it is compacted: the newest candles are written to a new file that replaces the previous one.
+
+    The appends and the compactions are done holding an exclusive lock on a lock file next to the store, so that the
+    candles appended by a process while another one compacts the store are not lost with the replaced file. Readers
+    don't need the lock, the file is only ever appended to or atomically replaced. The lock is not available on
+    Windows, where a single process should store the candles of each trading pair and interval.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @staticmethod
+    def candles_store_path() -> str:
+        return realpath(join(data_path(), "candles"))
+
+    def __init__(self, connector_name: str, trading_pair: str, interval_seconds: int, n_columns: int,
+                 max_records: int):
+        """
+        :param connector_name: the name of the connector the candles are fetched from
+        :param trading_pair: the trading pair of the candles
+        :param interval_seconds: the duration of the candles interval in seconds (the interval labels can't be used in
+        file names, since "1m" and "1M" would be the same file in case insensitive file systems)
+        :param n_columns: the number of values of each candle
+        :param max_records: the number of candles retained when the store is compacted
+        """
+        self._n_columns = n_columns
+        self._max_records = max_records
+        self._row_size = n_columns * np.dtype(np.float64).itemsize
+        self._path = join(self.candles_store_path(), connector_name, f"{trading_pair}_{interval_seconds}s.bin")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def lock_path(self) -> str:
+        return f"{self._path}.lock"
+
+    def load(self, max_records: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the stored candles sorted by timestamp without duplicates (the last stored version of each candle is
+        kept), limited to the newest max_records candles.
+        """
+        try:
+            candles = np.fromfile(self._path, dtype=np.float64)
+        except (FileNotFoundError, ValueError):
+            return np.empty((0, self._n_columns), dtype=float)
+        # A row partially written by a process that crashed while appending it is ignored
+        rows_count = candles.size // self._n_columns
+        candles = candles[:rows_count * self._n_columns].reshape(rows_count, self._n_columns)
+
+        timestamps = candles[:, 0]
+        if rows_count > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+            _, reversed_indexes = np.unique(timestamps[::-1], return_index=True)
+            candles = candles[rows_count - 1 - reversed_indexes]
+        if max_records is not None:
+            candles = candles[-max_records:]
+        return candles
+
+    def append(self, candles: Sequence[Sequence[float]]):
+        """
+        Appends the candles to the store, compacting it if needed. The errors writing the store are logged and ignored,
+        the candles feed keeps working without it.
+        """
+        candles = np.asarray(candles, dtype=np.float64).reshape(-1, self._n_columns)
+        if len(candles) == 0:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with self._exclusive_lock():
+                fd = os.open(self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+                try:
+                    file_size = os.fstat(fd).st_size
+                    if file_size % self._row_size != 0:
+                        os.ftruncate(fd, file_size - file_size % self._row_size)
+                    os.write(fd, candles.tobytes())
+                    rows_count = os.fstat(fd).st_size // self._row_size
+                finally:
+                    os.close(fd)
+                if rows_count > 2 * self._max_records:
+                    self._compact()
+        except OSError:
+            self.logger().warning(f"Could not store the candles in {self._path}.", exc_info=True)
+
+    def compact(self):
+        """
+        Rewrites the store with only the newest retained candles, sorted and without duplicates.
+        """
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with self._exclusive_lock():
+                self._compact()
+        except OSError:
+            self.logger().warning(f"Could not compact the candles store {self._path}.", exc_info=True)
+
+    def _compact(self):
+        candles = self.load(self._max_records)
+        temp_path = f"{self._path}.{os.getpid()}.tmp"
+        try:
+            candles.tofile(temp_path)
+            os.replace(temp_path, self._path)
+        except OSError:
+            self.logger().warning(f"Could not compact the candles store {self._path}.", exc_info=True)
+
+    @contextmanager
+    def _exclusive_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            # Closing the file releases the lock
+            os.close(lock_fd)
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+class CandlesStreamConnection:
+    """
+    A websocket connection of a CandlesStreamManager, subscribed to a set of candles streams. The subscriptions are
+    sent in batches, at most one subscription message every `subscriptions_interval` seconds, to respect the limit of
+    incoming messages of the exchange.
+    """
+
+    def __init__(self, manager: "CandlesStreamManager"):
+        self._manager = manager
+        self._streams: Set[str] = set()
+        # The streams subscribed through the current websocket connection
+        self._subscribed_streams: Set[str] = set()
+        self._subscriptions_changed = asyncio.Event()
+        self._request_id = 0
+        self._listen_task: Optional[asyncio.Task] = None
+
+    @property
+    def streams(self) -> Set[str]:
+        return self._streams
+
+    def add_stream(self, stream_name: str):
+        self._streams.add(stream_name)
+        self._subscriptions_changed.set()
+        if self._listen_task is None:
+            self._listen_task = safe_ensure_future(self._listen())
+
+    def remove_stream(self, stream_name: str):
+        self._streams.discard(stream_name)
+        self._subscriptions_changed.set()
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+
+    async def _listen(self):
+        while True:
+            ws: Optional[WSAssistant] = None
+            subscriptions_task: Optional[asyncio.Task] = None
+            try:
+                ws = await self._manager._connected_websocket_assistant()
+                self._subscribed_streams = set()
+                self._subscriptions_changed.set()
+                subscriptions_task = safe_ensure_future(self._update_subscriptions(ws))
+                async for ws_response in ws.iter_messages():
+                    data = ws_response.data
+                    # The combined streams messages are wrapped with the stream name, the responses to the
+                    # subscription requests are not
+                    if isinstance(data, dict) and "stream" in data:
+                        self._manager._dispatch(data["stream"], data["data"])
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self._manager.logger().warning(f"The candles websocket connection was closed ({connection_exception})")
+            except Exception:
+                self._manager.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._manager._sleep(1.0)
+            finally:
+                subscriptions_task and subscriptions_task.cancel()
+                ws and await ws.disconnect()
+                self._manager._notify_interruption(self._streams)
+
+    async def _update_subscriptions(self, ws: WSAssistant):
+        while True:
+            await self._subscriptions_changed.wait()
+            self._subscriptions_changed.clear()
+            for method, streams in (("UNSUBSCRIBE", self._subscribed_streams - self._streams),
+                                    ("SUBSCRIBE", self._streams - self._subscribed_streams)):
+                if len(streams) == 0:
+                    continue
+                self._request_id += 1
+                payload = {"method": method, "params": sorted(streams), "id": self._request_id}
+                await ws.send(WSJSONRequest(payload=payload))
+                if method == "SUBSCRIBE":
+                    self._subscribed_streams.update(streams)
+                else:
+                    self._subscribed_streams.difference_update(streams)
+                await self._manager._sleep(self._manager.subscriptions_interval)
+
+
+class CandlesStreamManager:
+    """
+    Multiplexes the candles streams of many candles feeds (trading pairs and intervals) of an exchange over a few
+    websocket connections, using the exchange combined streams endpoint. Each connection is subscribed to at most
+    `max_streams_per_connection` streams, and a new connection is opened when all of them are full.
+
+    The feeds subscribe to their stream with `subscribe`, and receive the stream messages through the returned queue.
+    When a connection is interrupted, None is put in the queues of its streams, since the candles received while it
+    was reconnecting are lost.
+
+    The subscription messages follow the Binance combined streams protocol (SUBSCRIBE and UNSUBSCRIBE methods, with the
+    stream names as parameters).
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _shared_instances: Dict[str, "CandlesStreamManager"] = {}
+
+    subscriptions_interval = 0.25
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls, wss_url: str, max_streams_per_connection: int) -> "CandlesStreamManager":
+        """
+        Returns the manager shared by all the candles feeds using the combined streams endpoint
+        """
+        if wss_url not in cls._shared_instances:
+            cls._shared_instances[wss_url] = CandlesStreamManager(wss_url, max_streams_per_connection)
+        return cls._shared_instances[wss_url]
+
+    def __init__(self, wss_url: str, max_streams_per_connection: int):
+        self._wss_url = wss_url
+        self._max_streams_per_connection = max_streams_per_connection
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        self._queues: Dict[str, List[asyncio.Queue]] = {}
+        self._connections: List[CandlesStreamConnection] = []
+
+    @property
+    def connections(self) -> List[CandlesStreamConnection]:
+        return self._connections
+
+    def subscribe(self, stream_name: str) -> asyncio.Queue:
+        """
+        Subscribes to the stream, opening a new connection if all the connections are full.
+        :param stream_name: the name of the stream in the exchange (e.g. btcusdt@kline_1m)
+        :return: the queue receiving the stream messages
+        """
+        queue = asyncio.Queue()
+        if stream_name not in self._queues:
+            self._queues[stream_name] = []
+            self._connection_with_capacity().add_stream(stream_name)
+        self._queues[stream_name].append(queue)
+        return queue
+
+    def unsubscribe(self, stream_name: str, queue: asyncio.Queue):
+        """
+        Stops sending the stream messages to the queue. The stream is unsubscribed when no queue is left, and the
+        connection is closed when no stream is left.
+        """
+        queues = self._queues.get(stream_name, [])
+        if queue in queues:
+            queues.remove(queue)
+        if len(queues) > 0 or stream_name not in self._queues:
+            return
+        del self._queues[stream_name]
+        for connection in self._connections:
+            if stream_name in connection.streams:
+                connection.remove_stream(stream_name)
+                if len(connection.streams) == 0:
+                    connection.stop()
+                    self._connections.remove(connection)
+                break
+
+    def _connection_with_capacity(self) -> CandlesStreamConnection:
+        for connection in self._connections:
+            if len(connection.streams) < self._max_streams_per_connection:
+                return connection
+        connection = CandlesStreamConnection(self)
+        self._connections.append(connection)
+        return connection
+
+    def _dispatch(self, stream_name: str, data: Dict):
+        for queue in self._queues.get(stream_name, []):
+            queue.put_nowait(data)
+
+    def _notify_interruption(self, stream_names: Set[str]):
+        for stream_name in stream_names:
+            self._dispatch(stream_name, None)
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=self._wss_url, ping_timeout=30)
+        return ws
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateUpdate(HummingbotBase):
+    """
+    Log of the changes in the tracking states of a market since its MarketState was last saved. The saved state is
+    restored by applying the updates, in order, to MarketState.saved_state.
+    """
+    __tablename__ = "MarketStateUpdate"
+    __table_args__ = (Index("msu_config_market_index",
+                            "config_file_path", "market"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    updated_states = Column(JSON, nullable=False)
+    removed_order_ids = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketStateUpdate(id={self.id}, config_file_path='{self.config_file_path}', " \
+               f"market='{self.market}', timestamp={self.timestamp}, updated_states={self.updated_states}, " \
+               f"removed_order_ids={self.removed_order_ids})"
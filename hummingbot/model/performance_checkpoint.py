@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class PerformanceCheckpoint(HummingbotBase):
+    """
+    Saved aggregates of the trades of a trading pair in a market since a start timestamp (see PerformanceAccumulator),
+    used to report the performance without going through all the trade fills again.
+
+    The markets recorder checkpoints the aggregates of all the trades of the config file, with the start timestamp
+    ALL_TRADES_START_TIMESTAMP, so that a single checkpoint per config file, market and trading pair is reused by all
+    the runs of the client.
+    """
+    ALL_TRADES_START_TIMESTAMP = 0
+
+    __tablename__ = "PerformanceCheckpoint"
+    __table_args__ = (Index("pc_config_start_timestamp_index",
+                            "config_file_path", "start_timestamp"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    state = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"PerformanceCheckpoint(id={self.id}, config_file_path='{self.config_file_path}', " \
+               f"market='{self.market}', symbol='{self.symbol}', start_timestamp={self.start_timestamp}, " \
+               f"timestamp={self.timestamp}, state={self.state})"
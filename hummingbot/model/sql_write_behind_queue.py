@@ -0,0 +1,171 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+
+SQLWrite = Callable[[Session], None]
+SQLCommitCallback = Callable[[], None]
+
+
+@dataclass
+class SQLWriteBehindQueueMetrics:
+    queue_size: int
+    max_queue_size: int
+    blocked_submissions: int
+    blocked_time: float
+    flushed_batches: int
+    flushed_writes: int
+    failed_writes: int
+
+
+class SQLWriteBehindQueue:
+    """
+    Queue of database writes executed by a dedicated writer thread.
+
+    Each write is a function receiving the session of the transaction it runs in. The writer thread groups the queued
+    writes in batches of up to max_batch_size writes (waiting at most flush_interval seconds for a batch to fill up)
+    and commits each batch in a single transaction, in the order the writes were submitted. If a batch fails, its
+    writes are retried one per transaction, so that a faulty write does not discard the rest of the batch.
+
+    A write can be submitted with an on_commit callback, called by the writer thread once the transaction of the
+    write has been committed. It is called exactly once if the write is committed (even if its batch is retried), and
+    never if the write fails, so it can be used for side effects outside of the database (e.g. the trades CSV file).
+
+    The queue is bounded: when it is full, submit blocks the caller until the writer thread frees space. The number
+    of times this happened and the time spent waiting are reported in the metrics.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 flush_interval: float = 1.0,
+                 max_batch_size: int = 100,
+                 max_queue_size: int = 10000):
+        self._sql_manager: SQLConnectionManager = sql
+        self._flush_interval: float = flush_interval
+        self._max_batch_size: int = max_batch_size
+        self._max_queue_size: int = max_queue_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stop_marker = object()
+
+        self._blocked_submissions: int = 0
+        self._blocked_time: float = 0
+        self._flushed_batches: int = 0
+        self._flushed_writes: int = 0
+        self._failed_writes: int = 0
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def metrics(self) -> SQLWriteBehindQueueMetrics:
+        return SQLWriteBehindQueueMetrics(
+            queue_size=self._queue.qsize(),
+            max_queue_size=self._max_queue_size,
+            blocked_submissions=self._blocked_submissions,
+            blocked_time=self._blocked_time,
+            flushed_batches=self._flushed_batches,
+            flushed_writes=self._flushed_writes,
+            failed_writes=self._failed_writes,
+        )
+
+    def start(self):
+        if not self.is_running:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="SQLWriteBehindQueue", daemon=True)
+            self._writer_thread.start()
+
+    def stop(self):
+        """
+        Stops the writer thread after all the writes submitted before the call have been committed
+        """
+        if self.is_running:
+            self._queue.put(self._stop_marker)
+            self._writer_thread.join()
+        self._writer_thread = None
+
+    def submit(self, write: SQLWrite, on_commit: Optional[SQLCommitCallback] = None):
+        item: Tuple[SQLWrite, Optional[SQLCommitCallback]] = (write, on_commit)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._blocked_submissions += 1
+            start = time.perf_counter()
+            self._queue.put(item)
+            self._blocked_time += time.perf_counter() - start
+
+    def _writer_loop(self):
+        stop_requested = False
+        while not stop_requested:
+            batch: List[Tuple[SQLWrite, Optional[SQLCommitCallback]]] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if item is self._stop_marker:
+                    stop_requested = True
+                    break
+                batch.append(item)
+                if len(batch) >= self._max_batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            if len(batch) > 0:
+                self._write_batch(batch)
+
+    def _write_batch(self, batch: List[Tuple[SQLWrite, Optional[SQLCommitCallback]]]):
+        try:
+            self._execute([write for write, _ in batch])
+            self._flushed_writes += len(batch)
+            for _, on_commit in batch:
+                self._did_commit(on_commit)
+        except Exception:
+            self.logger().warning(f"Error writing a batch of {len(batch)} records to the database. "
+                                  f"Retrying the records one by one.", exc_info=True)
+            for write, on_commit in batch:
+                try:
+                    self._execute([write])
+                    self._flushed_writes += 1
+                except Exception:
+                    self._failed_writes += 1
+                    self.logger().error("Unexpected error writing a record to the database.", exc_info=True)
+                    continue
+                self._did_commit(on_commit)
+        self._flushed_batches += 1
+
+    def _did_commit(self, on_commit: Optional[SQLCommitCallback]):
+        # An error in the callback must not fail the committed write, or it would be retried
+        if on_commit is not None:
+            try:
+                on_commit()
+            except Exception:
+                self.logger().error("Unexpected error after writing a record to the database.", exc_info=True)
+
+    def _execute(self, writes: List[SQLWrite]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for write in writes:
+                    write(session)
@@ -8,12 +8,22 @@ cdef class RingBuffer:
         int64_t _delimiter
         int64_t _length
         bint _is_full
+        double _sum
+        double _m2
+        int64_t _non_finite_count
+        int64_t _updates_since_anchor
 
-    cdef void c_add_value(self, float val)
+    cdef void c_add_value(self, double val)
     cdef void c_increment_delimiter(self)
+    cdef void c_anchor_statistics(self)
+    cdef int64_t c_count(self)
+    cdef double c_get_first_value(self)
     cdef double c_get_last_value(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
+    cdef double c_sum_value(self)
+    cdef double c_current_mean(self)
+    cdef double c_current_variance(self)
     cdef double c_mean_value(self)
     cdef double c_variance(self)
     cdef double c_std_dev(self)
@@ -1,11 +1,19 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of float values. The sum and the sum of squared deviations from the mean (Welford's M2) of the
+    stored values are updated as values are added and removed, so the mean, variance and standard deviation are
+    calculated in constant time. To bound the rounding errors of the running updates, the statistics are recalculated
+    from the stored values once every `length` additions. While non finite values (nan, inf) are stored the statistics
+    are calculated from the stored values, with the same results as NumPy.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,68 +21,152 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
+    def __cinit__(self, int64_t length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._reset_statistics()
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double removed_value
+            double previous_mean
+            double mean
+            int64_t count = self.c_count()
+
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            if isfinite(removed_value):
+                previous_mean = self._sum / (count - self._non_finite_count)
+                self._sum -= removed_value
+                if count - self._non_finite_count > 1:
+                    mean = self._sum / (count - self._non_finite_count - 1)
+                    self._m2 -= (removed_value - previous_mean) * (removed_value - mean)
+                else:
+                    self._sum = 0
+                    self._m2 = 0
+            else:
+                self._non_finite_count -= 1
+
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
 
+        if isfinite(val):
+            count = self.c_count() - self._non_finite_count - 1
+            previous_mean = self._sum / count if count > 0 else 0
+            self._sum += val
+            mean = self._sum / (count + 1)
+            self._m2 += (val - previous_mean) * (val - mean)
+        else:
+            self._non_finite_count += 1
+
+        self._updates_since_anchor += 1
+        if self._updates_since_anchor >= self._length:
+            self.c_anchor_statistics()
+
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_anchor_statistics(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_array()
+            np.ndarray[np.double_t, ndim=1] finite_values = values[np.isfinite(values)]
+
+        self._non_finite_count = values.size - finite_values.size
+        if finite_values.size > 0:
+            self._sum = np.sum(finite_values)
+            self._m2 = np.sum(np.square(finite_values - self._sum / finite_values.size))
+        else:
+            self._sum = 0
+            self._m2 = 0
+        self._updates_since_anchor = 0
+
+    cdef int64_t c_count(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[(self._delimiter - 1) % self._length]
+
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._delimiter if self._is_full else 0]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef double c_sum_value(self):
+        if self._non_finite_count > 0:
+            return np.sum(self.c_get_as_numpy_array())
+        return self._sum
+
+    cdef double c_current_mean(self):
+        cdef int64_t count = self.c_count()
+        if count == 0:
+            return np.nan
+        if self._non_finite_count > 0:
+            return np.mean(self.c_get_as_numpy_array())
+        return self._sum / count
+
+    cdef double c_current_variance(self):
+        cdef int64_t count = self.c_count()
+        if count == 0:
+            return np.nan
+        if self._non_finite_count > 0:
+            return np.var(self.c_get_as_numpy_array())
+        return max(self._m2, 0) / count
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_current_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_current_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_current_variance())
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._reset_statistics()
+
+    def __len__(self):
+        return self.c_count()
+
+    def _reset_statistics(self):
+        self._sum = 0
+        self._m2 = 0
+        self._non_finite_count = 0
+        self._updates_since_anchor = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +174,9 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +184,20 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def sum_value(self):
+        return self.c_sum_value()
+
+    @property
+    def current_mean(self):
+        """The mean of the stored values, also when the buffer is not full"""
+        return self.c_current_mean()
+
+    @property
+    def current_variance(self):
+        """The variance of the stored values, also when the buffer is not full"""
+        return self.c_current_variance()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -113,6 +222,7 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._reset_statistics()
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,17 +1,51 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+import numpy as np
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
+    """
+    Exponential moving average of the samples in the sampling buffer, with a span of `sampling_length` samples
+    (the same values as pandas `ewm(span=sampling_length, adjust=True).mean()` over the buffer).
+    The weighted sum of the samples is updated as samples are added and removed, and recalculated from the buffer once
+    every `sampling_length` samples to bound the rounding errors.
+    """
     def __init__(self, sampling_length: int = 30, processing_length: int = 1):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._reset_weighted_sum()
+
+    def add_sample(self, value: float):
+        value = float(value)
+        decay = 1 - self._alpha
+        self._weighted_sum = value + decay * self._weighted_sum
+        if self._sampling_buffer.is_full:
+            # The oldest sample leaves the buffer
+            self._weighted_sum -= decay ** self._sampling_buffer.length * self._sampling_buffer.get_first_value()
+        self._samples_since_anchor += 1
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        if self._samples_since_anchor >= self._sampling_buffer.length:
+            self._anchor_weighted_sum()
+        samples_count = len(self._sampling_buffer)
+        weights_sum = (1 - (1 - self._alpha) ** samples_count) / self._alpha
+        return self._weighted_sum / weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    def _sampling_length_updated(self):
+        self._reset_weighted_sum()
+        self._anchor_weighted_sum()
+
+    def _reset_weighted_sum(self):
+        self._alpha = 2 / (self._sampling_buffer.length + 1)
+        self._weighted_sum = 0.0
+        self._samples_since_anchor = 0
+
+    def _anchor_weighted_sum(self):
+        samples = self._sampling_buffer.get_as_numpy_array()
+        weights = (1 - self._alpha) ** np.arange(samples.size - 1, -1, -1)
+        self._weighted_sum = float(np.dot(weights, samples))
+        self._samples_since_anchor = 0
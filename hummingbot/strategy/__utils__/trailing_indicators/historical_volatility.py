@@ -1,18 +1,31 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between consecutive samples in the sampling buffer, with their running variance
+        self._log_returns = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        value = float(value)
+        if len(self._sampling_buffer) > 0:
+            self._log_returns.add_value(np.log(value) - np.log(self._sampling_buffer.get_last_value()))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.length == 1 or len(self._log_returns) == 0:
+            # Not enough prices to calculate returns
+            return 0.0
+        return self._log_returns.current_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if len(self._processing_buffer) > 0:
+            return np.sqrt(self._processing_buffer.current_mean)
+
+    def _sampling_length_updated(self):
+        self._log_returns = RingBuffer(max(self._sampling_buffer.length - 1, 1))
+        for log_return in np.diff(np.log(self._sampling_buffer.get_as_numpy_array())):
+            self._log_returns.add_value(log_return)
@@ -1,19 +1,34 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The squared changes between consecutive samples in the sampling buffer, with their running sum
+        self._squared_changes = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        value = float(value)
+        if len(self._sampling_buffer) > 0:
+            self._squared_changes.add_value((value - self._sampling_buffer.get_last_value()) ** 2)
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        if self._sampling_buffer.length == 1:
+            return 0.0
+        vol = np.sqrt(self._squared_changes.sum_value / len(self._sampling_buffer))
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _sampling_length_updated(self):
+        self._squared_changes = RingBuffer(max(self._sampling_buffer.length - 1, 1))
+        for squared_change in np.square(np.diff(self._sampling_buffer.get_as_numpy_array())):
+            self._squared_changes.add_value(squared_change)
@@ -12,17 +12,29 @@ cdef class TradingIntensityIndicator:
     cdef:
         double _alpha
         double _kappa
+        list _sample_timestamps
         dict _trade_samples
+        dict _price_level_amounts
+        bint _samples_changed
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
+        int _quotes_start
+        int _quotes_end
         int _sampling_length
         int _samples_length
+        double _fit_interval
+        double _last_fit_timestamp
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_append_quote(self, double timestamp, double price)
+    cdef c_process_trades(self)
+    cdef c_add_trade_sample(self, double sample_timestamp, object price_levels, object amounts)
+    cdef c_remove_oldest_samples(self, int samples_count)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,7 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
-from decimal import Decimal
+from bisect import insort
 from typing import Tuple
 
 import numpy as np
@@ -17,6 +17,13 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+INITIAL_QUOTES_CAPACITY = 64
+
+
+def intensity_curve(t, a, b):
+    return a * np.exp(-b * t)
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +33,31 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
-
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    """
+    Estimates the trading intensity parameters (alpha and kappa) of the order book, fitting an exponential curve to the
+    amounts traded at every price level (the distance between the trade price and the mid price quoted before it)
+    during the last `sampling_length` samples.
+
+    The mid price quotes are kept in NumPy buffers sorted by timestamp, and the trades are matched to the quotes with a
+    binary search. The amounts traded at every price level are aggregated incrementally as the samples are added and
+    removed. The fit is warm-started with the previous parameters, and it is only run when the samples changed and
+    at least `fit_interval` seconds have passed since the previous fit.
+    """
+
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_interval: float = 0):
         self._alpha = 0
         self._kappa = 0
+        # The timestamps of the trade samples, sorted
+        self._sample_timestamps = []
+        # The price levels and amounts of the trades of every sample, by sample timestamp
         self._trade_samples = {}
+        # The amount traded and the number of trades of every price level in the samples
+        self._price_level_amounts = {}
+        self._samples_changed = False
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +65,12 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        self._quote_timestamps = np.empty(INITIAL_QUOTES_CAPACITY, dtype=np.float64)
+        self._quote_prices = np.empty(INITIAL_QUOTES_CAPACITY, dtype=np.float64)
+        self._quotes_start = 0
+        self._quotes_end = 0
+        self._fit_interval = fit_interval
+        self._last_fit_timestamp = -np.inf
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +80,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._sample_timestamps) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._sample_timestamps)
+        self._samples_length = len(self._sample_timestamps)
         return is_changed
 
     @property
@@ -64,15 +96,30 @@ cdef class TradingIntensityIndicator:
     def sampling_length(self, new_len: int):
         self._sampling_length = new_len
 
+    @property
+    def fit_interval(self) -> float:
+        return self._fit_interval
+
+    @fit_interval.setter
+    def fit_interval(self, value: float):
+        self._fit_interval = value
+
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [
+            {"timestamp": timestamp, "price": price}
+            for timestamp, price in zip(self._quote_timestamps[self._quotes_start:self._quotes_end][::-1].tolist(),
+                                        self._quote_prices[self._quotes_start:self._quotes_end][::-1].tolist())
+        ]
 
     @last_quotes.setter
     def last_quotes(self, value):
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        self._quotes_start = 0
+        self._quotes_end = 0
+        for quote in reversed(value):
+            self.c_append_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
@@ -80,41 +127,20 @@ cdef class TradingIntensityIndicator:
 
     cdef c_calculate(self, timestamp):
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
-
-        latest_processed_quote_idx = None
-        for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+        self.c_append_quote(timestamp, float(price))
 
-        # THere are no trades left to process
-        self._current_trade_sample = []
-        # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if len(self._current_trade_sample) > 0:
+            self.c_process_trades()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        if len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_oldest_samples(len(self._sample_timestamps) - self._sampling_length)
 
-        if self.is_sampling_buffer_full:
+        if (self.is_sampling_buffer_full
+                and self._samples_changed
+                and timestamp - self._last_fit_timestamp >= self._fit_interval):
             self.c_estimate_intensity()
+            self._samples_changed = False
+            self._last_fit_timestamp = timestamp
 
     def register_trade(self, trade):
         """A helper method to be used in unit tests"""
@@ -123,44 +149,125 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
-    cdef c_estimate_intensity(self):
+    cdef c_append_quote(self, double timestamp, double price):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
+            int quotes_count = self._quotes_end - self._quotes_start
+            int capacity = len(self._quote_timestamps)
+
+        if self._quotes_end == capacity:
+            # Move the quotes to the beginning of the buffers, growing them if they are more than half full
+            if quotes_count * 2 > capacity:
+                capacity *= 2
+            quote_timestamps = np.empty(capacity, dtype=np.float64)
+            quote_prices = np.empty(capacity, dtype=np.float64)
+            quote_timestamps[:quotes_count] = self._quote_timestamps[self._quotes_start:self._quotes_end]
+            quote_prices[:quotes_count] = self._quote_prices[self._quotes_start:self._quotes_end]
+            self._quote_timestamps = quote_timestamps
+            self._quote_prices = quote_prices
+            self._quotes_start = 0
+            self._quotes_end = quotes_count
+
+        self._quote_timestamps[self._quotes_end] = timestamp
+        self._quote_prices[self._quotes_end] = price
+        self._quotes_end += 1
+
+    cdef c_process_trades(self):
+        trades = self._current_trade_sample
+        # There are no trades left to process
+        self._current_trade_sample = []
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+        quote_timestamps = self._quote_timestamps[self._quotes_start:self._quotes_end]
+        quote_prices = self._quote_prices[self._quotes_start:self._quotes_end]
+        trade_timestamps = np.fromiter((trade.timestamp for trade in trades), dtype=np.float64, count=len(trades))
+        trade_prices = np.fromiter((trade.price for trade in trades), dtype=np.float64, count=len(trades))
+        trade_amounts = np.fromiter((trade.amount for trade in trades), dtype=np.float64, count=len(trades))
+
+        # Every trade is matched to the latest quote before it
+        quote_indexes = np.searchsorted(quote_timestamps, trade_timestamps, side="left") - 1
+        matched = quote_indexes >= 0
+        if not matched.any():
+            return
+        quote_indexes = quote_indexes[matched]
+        price_levels = np.abs(trade_prices[matched] - quote_prices[quote_indexes])
+        trade_amounts = trade_amounts[matched]
+        sample_timestamps = quote_timestamps[quote_indexes] + 1
 
-                trades_consolidated[trade['price_level']] += trade['amount']
+        # Store quotes that happened after the latest trade + one before
+        self._quotes_start += int(quote_indexes.max())
+
+        order = np.argsort(sample_timestamps, kind="stable")
+        sample_timestamps = sample_timestamps[order]
+        price_levels = price_levels[order]
+        trade_amounts = trade_amounts[order]
+        unique_timestamps, first_indexes = np.unique(sample_timestamps, return_index=True)
+        last_indexes = np.append(first_indexes[1:], len(sample_timestamps))
+        for sample_timestamp, first_index, last_index in zip(unique_timestamps.tolist(),
+                                                             first_indexes.tolist(),
+                                                             last_indexes.tolist()):
+            self.c_add_trade_sample(sample_timestamp,
+                                    price_levels[first_index:last_index],
+                                    trade_amounts[first_index:last_index])
+
+    cdef c_add_trade_sample(self, double sample_timestamp, object price_levels, object amounts):
+        sample = self._trade_samples.get(sample_timestamp)
+        if sample is None:
+            if len(self._sample_timestamps) == 0 or self._sample_timestamps[-1] < sample_timestamp:
+                self._sample_timestamps.append(sample_timestamp)
+            else:
+                insort(self._sample_timestamps, sample_timestamp)
+            self._trade_samples[sample_timestamp] = (price_levels, amounts)
+        else:
+            self._trade_samples[sample_timestamp] = (np.concatenate((sample[0], price_levels)),
+                                                     np.concatenate((sample[1], amounts)))
+
+        for price_level, amount in zip(price_levels.tolist(), amounts.tolist()):
+            price_level_amount = self._price_level_amounts.get(price_level)
+            if price_level_amount is None:
+                self._price_level_amounts[price_level] = [amount, 1]
+            else:
+                price_level_amount[0] += amount
+                price_level_amount[1] += 1
+        self._samples_changed = True
+
+    cdef c_remove_oldest_samples(self, int samples_count):
+        for sample_timestamp in self._sample_timestamps[:samples_count]:
+            price_levels, amounts = self._trade_samples.pop(sample_timestamp)
+            for price_level, amount in zip(price_levels.tolist(), amounts.tolist()):
+                price_level_amount = self._price_level_amounts[price_level]
+                price_level_amount[1] -= 1
+                if price_level_amount[1] == 0:
+                    del self._price_level_amounts[price_level]
+                else:
+                    price_level_amount[0] -= amount
+        del self._sample_timestamps[:samples_count]
+        self._samples_changed = True
 
-        price_levels = sorted(price_levels, reverse=True)
+    cdef c_estimate_intensity(self):
+        cdef:
+            int price_levels_count = len(self._price_level_amounts)
 
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        price_levels = np.fromiter(self._price_level_amounts.keys(), dtype=np.float64, count=price_levels_count)
+        # Calculate lambdas / trading intensities
+        lambdas = np.fromiter((price_level_amount[0] for price_level_amount in self._price_level_amounts.values()),
+                              dtype=np.float64,
+                              count=price_levels_count)
+        order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[order]
+        lambdas = lambdas[order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
+        lambdas[lambdas == 0] = 10**-10
 
         # Fit the probability density function; reuse previously calculated parameters as initial values
         try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+            params = curve_fit(intensity_curve,
                                price_levels,
-                               lambdas_adj,
+                               lambdas,
                                p0=(self._alpha, self._kappa),
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
+            self._kappa = params[0][1]
+            self._alpha = params[0][0]
         except (RuntimeError, ValueError) as e:
             pass
@@ -429,7 +429,10 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 order_book=self.market_info.order_book,
                 price_delegate=self._price_delegate,
                 sampling_length=self._trading_intensity_buffer_size,
+                fit_interval=self._config_map.trading_intensity_fit_interval,
             )
+        elif self._trading_intensity is not None:
+            self._trading_intensity.fit_interval = self._config_map.trading_intensity_fit_interval
 
         self._ticks_to_be_ready += (ticks_to_be_ready_after - ticks_to_be_ready_before)
         if self._ticks_to_be_ready < 0:
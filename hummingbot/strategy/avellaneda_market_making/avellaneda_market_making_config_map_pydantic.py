@@ -307,6 +307,15 @@ class AvellanedaMarketMakingConfigMap(BaseTradingStrategyConfigMap):
             prompt=lambda mi: "Enter amount of ticks that will be stored to estimate order book liquidity",
         ),
     )
+    trading_intensity_fit_interval: float = Field(
+        default=0,
+        description="The minimum number of seconds between two estimations of the order book liquidity "
+                    "(0 to estimate it on every tick with new trades).",
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Enter the minimum number of seconds between two estimations of order book liquidity",
+        ),
+    )
     order_levels_mode: Union[SingleOrderLevelModel, MultiOrderLevelModel] = Field(
         default=SingleOrderLevelModel.construct(),
         description="Allows activating multi-order levels.",
@@ -1,10 +1,12 @@
+import asyncio
 import logging
+import time
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
 from functools import lru_cache
 from math import ceil, floor
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Optional, Tuple, cast
 
 import pandas as pd
 from bidict import bidict
@@ -120,6 +122,11 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         self._last_taker_sell_price = None
 
         self._main_task = None
+        # Processing tasks of the market pairs in concurrent mode
+        self._market_pair_tasks: Dict[MakerTakerMarketPair, asyncio.Task] = {}
+        # Timestamp of the last completed processing of each market pair, and duration in seconds of its last processing
+        self._market_pair_processed_timestamps: Dict[MakerTakerMarketPair, float] = {}
+        self._market_pair_processing_latencies: Dict[MakerTakerMarketPair, float] = {}
         self._gateway_quotes_task = None
         self._cancel_outdated_orders_task = None
         self._hedge_maker_order_tasks = []
@@ -229,6 +236,14 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
     def gateway_transaction_cancel_interval(self):
         return self._config_map.gateway_transaction_cancel_interval
 
+    @property
+    def concurrent_pair_processing(self) -> bool:
+        return self._config_map.concurrent_pair_processing
+
+    @property
+    def pair_processing_timeout(self) -> float:
+        return self._config_map.pair_processing_timeout
+
     @property
     def logging_options(self) -> int:
         return self._logging_options
@@ -331,6 +346,12 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             lines.extend(["", "  Markets:"] +
                          ["    " + line for line in str(markets_df).split("\n")])
 
+            processing_line, quote_age = self.market_pair_processing_status(market_pair)
+            lines.extend(["", f"  Processing: {processing_line}"])
+            if self.concurrent_pair_processing and quote_age is not None and quote_age > self.pair_processing_timeout:
+                warning_lines.append(f"  Quotes for {market_pair.maker.trading_pair} have not been updated for "
+                                     f"{quote_age:.0f} seconds.")
+
             oracle_df = self.oracle_status_df()
             if not oracle_df.empty:
                 lines.extend(["", "  Rate conversion:"] +
@@ -359,10 +380,33 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         return "\n".join(lines)
 
+    def market_pair_processing_status(self, market_pair: MakerTakerMarketPair) -> Tuple[str, Optional[float]]:
+        """
+        Describes the last processing of the market pair for the status, and returns the time elapsed since it last
+        completed (i.e. the age of its quotes), or None if it has not completed yet.
+        """
+        processed_timestamp = self._market_pair_processed_timestamps.get(market_pair)
+        latency = self._market_pair_processing_latencies.get(market_pair)
+        quote_age = None if processed_timestamp is None else self.current_timestamp - processed_timestamp
+        parts = [
+            "not completed yet" if quote_age is None else f"quotes updated {quote_age:.0f}s ago",
+            "" if latency is None else f"last run took {latency * 1e3:.1f} ms",
+        ]
+        task = self._market_pair_tasks.get(market_pair)
+        if task is not None and not task.done():
+            parts.append("running")
+        return ", ".join(part for part in parts if part), quote_age
+
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
 
+    def stop(self, clock: Clock):
+        for task in self._market_pair_tasks.values():
+            task.cancel()
+        self._market_pair_tasks.clear()
+        super().stop(clock)
+
     def tick(self, timestamp: float):
         """
         Clock tick entry point.
@@ -441,7 +485,15 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
             # Process each market pair independently.
             for market_pair in self._market_pairs.values():
-                await self.process_market_pair(timestamp, market_pair, market_pair_to_active_orders[market_pair])
+                if self.concurrent_pair_processing:
+                    # A market pair still being processed since a previous tick is not processed again
+                    task = self._market_pair_tasks.get(market_pair)
+                    if task is None or task.done():
+                        self._market_pair_tasks[market_pair] = safe_ensure_future(self.process_market_pair_isolated(
+                            timestamp, market_pair, market_pair_to_active_orders[market_pair]))
+                else:
+                    await self.process_market_pair_timed(
+                        timestamp, market_pair, market_pair_to_active_orders[market_pair])
 
             # log conversion rates every 5 minutes
             if self._last_conv_rates_logged + (60. * 5) < timestamp:
@@ -450,6 +502,40 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
         finally:
             self._last_timestamp = timestamp
 
+    async def process_market_pair_timed(self,
+                                        timestamp: float,
+                                        market_pair: MakerTakerMarketPair,
+                                        active_orders: List):
+        """
+        Processes the market pair, keeping track of the duration of the processing and of the last time it completed.
+        """
+        start = time.perf_counter()
+        try:
+            await self.process_market_pair(timestamp, market_pair, active_orders)
+            self._market_pair_processed_timestamps[market_pair] = timestamp
+        finally:
+            self._market_pair_processing_latencies[market_pair] = time.perf_counter() - start
+
+    async def process_market_pair_isolated(self,
+                                           timestamp: float,
+                                           market_pair: MakerTakerMarketPair,
+                                           active_orders: List):
+        """
+        Processes the market pair in concurrent mode. The processing is cancelled after the pair processing timeout,
+        and its errors are logged, so that they don't affect the other market pairs.
+        """
+        try:
+            await asyncio.wait_for(self.process_market_pair_timed(timestamp, market_pair, active_orders),
+                                   timeout=self.pair_processing_timeout)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.logger().warning(f"The processing of {market_pair.maker.trading_pair} was cancelled after "
+                                  f"{self.pair_processing_timeout} seconds.")
+        except Exception:
+            self.logger().error(f"Unexpected error while processing {market_pair.maker.trading_pair}.",
+                                exc_info=True)
+
     async def get_gateway_quotes(self):
         for market_pair in self._market_pairs.values():
             if self.is_gateway_market(market_pair.taker):
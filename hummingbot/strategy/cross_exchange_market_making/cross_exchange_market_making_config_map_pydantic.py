@@ -359,6 +359,24 @@ class CrossExchangeMarketMakingConfigMap(BaseTradingStrategyMakerTakerConfigMap)
             prompt_on_new=True,
         ),
     )
+    concurrent_pair_processing: bool = Field(
+        default=False,
+        description="Process the market pairs concurrently, so that a slow taker market only delays its own pair.",
+        client_data=ClientFieldData(
+            prompt=lambda mi: "Do you want to process each market pair in its own task? (Yes/No)"
+        ),
+    )
+    pair_processing_timeout: float = Field(
+        default=30.0,
+        description="Maximum duration of the processing of a market pair in concurrent mode.",
+        gt=0.0,
+        client_data=ClientFieldData(
+            prompt=lambda mi: (
+                "After how long should the processing of a market pair be cancelled when the market pairs are "
+                "processed concurrently? (Enter time in seconds)"
+            ),
+        ),
+    )
     taker_market: ClientConfigEnum(
         value="TakerMarkets",  # noqa: F821
         names={e: e for e in
@@ -1,5 +1,6 @@
 from decimal import Decimal
 import logging
+import time
 import pandas as pd
 from typing import (
     List)
@@ -190,7 +191,7 @@ cdef class StrategyBase(TimeIterator):
     def trades(self) -> List[Trade]:
         """
         Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        The trades are taken from the order filled events retained by the markets.
         """
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
             return Trade(order_filled_event.trading_pair,
@@ -203,9 +204,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), market.order_filled_events))
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
@@ -302,8 +301,17 @@ cdef class StrategyBase(TimeIterator):
         self._sb_order_tracker.c_start(clock, timestamp)
 
     cdef c_tick(self, double timestamp):
+        cdef double order_tracker_tick_start
+
         TimeIterator.c_tick(self, timestamp)
-        self._sb_order_tracker.c_tick(timestamp)
+        if self._clock is not None and self._clock._profiler is not None:
+            # Report the order tracker time separately, to tell it apart from the strategy logic
+            order_tracker_tick_start = time.perf_counter()
+            self._sb_order_tracker.c_tick(timestamp)
+            self._clock._profiler.record_iterator_tick(self._sb_order_tracker,
+                                                       time.perf_counter() - order_tracker_tick_start)
+        else:
+            self._sb_order_tracker.c_tick(timestamp)
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
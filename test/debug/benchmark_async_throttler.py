@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+"""
+Compares the CPU cost and the queueing latency of AsyncThrottler and AsyncSlidingWindowThrottler under a constant
+request rate, with the requests spread over several endpoints sharing a pool limit (similar to the limits of the
+Binance connector). Each throttler is run with a pool limit above the offered load and with a pool limit below it
+(i.e. with part of the requests waiting for capacity).
+
+Usage: python test/debug/benchmark_async_throttler.py [--rate 1000] [--duration 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+from typing import List, Type
+
+from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+POOL_ID = "REQUEST_WEIGHT"
+ENDPOINTS = [f"/api/v3/endpoint_{i}" for i in range(10)]
+BATCHES_PER_SECOND = 100
+
+
+def build_rate_limits(rate: int, pool_capacity_ratio: float) -> List[RateLimit]:
+    rate_limits = [RateLimit(limit_id=POOL_ID, limit=int(rate * pool_capacity_ratio), time_interval=1)]
+    for endpoint in ENDPOINTS:
+        rate_limits.append(RateLimit(limit_id=endpoint,
+                                     limit=rate,
+                                     time_interval=1,
+                                     linked_limits=[LinkedLimitWeightPair(POOL_ID, 1)]))
+    return rate_limits
+
+
+async def run_benchmark(throttler_class: Type[AsyncThrottlerBase],
+                        rate: int,
+                        duration: float,
+                        pool_capacity_ratio: float):
+    throttler = throttler_class(rate_limits=build_rate_limits(rate, pool_capacity_ratio),
+                                limits_share_percentage=Decimal("100"))
+    latencies: List[float] = []
+
+    async def request(limit_id: str):
+        start = time.perf_counter()
+        async with throttler.execute_task(limit_id=limit_id):
+            latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    batch_size = max(rate // BATCHES_PER_SECOND, 1)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for batch in range(int(duration * BATCHES_PER_SECOND)):
+        for i in range(batch_size):
+            tasks.append(asyncio.ensure_future(request(ENDPOINTS[(batch * batch_size + i) % len(ENDPOINTS)])))
+        # Keep the offered load at the target rate
+        delay = wall_start + (batch + 1) / BATCHES_PER_SECOND - time.perf_counter()
+        await asyncio.sleep(max(delay, 0))
+    await asyncio.gather(*tasks)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    latencies.sort()
+    print(f"{throttler_class.__name__} (pool limit at {pool_capacity_ratio:.0%} of the offered load):")
+    print(f"  requests:           {len(latencies)} in {wall_time:.2f}s ({len(latencies) / wall_time:.0f}/s)")
+    print(f"  CPU per request:    {cpu_time / len(latencies) * 1e6:.1f} us")
+    print(f"  median latency:     {statistics.median(latencies) * 1e3:.2f} ms")
+    print(f"  p99 latency:        {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=1000, help="Requests per second")
+    parser.add_argument("--duration", type=float, default=5, help="Duration of each run in seconds")
+    args = parser.parse_args()
+
+    # Silence the capacity warnings, they are notified through the client application
+    AsyncRequestContextBase._last_max_cap_warning_ts = float("inf")
+
+    ev_loop = asyncio.get_event_loop()
+    for pool_capacity_ratio in (2.0, 0.9):
+        for throttler_class in (AsyncThrottler, AsyncSlidingWindowThrottler):
+            ev_loop.run_until_complete(run_benchmark(throttler_class, args.rate, args.duration, pool_capacity_ratio))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of processing user stream messages with ClientOrderTracker. Each message looks up the order the
+way the connectors' user stream handlers do (by exchange order id for trades, by client order id for order updates)
+and is then processed with process_trade_update or process_order_update.
+
+The lookups are run with the tracker's indexed views and with the merged dictionaries the tracker used to build on
+every access, for comparison.
+
+Usage: python test/debug/benchmark_client_order_tracker.py [--messages 10000] [--active-orders 500]
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from decimal import Decimal
+from itertools import chain
+from typing import Dict, List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class BenchmarkExchange(ExchangeBase):
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return dict()
+
+
+def create_order(index: int) -> InFlightOrder:
+    return InFlightOrder(
+        client_order_id=f"OID{index}",
+        exchange_order_id=f"EOID{index}",
+        trading_pair=TRADING_PAIR,
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        amount=Decimal("1000000"),
+        price=Decimal("1"),
+        creation_timestamp=1640000000,
+        initial_state=OrderState.OPEN,
+    )
+
+
+def create_tracker(active_orders: int) -> ClientOrderTracker:
+    connector = BenchmarkExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    connector._set_current_timestamp(1640000000)
+    tracker = ClientOrderTracker(connector=connector)
+    # Fill the cache of closed orders, and then start tracking the active orders
+    for i in range(ClientOrderTracker.MAX_CACHE_SIZE):
+        order = create_order(active_orders + i)
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+    for i in range(active_orders):
+        tracker.start_tracking_order(create_order(i))
+    return tracker
+
+
+def merged_fillable_orders(tracker: ClientOrderTracker) -> Dict[str, InFlightOrder]:
+    return {**tracker.active_orders, **tracker.cached_orders, **tracker.lost_orders}
+
+
+def merged_fillable_orders_by_exchange_order_id(tracker: ClientOrderTracker) -> Dict[str, InFlightOrder]:
+    return {
+        order.exchange_order_id: order
+        for order in chain(tracker.active_orders.values(), tracker.cached_orders.values(), tracker.lost_orders.values())
+    }
+
+
+async def run_benchmark(messages: int, active_orders: int, indexed: bool):
+    tracker = create_tracker(active_orders)
+    random.seed(42)
+    order_indexes: List[int] = [random.randrange(active_orders) for _ in range(messages)]
+
+    start = time.perf_counter()
+    for message_number, order_index in enumerate(order_indexes):
+        if message_number % 2 == 0:
+            # Trade message, identified by exchange order id
+            if indexed:
+                order = tracker.all_fillable_orders_by_exchange_order_id.get(f"EOID{order_index}")
+            else:
+                order = merged_fillable_orders_by_exchange_order_id(tracker).get(f"EOID{order_index}")
+            tracker.process_trade_update(TradeUpdate(
+                trade_id=str(message_number),
+                client_order_id=order.client_order_id,
+                exchange_order_id=order.exchange_order_id,
+                trading_pair=TRADING_PAIR,
+                fill_timestamp=1640000000,
+                fill_price=Decimal("1"),
+                fill_base_amount=Decimal("1"),
+                fill_quote_amount=Decimal("1"),
+                fee=AddedToCostTradeFee(),
+            ))
+        else:
+            # Order status message, identified by client order id
+            if indexed:
+                order = tracker.all_updatable_orders.get(f"OID{order_index}")
+            else:
+                order = merged_fillable_orders(tracker).get(f"OID{order_index}")
+            await tracker.process_order_update(OrderUpdate(
+                client_order_id=order.client_order_id,
+                exchange_order_id=order.exchange_order_id,
+                trading_pair=TRADING_PAIR,
+                update_timestamp=1640000000,
+                new_state=OrderState.PARTIALLY_FILLED,
+            ))
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Indexed views' if indexed else 'Merged dictionaries'} "
+          f"({active_orders} active orders, {ClientOrderTracker.MAX_CACHE_SIZE} cached orders):")
+    print(f"  {messages} messages in {elapsed:.3f}s ({elapsed / messages * 1e6:.1f} us per message)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=10000, help="Number of user stream messages")
+    parser.add_argument("--active-orders", type=int, default=500, help="Number of active orders")
+    args = parser.parse_args()
+
+    logging.getLogger("hummingbot.connector.client_order_tracker").setLevel(logging.WARNING)
+
+    ev_loop = asyncio.get_event_loop()
+    for indexed in (False, True):
+        ev_loop.run_until_complete(run_benchmark(args.messages, args.active_orders, indexed))
+
+
+if __name__ == "__main__":
+    main()
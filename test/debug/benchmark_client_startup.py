@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of creating the connector settings when the client starts, with `python -X importtime`. The
+connector settings are created in a fresh interpreter once without the connector manifest (all the connector utils
+modules are imported to generate it) and then with the manifest already generated (only the manifest is read).
+The data directory used for the manifest is a temporary directory, the client data directory is not modified.
+
+`-X importtime` does not report the modules imported with importlib.import_module (as the connector utils modules
+are), so the number of imported modules is read from sys.modules in the measured interpreter.
+
+Usage: python test/debug/benchmark_client_startup.py [--runs 3]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import hummingbot
+
+STARTUP_CODE = (
+    "import sys, time; "
+    "import hummingbot; "
+    "hummingbot.set_data_path({data_path!r}); "
+    "from hummingbot.client.settings import AllConnectorSettings; "
+    "start = time.perf_counter(); "
+    "AllConnectorSettings.get_connector_settings(); "
+    "print(time.perf_counter() - start, len(sys.modules), "
+    "len([m for m in sys.modules if m.startswith('hummingbot.connector.')]))"
+)
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+
+
+def run_startup(data_path: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_CODE.format(data_path=data_path)],
+        cwd=hummingbot.prefix_path(),
+        capture_output=True,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+    self_time_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            self_time_us += int(match.group(1))
+    settings_time, modules, connector_modules = result.stdout.split()[-3:]
+    return {
+        "wall_time": wall_time,
+        "import_time": self_time_us / 1e6,
+        "settings_time": float(settings_time),
+        "modules": int(modules),
+        "connector_modules": int(connector_modules),
+    }
+
+
+def print_results(label: str, results: List[Dict[str, float]]):
+    print(f"{label}:")
+    print(f"  wall time (median)      {statistics.median(r['wall_time'] for r in results):8.3f} s")
+    print(f"  import time (median)    {statistics.median(r['import_time'] for r in results):8.3f} s")
+    print(f"  settings time (median)  {statistics.median(r['settings_time'] for r in results):8.3f} s")
+    print(f"  imported modules        {int(statistics.median(r['modules'] for r in results)):8d}")
+    print(f"  connector modules       {int(statistics.median(r['connector_modules'] for r in results)):8d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Number of runs of each scenario")
+    args = parser.parse_args()
+
+    cold_results = []
+    warm_results = []
+    with tempfile.TemporaryDirectory() as data_path:
+        manifest_path = os.path.join(data_path, "connector_manifest.json")
+        for _ in range(args.runs):
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            cold_results.append(run_startup(data_path))
+            warm_results.append(run_startup(data_path))
+
+    print_results("Without connector manifest", cold_results)
+    print_results("With connector manifest", warm_results)
+
+
+if __name__ == "__main__":
+    main()
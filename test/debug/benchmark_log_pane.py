@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of logging to the CLI log pane when a strategy logs in bursts (e.g. an order refresh across many
+levels on every tick). The log pane holds MAXIMUM_LOG_PANE_LINE_COUNT lines, and every frame the visible window of the
+pane is rendered (the buffer control content is created and the visible lines are lexed).
+
+Two log panes are compared:
+- the previous implementation (reproduced below as `JoinTextArea`), which joined all the lines into a new document on
+  every log call, with a lexer without cache, and was rendered after every log call
+- the log buffer with the refresh interval of the log pane, which only appends the lines on each log call and creates
+  the document once per burst, when it is rendered. The refresh scheduled on the event loop is run directly after
+  each burst
+
+Usage: python test/debug/benchmark_log_pane.py [--bursts 500] [--burst-size 20]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Callable, Deque, List
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.application.current import set_app
+from prompt_toolkit.document import Document
+from prompt_toolkit.input import DummyInput
+from prompt_toolkit.layout import Layout
+from prompt_toolkit.output import DummyOutput
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.settings import LOG_PANE_REFRESH_INTERVAL, MAXIMUM_LOG_PANE_LINE_COUNT
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
+
+WINDOW_WIDTH = 120
+WINDOW_HEIGHT = 40
+
+
+class UncachedLexer(FormattedTextLexer):
+    def lex_document(self, document: Document):
+        lines = document.lines
+
+        def get_line(lineno: int):
+            try:
+                return list(self._line_fragments(lines[lineno]))
+            except IndexError:
+                return []
+
+        return get_line
+
+
+class JoinTextArea(CustomTextArea):
+    """
+    The previous log implementation: the lines are kept in a deque and joined into a new document on every log call
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.previous_log_lines: Deque[str] = deque()
+        super().__init__(*args, **kwargs)
+
+    def log(self, text: str, save_log: bool = True, silent: bool = False):
+        if self.window.render_info is None:
+            max_width = 100
+        else:
+            max_width = self.window.render_info.window_width - 2
+
+        repls = (('<b>', ''), ('</b>', ''), ('<pre>', ''), ('</pre>', ''))
+        for r in repls:
+            text = text.replace(*r)
+
+        new_lines_raw: List[str] = str(text).split('\n')
+        new_lines = []
+        for line in new_lines_raw:
+            while len(line) > max_width:
+                new_lines.append(line[0:max_width])
+                line = line[max_width:]
+            new_lines.append(line)
+
+        if save_log:
+            self.previous_log_lines.extend(new_lines)
+            while len(self.previous_log_lines) > self.max_line_count:
+                self.previous_log_lines.popleft()
+            new_text: str = "\n".join(self.previous_log_lines)
+        else:
+            new_text: str = "\n".join(new_lines)
+        if not silent:
+            self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+
+class ManualLoop:
+    """
+    Stands for the event loop of the log pane, the scheduled refreshes are run by the benchmark
+    """
+
+    def call_soon_threadsafe(self, *_):
+        pass
+
+    def call_later(self, *_):
+        pass
+
+
+def render(text_area: CustomTextArea):
+    content = text_area.control.create_content(WINDOW_WIDTH, WINDOW_HEIGHT)
+    for line_number in range(max(0, content.line_count - WINDOW_HEIGHT), content.line_count):
+        content.get_line(line_number)
+
+
+def make_log_lines(count: int) -> List[str]:
+    rng = random.Random(42)
+    lines = []
+    for i in range(count):
+        side = rng.choice(("BUY", "SELL"))
+        price = 100 + rng.uniform(-1, 1)
+        lines.append(f"12:00:{i % 60:02} - pure_mm - Created {side} order {i:08d} for "
+                     f"{rng.uniform(0.1, 10):.4f} COINALPHA at {price:.6f} HBOT (level {i % 20})")
+    return lines
+
+
+def run(text_area: CustomTextArea, bursts: List[List[str]], after_burst: Callable[[CustomTextArea], None],
+        render_every_log: bool) -> float:
+    start = time.perf_counter()
+    for burst in bursts:
+        for line in burst:
+            text_area.log(line)
+            if render_every_log:
+                render(text_area)
+        after_burst(text_area)
+    return time.perf_counter() - start
+
+
+async def run_benchmark(args: argparse.Namespace):
+    # The buffer controls are rendered inside the event loop, as in the client
+    await read_system_configs_from_yml()
+    client_config_map = ClientConfigAdapter(ClientConfigMap())
+    lines = make_log_lines(args.bursts * args.burst_size)
+    bursts = [lines[i:i + args.burst_size] for i in range(0, len(lines), args.burst_size)]
+    initial_text = "\n".join(make_log_lines(MAXIMUM_LOG_PANE_LINE_COUNT))
+
+    def refresh_and_render(text_area: CustomTextArea):
+        text_area._refresh_document()
+        render(text_area)
+
+    previous = JoinTextArea(max_line_count=MAXIMUM_LOG_PANE_LINE_COUNT, initial_text=initial_text,
+                            lexer=UncachedLexer(client_config_map))
+    coalesced = CustomTextArea(max_line_count=MAXIMUM_LOG_PANE_LINE_COUNT, initial_text=initial_text,
+                               lexer=FormattedTextLexer(client_config_map))
+    coalesced.refresh_interval = LOG_PANE_REFRESH_INTERVAL
+    coalesced._ev_loop = ManualLoop()
+
+    runs = [
+        ("join per log (previous)", previous, lambda _: None, True),
+        ("log buffer, coalesced", coalesced, refresh_and_render, False),
+    ]
+    log_calls = args.bursts * args.burst_size
+    print(f"{log_calls} log calls in {args.bursts} bursts of {args.burst_size}, "
+          f"{MAXIMUM_LOG_PANE_LINE_COUNT} lines in the pane")
+    for label, text_area, after_burst, render_every_log in runs:
+        with set_app(Application(layout=Layout(text_area), input=DummyInput(), output=DummyOutput())):
+            elapsed = run(text_area, bursts, after_burst, render_every_log)
+        kept_lines = min(len(lines), MAXIMUM_LOG_PANE_LINE_COUNT)
+        assert text_area.text.split("\n")[-kept_lines:] == lines[-kept_lines:]
+        print(f"  {label:26} {elapsed:8.3f} s  {elapsed / log_calls * 1e6:8.1f} us/log  "
+              f"{elapsed / args.bursts * 1e3:8.3f} ms/burst")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bursts", type=int, default=500, help="Number of bursts (frames) of log lines")
+    parser.add_argument("--burst-size", type=int, default=20, help="Number of log calls per burst")
+    args = parser.parse_args()
+
+    asyncio.get_event_loop().run_until_complete(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Measures the order book diff throughput of a single core, from the decoded websocket message to the updated order
+book: the creation of the order book message by the connector and its application to the order book by the tracker.
+
+The diffs are Binance-like depth updates (prices and amounts as strings) with the given number of levels per side,
+around a mid price that drifts randomly. Two paths are compared:
+- the previous one: an OrderBookMessage whose levels are parsed into OrderBookRow instances by the tracker
+  (`message.bids` / `message.asks`) and applied with `OrderBook.apply_diffs`
+- NumpyOrderBookMessage (created by BinanceOrderBook.diff_message_from_exchange), whose levels are parsed once into
+  NumPy arrays and applied with `OrderBook.apply_diff_message`
+
+Both order books are checked to be identical at the end.
+
+Usage: python test/debug/benchmark_order_book_messages.py [--messages 50000] [--levels 20]
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+def make_diffs(count: int, levels: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    mid_price = 100.0
+    diffs = []
+    for i in range(count):
+        mid_price = max(mid_price + rng.uniform(-0.01, 0.01), 1)
+        bids = [[f"{mid_price - 0.01 * (level + 1):.2f}", f"{rng.choice((0, rng.uniform(0.1, 10))):.4f}"]
+                for level in range(levels)]
+        asks = [[f"{mid_price + 0.01 * (level + 1):.2f}", f"{rng.choice((0, rng.uniform(0.1, 10))):.4f}"]
+                for level in range(levels)]
+        diffs.append({"trading_pair": TRADING_PAIR, "U": i + 1, "u": i + 1, "b": bids, "a": asks})
+    return diffs
+
+
+def previous_path(order_book: OrderBook, diff: Dict[str, Any]):
+    message = OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": diff["trading_pair"],
+        "first_update_id": diff["U"],
+        "update_id": diff["u"],
+        "bids": diff["b"],
+        "asks": diff["a"],
+    }, timestamp=1.0)
+    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+
+def numpy_path(order_book: OrderBook, diff: Dict[str, Any]):
+    message = BinanceOrderBook.diff_message_from_exchange(diff, timestamp=1.0)
+    order_book.apply_diff_message(message)
+
+
+def run(diffs: List[Dict[str, Any]], apply: Callable[[OrderBook, Dict[str, Any]], None]) -> Tuple[float, OrderBook]:
+    order_book = OrderBook()
+    start = time.perf_counter()
+    for diff in diffs:
+        apply(order_book, diff)
+    return time.perf_counter() - start, order_book
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=50000, help="Number of diff messages")
+    parser.add_argument("--levels", type=int, default=20, help="Number of price levels per side in each diff")
+    args = parser.parse_args()
+
+    diffs = make_diffs(args.messages, args.levels)
+    print(f"{args.messages} diffs with {args.levels} levels per side")
+    results = []
+    for label, apply in (("OrderBookRow (previous)", previous_path), ("NumpyOrderBookMessage", numpy_path)):
+        elapsed, order_book = run(diffs, apply)
+        results.append(order_book.snapshot)
+        print(f"  {label:24} {elapsed:8.3f} s  {args.messages / elapsed:10,.0f} msg/s")
+
+    (previous_bids, previous_asks), (numpy_bids, numpy_asks) = results
+    assert previous_bids.equals(numpy_bids) and previous_asks.equals(numpy_asks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""
+Measures the signing throughput of the connector auth classes that timestamp their requests with a TimeSynchronizer.
+Every auth class signs the same authenticated POST request with the TimeSynchronizer (offset cached until the samples
+change) and with the implementation it replaced (reproduced below as `NumpyTimeSynchronizer`), which recalculated the
+median and the weighted average of the samples with NumPy on every call to `time()`.
+
+The auth classes are created with dummy credentials. The request body is sent as JSON, or as a dictionary to the auth
+classes that sign the body parameters. The auth classes that can't sign the benchmark request are reported as skipped.
+
+Usage: python test/debug/benchmark_time_synchronizer.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import time
+from typing import List, Optional, Tuple, Type
+
+import numpy
+
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+
+AUTH_CLASSES = [
+    ("hummingbot.connector.exchange.binance.binance_auth", "BinanceAuth"),
+    ("hummingbot.connector.derivative.binance_perpetual.binance_perpetual_auth", "BinancePerpetualAuth"),
+    ("hummingbot.connector.exchange.bybit.bybit_auth", "BybitAuth"),
+    ("hummingbot.connector.exchange.kucoin.kucoin_auth", "KucoinAuth"),
+    ("hummingbot.connector.derivative.kucoin_perpetual.kucoin_perpetual_auth", "KucoinPerpetualAuth"),
+    ("hummingbot.connector.exchange.gate_io.gate_io_auth", "GateIoAuth"),
+    ("hummingbot.connector.exchange.okx.okx_auth", "OkxAuth"),
+    ("hummingbot.connector.exchange.huobi.huobi_auth", "HuobiAuth"),
+    ("hummingbot.connector.exchange.bitmart.bitmart_auth", "BitmartAuth"),
+    ("hummingbot.connector.derivative.bitget_perpetual.bitget_perpetual_auth", "BitgetPerpetualAuth"),
+    ("hummingbot.connector.exchange.ciex.ciex_auth", "CiexAuth"),
+    ("hummingbot.connector.exchange.whitebit.whitebit_auth", "WhitebitAuth"),
+    ("hummingbot.connector.exchange.btc_markets.btc_markets_auth", "BtcMarketsAuth"),
+]
+DUMMY_SECRET = "c2VjcmV0c2VjcmV0c2VjcmV0c2VjcmV0"
+
+
+class NumpyTimeSynchronizer(TimeSynchronizer):
+    """
+    The previous TimeSynchronizer offset calculation, run on every call to `time()`
+    """
+
+    @property
+    def time_offset_ms(self) -> float:
+        if not self._time_offset_ms:
+            offset = (self._time() - self._current_seconds_counter()) * 1e3
+        else:
+            median = numpy.median(self._time_offset_ms)
+            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+            offset = numpy.mean([median, weighted_average])
+
+        return offset
+
+
+def create_time_synchronizer(time_synchronizer_class: Type[TimeSynchronizer]) -> TimeSynchronizer:
+    time_synchronizer = time_synchronizer_class()
+    for offset in [120.5, 98.25, 101.0, 110.75, 99.5]:
+        time_synchronizer.add_time_offset_ms_sample(offset)
+    return time_synchronizer
+
+
+def create_auth(module_name: str, class_name: str, time_synchronizer: TimeSynchronizer) -> AuthBase:
+    auth_class = getattr(importlib.import_module(module_name), class_name)
+    arguments = {}
+    for name, parameter in list(inspect.signature(auth_class.__init__).parameters.items())[1:]:
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if parameter.annotation is TimeSynchronizer or "time" in name:
+            arguments[name] = time_synchronizer
+        elif parameter.default is not parameter.empty:
+            continue
+        else:
+            arguments[name] = DUMMY_SECRET
+    return auth_class(**arguments)
+
+
+def create_request(json_body: bool) -> RESTRequest:
+    body = {"symbol": "COINALPHA-HBOT", "side": "BUY", "price": "100.5", "quantity": "1.25"}
+    return RESTRequest(
+        method=RESTMethod.POST,
+        url="https://api.test.com/api/v1/order",
+        params={"symbol": "COINALPHA-HBOT"},
+        data=json.dumps(body) if json_body else body,
+        headers={"Content-Type": "application/json"},
+        is_auth_required=True,
+        throttler_limit_id="/api/v1/order",
+    )
+
+
+async def sign_requests(auth: AuthBase, requests: int, json_body: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await auth.rest_authenticate(create_request(json_body))
+    return time.perf_counter() - start
+
+
+def measure(module_name: str, class_name: str, requests: int) -> Optional[Tuple[float, float]]:
+    loop = asyncio.get_event_loop()
+    results: List[float] = []
+    for time_synchronizer_class in (NumpyTimeSynchronizer, TimeSynchronizer):
+        auth = create_auth(module_name, class_name, create_time_synchronizer(time_synchronizer_class))
+        json_body = None
+        for candidate in (True, False):
+            try:
+                loop.run_until_complete(sign_requests(auth, 10, candidate))
+                json_body = candidate
+                break
+            except Exception:
+                continue
+        if json_body is None:
+            return None
+        results.append(loop.run_until_complete(sign_requests(auth, requests, json_body)))
+    return results[0], results[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Number of requests signed by each auth class")
+    args = parser.parse_args()
+
+    for label, time_synchronizer_class in (("numpy (previous)", NumpyTimeSynchronizer), ("cached", TimeSynchronizer)):
+        time_synchronizer = create_time_synchronizer(time_synchronizer_class)
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            time_synchronizer.time()
+        elapsed = time.perf_counter() - start
+        print(f"TimeSynchronizer.time() {label:18} {elapsed / args.requests * 1e6:8.2f} us/call")
+
+    print(f"\n{'auth class':24} {'previous':>14} {'cached':>14} {'speedup':>8}   (signed requests per second)")
+    for module_name, class_name in AUTH_CLASSES:
+        result = measure(module_name, class_name, args.requests)
+        if result is None:
+            print(f"{class_name:24} skipped")
+            continue
+        previous, cached = result
+        print(f"{class_name:24} {args.requests / previous:14,.0f} {args.requests / cached:14,.0f} "
+              f"{previous / cached:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of the TradingIntensityIndicator ticks on a busy pair: every tick quotes a new mid price and
+registers a batch of trades around it, and the indicator fits the trading intensity once its sampling buffer is full.
+
+The indicator is compared with the list based implementation it replaced (reproduced below as
+`ListTradingIntensityIndicator`, run as plain Python), which matched every trade against every quote and rebuilt the
+price level totals on every fit. The indicator is also run with a fit interval, to rate limit the curve fits.
+
+Usage: python test/debug/benchmark_trading_intensity.py [--ticks 2000] [--trades-per-tick 50] [--sampling-length 200]
+"""
+
+import argparse
+import random
+import time
+import warnings
+from decimal import Decimal
+from typing import List, Tuple
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+TRADING_PAIR = "COINALPHA-HBOT"
+
+
+class FixedPriceDelegate:
+    def __init__(self):
+        self.price = Decimal("100")
+
+    def get_price_by_type(self, _: PriceType) -> Decimal:
+        return self.price
+
+
+class ListTradingIntensityIndicator:
+    """
+    The previous implementation of TradingIntensityIndicator: quotes kept in a list of dicts (newest first), trades
+    matched against the quotes in a nested loop and the price level totals rebuilt on every fit.
+    """
+
+    def __init__(self, price_delegate: FixedPriceDelegate, sampling_length: int):
+        self._alpha = 0
+        self._kappa = 0
+        self._trade_samples = {}
+        self._current_trade_sample = []
+        self._price_delegate = price_delegate
+        self._sampling_length = sampling_length
+        self._last_quotes = []
+        warnings.simplefilter("ignore", OptimizeWarning)
+
+    @property
+    def current_value(self) -> Tuple[float, float]:
+        return self._alpha, self._kappa
+
+    def register_trade(self, trade):
+        self._current_trade_sample.append(trade)
+
+    def calculate(self, timestamp):
+        price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
+        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+
+        latest_processed_quote_idx = None
+        for trade in self._current_trade_sample:
+            for i, quote in enumerate(self._last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
+                        self._trade_samples[quote["timestamp"] + 1] = []
+                    self._trade_samples[quote["timestamp"] + 1] += [trade]
+                    break
+
+        self._current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
+
+        if len(self._trade_samples.keys()) > self._sampling_length:
+            timestamps = list(self._trade_samples.keys())
+            timestamps.sort()
+            timestamps = timestamps[-self._sampling_length:]
+            self._trade_samples = {timestamp: self._trade_samples[timestamp] for timestamp in timestamps}
+
+        if len(self._trade_samples.keys()) == self._sampling_length:
+            self._estimate_intensity()
+
+    def _estimate_intensity(self):
+        trades_consolidated = {}
+        price_levels = []
+        for timestamp in self._trade_samples.keys():
+            for trade in self._trade_samples[timestamp]:
+                if trade['price_level'] not in trades_consolidated.keys():
+                    trades_consolidated[trade['price_level']] = 0
+                    price_levels += [trade['price_level']]
+                trades_consolidated[trade['price_level']] += trade['amount']
+
+        price_levels = sorted(price_levels, reverse=True)
+        lambdas = [trades_consolidated[price_level] for price_level in price_levels]
+        lambdas_adj = [10**-10 if x == 0 else x for x in lambdas]
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t),
+                               price_levels,
+                               lambdas_adj,
+                               p0=(self._alpha, self._kappa),
+                               method='dogbox',
+                               bounds=([0, 0], [np.inf, np.inf]))
+            self._kappa = Decimal(str(params[0][1]))
+            self._alpha = Decimal(str(params[0][0]))
+        except (RuntimeError, ValueError):
+            pass
+
+
+def make_ticks(ticks: int, trades_per_tick: int) -> List[Tuple[float, float, List[OrderBookTradeEvent]]]:
+    rng = random.Random(42)
+    mid_price = 100.0
+    result = []
+    for tick in range(ticks):
+        timestamp = 1_600_000_000.0 + tick
+        mid_price *= 1 + rng.gauss(0, 0.0005)
+        trades = []
+        for _ in range(trades_per_tick):
+            price_level = round(rng.expovariate(10), 2)
+            trade_type = rng.choice((TradeType.BUY, TradeType.SELL))
+            price = mid_price + price_level if trade_type == TradeType.BUY else mid_price - price_level
+            trades.append(OrderBookTradeEvent(trading_pair=TRADING_PAIR,
+                                              timestamp=timestamp + 0.5,
+                                              price=price,
+                                              amount=rng.uniform(0.1, 2),
+                                              type=trade_type))
+        result.append((timestamp, mid_price, trades))
+    return result
+
+
+def run(indicator, price_delegate: FixedPriceDelegate, ticks) -> float:
+    start = time.perf_counter()
+    for timestamp, mid_price, trades in ticks:
+        price_delegate.price = Decimal(str(mid_price))
+        indicator.calculate(timestamp)
+        for trade in trades:
+            indicator.register_trade(trade)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--trades-per-tick", type=int, default=50)
+    parser.add_argument("--sampling-length", type=int, default=200)
+    parser.add_argument("--fit-interval", type=float, default=10, help="Fit interval of the rate limited run (s)")
+    args = parser.parse_args()
+
+    ticks = make_ticks(args.ticks, args.trades_per_tick)
+    runs = [
+        ("list based (previous)", lambda delegate: ListTradingIntensityIndicator(delegate, args.sampling_length)),
+        ("array based", lambda delegate: TradingIntensityIndicator(OrderBook(), delegate, args.sampling_length)),
+        (f"array based, fit every {args.fit_interval:g}s",
+         lambda delegate: TradingIntensityIndicator(OrderBook(), delegate, args.sampling_length, args.fit_interval)),
+    ]
+    print(f"{args.ticks} ticks, {args.trades_per_tick} trades per tick, sampling length {args.sampling_length}")
+    for label, factory in runs:
+        price_delegate = FixedPriceDelegate()
+        indicator = factory(price_delegate)
+        elapsed = run(indicator, price_delegate, ticks)
+        alpha, kappa = indicator.current_value
+        print(f"  {label:32} {elapsed:8.3f} s  {elapsed / args.ticks * 1e3:8.3f} ms/tick  "
+              f"alpha={float(alpha):.6f} kappa={float(kappa):.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class TickProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.captures = []
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _start_clock(self):
+        self.app.clock = Clock(ClockMode.BACKTEST, tick_size=1, start_time=1640000000, end_time=1640000010)
+        self.app.clock.add_iterator(TimeIterator())
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_tick_profile_requires_running_strategy(self, notify_mock):
+        notify_mock.side_effect = lambda s: self.captures.append(s)
+
+        self.async_run_with_timeout(self.app.show_tick_profile())
+
+        self.assertEqual(["\n This command can only be used while a strategy is running"], self.captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_tick_profile(self, notify_mock):
+        notify_mock.side_effect = lambda s: self.captures.append(s)
+        self._start_clock()
+
+        self.async_run_with_timeout(self.app.show_tick_profile())
+        self.assertEqual("\n Tick profiling is disabled. Use `tick_profile enable` to enable it.", self.captures[-1])
+
+        self.async_run_with_timeout(self.app.show_tick_profile(option="enable", overrun_threshold=0.5))
+        self.assertEqual("\n Tick profiling enabled (overrun threshold: 0.5s).", self.captures[-1])
+
+        self.app.clock.backtest_til(1640000005)
+        self.async_run_with_timeout(self.app.show_tick_profile())
+
+        profile = self.captures[-1]
+        self.assertIn("Ticks: 5, overruns (> 500.0ms): 0", profile)
+        self.assertIn("TimeIterator", profile)
+
+        self.async_run_with_timeout(self.app.show_tick_profile(option="disable"))
+        self.assertEqual("\n Tick profiling disabled.", self.captures[-1])
+        self.assertIsNone(self.app.clock.profiler)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_export_tick_profile(self, notify_mock):
+        notify_mock.side_effect = lambda s: self.captures.append(s)
+        self._start_clock()
+        self.app.clock.enable_profiling()
+        self.app.clock.backtest_til(1640000002)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.client_config_map.log_file_path = temp_dir
+            self.async_run_with_timeout(self.app.show_tick_profile(option="export"))
+
+            file_names = os.listdir(temp_dir)
+            self.assertEqual(1, len(file_names))
+            self.assertTrue(file_names[0].startswith("tick_profile_"))
+            with open(os.path.join(temp_dir, file_names[0])) as export_file:
+                snapshot = json.load(export_file)
+
+        self.assertEqual(2, snapshot["ticks"])
+        self.assertEqual("TimeIterator", snapshot["iterators"][0]["name"])
+        self.assertTrue(self.captures[-1].startswith("Successfully exported the tick profile to "))
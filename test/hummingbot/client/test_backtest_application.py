@@ -0,0 +1,109 @@
+import asyncio
+import tempfile
+import unittest
+from decimal import Decimal
+from test.hummingbot.strategy import assign_config_default
+
+from hummingbot.client.backtest_application import BacktestApplication
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map as c_map
+
+
+class BacktestApplicationTest(unittest.TestCase):
+    # 2022-01-01 00:00:00 UTC
+    day_start = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.client_config_map.paper_trade.paper_trade_account_balance = {"COINALPHA": 10, "HBOT": 1000}
+        # The application created by other tests is restored after the test, the backtest must not create one
+        main_app = HummingbotApplication._main_app
+        HummingbotApplication._main_app = None
+        self.addCleanup(setattr, HummingbotApplication, "_main_app", main_app)
+
+        assign_config_default(c_map)
+        c_map.get("exchange").value = "binance_paper_trade"
+        c_map.get("market").value = self.trading_pair
+        c_map.get("bid_spread").value = Decimal("1")
+        c_map.get("ask_spread").value = Decimal("1")
+        c_map.get("order_amount").value = Decimal("1")
+        c_map.get("order_refresh_time").value = 60.
+
+        market_data_file = MarketDataFile("binance", self.trading_pair, self.temp_directory.name)
+        market_data_file.append_messages([
+            OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": self.trading_pair, "update_id": 1, "bids": [["99.9", "5"]], "asks": [["100.1", "5"]],
+            }, self.day_start),
+            OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": self.trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": 1,
+                "price": "98.5", "amount": "2",
+            }, self.day_start + 30.5),
+        ])
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+        super().tearDown()
+
+    def _create_application(self) -> BacktestApplication:
+        return BacktestApplication(client_config_map=self.client_config_map,
+                                   strategy_file_name="conf_pure_mm_1.yml",
+                                   strategy_name="pure_market_making",
+                                   strategy_config_map=c_map,
+                                   start_time=self.day_start + 10,
+                                   end_time=self.day_start + 40,
+                                   market_data_path=self.temp_directory.name)
+
+    def test_run_pure_market_making_over_recorded_market_data(self):
+        application = self._create_application()
+        result = self.ev_loop.run_until_complete(application.run())
+
+        self.assertTrue(result)
+        self.assertIsNone(HummingbotApplication._main_app)
+        market = application.markets["binance_paper_trade"]
+        self.assertIsInstance(market, BacktestExchange)
+        self.assertEqual("binance", market.name)
+        self.assertEqual(self.day_start + 40, application.clock.current_timestamp)
+
+        # The bid order at 99 was filled by the trade, the ask order at 101 is still open
+        fills = application.fill_loggers["binance_paper_trade"].event_log
+        self.assertEqual(1, len(fills))
+        self.assertEqual(TradeType.BUY, fills[0].trade_type)
+        self.assertEqual(Decimal("99"), fills[0].price)
+        self.assertEqual(Decimal("10") + Decimal("0.999"), market.get_balance("COINALPHA"))
+        self.assertEqual(Decimal("901"), market.get_balance("HBOT"))
+        self.assertEqual(1, len(application.strategy.active_sells))
+        self.assertTrue(any("Maker BUY order" in notification for notification in application.notifications))
+
+        report = application.report()
+        self.assertIn("binance_paper_trade / COINALPHA-HBOT", report)
+        self.assertIn("Trades: 1 (1 buys, 0 sells)", report)
+        self.assertIn("COINALPHA balance: 10 -> 10.999", report)
+        self.assertIn("HBOT balance: 1000 -> 901", report)
+
+    def test_report_of_a_market_without_recorded_data(self):
+        c_map.get("market").value = "ETH-HBOT"
+        application = self._create_application()
+        self.ev_loop.run_until_complete(application.run())
+
+        report = application.report()
+
+        self.assertEqual("binance_paper_trade / ETH-HBOT\n  No market data recorded in the backtest range", report)
+
+    def test_run_fails_when_the_strategy_is_not_created(self):
+        c_map.get("market").value = None
+        application = self._create_application()
+
+        result = self.ev_loop.run_until_complete(application.run())
+
+        self.assertFalse(result)
+        self.assertEqual(0, len(application.clock.child_iterators))
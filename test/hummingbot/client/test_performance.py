@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceAccumulator, PerformanceMetrics
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -24,9 +24,10 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         RateOracle._shared_instance = None
         super().tearDown()
 
-    def mock_trade(self, id, amount, price, position="OPEN", type="BUY", fee=None):
+    def mock_trade(self, id, amount, price, position="OPEN", type="BUY", fee=None, timestamp=0):
         trade = MagicMock()
         trade.order_id = id
+        trade.timestamp = timestamp
         trade.position = position
         trade.trade_type = type
         trade.amount = amount
@@ -326,3 +327,116 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+
+class PerformanceAccumulatorTests(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        super().tearDown()
+
+    @staticmethod
+    def trade_fill(order_id: str, trade_type: str, price: str, amount: str, position: str, timestamp: int,
+                   exchange_trade_id: str = None) -> TradeFill:
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="perpetual_market_making",
+            market="binance_perpetual",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")).to_json(),
+            exchange_trade_id=exchange_trade_id or f"{order_id}-{timestamp}",
+            position=position,
+        )
+
+    def derivative_trades(self):
+        return [
+            self.trade_fill("order1", "BUY", "10", "50", "OPEN", 1),
+            self.trade_fill("order2", "SELL", "20", "100", "OPEN", 2),
+            self.trade_fill("order1", "BUY", "12", "50", "OPEN", 3),
+            self.trade_fill("order3", "SELL", "15", "60", "CLOSE", 4),
+            self.trade_fill("order4", "BUY", "16", "100", "CLOSE", 5),
+            self.trade_fill("order3", "SELL", "17", "40", "CLOSE", 6),
+            self.trade_fill("order5", "BUY", "11", "30", "OPEN", 7),
+        ]
+
+    @staticmethod
+    def batch_derivative_pnl(trades) -> Decimal:
+        buys = [trade for trade in trades if trade.trade_type == "BUY"]
+        sells = [trade for trade in trades if trade.trade_type == "SELL"]
+        buys, sells = PerformanceMetrics.aggregate_position_order(buys, sells)
+        long, short = [], []
+        while True:
+            lng = PerformanceMetrics.position_order(buys, sells)
+            if lng is not None:
+                long.append(lng)
+            sht = PerformanceMetrics.position_order(sells, buys)
+            if sht is not None:
+                short.append(sht)
+            if lng is None and sht is None:
+                break
+        return Decimal(str(sum(PerformanceMetrics.derivative_pnl(long, short))))
+
+    def test_derivative_pnl_updated_with_each_fill(self):
+        trades = self.derivative_trades()
+        accumulator = PerformanceAccumulator(trading_pair)
+        for i, trade in enumerate(trades):
+            accumulator.add_trade(trade)
+            self.assertEqual(self.batch_derivative_pnl(self.derivative_trades()[:i + 1]), accumulator.derivative_pnl)
+
+        self.assertTrue(accumulator.are_derivatives)
+        self.assertEqual(4, accumulator.num_buys)
+        self.assertEqual(3, accumulator.num_sells)
+        self.assertEqual(Decimal("10"), accumulator.first_price)
+        self.assertEqual(Decimal("11"), accumulator.last_price)
+
+    def test_json_round_trip_keeps_aggregates(self):
+        trades = self.derivative_trades()
+        accumulator = PerformanceAccumulator(trading_pair)
+        for trade in trades[:4]:
+            accumulator.add_trade(trade)
+
+        restored = PerformanceAccumulator.from_json(accumulator.to_json())
+        for trade in trades[4:]:
+            accumulator.add_trade(trade)
+            restored.add_trade(trade)
+
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+        self.assertEqual(accumulator.derivative_pnl, restored.derivative_pnl)
+        self.assertEqual(self.batch_derivative_pnl(self.derivative_trades()), restored.derivative_pnl)
+
+    def test_contains_trades_added_up_to_last_timestamp(self):
+        accumulator = PerformanceAccumulator(trading_pair)
+        accumulator.add_trade(self.trade_fill("order1", "BUY", "10", "1", "NIL", 1))
+        accumulator.add_trade(self.trade_fill("order2", "BUY", "10", "1", "NIL", 2, exchange_trade_id="trade2"))
+
+        self.assertFalse(accumulator.are_derivatives)
+        self.assertTrue(accumulator.contains(self.trade_fill("order1", "BUY", "10", "1", "NIL", 1)))
+        self.assertTrue(accumulator.contains(self.trade_fill("order2", "BUY", "10", "1", "NIL", 2, "trade2")))
+        self.assertFalse(accumulator.contains(self.trade_fill("order3", "BUY", "10", "1", "NIL", 2, "trade3")))
+        self.assertFalse(accumulator.contains(self.trade_fill("order4", "BUY", "10", "1", "NIL", 3)))
+
+    def test_metrics_from_accumulator_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("15")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = self.derivative_trades()
+        accumulator = PerformanceAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        current_balances = {base: Decimal("100"), quote: Decimal("10000")}
+
+        from_trades = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create(trading_pair, trades, current_balances))
+        from_accumulator = asyncio.get_event_loop().run_until_complete(
+            PerformanceMetrics.create_from_accumulator(accumulator, current_balances))
+
+        self.assertEqual(from_trades, from_accumulator)
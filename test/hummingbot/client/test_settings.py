@@ -1,9 +1,13 @@
+import json
+import sys
 import unittest
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.gateway.clob_spot.data_sources.injective.injective_api_data_source import (
     InjectiveAPIDataSource,
@@ -149,3 +153,107 @@ class SettingsTest(unittest.TestCase):
 
         self.assertIsInstance(api_data_source, InjectiveAPIDataSource)
         self.assertEqual(expected_params_without_api_data_source, params)
+
+
+class AllConnectorSettingsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.manifest_path = join(self.tmp_dir.name, "connector_manifest.json")
+        manifest_path_patch = patch.object(
+            AllConnectorSettings, "connector_manifest_path", return_value=self.manifest_path
+        )
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        gateway_connections_patch = patch(
+            "hummingbot.client.settings.GatewayConnectionSetting.load", return_value=[]
+        )
+        gateway_connections_patch.start()
+        self.addCleanup(gateway_connections_patch.stop)
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = {}
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_create_connector_settings_writes_and_reuses_the_manifest(self):
+        scanned_settings = dict(AllConnectorSettings.create_connector_settings())
+
+        with open(self.manifest_path) as fd:
+            manifest = json.load(fd)
+        self.assertEqual(len(scanned_settings), len(manifest["connectors"]))
+        self.assertIn("binance", {entry["name"] for entry in manifest["connectors"]})
+
+        with patch.object(AllConnectorSettings, "_scan_connector_utils") as scan_mock:
+            loaded_settings = dict(AllConnectorSettings.create_connector_settings())
+
+        scan_mock.assert_not_called()
+        self.assertEqual(scanned_settings.keys(), loaded_settings.keys())
+        binance_us = loaded_settings["binance_us"]
+        self.assertEqual(scanned_settings["binance_us"].trade_fee_schema, binance_us.trade_fee_schema)
+        self.assertEqual("binance", binance_us.parent_name)
+        self.assertTrue(binance_us.is_sub_domain)
+
+    def test_connector_config_keys_loaded_on_first_use(self):
+        AllConnectorSettings.create_connector_settings()
+        utils_module_path = "hummingbot.connector.exchange.binance.binance_utils"
+        utils_module = sys.modules[utils_module_path]
+
+        with patch.dict(sys.modules):
+            del sys.modules[utils_module_path]
+            with patch.object(AllConnectorSettings, "_scan_connector_utils") as scan_mock:
+                settings = AllConnectorSettings.create_connector_settings()
+            scan_mock.assert_not_called()
+            self.assertNotIn(utils_module_path, sys.modules)
+
+            sys.modules[utils_module_path] = utils_module
+            self.assertIs(utils_module.KEYS, settings["binance"].config_keys)
+            self.assertIs(utils_module.OTHER_DOMAINS_KEYS["binance_us"], settings["binance_us"].config_keys)
+
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+        paper_trade_settings = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+        self.assertEqual("binance", paper_trade_settings.parent_name)
+        self.assertIs(utils_module.KEYS, paper_trade_settings.config_keys)
+
+    def test_manifest_regenerated_when_connector_utils_change(self):
+        AllConnectorSettings.create_connector_settings()
+        fingerprint = AllConnectorSettings._connector_utils_fingerprint(AllConnectorSettings._find_connector_utils())
+        fingerprint[0][2] += 1
+
+        with patch.object(AllConnectorSettings, "_connector_utils_fingerprint", return_value=fingerprint):
+            with patch.object(
+                AllConnectorSettings, "_scan_connector_utils", wraps=AllConnectorSettings._scan_connector_utils
+            ) as scan_mock:
+                AllConnectorSettings.create_connector_settings()
+
+        scan_mock.assert_called_once()
+        with open(self.manifest_path) as fd:
+            self.assertEqual(fingerprint, json.load(fd)["fingerprint"])
+
+    def test_skipped_connectors_scanned_again_until_they_can_be_imported(self):
+        connector_utils_entries = AllConnectorSettings._connector_utils_entries
+
+        def entries_without_binance(type_dir_name: str, connector_dir_name: str):
+            if connector_dir_name == "binance":
+                return None
+            return connector_utils_entries(type_dir_name, connector_dir_name)
+
+        with patch.object(AllConnectorSettings, "_connector_utils_entries", side_effect=entries_without_binance):
+            settings = dict(AllConnectorSettings.create_connector_settings())
+            self.assertNotIn("binance", settings)
+            with patch.object(AllConnectorSettings, "_scan_connector_utils") as scan_mock:
+                settings = dict(AllConnectorSettings.create_connector_settings())
+            scan_mock.assert_not_called()
+            self.assertNotIn("binance", settings)
+
+        with open(self.manifest_path) as fd:
+            self.assertIn(["exchange", "binance"], json.load(fd)["skipped"])
+
+        with patch.object(AllConnectorSettings, "_scan_connector_utils") as scan_mock:
+            settings = dict(AllConnectorSettings.create_connector_settings())
+
+        scan_mock.assert_not_called()
+        self.assertIn("binance", settings)
+        self.assertEqual("binance", settings["binance_us"].parent_name)
+        with open(self.manifest_path) as fd:
+            self.assertNotIn(["exchange", "binance"], json.load(fd)["skipped"])
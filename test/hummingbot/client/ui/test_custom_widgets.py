@@ -6,7 +6,7 @@ from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer, LogBuffer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +91,60 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+    def test_get_line_fragments_are_cached(self):
+        TEXT = "SOME RANDOM TEXT WITH &cSPECIAL_WORD"
+        get_line = self.lexer.lex_document(Document(text=f"{TEXT}\n{TEXT}"))
+
+        first_line_fragments = get_line(0)
+        first_line_fragments.append(("", "MODIFIED"))
+
+        self.assertNotIn(("", "MODIFIED"), get_line(0))
+        self.assertEqual(get_line(0), get_line(1))
+        self.assertEqual(1, self.lexer._cached_line_fragments.cache_info().misses)
+
+    def test_log_buffer_keeps_last_lines(self):
+        log_buffer = LogBuffer(max_line_count=3)
+        log_buffer.extend(["first", "second"])
+        log_buffer.extend(["", "fourth"])
+
+        self.assertEqual(["second", "", "fourth"], log_buffer.lines)
+        self.assertEqual("second\n\nfourth", log_buffer.text)
+
+        document = log_buffer.document()
+        self.assertEqual("second\n\nfourth", document.text)
+        self.assertEqual(len(document.text), document.cursor_position)
+        self.assertEqual(["second", "", "fourth"], document.lines)
+        self.assertEqual(2, document.cursor_position_row)
+
+    def test_text_area_log(self):
+        text_area = CustomTextArea(max_line_count=2)
+        text_area.log("first\nsecond")
+        text_area.log("third")
+
+        self.assertEqual("second\nthird", text_area.text)
+
+        text_area.log("fourth", silent=True)
+        self.assertEqual("second\nthird", text_area.text)
+
+        text_area.log("live update", save_log=False)
+        self.assertEqual("live update", text_area.text)
+        self.assertEqual(["third", "fourth"], text_area.log_lines.lines)
+
+    def test_text_area_log_refreshes_once_per_interval(self):
+        text_area = CustomTextArea(max_line_count=3, refresh_interval=0.01)
+        updates = []
+        text_area.buffer.on_text_changed += lambda _: updates.append(text_area.text)
+
+        for line in ["first", "second", "third", "fourth"]:
+            text_area.log(line)
+        self.assertEqual([], updates)
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual(["second\nthird\nfourth"], updates)
+
+        text_area.log("fifth")
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual(["second\nthird\nfourth", "third\nfourth\nfifth"], updates)
@@ -16,7 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -1157,6 +1157,120 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 price=Decimal("2"),
             ))
 
+    def _start_tracking_orders_for_status_update(self, orders_count: int) -> List[InFlightOrder]:
+        for i in range(orders_count):
+            self.exchange.start_tracking_order(
+                order_id=f"{self.client_order_id_prefix}{i}",
+                exchange_order_id=str(self.expected_exchange_order_id + i),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        return list(self.exchange.in_flight_orders.values())
+
+    def _open_order_update(self, order: InFlightOrder) -> OrderUpdate:
+        return OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=self.exchange.current_timestamp,
+            new_state=OrderState.OPEN,
+        )
+
+    def test_update_order_status_runs_requests_concurrently(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders_for_status_update(orders_count=2 * self.exchange.STATUS_UPDATE_MAX_CONCURRENCY)
+        running_requests = 0
+        max_running_requests = 0
+
+        async def request():
+            nonlocal running_requests, max_running_requests
+            running_requests += 1
+            max_running_requests = max(max_running_requests, running_requests)
+            await asyncio.sleep(0.01)
+            running_requests -= 1
+
+        async def all_trade_updates_for_order(order: InFlightOrder):
+            await request()
+            return []
+
+        async def request_order_status(tracked_order: InFlightOrder):
+            await request()
+            return self._open_order_update(tracked_order)
+
+        self.exchange._all_trade_updates_for_order = AsyncMock(side_effect=all_trade_updates_for_order)
+        self.exchange._request_order_status = AsyncMock(side_effect=request_order_status)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(len(orders), self.exchange._all_trade_updates_for_order.call_count)
+        self.assertEqual(len(orders), self.exchange._request_order_status.call_count)
+        self.assertEqual(self.exchange.STATUS_UPDATE_MAX_CONCURRENCY, self.exchange.status_update_concurrency)
+        self.assertEqual(self.exchange.status_update_concurrency, max_running_requests)
+
+        metrics = self.exchange.status_update_metrics[-1]
+        self.assertEqual(1640780000, metrics.timestamp)
+        self.assertEqual(len(orders), metrics.orders_count)
+        self.assertEqual(2 * len(orders), metrics.requests_count)
+        self.assertGreater(metrics.duration, 0)
+
+    def test_update_order_status_only_requests_orders_not_included_in_bulk_update(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders_for_status_update(orders_count=3)
+
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_bulk_order_status = AsyncMock(return_value=[self._open_order_update(orders[0])])
+        self.exchange._request_order_status = AsyncMock(
+            side_effect=lambda tracked_order: self._open_order_update(tracked_order))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.exchange._request_bulk_order_status.assert_awaited_once_with(orders=orders)
+        requested_order_ids = [call.kwargs["tracked_order"].client_order_id
+                               for call in self.exchange._request_order_status.call_args_list]
+        self.assertCountEqual([orders[1].client_order_id, orders[2].client_order_id], requested_order_ids)
+        # 3 trade updates requests, 1 bulk status request and 2 individual status requests
+        self.assertEqual(6, self.exchange.status_update_metrics[-1].requests_count)
+
+    def test_update_order_status_uses_bulk_trade_updates(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders_for_status_update(orders_count=3)
+
+        self.exchange._request_bulk_trade_updates = AsyncMock(return_value=[])
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_order_status = AsyncMock(
+            side_effect=lambda tracked_order: self._open_order_update(tracked_order))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.exchange._request_bulk_trade_updates.assert_awaited_once_with(orders=orders)
+        self.exchange._all_trade_updates_for_order.assert_not_called()
+        self.assertEqual(4, self.exchange.status_update_metrics[-1].requests_count)
+
+    def test_update_order_status_metrics_do_not_count_lost_orders_requests(self):
+        self.exchange._set_current_timestamp(1640780000)
+        orders = self._start_tracking_orders_for_status_update(orders_count=3)
+        lost_order = orders[0]
+        self.exchange._order_tracker._lost_orders[lost_order.client_order_id] = lost_order
+        del self.exchange._order_tracker._in_flight_orders[lost_order.client_order_id]
+
+        async def all_trade_updates_for_order(order: InFlightOrder):
+            await asyncio.sleep(0.01)
+            return []
+
+        self.exchange._all_trade_updates_for_order = AsyncMock(side_effect=all_trade_updates_for_order)
+        self.exchange._request_order_status = AsyncMock(
+            side_effect=lambda tracked_order: self._open_order_update(tracked_order))
+
+        self.async_run_with_timeout(asyncio.gather(self.exchange._update_order_status(),
+                                                   self.exchange._update_lost_orders_status()))
+
+        # The lost order is included in the fillable orders of the cycle, but not in its status requests
+        self.assertEqual(3 + 2, self.exchange.status_update_metrics[-1].requests_count)
+        self.assertEqual(3 + 1, self.exchange._all_trade_updates_for_order.call_count)
+
     def _validate_auth_credentials_taking_parameters_from_argument(self,
                                                                    request_call_tuple: RequestCall,
                                                                    params: Dict[str, Any]):
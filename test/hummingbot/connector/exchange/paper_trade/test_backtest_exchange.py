@@ -0,0 +1,157 @@
+import random
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.backtest_exchange import BacktestExchange
+from hummingbot.connector.exchange.paper_trade.backtest_order_book_data_source import BacktestOrderBookDataSource
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+
+
+class BacktestExchangeTests(TestCase):
+    # 2022-01-01 00:00:00 UTC
+    day_start = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.market_data_file = MarketDataFile("binance", self.trading_pair, self.temp_directory.name)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+        super().tearDown()
+
+    def _create_exchange(self, start_time: float, end_time: float) -> BacktestExchange:
+        data_source = BacktestOrderBookDataSource(trading_pairs=[self.trading_pair],
+                                                  connector_name="binance",
+                                                  start_time=start_time,
+                                                  end_time=end_time,
+                                                  market_data_path=self.temp_directory.name)
+        exchange = BacktestExchange(ClientConfigAdapter(ClientConfigMap()), data_source, exchange_name="binance")
+        exchange.set_balance("COINALPHA", Decimal("10"))
+        exchange.set_balance("HBOT", Decimal("1000"))
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, start_time, end_time)
+        self.clock.add_iterator(exchange)
+        return exchange
+
+    def _record(self, message_type: OrderBookMessageType, timestamp: float, content):
+        content["trading_pair"] = self.trading_pair
+        message = OrderBookMessage(message_type, content, timestamp)
+        self.market_data_file.append_message(message)
+        return message
+
+    def _record_snapshot(self, timestamp: float, update_id: int, bids, asks):
+        return self._record(OrderBookMessageType.SNAPSHOT, timestamp,
+                            {"update_id": update_id, "bids": bids, "asks": asks})
+
+    def _record_diff(self, timestamp: float, update_id: int, bids, asks):
+        return self._record(OrderBookMessageType.DIFF, timestamp, {"update_id": update_id, "bids": bids, "asks": asks})
+
+    def _record_trade(self, timestamp: float, trade_id: int, trade_type: TradeType, price: str, amount: str):
+        return self._record(OrderBookMessageType.TRADE, timestamp, {
+            "trade_id": trade_id, "trade_type": float(trade_type.value), "price": price, "amount": amount,
+        })
+
+    def test_order_book_at_start_time_and_after_each_tick(self):
+        self._record_snapshot(self.day_start + 5, 1, [["99", "1"], ["98", "2"]], [["101", "1"], ["102", "2"]])
+        self._record_diff(self.day_start + 8, 2, [["99", "0"]], [])
+        self._record_diff(self.day_start + 11.5, 3, [["99.5", "4"]], [["100.5", "1"]])
+        # Older than the snapshot recorded after it, it is not applied
+        self._record_snapshot(self.day_start + 12.2, 10, [["97", "1"]], [["103", "1"]])
+        self._record_diff(self.day_start + 12.5, 9, [["97.5", "1"]], [])
+        self._record_diff(self.day_start + 12.7, 11, [["96", "1"]], [["103", "0"], ["104", "2"]])
+        exchange = self._create_exchange(self.day_start + 10, self.day_start + 60)
+
+        self.clock.backtest_til(self.day_start + 10)
+        order_book: OrderBook = exchange.get_order_book(self.trading_pair)
+        self.assertEqual([98], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([101, 102], [row.price for row in order_book.ask_entries()])
+
+        self.clock.backtest_til(self.day_start + 12)
+        self.assertEqual([99.5, 98], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([100.5, 101, 102], [row.price for row in order_book.ask_entries()])
+
+        self.clock.backtest_til(self.day_start + 13)
+        self.assertEqual([97, 96], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([104], [row.price for row in order_book.ask_entries()])
+        self.assertEqual(10, order_book.snapshot_uid)
+        self.assertEqual(11, order_book.last_diff_uid)
+
+    def test_replayed_order_book_matches_the_recorded_messages(self):
+        rng = random.Random(42)
+        messages = [self._record_snapshot(self.day_start, 1, [["99", "1"]], [["101", "1"]])]
+        timestamp = self.day_start
+        for update_id in range(2, 500):
+            timestamp += rng.choice([0, 0.1, 0.5])
+            bids = [[str(rng.randint(90, 99)), str(rng.choice([0, 1, 2]))] for _ in range(rng.randint(0, 3))]
+            asks = [[str(rng.randint(101, 110)), str(rng.choice([0, 1, 2]))] for _ in range(rng.randint(0, 3))]
+            messages.append(self._record_diff(timestamp, update_id, bids, asks))
+        expected_order_book = OrderBook()
+        expected_order_book.apply_snapshot_message(messages[0])
+        for message in messages[1:]:
+            expected_order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+        exchange = self._create_exchange(self.day_start, timestamp + 1)
+        self.clock.backtest_til(timestamp + 1)
+
+        order_book = exchange.get_order_book(self.trading_pair)
+        self.assertEqual(list(expected_order_book.bid_entries()), list(order_book.bid_entries()))
+        self.assertEqual(list(expected_order_book.ask_entries()), list(order_book.ask_entries()))
+
+    def test_recorded_trades_fill_limit_orders(self):
+        self._record_snapshot(self.day_start + 5, 1, [["99", "1"]], [["101", "1"]])
+        # Recorded before the start time, they don't fill the orders
+        self._record_trade(self.day_start + 9, 1, TradeType.SELL, "97", "1")
+        self._record_trade(self.day_start + 15.5, 2, TradeType.SELL, "99.5", "1")
+        self._record_trade(self.day_start + 20.5, 3, TradeType.SELL, "98.5", "1")
+        self._record_trade(self.day_start + 21.5, 4, TradeType.BUY, "101.5", "1")
+        exchange = self._create_exchange(self.day_start + 10, self.day_start + 60)
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        self.clock.backtest_til(self.day_start + 10)
+        self.assertEqual(97, exchange.get_order_book(self.trading_pair).last_trade_price)
+        exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99"))
+        exchange.sell(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("101"))
+
+        self.clock.backtest_til(self.day_start + 20)
+        self.assertEqual(0, len(fill_logger.event_log))
+        self.assertEqual(99.5, exchange.get_order_book(self.trading_pair).last_trade_price)
+
+        self.clock.backtest_til(self.day_start + 21)
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(TradeType.BUY, fill_logger.event_log[0].trade_type)
+        self.assertEqual(Decimal("99"), fill_logger.event_log[0].price)
+        self.assertEqual(self.day_start + 21, fill_logger.event_log[0].timestamp)
+
+        self.clock.backtest_til(self.day_start + 22)
+        self.assertEqual(2, len(fill_logger.event_log))
+        self.assertEqual(TradeType.SELL, fill_logger.event_log[1].trade_type)
+        self.assertEqual(0, len(exchange.limit_orders))
+        # The fees are deducted from the returns of the orders
+        self.assertEqual(Decimal("10") + Decimal("0.999") - Decimal("1"), exchange.get_balance("COINALPHA"))
+        self.assertEqual(Decimal("1000") - Decimal("99") + Decimal("101") * Decimal("0.999"),
+                         exchange.get_balance("HBOT"))
+
+    def test_market_orders_are_executed_against_the_replayed_order_book(self):
+        self._record_snapshot(self.day_start + 5, 1, [["99", "1"]], [["101", "1"], ["102", "5"]])
+        exchange = self._create_exchange(self.day_start + 10, self.day_start + 60)
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+
+        self.clock.backtest_til(self.day_start + 10)
+        exchange.buy(self.trading_pair, Decimal("2"), OrderType.MARKET)
+        self.clock.backtest_til(self.day_start + 10 + exchange.TRADE_EXECUTION_DELAY)
+
+        self.assertEqual([101, 102], [float(event.price) for event in fill_logger.event_log])
+        self.assertEqual(Decimal("1000") - Decimal("203"), exchange.get_balance("HBOT"))
+        self.assertEqual(Decimal("10") + Decimal("2") * Decimal("0.999"), exchange.get_balance("COINALPHA"))
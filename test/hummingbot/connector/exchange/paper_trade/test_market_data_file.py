@@ -0,0 +1,113 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+
+
+class MarketDataFileTests(TestCase):
+    # 2022-01-01 00:00:00 UTC
+    day_start = 1640995200.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.market_data_file = MarketDataFile("binance", self.trading_pair, self.temp_directory.name)
+
+    def tearDown(self) -> None:
+        self.temp_directory.cleanup()
+        super().tearDown()
+
+    def _snapshot(self, timestamp: float, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": [["99", "1"], ["98", "2"]],
+            "asks": [["101", "3"]],
+        }, timestamp)
+
+    def _trade(self, timestamp: float, trade_id, price: str) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair,
+            "trade_type": float(TradeType.SELL.value),
+            "trade_id": trade_id,
+            "price": price,
+            "amount": "0.5",
+        }, timestamp)
+
+    def test_message_rows(self):
+        rows = MarketDataFile.message_rows(self._snapshot(self.day_start + 1, 10))
+        expected = np.array([
+            [self.day_start + 1, 1, TradeType.BUY.value, 99, 1, 10],
+            [self.day_start + 1, 1, TradeType.BUY.value, 98, 2, 10],
+            [self.day_start + 1, 1, TradeType.SELL.value, 101, 3, 10],
+        ])
+        np.testing.assert_array_equal(expected, rows)
+
+        diff = NumpyOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": self.trading_pair, "update_id": 11, "bids": [], "asks": [["102", "0"]],
+        }, self.day_start + 2)
+        np.testing.assert_array_equal(np.array([[self.day_start + 2, 2, TradeType.SELL.value, 102, 0, 11]]),
+                                      MarketDataFile.message_rows(diff))
+
+        rows = MarketDataFile.message_rows(self._trade(self.day_start + 3, 12345, "100.5"))
+        np.testing.assert_array_equal(np.array([[self.day_start + 3, 3, TradeType.SELL.value, 100.5, 0.5, 12345]]),
+                                      rows)
+        rows = MarketDataFile.message_rows(self._trade(self.day_start + 3, "abc-1", "100.5"))
+        self.assertTrue(np.isnan(rows[0, MarketDataFile.UPDATE_ID]))
+
+    def test_append_and_load_messages_of_several_days(self):
+        self.market_data_file.append_messages([
+            self._snapshot(self.day_start + 10, 1),
+            self._trade(self.day_start + 20, 1, "100"),
+            self._trade(self.day_start + 86400 + 5, 2, "101"),
+            # Recorded late by another process
+            self._trade(self.day_start + 15, 3, "102"),
+        ])
+
+        self.assertTrue(os.path.exists(os.path.join(self.market_data_file.directory, "2022-01-01.bin")))
+        self.assertTrue(os.path.exists(os.path.join(self.market_data_file.directory, "2022-01-02.bin")))
+
+        rows = self.market_data_file.load(self.day_start + 12, self.day_start + 86400 + 10)
+        self.assertEqual([self.day_start + 10] * 3 + [self.day_start + 15, self.day_start + 20, self.day_start + 86405],
+                         rows[:, MarketDataFile.TIMESTAMP].tolist())
+        self.assertEqual([102, 100, 101], rows[3:, MarketDataFile.PRICE].tolist())
+
+        rows = self.market_data_file.load(self.day_start + 86400, self.day_start + 86400 + 10)
+        self.assertEqual([101], rows[:, MarketDataFile.PRICE].tolist())
+
+        rows = self.market_data_file.load(self.day_start, self.day_start + 16)
+        self.assertEqual([self.day_start + 10] * 3 + [self.day_start + 15], rows[:, MarketDataFile.TIMESTAMP].tolist())
+
+    def test_append_rows_writes_the_rows_to_the_files_of_their_days(self):
+        messages = [self._trade(self.day_start + 20, 1, "100"),
+                    self._trade(self.day_start + 86400 + 5, 2, "101"),
+                    self._trade(self.day_start + 30, 3, "102")]
+
+        self.market_data_file.append_rows(np.concatenate([MarketDataFile.message_rows(m) for m in messages]))
+
+        rows = self.market_data_file.load(self.day_start, self.day_start + 60)
+        self.assertEqual([100, 102], rows[:, MarketDataFile.PRICE].tolist())
+        rows = self.market_data_file.load(self.day_start + 86400, self.day_start + 86400 + 60)
+        self.assertEqual([101], rows[:, MarketDataFile.PRICE].tolist())
+
+    def test_load_ignores_partial_rows(self):
+        self.market_data_file.append_message(self._trade(self.day_start + 20, 1, "100"))
+        with open(self.market_data_file.day_file_path(self.day_start), "ab") as file:
+            file.write(b"\x00" * 10)
+
+        rows = self.market_data_file.load(self.day_start, self.day_start + 60)
+        self.assertEqual(1, len(rows))
+
+        self.market_data_file.append_message(self._trade(self.day_start + 30, 2, "101"))
+        rows = self.market_data_file.load(self.day_start, self.day_start + 60)
+        self.assertEqual([100, 101], rows[:, MarketDataFile.PRICE].tolist())
+
+    def test_load_without_data(self):
+        rows = self.market_data_file.load(self.day_start, self.day_start + 60)
+        self.assertEqual((0, MarketDataFile.N_COLUMNS), rows.shape)
@@ -0,0 +1,114 @@
+import asyncio
+import tempfile
+import time
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from hummingbot.connector.exchange.paper_trade.market_data_file import MarketDataFile
+from hummingbot.connector.exchange.paper_trade.market_data_recorder import MarketDataRecorder
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class MarketDataRecorderTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_directory.cleanup)
+        data_source = MagicMock()
+        data_source.get_new_order_book = AsyncMock(side_effect=self._new_order_book)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair],
+                                        direct_dispatch=True)
+        self.tracker._sleep = AsyncMock()
+        self.connector = MagicMock()
+        self.connector.order_book_tracker = self.tracker
+        self.recorder = MarketDataRecorder({"binance_paper_trade": self.connector}, self.temp_directory.name)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _new_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        message = self._message(OrderBookMessageType.SNAPSHOT, bids=[(99.0, 1.0)], asks=[(101.0, 2.0)], update_id=10)
+        order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        return order_book
+
+    def _message(self, message_type: OrderBookMessageType, bids, asks, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=time.time())
+
+    def _recorded_rows(self) -> np.ndarray:
+        now = time.time()
+        return MarketDataFile("binance", self.trading_pair, self.temp_directory.name).load(now, now + 1)
+
+    def test_records_the_order_book_messages_applied_by_the_tracker(self):
+        self.recorder.FLUSH_INTERVAL = 0.01
+        self.recorder.start()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        self.tracker._message_dispatcher.put_nowait(
+            self._message(OrderBookMessageType.DIFF, bids=[(99.0, 3.0)], asks=[], update_id=11))
+        self.tracker.apply_pending_updates()
+
+        # The rows are buffered until the next flush
+        self.assertEqual(0, len(self._recorded_rows()))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        rows = self._recorded_rows()
+
+        snapshot_type, diff_type = OrderBookMessageType.SNAPSHOT.value, OrderBookMessageType.DIFF.value
+        self.assertEqual(
+            [[snapshot_type, TradeType.BUY.value, 99, 1, 10],
+             [snapshot_type, TradeType.SELL.value, 101, 2, 10],
+             [diff_type, TradeType.BUY.value, 99, 3, 11]],
+            rows[:, MarketDataFile.TYPE:].tolist())
+
+    def test_stop_writes_the_buffered_rows(self):
+        self.recorder.start()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        self.assertEqual(0, len(self._recorded_rows()))
+
+        self.recorder.stop()
+
+        self.assertEqual(2, len(self._recorded_rows()))
+        self.assertIsNone(self.recorder._flush_handle)
+
+    def test_stop_removes_the_tracker_listener(self):
+        self.recorder.start()
+        self.recorder.stop()
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertEqual(0, len(self._recorded_rows()))
+
+    def test_paper_trade_connector_not_recorded_with_its_exchange_connector(self):
+        exchange_tracker = MagicMock()
+        exchange_connector = MagicMock()
+        exchange_connector.order_book_tracker = exchange_tracker
+        recorder = MarketDataRecorder({"binance_paper_trade": self.connector, "binance": exchange_connector},
+                                      self.temp_directory.name)
+
+        recorder.start()
+
+        self.assertEqual(["binance"], list(recorder._listeners))
+        exchange_tracker.add_message_listener.assert_called_once()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        recorder.stop()
+        self.assertEqual(0, len(self._recorded_rows()))
+        exchange_tracker.remove_message_listener.assert_called_once()
+
+    def test_connectors_without_order_book_tracker_are_not_recorded(self):
+        recorder = MarketDataRecorder({"gateway": MagicMock(spec=[])}, self.temp_directory.name)
+
+        recorder.start()
+
+        self.assertEqual({}, recorder._listeners)
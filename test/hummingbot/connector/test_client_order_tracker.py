@@ -250,6 +250,48 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertTrue(fetched_order == order)
 
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        order.update_exchange_order_id("someExchangeOrderId")
+
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual(order, self.tracker.all_fillable_orders_by_exchange_order_id["someExchangeOrderId"])
+        self.assertEqual({"someExchangeOrderId": order}, dict(self.tracker.all_updatable_orders_by_exchange_order_id))
+
+    def test_orders_by_exchange_order_id_only_include_tracked_orders(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        # Cached orders can still be filled, but not updated
+        self.assertIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+        self.tracker._cached_orders.clear()
+
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
     def test_fetch_order_does_not_match_orders_with_undefined_exchange_id(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -821,6 +863,60 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.assertNotIn("OID3", self.tracker.all_orders)
         self.assertNotIn("OID4", self.tracker.all_orders)
 
+    def test_tracking_states_updates_only_include_changed_orders(self):
+        orders = [
+            InFlightOrder(
+                client_order_id=f"OID{i}",
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                amount=Decimal("1000.0"),
+                price=Decimal("1.0"),
+                creation_timestamp=1640001112.223,
+            )
+            for i in range(3)
+        ]
+        for order in orders:
+            self.tracker.start_tracking_order(order)
+
+        updated_states, removed_order_ids = self.tracker.tracking_states_updates()
+        self.assertEqual({order.client_order_id: order.to_json() for order in orders}, updated_states)
+        self.assertEqual([], removed_order_ids)
+
+        self.assertEqual(({}, []), self.tracker.tracking_states_updates())
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=orders[0].client_order_id,
+            exchange_order_id="EOID0",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        update_future = self.tracker.process_order_update(order_update)
+        self.async_run_with_timeout(update_future)
+        self.tracker.stop_tracking_order(orders[1].client_order_id)
+
+        updated_states, removed_order_ids = self.tracker.tracking_states_updates()
+        self.assertEqual({orders[0].client_order_id: orders[0].to_json()}, updated_states)
+        self.assertEqual([orders[1].client_order_id], removed_order_ids)
+
+        # Polling the order again without any change does not mark it as changed
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=orders[0].client_order_id,
+            exchange_order_id="EOID0",
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.OPEN,
+        )
+        update_future = self.tracker.process_order_update(order_update)
+        self.async_run_with_timeout(update_future)
+        self.assertEqual(({}, []), self.tracker.tracking_states_updates())
+
+        updated_states, removed_order_ids = self.tracker.tracking_states_updates(reset=True)
+        self.assertEqual({order.client_order_id: order.to_json() for order in (orders[0], orders[2])},
+                         updated_states)
+        self.assertEqual([], removed_order_ids)
+
     def test_update_to_close_order_is_not_processed_until_order_completelly_filled(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id="someClientOrderId",
@@ -1,5 +1,8 @@
+import csv
+import tempfile
 import time
 from decimal import Decimal
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -7,6 +10,7 @@ from sqlalchemy import create_engine
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceAccumulator
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
@@ -17,7 +21,10 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_update import MarketStateUpdate
 from hummingbot.model.order import Order
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
@@ -42,6 +49,7 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.restored_tracking_states = None
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
         pass
@@ -49,6 +57,15 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def restore_tracking_states(self, tracking_states):
+        self.restored_tracking_states = tracking_states
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +283,329 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_write_behind_mode_writes_all_events_when_stopped(self):
+        # The writer thread can not share an in-memory database, so this test uses a database file
+        with tempfile.TemporaryDirectory() as db_dir:
+            with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+                engine_mock.return_value = create_engine(f"sqlite:///{Path(db_dir) / 'test_DB.sqlite'}")
+                manager = SQLConnectionManager(
+                    ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+                )
+            self.tracking_states = {"OID1-1642010000000000": {"state": "OPEN"}}
+
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                flush_interval=60,
+                max_batch_size=10,
+            )
+            recorder.start()
+
+            create_event = BuyOrderCreatedEvent(
+                timestamp=1642010000,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id="OID1-1642010000000000",
+                creation_timestamp=1640001112.223,
+                exchange_order_id="EOID1",
+            )
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+
+            fill_event = OrderFilledEvent(
+                timestamp=1642020000,
+                order_id=create_event.order_id,
+                trading_pair=create_event.trading_pair,
+                trade_type=TradeType.BUY,
+                order_type=create_event.type,
+                price=Decimal(1010),
+                amount=create_event.amount,
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id="TradeId1"
+            )
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+            recorder.stop()
+
+            with manager.get_new_session() as session:
+                orders = session.query(Order).all()
+                order_status = orders[0].status
+                trade_fills = orders[0].trade_fills
+                market_states = session.query(MarketState).all()
+
+            self.assertEqual(1, len(orders))
+            self.assertEqual(2, len(order_status))
+            self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
+            self.assertEqual(MarketEvent.OrderFilled.name, order_status[1].status)
+            self.assertEqual(1, len(trade_fills))
+            self.assertEqual(1, len(market_states))
+            self.assertEqual(self.tracking_states, market_states[0].saved_state)
+
+            metrics = recorder.write_behind_metrics
+            # Order creation, order fill and a single market states snapshot in one batch
+            self.assertEqual(3, metrics.flushed_writes)
+            self.assertEqual(1, metrics.flushed_batches)
+            self.assertEqual(0, metrics.queue_size)
+            self.assertEqual(0, metrics.blocked_submissions)
+
+    def test_write_behind_mode_appends_one_csv_row_per_fill_when_a_batch_is_retried(self):
+        with tempfile.TemporaryDirectory() as db_dir:
+            with patch("hummingbot.model.sql_connection_manager.create_engine") as engine_mock:
+                engine_mock.return_value = create_engine(f"sqlite:///{Path(db_dir) / 'test_DB.sqlite'}")
+                manager = SQLConnectionManager(
+                    ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+                )
+            recorder = MarketsRecorder(
+                sql=manager,
+                markets=[self],
+                config_file_path="test_config.yml",
+                strategy_name=self.strategy_name,
+                flush_interval=60,
+                max_batch_size=10,
+            )
+
+            def failing_write(session):
+                raise ValueError("Invalid record")
+
+            with patch("hummingbot.connector.markets_recorder.data_path", return_value=db_dir):
+                recorder.start()
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                         self._order_filled_event("OID1", 1642020000))
+                # Fails the batch, so that the fills are retried one per transaction
+                recorder._write(failing_write)
+                recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                         self._order_filled_event("OID2", 1642020001))
+                recorder.stop()
+
+            with open(Path(db_dir) / "trades_test_config.csv", newline="") as csv_file:
+                rows = list(csv.DictReader(csv_file))
+            with manager.get_new_session() as session:
+                trade_fills = session.query(TradeFill).all()
+
+            self.assertEqual(["OID1", "OID2"], [row["order_id"] for row in rows])
+            self.assertEqual(2, len(trade_fills))
+            self.assertEqual(1, recorder.write_behind_metrics.failed_writes)
+
+    def test_synchronous_mode_has_no_write_behind_metrics(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        self.assertIsNone(recorder.write_behind_metrics)
+
+    def _order_created_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
+    def _order_filled_event(self, order_id: str, timestamp: float, trade_type: TradeType = TradeType.BUY,
+                            price: Decimal = Decimal(1000)) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=order_id,
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=price,
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id=f"T{order_id}",
+        )
+
+    def test_fills_since_start_are_aggregated_and_checkpointed(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            performance_start_timestamp=1642000000,
+        )
+
+        with patch.object(MarketsRecorder, "PERFORMANCE_CHECKPOINT_INTERVAL", 2):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, self._order_filled_event("OID0", 1641000000))
+            for i in range(1, 4):
+                recorder._did_fill_order(MarketEvent.OrderFilled.value,
+                                         self,
+                                         self._order_filled_event(f"OID{i}", 1642000000 + i, price=Decimal(1000 + i)))
+
+        accumulators = recorder.performance_accumulators(1642000000)
+        self.assertEqual([(self.display_name, self.trading_pair)], list(accumulators))
+        accumulator = accumulators[(self.display_name, self.trading_pair)]
+        self.assertEqual(3, accumulator.num_buys)
+        self.assertEqual(Decimal(1001), accumulator.first_price)
+        self.assertEqual(Decimal(1003), accumulator.last_price)
+
+        # The trades since a timestamp before the first trade are all the trades, other timestamps are not aggregated
+        all_trades_accumulator = recorder.performance_accumulators(1641000000)[(self.display_name, self.trading_pair)]
+        self.assertEqual(4, all_trades_accumulator.num_buys)
+        self.assertEqual(Decimal(1000), all_trades_accumulator.first_price)
+        self.assertIsNone(recorder.performance_accumulators(1641500000))
+
+        with self.manager.get_new_session() as session:
+            checkpoint = session.query(PerformanceCheckpoint).one()
+
+        # The trades of all the runs are checkpointed, with the first fill of the pair, then after the interval
+        self.assertEqual(PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP, checkpoint.start_timestamp)
+        self.assertEqual(3, checkpoint.state["num_buys"])
+
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            checkpoint = session.query(PerformanceCheckpoint).one()
+        self.assertEqual(all_trades_accumulator.to_json(), checkpoint.state)
+
+    def test_performance_restored_from_checkpoints_and_later_fills(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            performance_start_timestamp=1642000000,
+        )
+        with patch.object(MarketsRecorder, "PERFORMANCE_CHECKPOINT_INTERVAL", 2):
+            for i in range(1, 5):
+                recorder._did_fill_order(
+                    MarketEvent.OrderFilled.value,
+                    self,
+                    self._order_filled_event(f"OID{i}", 1642000000 + i // 2, TradeType.BUY if i % 2 else TradeType.SELL))
+        accumulator = recorder.performance_accumulators(1642000000)[(self.display_name, self.trading_pair)]
+
+        with self.manager.get_new_session() as session:
+            checkpoint = session.query(PerformanceCheckpoint).one()
+        self.assertEqual(3, checkpoint.state["num_buys"] + checkpoint.state["num_sells"])
+
+        restored_recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            performance_start_timestamp=1642000000,
+        )
+        restored = restored_recorder.performance_accumulators(1642000000)[(self.display_name, self.trading_pair)]
+
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+
+        recorder.stop()
+
+        with self.manager.get_new_session() as session:
+            checkpoint = session.query(PerformanceCheckpoint).one()
+        self.assertEqual(accumulator.to_json(), checkpoint.state)
+
+    def test_checkpoint_of_an_earlier_run_is_restored(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            performance_start_timestamp=1642000000,
+        )
+        for i in range(3):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                     self._order_filled_event(f"OID{i}", 1642000000 + i))
+        recorder.stop()
+        all_trades_accumulator = recorder.performance_accumulators(1642000000)[(self.display_name, self.trading_pair)]
+
+        # A checkpoint of the previous versions, started at the start timestamp of the run, is superseded
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(PerformanceCheckpoint(config_file_path=self.config_file_path,
+                                                  market=self.display_name,
+                                                  symbol=self.trading_pair,
+                                                  start_timestamp=1642000000 * 1e3,
+                                                  timestamp=1642000000 * 1e3,
+                                                  state=all_trades_accumulator.to_json()))
+
+        # The next run of the client starts later
+        with patch.object(PerformanceAccumulator, "add_trade", autospec=True,
+                          side_effect=PerformanceAccumulator.add_trade) as add_trade_mock:
+            restored_recorder = MarketsRecorder(
+                sql=self.manager,
+                markets=[self],
+                config_file_path=self.config_file_path,
+                strategy_name=self.strategy_name,
+                performance_start_timestamp=1643000000,
+            )
+        # The trades of the earlier run are not read again
+        add_trade_mock.assert_not_called()
+        self.assertEqual({}, restored_recorder.performance_accumulators(1643000000))
+        restored = restored_recorder.performance_accumulators(1641000000)[(self.display_name, self.trading_pair)]
+        self.assertEqual(all_trades_accumulator.to_json(), restored.to_json())
+
+        restored_recorder._did_fill_order(MarketEvent.OrderFilled.value, self,
+                                          self._order_filled_event("OID3", 1643000001))
+        restored_recorder.stop()
+
+        self.assertEqual(1, restored_recorder.performance_accumulators(1643000000)[
+            (self.display_name, self.trading_pair)].num_buys)
+        self.assertEqual(4, restored_recorder.performance_accumulators(1641000000)[
+            (self.display_name, self.trading_pair)].num_buys)
+        with self.manager.get_new_session() as session:
+            checkpoint = session.query(PerformanceCheckpoint).one()
+        self.assertEqual(PerformanceCheckpoint.ALL_TRADES_START_TIMESTAMP, checkpoint.start_timestamp)
+        self.assertEqual(4, checkpoint.state["num_buys"])
+
+    def test_market_states_changes_are_logged_and_restored(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        self.tracking_states = {"OID1": {"state": "OPEN"}}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._order_created_event("OID1"))
+        self.tracking_states = {"OID1": {"state": "OPEN"}, "OID2": {"state": "OPEN"}}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._order_created_event("OID2"))
+        self.tracking_states = {"OID2": {"state": "PARTIALLY_FILLED"}}
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self._order_created_event("OID3"))
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).one()
+            updates = session.query(MarketStateUpdate).order_by(MarketStateUpdate.id).all()
+
+        # The first save stores the complete tracking states, the next ones only the changes
+        self.assertEqual({"OID1": {"state": "OPEN"}}, market_states.saved_state)
+        self.assertEqual(2, len(updates))
+        self.assertEqual({"OID2": {"state": "OPEN"}}, updates[0].updated_states)
+        self.assertEqual([], updates[0].removed_order_ids)
+        self.assertEqual({"OID2": {"state": "PARTIALLY_FILLED"}}, updates[1].updated_states)
+        self.assertEqual(["OID1"], updates[1].removed_order_ids)
+
+        recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+    def test_market_state_updates_are_compacted(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        with patch.object(MarketsRecorder, "MARKET_STATE_UPDATES_COMPACTION_INTERVAL", 2):
+            for i in range(3):
+                self.tracking_states = {f"OID{j}": {"state": "OPEN"} for j in range(i + 1)}
+                recorder._did_create_order(
+                    MarketEvent.BuyOrderCreated.value, self, self._order_created_event(f"OID{i}"))
+
+        with self.manager.get_new_session() as session:
+            market_states = session.query(MarketState).one()
+            updates = session.query(MarketStateUpdate).all()
+
+        self.assertEqual(self.tracking_states, market_states.saved_state)
+        self.assertEqual(0, len(updates))
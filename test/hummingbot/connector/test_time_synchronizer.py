@@ -75,3 +75,57 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._blended_average")
+    def test_offset_is_recalculated_only_when_samples_change(self, blended_average_mock):
+        blended_average_mock.side_effect = [100, 200]
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(100)
+
+        self.assertEqual(100, time_provider.time_offset_ms)
+        self.assertEqual(100, time_provider.time_offset_ms)
+        self.assertEqual(1, blended_average_mock.call_count)
+
+        time_provider.add_time_offset_ms_sample(300)
+
+        self.assertEqual(200, time_provider.time_offset_ms)
+        self.assertEqual(2, blended_average_mock.call_count)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time")
+    def test_clear_samples(self, time_mock, seconds_counter_mock):
+        time_mock.return_value = 1640000000.0
+        seconds_counter_mock.return_value = 10
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(5000)
+
+        time_provider.clear_time_offset_ms_samples()
+
+        self.assertEqual((1640000000.0 - 10) * 1e3, time_provider.time_offset_ms)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_time_with_drift_correction_interpolates_offset(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer(drift_correction=True)
+        # The server clock runs 100 ppm (0.1 ms per second) faster than the local clock
+        for sample_time in [100, 200, 300, 400]:
+            time_provider.add_time_offset_ms_sample(1000 + 0.1 * sample_time, local_time=sample_time)
+
+        seconds_counter_mock.return_value = 1000
+        self.assertAlmostEqual(100, time_provider.drift_ppm)
+        self.assertAlmostEqual(1100, time_provider.time_offset_ms)
+        self.assertAlmostEqual(1000 + 1.1, time_provider.time())
+
+    def test_drift_correction_is_bounded(self):
+        time_provider = TimeSynchronizer(drift_correction=True)
+        time_provider.add_time_offset_ms_sample(0, local_time=0)
+        time_provider.add_time_offset_ms_sample(1000, local_time=1)
+
+        self.assertEqual(TimeSynchronizer.MAX_DRIFT_PPM, time_provider.drift_ppm)
+
+    def test_drift_is_zero_without_drift_correction(self):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(0, local_time=0)
+        time_provider.add_time_offset_ms_sample(1000, local_time=1)
+
+        self.assertEqual(0, time_provider.drift_ppm)
+        self.assertEqual(625, time_provider.time_offset_ms)
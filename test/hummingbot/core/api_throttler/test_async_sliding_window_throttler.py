@@ -0,0 +1,176 @@
+import asyncio
+import sys
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import (
+    AsyncSlidingWindowRequestContext,
+    AsyncSlidingWindowThrottler,
+    SlidingWindow,
+    to_microseconds,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class AsyncSlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits)
+
+    def test_sliding_window_flush_only_removes_elapsed_tasks(self):
+        window = SlidingWindow()
+        window.add(to_microseconds(1.0), 2)
+        window.add(to_microseconds(5.0), 3)
+        self.assertEqual(5, window.capacity_used)
+
+        window.flush(now_us=to_microseconds(6.0), window_us=to_microseconds(5.0))
+        self.assertEqual(2, len(window))
+        self.assertEqual(5, window.capacity_used)
+
+        window.flush(now_us=to_microseconds(6.1), window_us=to_microseconds(5.0))
+        self.assertEqual(1, len(window))
+        self.assertEqual(3, window.capacity_used)
+
+    def test_sliding_window_release_time(self):
+        window = SlidingWindow()
+        window.add(to_microseconds(1.0), 2)
+        window.add(to_microseconds(2.0), 3)
+
+        # Fitting a task of weight 1 in a limit of 5 requires releasing the first task only
+        self.assertEqual(to_microseconds(6.0) + 1, window.release_time_us(1, 5, to_microseconds(5.0)))
+        # Fitting a task of weight 4 requires releasing both tasks
+        self.assertEqual(to_microseconds(7.0) + 1, window.release_time_us(4, 5, to_microseconds(5.0)))
+        # A task heavier than the limit never fits
+        self.assertIsNone(window.release_time_us(6, 5, to_microseconds(5.0)))
+
+    def test_within_capacity_singular_non_weighted_task(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+
+        self.ev_loop.run_until_complete(context.acquire())
+
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].capacity_used)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        # Weighted Task 1 and Task 2 already executed, resulting in a used capacity of 6/10
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).acquire())
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].capacity_used)
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_returns_true_for_throttler_without_configured_limits(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(context.acquire(), 1.0)
+            )
+
+    @patch("hummingbot.core.api_throttler.async_sliding_window_throttler.asyncio.sleep")
+    @patch("hummingbot.core.api_throttler.async_sliding_window_throttler.AsyncSlidingWindowRequestContext._time")
+    def test_acquire_sleeps_until_capacity_is_released(self, time_mock, sleep_mock):
+        sleep_delays = []
+
+        async def sleep(delay):
+            sleep_delays.append(delay)
+            time_mock.return_value += delay
+
+        sleep_mock.side_effect = sleep
+        rate_limit = RateLimit(limit_id="limit", limit=2, time_interval=1)
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+
+        time_mock.return_value = 1640000000.0
+        self.ev_loop.run_until_complete(throttler.execute_task(limit_id="limit").acquire())
+        time_mock.return_value = 1640000000.5
+        self.ev_loop.run_until_complete(throttler.execute_task(limit_id="limit").acquire())
+        self.assertEqual([], sleep_delays)
+
+        time_mock.return_value = 1640000000.6
+        self.ev_loop.run_until_complete(throttler.execute_task(limit_id="limit").acquire())
+
+        # A single sleep until the first task leaves the window
+        self.assertEqual(1, len(sleep_delays))
+        self.assertAlmostEqual(0.4, sleep_delays[0], places=5)
+        self.assertEqual(2, throttler._windows["limit"].capacity_used)
+
+    @patch("hummingbot.core.api_throttler.async_sliding_window_throttler.AsyncSlidingWindowRequestContext._time")
+    def test_within_capacity_for_limits_with_milliseconds_interval(self, time_mock):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        windows = {}
+
+        context = AsyncSlidingWindowRequestContext(
+            windows=windows,
+            rate_limit=specific_limit,
+            related_limits=[(per_millisecond_limit, 1), (per_second_limit, 1)],
+            lock=asyncio.Lock(),
+            safety_margin_pct=0,
+        )
+
+        # Scenario where one specific task was executed at 0 milliseconds
+        time_mock.return_value = 1640000000.0000
+        self.ev_loop.run_until_complete(context.acquire())
+
+        time_mock.return_value = 1640000000.0100
+        self.assertTrue(context.within_capacity())
+
+        # Add one more occurrence of the same task at millisecond 100
+        time_mock.return_value = 1640000000.1000
+        self.ev_loop.run_until_complete(context.acquire())
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.1900
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2000
+        self.assertFalse(context.within_capacity())
+
+        time_mock.return_value = 1640000000.2100
+        self.assertTrue(context.within_capacity())
@@ -498,6 +498,60 @@ class InFlightOrderPyUnitTests(unittest.TestCase):
         self.assertEqual(Decimal("0"), order.executed_amount_quote)
         self.assertEqual(1, order.last_update_timestamp)
 
+    def test_state_version_changes_when_order_is_updated(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        initial_version = order.state_version
+
+        open_order_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        order.update_with_order_update(open_order_update)
+        open_version = order.state_version
+
+        self.assertGreater(open_version, initial_version)
+        self.assertEqual(open_version, order.state_version)
+
+        order.current_state = OrderState.PENDING_CANCEL
+
+        self.assertGreater(order.state_version, open_version)
+
+    def test_state_version_unchanged_by_order_update_without_changes(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id=self.client_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            exchange_order_id=self.exchange_order_id,
+            initial_state=OrderState.OPEN,
+        )
+        version = order.state_version
+
+        open_order_update: OrderUpdate = OrderUpdate(
+            client_order_id=self.client_order_id,
+            exchange_order_id=self.exchange_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.OPEN,
+        )
+
+        self.assertFalse(order.update_with_order_update(open_order_update))
+        self.assertEqual(version, order.state_version)
+
     def test_update_with_order_update_multiple_order_updates(self):
         order: InFlightOrder = InFlightOrder(
             client_order_id=self.client_order_id,
@@ -3,6 +3,7 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +51,124 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_volume_and_price_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 4)
+        self.assertEqual(2, result.result_price)
+        result = order_book.get_price_for_volume(True, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertEqual(4.5, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertEqual((3 * 3 + 1 * 2) / 4, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 14)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(14, result.result_volume)
+        result = order_book.get_price_for_quote_volume(False, 1000)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(14, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(9, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(14, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 2)
+        self.assertEqual(2, result.result_price)
+        self.assertEqual(5, result.result_volume)
+        result = order_book.get_volume_for_price(True, 3)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(True, 5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(14, result.result_volume)
+        result = order_book.get_quote_volume_for_price(False, 1)
+        self.assertEqual(1, result.result_price)
+        self.assertEqual(14, result.result_volume)
+
+    def test_volume_queries_reflect_applied_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 1], [3, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 1], [6, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(5, order_book.get_price_for_volume(True, 2).result_price)
+
+        order_book.apply_numpy_diffs(np.array([[3, 0, 2]], dtype=np.float64),
+                                     np.array([[4, 5, 2]], dtype=np.float64))
+
+        self.assertEqual(4, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(1, order_book.get_price_for_volume(False, 3).result_price)
+        self.assertEqual(5, order_book.get_volume_for_price(True, 4).result_volume)
+
+    def test_volume_queries_match_walking_the_book(self):
+        rng = np.random.default_rng(42)
+        prices = np.arange(1, 2001, dtype=np.float64)
+        amounts = rng.uniform(0.1, 10, size=prices.size)
+        bids_array = np.column_stack([prices, amounts, np.ones(prices.size)])
+        asks_array = np.column_stack([prices + 2000, amounts[::-1], np.ones(prices.size)])
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for is_buy in (True, False):
+            rows = list(order_book.ask_entries() if is_buy else order_book.bid_entries())
+            cumulative_volume = np.cumsum([row.amount for row in rows])
+            for volume in rng.uniform(0, cumulative_volume[-1], size=50):
+                expected_price = rows[int(np.searchsorted(cumulative_volume, volume))].price
+                self.assertEqual(expected_price, order_book.get_price_for_volume(is_buy, volume).result_price)
+            for row in rows[::100]:
+                expected_volume = sum(r.amount for r in rows if (r.price <= row.price if is_buy else r.price >= row.price))
+                self.assertAlmostEqual(expected_volume, order_book.get_volume_for_price(is_buy, row.price).result_volume)
+
+    def test_apply_numpy_messages(self):
+        def content(bids, asks, update_id):
+            return {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks}
+
+        snapshot = content(bids=[["99", "1"], ["98", "2"]], asks=[["101", "1"], ["102", "2"]], update_id=1)
+        diff = content(bids=[["99", "0"], ["97", "3"]], asks=[["101", "4"], ["100.5", "1"]], update_id=2)
+        books = []
+        for message_class in (OrderBookMessage, NumpyOrderBookMessage):
+            order_book = OrderBook()
+            order_book.apply_snapshot_message(message_class(OrderBookMessageType.SNAPSHOT, dict(snapshot), 1))
+            order_book.apply_diff_message(message_class(OrderBookMessageType.DIFF, dict(diff), 2))
+            books.append(order_book)
+
+        python_book, numpy_book = books
+        self.assertEqual([(98.0, 2.0), (97.0, 3.0)], [(row.price, row.amount) for row in numpy_book.bid_entries()])
+        self.assertEqual([(100.5, 1.0), (101.0, 4.0), (102.0, 2.0)],
+                         [(row.price, row.amount) for row in numpy_book.ask_entries()])
+        self.assertEqual(list(python_book.bid_entries()), list(numpy_book.bid_entries()))
+        self.assertEqual(list(python_book.ask_entries()), list(numpy_book.ask_entries()))
+        self.assertEqual(1, numpy_book.snapshot_uid)
+        self.assertEqual(2, numpy_book.last_diff_uid)
+
+    def test_apply_numpy_diffs_with_update_id(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_diffs(np.array([[1, 1, 3], [1, 2, 4]], dtype=np.float64),
+                                     np.array([[2, 1, 4]], dtype=np.float64),
+                                     update_id=7)
+
+        self.assertEqual(7, order_book.last_diff_uid)
+        # The rows are applied in order, so the last change of a price level prevails
+        self.assertEqual([(1.0, 2.0)], [(row.price, row.amount) for row in order_book.bid_entries()])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
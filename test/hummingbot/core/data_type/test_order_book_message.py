@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -119,6 +121,38 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_numpy_message_parses_levels_once(self):
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 5,
+                "asks": [["1.5", "2", "0", "3"], ["3.25", "4", "0", "1"]],
+                "bids": [["0.5", "6"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertEqual(np.float64, msg.asks_array.dtype)
+        self.assertEqual([[1.5, 2, 5], [3.25, 4, 5]], msg.asks_array.tolist())
+        self.assertEqual([[0.5, 6, 5]], msg.bids_array.tolist())
+
+        asks = msg.asks
+        self.assertEqual(2, len(asks))
+        self.assertTrue(isinstance(asks[0], OrderBookRow))
+        self.assertEqual(OrderBookRow(3.25, 4, 5), asks[1])
+        self.assertEqual([OrderBookRow(0.5, 6, 5)], msg.bids)
+
+    def test_numpy_message_with_empty_levels(self):
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"update_id": 5, "asks": [], "bids": []},
+            timestamp=time.time(),
+        )
+
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertEqual((0, 3), msg.bids_array.shape)
+        self.assertEqual([], msg.asks)
+
     def test_has_update_id(self):
         update_id = "someId"
 
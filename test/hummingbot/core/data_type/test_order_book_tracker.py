@@ -0,0 +1,226 @@
+import asyncio
+import unittest
+from typing import Awaitable, List, Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MagicMock()
+        self.data_source.get_new_order_book = AsyncMock(side_effect=self._new_order_book)
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=[self.trading_pair],
+                                        direct_dispatch=True)
+        self.tracker._sleep = AsyncMock()
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def _new_order_book(trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(*OrderBookTrackerTests._rows(bids=[(99.0, 1.0), (98.0, 1.0)],
+                                                               asks=[(101.0, 1.0), (102.0, 1.0)],
+                                                               update_id=10), 10)
+        return order_book
+
+    @staticmethod
+    def _rows(bids: List[Tuple[float, float]], asks: List[Tuple[float, float]], update_id: int):
+        message = OrderBookTrackerTests._message(OrderBookMessageType.SNAPSHOT, bids, asks, update_id)
+        return message.bids, message.asks
+
+    @classmethod
+    def _message(cls,
+                 message_type: OrderBookMessageType,
+                 bids: List[Tuple[float, float]],
+                 asks: List[Tuple[float, float]],
+                 update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id))
+
+    def _diff(self, bids: List[Tuple[float, float]], asks: List[Tuple[float, float]], update_id: int):
+        return self._message(OrderBookMessageType.DIFF, bids, asks, update_id)
+
+    @staticmethod
+    def _book_levels(order_book: OrderBook):
+        return ([(row.price, row.amount) for row in order_book.bid_entries()],
+                [(row.price, row.amount) for row in order_book.ask_entries()])
+
+    def test_direct_dispatch_coalesces_pending_diffs(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        order_book = self.tracker.order_books[self.trading_pair]
+        update_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.UpdateEvent, update_logger)
+
+        dispatcher = self.tracker._message_dispatcher
+        dispatcher.put_nowait(self._diff(bids=[(99.0, 2.0)], asks=[], update_id=11))
+        dispatcher.put_nowait(self._diff(bids=[(99.0, 3.0), (98.0, 0.0)], asks=[(100.5, 1.0)], update_id=12))
+        dispatcher.put_nowait(self._diff(bids=[], asks=[(100.5, 0.0)], update_id=13))
+
+        gauges = self.tracker.gauges[self.trading_pair]
+        self.assertEqual(3, gauges.queue_depth)
+        self.assertEqual(0, gauges.last_update_time)
+        # The diffs are not applied until the pending updates are processed
+        self.assertEqual(([(99.0, 1.0), (98.0, 1.0)], [(101.0, 1.0), (102.0, 1.0)]), self._book_levels(order_book))
+
+        self.tracker.apply_pending_updates()
+
+        self.assertEqual(([(99.0, 3.0)], [(101.0, 1.0), (102.0, 1.0)]), self._book_levels(order_book))
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual(1, self.tracker._apply_diffs_calls_count)
+        self.assertEqual(3, self.tracker._coalesced_diffs_count)
+        self.assertEqual(1, len(update_logger.event_log))
+        self.assertEqual(13, update_logger.event_log[0].update_id)
+
+        gauges = self.tracker.gauges[self.trading_pair]
+        self.assertEqual(0, gauges.queue_depth)
+        self.assertEqual(0, gauges.staleness)
+        self.assertGreater(gauges.last_update_time, 0)
+
+    def test_direct_dispatch_coalesces_pending_numpy_diffs(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        order_book = self.tracker.order_books[self.trading_pair]
+
+        def numpy_diff(bids: List[Tuple[str, str]], asks: List[Tuple[str, str]], update_id: int):
+            return NumpyOrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+                timestamp=float(update_id))
+
+        dispatcher = self.tracker._message_dispatcher
+        dispatcher.put_nowait(numpy_diff(bids=[("99", "2")], asks=[], update_id=11))
+        dispatcher.put_nowait(numpy_diff(bids=[("99", "3"), ("98", "0")], asks=[("100.5", "1")], update_id=12))
+        dispatcher.put_nowait(numpy_diff(bids=[], asks=[("100.5", "0")], update_id=13))
+
+        self.tracker.apply_pending_updates()
+
+        self.assertEqual(([(99.0, 3.0)], [(101.0, 1.0), (102.0, 1.0)]), self._book_levels(order_book))
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual(1, self.tracker._apply_diffs_calls_count)
+        self.assertEqual(3, self.tracker._coalesced_diffs_count)
+
+    def test_direct_dispatch_rejects_diffs_older_than_snapshot(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        order_book = self.tracker.order_books[self.trading_pair]
+
+        self.tracker._message_dispatcher.put_nowait(self._diff(bids=[(99.0, 5.0)], asks=[], update_id=9))
+
+        self.assertEqual(0, self.tracker.gauges[self.trading_pair].queue_depth)
+        self.tracker.apply_pending_updates()
+        self.assertEqual(([(99.0, 1.0), (98.0, 1.0)], [(101.0, 1.0), (102.0, 1.0)]), self._book_levels(order_book))
+
+    def test_direct_dispatch_applies_diffs_received_before_initialization(self):
+        self.tracker._message_dispatcher.put_nowait(self._diff(bids=[(97.0, 1.0)], asks=[], update_id=11))
+        self.assertEqual(1, len(self.tracker._saved_message_queues[self.trading_pair]))
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        self.assertEqual(1, self.tracker.gauges[self.trading_pair].queue_depth)
+        self.tracker.apply_pending_updates()
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([(99.0, 1.0), (98.0, 1.0), (97.0, 1.0)], self._book_levels(order_book)[0])
+
+    def test_direct_dispatch_applies_pending_snapshot_before_newer_diffs(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        order_book = self.tracker.order_books[self.trading_pair]
+        dispatcher = self.tracker._message_dispatcher
+
+        dispatcher.put_nowait(self._diff(bids=[(95.0, 1.0)], asks=[], update_id=11))
+        dispatcher.put_nowait(self._message(OrderBookMessageType.SNAPSHOT,
+                                            bids=[(90.0, 1.0)], asks=[(110.0, 1.0)], update_id=12))
+        dispatcher.put_nowait(self._diff(bids=[(91.0, 1.0)], asks=[], update_id=13))
+        self.assertEqual(3, self.tracker.gauges[self.trading_pair].queue_depth)
+
+        self.tracker.apply_pending_updates()
+
+        self.assertEqual(([(91.0, 1.0), (90.0, 1.0)], [(110.0, 1.0)]), self._book_levels(order_book))
+        self.assertEqual(12, order_book.snapshot_uid)
+        self.assertEqual(13, order_book.last_diff_uid)
+
+    def test_direct_dispatch_update_task_applies_pending_diffs(self):
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.tracker._apply_pending_updates_task = self.ev_loop.create_task(
+            self.tracker._apply_pending_updates_loop())
+
+        self.tracker._message_dispatcher.put_nowait(self._diff(bids=[(99.0, 4.0)], asks=[], update_id=11))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(11, order_book.last_diff_uid)
+        self.assertEqual(0, self.tracker.gauges[self.trading_pair].queue_depth)
+
+    def test_message_listeners_are_notified_of_the_applied_messages(self):
+        messages = []
+        self.tracker.add_message_listener(messages.append)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+        dispatcher = self.tracker._message_dispatcher
+        dispatcher.put_nowait(self._diff(bids=[(95.0, 1.0)], asks=[], update_id=11))
+        dispatcher.put_nowait(self._message(OrderBookMessageType.SNAPSHOT,
+                                            bids=[(90.0, 1.0)], asks=[(110.0, 1.0)], update_id=12))
+        dispatcher.put_nowait(self._diff(bids=[(91.0, 1.0)], asks=[], update_id=13))
+        self.tracker.apply_pending_updates()
+        trade = OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_type": float(TradeType.BUY.value), "trade_id": 1,
+            "price": "100", "amount": "1"}, timestamp=14.0)
+        self.tracker._order_book_trade_stream.put_nowait(trade)
+        trade_task = self.ev_loop.create_task(self.tracker._emit_trade_event_loop())
+        try:
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+        finally:
+            trade_task.cancel()
+
+        initial_snapshot = messages[0]
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, initial_snapshot.type)
+        self.assertEqual(10, initial_snapshot.update_id)
+        self.assertEqual([[99.0, 1.0], [98.0, 1.0]], initial_snapshot.content["bids"].tolist())
+        self.assertEqual([[101.0, 1.0], [102.0, 1.0]], initial_snapshot.content["asks"].tolist())
+        # The diff older than the snapshot is not applied
+        self.assertEqual([(OrderBookMessageType.SNAPSHOT, 12), (OrderBookMessageType.DIFF, 13)],
+                         [(message.type, message.update_id) for message in messages[1:3]])
+        self.assertEqual([trade], messages[3:])
+
+        self.tracker.remove_message_listener(messages.append)
+        dispatcher.put_nowait(self._diff(bids=[(92.0, 1.0)], asks=[], update_id=15))
+        self.tracker.apply_pending_updates()
+        self.assertEqual(4, len(messages))
+
+    def test_gauges_without_direct_dispatch(self):
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        tracker._sleep = AsyncMock()
+        self.async_run_with_timeout(tracker._init_order_books())
+        tracker._order_book_diff_stream.put_nowait(self._diff(bids=[(99.0, 4.0)], asks=[], update_id=11))
+        # Stop the book tracking task, to keep the message in the tracking queue
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+        router_task = self.ev_loop.create_task(tracker._order_book_diff_router())
+        try:
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+            gauges = tracker.gauges[self.trading_pair]
+            self.assertEqual(1, gauges.queue_depth)
+            self.assertGreater(gauges.staleness, 0)
+            self.assertEqual(0, gauges.last_update_time)
+        finally:
+            router_task.cancel()
+            tracker.stop()
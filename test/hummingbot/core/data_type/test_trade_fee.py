@@ -267,6 +267,24 @@ class TokenAmountTests(TestCase):
         self.assertEqual(amount, TokenAmount.from_json(amount.to_json()))
 
 
+class TradeFeeSchemaTests(TestCase):
+
+    def test_json_serialization_round_trip(self):
+        schema = TradeFeeSchema(
+            percent_fee_token="HBOT",
+            maker_percent_fee_decimal=Decimal("0.001"),
+            taker_percent_fee_decimal=Decimal("0.0025"),
+            buy_percent_fee_deducted_from_returns=False,
+            maker_fixed_fees=[TokenAmount(token="COINALPHA", amount=Decimal("20"))],
+            taker_fixed_fees=[TokenAmount(token="COINALPHA", amount=Decimal("20.5"))],
+        )
+
+        schema_json = schema.to_json()
+
+        self.assertEqual("0.0025", schema_json["taker_percent_fee_decimal"])
+        self.assertEqual(schema, TradeFeeSchema.from_json(schema_json))
+
+
 class TradeUpdateTests(TestCase):
 
     def test_json_serialization(self):
@@ -0,0 +1,84 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+from hummingbot.core.event.fill_ledger import FillLedger
+
+
+class FillLedgerTests(unittest.TestCase):
+
+    @staticmethod
+    def _fill(timestamp: float, trade_type: TradeType, price: str, amount: str, trading_pair: str = "COINALPHA-HBOT"):
+        return OrderFilledEvent(
+            timestamp=timestamp,
+            order_id=f"OID{timestamp}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(price),
+            amount=Decimal(amount),
+            trade_fee=AddedToCostTradeFee(),
+        )
+
+    @staticmethod
+    def _scan_balances(fills, starting_timestamp: float):
+        balances = {}
+        for fill in fills:
+            if fill.timestamp <= starting_timestamp:
+                continue
+            base, quote = fill.trading_pair.split("-")
+            sign = 1 if fill.trade_type is TradeType.BUY else -1
+            balances[base] = balances.get(base, Decimal("0")) + sign * fill.amount
+            balances[quote] = balances.get(quote, Decimal("0")) - sign * fill.amount * fill.price
+        return balances
+
+    def test_balances_since_timestamp(self):
+        ledger = FillLedger()
+        ledger.append(self._fill(1, TradeType.BUY, "100", "2"))
+        ledger.append(self._fill(2, TradeType.SELL, "110", "1"))
+        ledger.append(self._fill(3, TradeType.BUY, "5", "10", trading_pair="HBOT-USDT"))
+
+        self.assertEqual({"COINALPHA": Decimal("1"), "HBOT": Decimal("-80"), "USDT": Decimal("-50")},
+                         ledger.balances_since(0))
+        self.assertEqual({"COINALPHA": Decimal("-1"), "HBOT": Decimal("120"), "USDT": Decimal("-50")},
+                         ledger.balances_since(1))
+        self.assertEqual({"HBOT": Decimal("10"), "USDT": Decimal("-50")}, ledger.balances_since(2))
+        self.assertEqual({}, ledger.balances_since(3))
+
+    def test_fills_received_out_of_order(self):
+        fills = [self._fill(timestamp, TradeType.BUY if timestamp % 2 else TradeType.SELL, str(timestamp), "1")
+                 for timestamp in (1, 4, 2, 5, 3)]
+        ledger = FillLedger()
+        for fill in fills:
+            ledger.append(fill)
+
+        for starting_timestamp in range(6):
+            self.assertEqual(self._scan_balances(fills, starting_timestamp), ledger.balances_since(starting_timestamp))
+        self.assertEqual(fills, ledger.events)
+
+    def test_keeps_only_the_most_recent_events(self):
+        fills = [self._fill(timestamp, TradeType.BUY if timestamp % 3 else TradeType.SELL, "10", str(timestamp))
+                 for timestamp in range(1, 26)]
+        ledger = FillLedger(max_events=4)
+        for fill in fills:
+            ledger.append(fill)
+
+        self.assertEqual(fills[-4:], ledger.events)
+        self.assertEqual(21, ledger.evicted_count)
+        # The balance changes of the discarded fills are kept
+        self.assertEqual(self._scan_balances(fills, 0), ledger.balances_since(0))
+        for starting_timestamp in range(20, 26):
+            self.assertEqual(self._scan_balances(fills, starting_timestamp), ledger.balances_since(starting_timestamp))
+
+    def test_clear(self):
+        ledger = FillLedger(max_events=1)
+        ledger.append(self._fill(1, TradeType.BUY, "100", "2"))
+        ledger.append(self._fill(2, TradeType.BUY, "100", "2"))
+
+        ledger.clear()
+
+        self.assertEqual(0, len(ledger))
+        self.assertEqual(0, ledger.evicted_count)
+        self.assertEqual({}, ledger.balances_since(0))
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import ConversionGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -101,3 +101,29 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_find_rate_through_several_pairs(self):
+        prices = {"HBOT-ETH": Decimal("0.01"), "ETH-BTC": Decimal("0.05"), "BTC-USDT": Decimal("20000"),
+                  "USDT-GBP": Decimal("0.75"), "ZBOT-XBOT": Decimal("2")}
+
+        self.assertEqual(Decimal("7.5"), find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("1") / Decimal("7.5"), find_rate(prices, "GBP-HBOT"))
+        self.assertEqual(Decimal("0.0005"), find_rate(prices, "HBOT-BTC"))
+        self.assertIsNone(find_rate(prices, "HBOT-XBOT"))
+
+    def test_conversion_graph_prefers_bridge_tokens(self):
+        prices = {"HBOT-USDT": Decimal("10"), "HBOT-XBOT": Decimal("1"),
+                  "USDT-GBP": Decimal("0.75"), "XBOT-GBP": Decimal("100")}
+
+        self.assertEqual(Decimal("7.5"), ConversionGraph(prices, bridge_tokens=["USDT"]).rate("HBOT-GBP"))
+        self.assertEqual(Decimal("100"), ConversionGraph(prices, bridge_tokens=["XBOT"]).rate("HBOT-GBP"))
+
+    def test_pair_rate_uses_prices_added_after_refresh(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"HBOT-USDT": Decimal("10")}
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate("HBOT-USDT"))
+        self.assertIsNone(rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle._prices["USDT-GBP"] = Decimal("0.75")
+
+        self.assertEqual(Decimal("7.5"), rate_oracle.get_pair_rate("HBOT-GBP"))
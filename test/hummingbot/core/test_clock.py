@@ -7,9 +7,22 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
+class TickRecordingIterator(PyTimeIterator):
+
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def tick(self, timestamp: float):
+        self.ticks.append(timestamp)
+
+
 class ClockUnitTest(unittest.TestCase):
 
     backtest_start_timestamp: float = pd.Timestamp("2021-01-01", tz="UTC").timestamp()
@@ -124,3 +137,83 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def _run_with_triggers(self, clock: Clock, publisher: PubSub, trigger_delays, duration: float):
+        for delay in trigger_delays:
+            self.ev_loop.call_later(delay, publisher.trigger_event, OrderBookEvent.UpdateEvent, None)
+        with self.assertRaises(asyncio.TimeoutError), clock:
+            self.ev_loop.run_until_complete(asyncio.wait_for(clock.run(), duration))
+
+    def test_tick_trigger_ticks_iterator_before_tick_boundary(self):
+        # Long tick size to prevent the regular tick from happening during the test
+        clock = Clock(ClockMode.REALTIME, tick_size=3600, min_tick_interval=0.05)
+        triggered_iterator = TickRecordingIterator()
+        other_iterator = TickRecordingIterator()
+        publisher = PubSub()
+        clock.add_iterator(triggered_iterator)
+        clock.add_iterator(other_iterator)
+        clock.add_tick_trigger(triggered_iterator, publisher, OrderBookEvent.UpdateEvent)
+
+        self._run_with_triggers(clock, publisher, trigger_delays=[0.1], duration=0.3)
+
+        self.assertEqual(1, len(triggered_iterator.ticks))
+        self.assertEqual(0, len(other_iterator.ticks))
+        self.assertEqual(clock.current_timestamp, triggered_iterator.ticks[0])
+        self.assertEqual(1, clock.tick_latency_histograms["triggered"].count)
+        self.assertEqual(0, clock.tick_latency_histograms["scheduled"].count)
+
+    def test_tick_triggers_are_debounced(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=3600, min_tick_interval=0.2)
+        iterator = TickRecordingIterator()
+        publisher = PubSub()
+        clock.add_iterator(iterator)
+        clock.add_tick_trigger(iterator, publisher, OrderBookEvent.UpdateEvent)
+
+        self._run_with_triggers(clock, publisher, trigger_delays=[0.05, 0.1, 0.15], duration=0.5)
+
+        # The first request is processed immediately, the next ones are coalesced in a single tick
+        self.assertEqual(2, len(iterator.ticks))
+        self.assertGreaterEqual(iterator.ticks[1] - iterator.ticks[0], 0.2)
+
+    def test_remove_iterator_removes_tick_triggers(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=3600)
+        iterator = TickRecordingIterator()
+        publisher = PubSub()
+        clock.add_iterator(iterator)
+        clock.add_tick_trigger(iterator, publisher, OrderBookEvent.UpdateEvent)
+        self.assertEqual(1, len(publisher.get_listeners(OrderBookEvent.UpdateEvent)))
+
+        clock.remove_iterator(iterator)
+
+        self.assertEqual(0, len(publisher.get_listeners(OrderBookEvent.UpdateEvent)))
+
+    def test_tick_requests_ignored_in_backtest_mode(self):
+        iterator = TickRecordingIterator()
+        self.clock_backtest.add_iterator(iterator)
+        self.clock_backtest.request_tick(iterator)
+
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
+
+        self.assertEqual([self.backtest_start_timestamp + self.tick_size], iterator.ticks)
+
+    def test_profiling_records_iterator_ticks(self):
+        first_iterator = TickRecordingIterator()
+        second_iterator = TickRecordingIterator()
+        self.clock_backtest.add_iterator(first_iterator)
+        self.clock_backtest.add_iterator(second_iterator)
+        self.assertIsNone(self.clock_backtest.profiler)
+
+        profiler = self.clock_backtest.enable_profiling()
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 3 * self.tick_size)
+
+        self.assertEqual(self.tick_size, profiler.overrun_threshold)
+        self.assertEqual(3, profiler.ticks)
+        self.assertEqual([3, 3], [stats.ticks for stats in profiler.iterator_stats])
+        # There is no scheduled tick start time in backtest mode
+        self.assertEqual(0, profiler.tick_start_jitter.count)
+
+        self.clock_backtest.disable_profiling()
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + 4 * self.tick_size)
+
+        self.assertIsNone(self.clock_backtest.profiler)
+        self.assertEqual(3, profiler.ticks)
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.clock_profiler import ClockProfiler
+from hummingbot.core.time_iterator import TimeIterator
+
+
+class ClockProfilerUnitTest(unittest.TestCase):
+    level = 0
+
+    def setUp(self):
+        super().setUp()
+        self.profiler = ClockProfiler(overrun_threshold=0.5)
+        self.log_records = []
+        self.profiler.logger().setLevel(1)
+        self.profiler.logger().addHandler(self)
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    def test_record_iterator_ticks(self):
+        first_iterator = TimeIterator()
+        second_iterator = TimeIterator()
+
+        self.profiler.start_tick(1000)
+        self.profiler.record_iterator_tick(first_iterator, 0.01)
+        self.profiler.record_iterator_tick(second_iterator, 0.02)
+        self.profiler.end_tick()
+        self.profiler.start_tick(1001)
+        self.profiler.record_iterator_tick(first_iterator, 0.03)
+        self.profiler.end_tick()
+
+        self.assertEqual(2, self.profiler.ticks)
+        self.assertEqual(0, self.profiler.overruns)
+        first_stats, second_stats = self.profiler.iterator_stats
+        self.assertEqual("TimeIterator", first_stats.name)
+        self.assertEqual(2, first_stats.ticks)
+        self.assertAlmostEqual(0.02, first_stats.mean_time)
+        self.assertEqual(0.03, first_stats.max_time)
+        self.assertEqual(0.03, first_stats.last_time)
+        self.assertEqual(1, second_stats.ticks)
+
+    @patch("hummingbot.core.clock_profiler.time.time")
+    def test_tick_start_jitter(self, time_mock):
+        time_mock.return_value = 1000.25
+        self.profiler.start_tick(1000, scheduled_time=1000)
+        self.profiler.end_tick()
+        self.profiler.start_tick(1000.5)
+        self.profiler.end_tick()
+
+        self.assertEqual(1, self.profiler.tick_start_jitter.count)
+        self.assertEqual(0.25, self.profiler.tick_start_jitter.max)
+
+    @patch("hummingbot.core.clock_profiler.time.perf_counter")
+    def test_overruns_are_counted_and_logged(self, perf_counter_mock):
+        iterator = TimeIterator()
+        perf_counter_mock.side_effect = [10, 11]
+        self.profiler.start_tick(1000)
+        self.profiler.record_iterator_tick(iterator, 0.9)
+        self.profiler.end_tick()
+
+        self.assertEqual(1, self.profiler.overruns)
+        self.assertTrue(self._is_logged(
+            "WARNING",
+            "Clock tick at 1000 took 1000.0ms (threshold 500.0ms). Slowest iterators: TimeIterator: 900.0ms"))
+
+    def test_snapshot_and_reset(self):
+        self.profiler.start_tick(1000)
+        self.profiler.record_iterator_tick(TimeIterator(), 0.01)
+        self.profiler.end_tick()
+
+        snapshot = self.profiler.snapshot()
+        self.assertEqual(1, snapshot["ticks"])
+        self.assertEqual(0.5, snapshot["overrun_threshold"])
+        self.assertEqual(1, snapshot["tick_duration"]["count"])
+        self.assertEqual([{"name": "TimeIterator", "ticks": 1, "total_time": 0.01, "mean_time": 0.01,
+                           "max_time": 0.01, "last_time": 0.01}],
+                         snapshot["iterators"])
+
+        self.profiler.reset()
+
+        self.assertEqual(0, self.profiler.ticks)
+        self.assertEqual(0, len(self.profiler.iterator_stats))
@@ -0,0 +1,125 @@
+import csv
+import datetime
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.core.utils.append_only_csv_writer import AppendOnlyCSVWriter
+
+
+class AppendOnlyCSVWriterTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.dir_path = Path(self._temp_dir.name)
+        self.file_path = str(self.dir_path / "trades_test.csv")
+        self.header = ("id", "price", "age")
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def _read_rows(self, file_path: str):
+        with open(file_path, newline="") as csv_file:
+            return list(csv.reader(csv_file))
+
+    def _csv_files(self):
+        return sorted(os.listdir(self.dir_path))
+
+    def test_write_rows_with_single_header(self):
+        writer = AppendOnlyCSVWriter(file_path=self.file_path)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "00:00:01"))
+        writer.close()
+
+        writer = AppendOnlyCSVWriter(file_path=self.file_path)
+        writer.write_row(self.header, (3, "12", "n/a"))
+        writer.close()
+
+        self.assertEqual(
+            [list(self.header), ["1", "10.5", "n/a"], ["2", "11", "00:00:01"], ["3", "12", "n/a"]],
+            self._read_rows(self.file_path))
+
+    def test_rows_are_flushed_after_flush_interval(self):
+        writer = AppendOnlyCSVWriter(file_path=self.file_path, flush_interval=60)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "n/a"))
+
+        # The first write is flushed, the second one is buffered until the next flush
+        self.assertEqual(2, len(self._read_rows(self.file_path)))
+
+        writer.flush()
+        self.assertEqual(3, len(self._read_rows(self.file_path)))
+        writer.close()
+
+    def test_buffered_row_is_flushed_by_timer_when_idle(self):
+        writer = AppendOnlyCSVWriter(file_path=self.file_path, flush_interval=0.05)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "n/a"))
+        self.assertEqual(2, len(self._read_rows(self.file_path)))
+
+        # No other row is written, the buffered row is flushed after the flush interval
+        deadline = time.monotonic() + 5
+        while len(self._read_rows(self.file_path)) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(3, len(self._read_rows(self.file_path)))
+        writer.close()
+
+    def test_close_cancels_flush_timer(self):
+        writer = AppendOnlyCSVWriter(file_path=self.file_path, flush_interval=60)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "n/a"))
+        self.assertIsNotNone(writer._flush_timer)
+
+        writer.close()
+
+        self.assertIsNone(writer._flush_timer)
+        self.assertEqual(3, len(self._read_rows(self.file_path)))
+
+    def test_existing_file_with_different_header_is_moved_aside(self):
+        with open(self.file_path, "w") as csv_file:
+            csv_file.write("id,price\n1,10\n")
+
+        writer = AppendOnlyCSVWriter(file_path=self.file_path)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertTrue(files[1].startswith("trades_test_old_"))
+        self.assertEqual([["id", "price"], ["1", "10"]], self._read_rows(str(self.dir_path / files[1])))
+        self.assertEqual([list(self.header), ["1", "10.5", "n/a"]], self._read_rows(self.file_path))
+
+    def test_file_is_rotated_when_max_size_reached(self):
+        writer = AppendOnlyCSVWriter(file_path=self.file_path, flush_interval=0, max_file_size=30)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "n/a"))
+        self.assertEqual(1, len(self._csv_files()))
+
+        writer.write_row(self.header, (3, "12", "n/a"))
+        writer.close()
+
+        files = self._csv_files()
+        self.assertEqual(2, len(files))
+        self.assertEqual([list(self.header), ["1", "10.5", "n/a"], ["2", "11", "n/a"]],
+                         self._read_rows(str(self.dir_path / files[1])))
+        self.assertEqual([list(self.header), ["3", "12", "n/a"]], self._read_rows(self.file_path))
+
+    @patch("hummingbot.core.utils.append_only_csv_writer.AppendOnlyCSVWriter._current_date")
+    def test_file_is_rotated_daily(self, current_date_mock):
+        current_date_mock.return_value = datetime.date(2022, 1, 1)
+        writer = AppendOnlyCSVWriter(file_path=self.file_path, rotate_daily=True)
+        writer.write_row(self.header, (1, "10.5", "n/a"))
+        writer.write_row(self.header, (2, "11", "n/a"))
+        self.assertEqual(1, len(self._csv_files()))
+
+        current_date_mock.return_value = datetime.date(2022, 1, 2)
+        writer.write_row(self.header, (3, "12", "n/a"))
+        writer.close()
+
+        self.assertEqual(2, len(self._csv_files()))
+        self.assertEqual([list(self.header), ["3", "12", "n/a"]], self._read_rows(self.file_path))
@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTests(TestCase):
+
+    def test_record_latencies(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1))
+        for latency in (0.005, 0.05, 0.06, 0.5, 2):
+            histogram.record(latency)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(0.523, histogram.mean)
+        self.assertEqual(2, histogram.max)
+        self.assertEqual([(0.01, 1), (0.1, 2), (1, 1), (float("inf"), 1)], histogram.buckets)
+
+    def test_percentile(self):
+        histogram = LatencyHistogram(bucket_bounds=(0.01, 0.1, 1))
+        self.assertEqual(0, histogram.percentile(50))
+
+        for latency in [0.005] * 90 + [0.05] * 9 + [3]:
+            histogram.record(latency)
+
+        self.assertEqual(0.01, histogram.percentile(50))
+        self.assertEqual(0.01, histogram.percentile(90))
+        self.assertEqual(0.1, histogram.percentile(99))
+        self.assertEqual(3, histogram.percentile(100))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.5)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.max)
+        self.assertTrue(all(count == 0 for _, count in histogram.buckets))
@@ -1,7 +1,10 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
+from os.path import join
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -67,32 +70,172 @@ class TestTradingPairFetcher(unittest.TestCase):
         # Need to reset TradingPairFetcher module so next time it gets imported it works as expected
         TradingPairFetcher._sf_shared_instance = None
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = TemporaryDirectory()
+        self.cache_path = join(self.tmp_dir.name, "trading_pairs_cache.json")
+        cache_path_patch = patch.object(TradingPairFetcher, "trading_pairs_cache_path", return_value=self.cache_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
     def test_trading_pair_fetcher_returns_same_instance_when_get_new_instance_once_initialized(self):
         instance = TradingPairFetcher.get_instance()
         self.assertIs(instance, TradingPairFetcher.get_instance())
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
-    def test_fetched_connector_trading_pairs(self, _, mock_connector_settings):
+    def test_fetched_connector_trading_pairs(self, _, mock_connector_settings, configured_connectors_mock):
         connector = AsyncMock()
         connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
         mock_connector_settings.return_value = {
-            "mock_exchange_1": self.MockConnectorSetting(name="mockConnector", connector=connector),
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
             "mock_paper_trade": self.MockConnectorSetting(name="mock_paper_trade", parent_name="mock_exchange_1")
         }
+        configured_connectors_mock.return_value = {"mock_exchange_1", "mock_paper_trade"}
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         trading_pair_fetcher = TradingPairFetcher(client_config_map)
         self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
         trading_pairs = trading_pair_fetcher.trading_pairs
         self.assertEqual(2, len(trading_pairs))
-        self.assertEqual({"mockConnector": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
+        # The paper trade connector reuses the trading pairs of the connector it simulates
+        connector.all_trading_pairs.assert_called_once()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_only_configured_connectors_fetched_eagerly(self, _, mock_connector_settings, configured_connectors_mock):
+        configured_connector = AsyncMock()
+        configured_connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        other_connector = AsyncMock()
+        other_connector.all_trading_pairs.return_value = ["OTHER-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=configured_connector),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=other_connector),
+        }
+        configured_connectors_mock.return_value = {"mock_exchange_1"}
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({"mock_exchange_1": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        other_connector.all_trading_pairs.assert_not_called()
+
+        trading_pair_fetcher.fetch_trading_pairs("mock_exchange_2")
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(["OTHER-HBOT"], trading_pair_fetcher.trading_pairs["mock_exchange_2"])
+        with open(self.cache_path) as fd:
+            cache = json.load(fd)
+        self.assertEqual(["MOCK-HBOT"], cache["mock_exchange_1"]["trading_pairs"])
+        self.assertEqual(["OTHER-HBOT"], cache["mock_exchange_2"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_cached_trading_pairs_not_fetched_until_expired(self, _, mock_connector_settings, configured_connectors_mock):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["NEW-HBOT"]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+            "mock_exchange_2": self.MockConnectorSetting(name="mock_exchange_2", connector=connector),
+        }
+        configured_connectors_mock.return_value = {"mock_exchange_1", "mock_exchange_2"}
+        with open(self.cache_path, "w") as fd:
+            json.dump({
+                "mock_exchange_1": {"timestamp": time.time(), "trading_pairs": ["CACHED-HBOT"]},
+                "mock_exchange_2": {
+                    "timestamp": time.time() - TradingPairFetcher.CACHE_TTL - 1, "trading_pairs": ["EXPIRED-HBOT"]
+                },
+            }, fd)
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual(
+            {"mock_exchange_1": ["CACHED-HBOT"], "mock_exchange_2": ["NEW-HBOT"]}, trading_pair_fetcher.trading_pairs
+        )
+        connector.all_trading_pairs.assert_called_once()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_failed_fetch_not_retried_until_expired(self, _, mock_connector_settings, configured_connectors_mock):
+        connector = AsyncMock()
+        connector.all_trading_pairs.side_effect = [IOError("Unreachable"), IOError("Unreachable"), ["MOCK-HBOT"]]
+        mock_connector_settings.return_value = {
+            "mock_exchange_1": self.MockConnectorSetting(name="mock_exchange_1", connector=connector),
+        }
+        configured_connectors_mock.return_value = set()
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        with patch.object(TradingPairFetcher, "logger"):
+            trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+            self.async_run_with_timeout(asyncio.sleep(0.01))
+            self.assertEqual([], trading_pair_fetcher.trading_pairs["mock_exchange_1"])
+
+            # Every keystroke requests the trading pairs again, but the failed fetch is not retried
+            for _ in range(3):
+                trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+                self.async_run_with_timeout(asyncio.sleep(0.01))
+            self.assertEqual(1, connector.all_trading_pairs.call_count)
+
+            with patch.object(TradingPairFetcher, "FAILED_FETCH_TTL", 0):
+                trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+                self.async_run_with_timeout(asyncio.sleep(0.01))
+                trading_pair_fetcher.fetch_trading_pairs("mock_exchange_1")
+                self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(3, connector.all_trading_pairs.call_count)
+        self.assertEqual(["MOCK-HBOT"], trading_pair_fetcher.trading_pairs["mock_exchange_1"])
+        self.assertNotIn("mock_exchange_1", trading_pair_fetcher._failed_fetch_times)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    def test_concurrent_fetches_are_bounded(self, _, mock_connector_settings, configured_connectors_mock):
+        running_fetches = 0
+        max_running_fetches = 0
+
+        async def all_trading_pairs():
+            nonlocal running_fetches, max_running_fetches
+            running_fetches += 1
+            max_running_fetches = max(max_running_fetches, running_fetches)
+            await asyncio.sleep(0.001)
+            running_fetches -= 1
+            return ["MOCK-HBOT"]
+
+        connector = MagicMock()
+        connector.all_trading_pairs.side_effect = all_trading_pairs
+        connector_names = [f"mock_exchange_{i}" for i in range(TradingPairFetcher.MAX_CONCURRENT_FETCHES * 3)]
+        mock_connector_settings.return_value = {
+            name: self.MockConnectorSetting(name=name, connector=connector) for name in connector_names
+        }
+        configured_connectors_mock.return_value = set(connector_names)
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual(len(connector_names), len(trading_pair_fetcher.trading_pairs))
+        self.assertEqual(TradingPairFetcher.MAX_CONCURRENT_FETCHES, max_running_fetches)
 
     @aioresponses()
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._configured_connector_names")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
     @patch("hummingbot.client.settings.GatewayConnectionSetting.get_connector_spec_from_market_name")
-    def test_fetch_all(self, mock_api, con_spec_mock, perp_market_mock, all_connector_settings_mock, ):
+    def test_fetch_all(
+        self, mock_api, con_spec_mock, perp_market_mock, all_connector_settings_mock, configured_connectors_mock
+    ):
+        configured_connectors_mock.return_value = {"binance", "perp_ethereum_optimism"}
         all_connector_settings_mock.return_value = {
             "binance": ConnectorSetting(
                 name='binance',
@@ -1,14 +1,18 @@
 import asyncio
 import json
 import re
+import tempfile
 import unittest
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_indicators import EMAIndicator
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 
 
 class TestBinanceSpotCandles(unittest.TestCase):
@@ -178,6 +182,123 @@ class TestBinanceSpotCandles(unittest.TestCase):
     def test_candles_empty(self):
         self.assertTrue(self.data_feed.candles_df.empty)
 
+    def _candle(self, timestamp: int, close: float):
+        return [timestamp, close, close, close, close, 1, close, 1, 1, close]
+
+    def test_candles_df_is_an_independent_copy_of_the_candles(self):
+        self.data_feed._add_candle(self._candle(1672981200000, 10))
+        candles_df = self.data_feed.candles_df
+        candles_df["new_column"] = 1
+
+        self.data_feed._update_last_candle(self._candle(1672981200000, 11))
+        updated_df = self.data_feed.candles_df
+        self.assertEqual(list(self.data_feed.columns), list(updated_df.columns))
+        self.assertEqual([11], updated_df["close"].tolist())
+        self.assertEqual([10], candles_df["close"].tolist())
+
+        self.data_feed._add_candle(self._candle(1672984800000, 12))
+        self.assertEqual([11, 12], self.data_feed.candles_df["close"].tolist())
+        self.assertEqual([11], updated_df["close"].tolist())
+
+    def test_candles_df_can_be_modified(self):
+        self.data_feed._add_candle(self._candle(1672981200000, 10))
+        self.data_feed._add_candle(self._candle(1672984800000, 11))
+
+        candles_df = self.data_feed.candles_df
+        candles_df.loc[0, "close"] = 20
+        candles_df["close"] *= 2
+        candles_df["volume"] = candles_df["volume"] + 1
+
+        self.assertEqual([40, 22], candles_df["close"].tolist())
+        self.assertEqual([10, 11], self.data_feed.candles_df["close"].tolist())
+        self.assertEqual([1, 1], self.data_feed.candles_df["volume"].tolist())
+
+    def test_indicators_are_updated_with_candles(self):
+        self.data_feed._add_candle(self._candle(1672981200000, 10))
+        ema = self.data_feed.add_indicator(EMAIndicator(length=3))
+        self.assertEqual(10, ema.value)
+
+        self.data_feed._add_candle(self._candle(1672984800000, 12))
+        self.assertEqual(11, ema.value)
+        self.data_feed._update_last_candle(self._candle(1672984800000, 14))
+        self.assertEqual(12, ema.value)
+        self.assertEqual({"EMA_3": 12}, self.data_feed.indicators_values)
+
+        self.data_feed._add_historical_candles([self._candle(1672977600000, 6)])
+        self.assertEqual(11, ema.value)
+
+        self.async_run_with_timeout(self.data_feed._on_order_stream_interruption())
+        self.assertEqual(0, len(self.data_feed.candles_df))
+        self.data_feed.remove_indicator(ema)
+        self.assertEqual({}, self.data_feed.indicators_values)
+
+    def _create_data_feed_with_candles_store(self, max_records: int) -> BinanceSpotCandles:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        store_path_patch = patch.object(CandlesStore, "candles_store_path", return_value=temp_dir.name)
+        store_path_patch.start()
+        self.addCleanup(store_path_patch.stop)
+        return BinanceSpotCandles(trading_pair=self.trading_pair, interval=self.interval, max_records=max_records,
+                                  store_candles=True)
+
+    def test_closed_candles_are_stored(self):
+        data_feed = self._create_data_feed_with_candles_store(max_records=5)
+        data_feed._add_candle(self._candle(1672981200000, 10))
+        data_feed._update_last_candle(self._candle(1672981200000, 11))
+        self.assertEqual(0, len(data_feed._candles_store.load()))
+
+        data_feed._add_candle(self._candle(1672984800000, 12))
+
+        self.assertEqual([[1672981200000, 11]], data_feed._candles_store.load()[:, [0, 4]].tolist())
+
+    def test_fill_historical_candles_loads_stored_candles_and_fetches_missing_ones(self):
+        interval_ms = 3600 * 1000
+        data_feed = self._create_data_feed_with_candles_store(max_records=5)
+        data_feed._candles_store.append([self._candle(1672981200000 + i * interval_ms, i) for i in range(3)])
+        missing_candle = np.array([self._candle(1672981200000 + 3 * interval_ms, 3)], dtype=float)
+        data_feed.fetch_candles = AsyncMock(return_value=missing_candle)
+        data_feed._add_candle(self._candle(1672981200000 + 4 * interval_ms, 4))
+
+        self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+        data_feed.fetch_candles.assert_awaited_once_with(start_time=1672981200000 + 3 * interval_ms,
+                                                         end_time=1672981200000 + 4 * interval_ms - 1,
+                                                         limit=data_feed.candles_page_size)
+        self.assertTrue(data_feed.is_ready)
+        self.assertEqual([0, 1, 2, 3, 4], data_feed.candles_df["close"].tolist())
+        self.assertEqual([0, 1, 2, 3], data_feed._candles_store.load()[:, 4].tolist())
+
+    def test_fill_historical_candles_fetches_candles_missing_between_stored_ones(self):
+        interval_ms = 3600 * 1000
+        data_feed = self._create_data_feed_with_candles_store(max_records=6)
+        data_feed._candles_store.append([self._candle(1672981200000 + i * interval_ms, i) for i in (0, 1, 4)])
+        missing_candles = np.array([self._candle(1672981200000 + i * interval_ms, i) for i in (2, 3)], dtype=float)
+        data_feed.fetch_candles = AsyncMock(return_value=missing_candles)
+        data_feed._add_candle(self._candle(1672981200000 + 5 * interval_ms, 5))
+
+        self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+        data_feed.fetch_candles.assert_awaited_once_with(start_time=1672981200000 + 2 * interval_ms,
+                                                         end_time=1672981200000 + 4 * interval_ms - 1,
+                                                         limit=data_feed.candles_page_size)
+        self.assertTrue(data_feed.is_ready)
+        self.assertEqual([0, 1, 2, 3, 4, 5], data_feed.candles_df["close"].tolist())
+        self.assertEqual([0, 1, 2, 3, 4], data_feed._candles_store.load()[:, 4].tolist())
+
+    def test_fill_historical_candles_ignores_outdated_stored_candles(self):
+        interval_ms = 3600 * 1000
+        data_feed = self._create_data_feed_with_candles_store(max_records=3)
+        data_feed._candles_store.append([self._candle(1672981200000, 0)])
+        current_timestamp = 1672981200000 + 10 * interval_ms
+        data_feed.fetch_candles = AsyncMock(return_value=np.array(
+            [self._candle(current_timestamp + (i - 2) * interval_ms, i) for i in range(3)], dtype=float))
+        data_feed._add_candle(self._candle(current_timestamp, 2))
+
+        self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+        data_feed.fetch_candles.assert_awaited_once_with(end_time=current_timestamp, limit=3)
+        self.assertEqual([0, 1, 2], data_feed.candles_df["close"].tolist())
+
     @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_listen_for_subscriptions_subscribes_to_klines(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTests(unittest.TestCase):
+
+    def _candle(self, timestamp: float):
+        return [timestamp, timestamp + 0.5]
+
+    def test_append_drops_oldest_candles_when_full(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        for timestamp in range(10):
+            buffer.append(self._candle(timestamp))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([7, 8, 9], buffer.values[:, 0].tolist())
+        self.assertEqual(9.5, buffer[-1][1])
+
+    def test_values_is_read_only_view(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        buffer.append(self._candle(1))
+
+        values = buffer.values
+        with self.assertRaises(ValueError):
+            values[0, 0] = 10
+
+        # Updates of the last candle are visible through the view
+        buffer[-1] = self._candle(2)
+        self.assertEqual(2, values[0, 0])
+
+    def test_previous_views_are_not_overwritten_by_appends(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        for timestamp in range(3):
+            buffer.append(self._candle(timestamp))
+        values = buffer.values.copy()
+        view = buffer.values
+
+        for timestamp in range(3, 20):
+            buffer.append(self._candle(timestamp))
+
+        self.assertTrue(np.array_equal(values, view))
+        self.assertEqual([17, 18, 19], buffer.values[:, 0].tolist())
+
+    def test_prepend_candles(self):
+        buffer = CandlesBuffer(maxlen=5, n_columns=2)
+        buffer.append(self._candle(10))
+        version = buffer.view_version
+
+        buffer.prepend([self._candle(timestamp) for timestamp in range(2, 10)])
+
+        # Only the newest candles fitting in the buffer are kept
+        self.assertEqual([6, 7, 8, 9, 10], buffer.values[:, 0].tolist())
+        self.assertNotEqual(version, buffer.view_version)
+
+    def test_prepend_after_appends_moves_candles(self):
+        buffer = CandlesBuffer(maxlen=4, n_columns=2)
+        for timestamp in range(4, 10):
+            buffer.append(self._candle(timestamp))
+        buffer.pop()
+        buffer.pop()
+        buffer.pop()
+
+        buffer.prepend([self._candle(2), self._candle(3)])
+
+        self.assertEqual([2, 3, 6], buffer.values[:, 0].tolist())
+
+    def test_pop_and_clear(self):
+        buffer = CandlesBuffer(maxlen=3, n_columns=2)
+        buffer.append(self._candle(1))
+        buffer.append(self._candle(2))
+
+        self.assertEqual(self._candle(2), buffer.pop().tolist())
+        self.assertEqual(1, len(buffer))
+
+        buffer.clear()
+        self.assertEqual(0, len(buffer))
+        with self.assertRaises(IndexError):
+            buffer.pop()
+        with self.assertRaises(IndexError):
+            buffer[0] = self._candle(1)
@@ -0,0 +1,62 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_indicators import BollingerBandsIndicator, EMAIndicator, RSIIndicator
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        random_generator = np.random.default_rng(42)
+        cls.closes = pd.Series(100 + np.cumsum(random_generator.normal(size=200)))
+
+    def _feed(self, indicator):
+        # Each candle is updated before closing, as it happens with the websocket updates
+        for close in self.closes:
+            indicator.append(close + 1)
+            indicator.update_last(close)
+        return indicator
+
+    def test_ema(self):
+        indicator = self._feed(EMAIndicator(length=10))
+
+        expected = self.closes.ewm(span=10, adjust=False).mean()
+        self.assertAlmostEqual(expected.iloc[-1], indicator.value)
+        self.assertEqual(["EMA_10"], list(indicator.values.keys()))
+
+    def test_rsi(self):
+        indicator = RSIIndicator(length=14)
+        changes = self.closes.diff()
+        average_gains = changes.clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+        average_losses = (-changes).clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+        expected = 100 * average_gains / (average_gains + average_losses)
+
+        indicator.reset(self.closes.iloc[:14])
+        self.assertTrue(math.isnan(indicator.value))
+        indicator.append(self.closes.iloc[14])
+        self.assertAlmostEqual(expected.iloc[14], indicator.value)
+
+        indicator = self._feed(RSIIndicator(length=14))
+        self.assertAlmostEqual(expected.iloc[-1], indicator.value)
+
+    def test_bollinger_bands(self):
+        indicator = self._feed(BollingerBandsIndicator(length=20, std=2))
+
+        mean = self.closes.rolling(20).mean().iloc[-1]
+        deviation = self.closes.rolling(20).std(ddof=0).iloc[-1]
+        self.assertAlmostEqual(mean, indicator.middle)
+        self.assertAlmostEqual(mean - 2 * deviation, indicator.lower)
+        self.assertAlmostEqual(mean + 2 * deviation, indicator.upper)
+        self.assertAlmostEqual((self.closes.iloc[-1] - indicator.lower) / (4 * deviation), indicator.percent)
+        self.assertEqual(["BBL_20_2.0", "BBM_20_2.0", "BBU_20_2.0", "BBP_20_2.0"], list(indicator.values.keys()))
+
+    def test_bollinger_bands_not_available_before_length_candles(self):
+        indicator = BollingerBandsIndicator(length=20)
+        indicator.reset(self.closes.iloc[:19])
+
+        self.assertTrue(math.isnan(indicator.middle))
@@ -0,0 +1,106 @@
+import fcntl
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        store_path_patch = patch.object(CandlesStore, "candles_store_path", return_value=self.temp_dir.name)
+        store_path_patch.start()
+        self.addCleanup(store_path_patch.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        self.store = CandlesStore("binance", "BTC-USDT", interval_seconds=60, n_columns=3, max_records=4)
+
+    @staticmethod
+    def _candles(*timestamps: int, value: float = 1) -> np.ndarray:
+        return np.array([[timestamp, value, value] for timestamp in timestamps], dtype=float)
+
+    def test_load_empty_store(self):
+        self.assertEqual((0, 3), self.store.load().shape)
+
+    def test_append_and_load(self):
+        self.store.append(self._candles(1, 2))
+        self.store.append(self._candles(3)[0])
+
+        self.assertTrue(np.array_equal(self._candles(1, 2, 3), self.store.load()))
+        self.assertTrue(np.array_equal(self._candles(2, 3), self.store.load(max_records=2)))
+
+    def test_load_sorts_candles_and_keeps_last_stored_duplicate(self):
+        self.store.append(self._candles(3, 4))
+        self.store.append(self._candles(1, 2))
+        self.store.append(self._candles(4, value=2))
+
+        candles = self.store.load()
+
+        self.assertEqual([1, 2, 3, 4], candles[:, 0].tolist())
+        self.assertEqual([1, 1, 1, 2], candles[:, 1].tolist())
+
+    def test_partially_written_candle_is_ignored(self):
+        self.store.append(self._candles(1, 2))
+        with open(self.store.path, "ab") as store_file:
+            store_file.write(b"\x00" * 5)
+
+        self.assertEqual([1, 2], self.store.load()[:, 0].tolist())
+
+        self.store.append(self._candles(3))
+        self.assertEqual([1, 2, 3], self.store.load()[:, 0].tolist())
+
+    def test_store_is_compacted_when_it_doubles_the_retained_candles(self):
+        self.store.append(self._candles(1, 2, 3, 4, 5, 6, 7, 8))
+        self.assertEqual(8 * 3 * 8, os.path.getsize(self.store.path))
+
+        self.store.append(self._candles(9))
+
+        self.assertEqual(4 * 3 * 8, os.path.getsize(self.store.path))
+        self.assertEqual([6, 7, 8, 9], self.store.load()[:, 0].tolist())
+
+    def test_stores_are_keyed_by_connector_trading_pair_and_interval(self):
+        self.store.append(self._candles(1))
+        other_stores = [
+            CandlesStore("binance_perpetual", "BTC-USDT", interval_seconds=60, n_columns=3, max_records=4),
+            CandlesStore("binance", "ETH-USDT", interval_seconds=60, n_columns=3, max_records=4),
+            CandlesStore("binance", "BTC-USDT", interval_seconds=2592000, n_columns=3, max_records=4),
+        ]
+
+        for store in other_stores:
+            self.assertEqual(0, len(store.load()))
+        same_store = CandlesStore("binance", "BTC-USDT", interval_seconds=60, n_columns=3, max_records=4)
+        self.assertEqual([1], same_store.load()[:, 0].tolist())
+
+    def _assert_waits_for_lock(self, store_operation):
+        lock_fd = os.open(self.store.lock_path, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            operation_thread = threading.Thread(target=store_operation)
+            operation_thread.start()
+            operation_thread.join(timeout=0.2)
+            self.assertTrue(operation_thread.is_alive())
+        finally:
+            os.close(lock_fd)
+        operation_thread.join(timeout=5)
+        self.assertFalse(operation_thread.is_alive())
+
+    def test_append_waits_for_the_store_lock(self):
+        self.store.append(self._candles(1))
+
+        self._assert_waits_for_lock(lambda: self.store.append(self._candles(2)))
+
+        self.assertEqual([1, 2], self.store.load()[:, 0].tolist())
+
+    def test_compact_waits_for_the_store_lock(self):
+        self.store.append(self._candles(1, 2, 3, 4, 5, 6))
+
+        self._assert_waits_for_lock(self.store.compact)
+
+        self.assertEqual(4 * 3 * 8, os.path.getsize(self.store.path))
+        self.assertEqual([3, 4, 5, 6], self.store.load()[:, 0].tolist())
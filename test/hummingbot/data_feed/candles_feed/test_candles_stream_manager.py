@@ -0,0 +1,139 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable, List
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_stream_manager import CandlesStreamManager
+
+
+class CandlesStreamManagerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.manager = CandlesStreamManager(wss_url="wss://test.url/stream", max_streams_per_connection=2)
+        sleep_patch = patch.object(self.manager, "_sleep", new_callable=AsyncMock)
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+        self.listening_tasks = []
+
+    def tearDown(self) -> None:
+        for task in self.listening_tasks:
+            task.cancel()
+        for connection in list(self.manager.connections):
+            connection.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    def kline_message(symbol: str, interval: str, timestamp: int, close: str):
+        return {
+            "e": "kline",
+            "E": timestamp,
+            "s": symbol.upper(),
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol.upper(), "i": interval, "o": close, "c": close,
+                  "h": close, "l": close, "v": "1", "n": 1, "x": False, "q": close, "V": "1", "Q": close},
+        }
+
+    def combined_message(self, symbol: str, interval: str, timestamp: int, close: str):
+        return {"stream": f"{symbol}@kline_{interval}", "data": self.kline_message(symbol, interval, timestamp, close)}
+
+    async def _subscribe(self, *stream_names: str) -> List[asyncio.Queue]:
+        return [self.manager.subscribe(stream_name) for stream_name in stream_names]
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_are_multiplexed_over_connections(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+
+        self.async_run_with_timeout(self._subscribe("btcusdt@kline_1m", "btcusdt@kline_1h", "ethusdt@kline_1m"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(2, len(self.manager.connections))
+        self.assertEqual(2, ws_connect_mock.call_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertIn({"method": "SUBSCRIBE", "params": ["btcusdt@kline_1h", "btcusdt@kline_1m"], "id": 1},
+                      sent_messages)
+        self.assertIn({"method": "SUBSCRIBE", "params": ["ethusdt@kline_1m"], "id": 1}, sent_messages)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_messages_are_dispatched_to_the_stream_subscribers(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        first_queue, second_queue, other_queue = self.async_run_with_timeout(
+            self._subscribe("btcusdt@kline_1m", "btcusdt@kline_1m", "btcusdt@kline_1h"))
+        message = self.combined_message("btcusdt", "1m", 1672981200000, "10")
+
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value,
+                                                             json.dumps({"result": None, "id": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, json.dumps(message))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, len(self.manager.connections))
+        self.assertEqual(message["data"], first_queue.get_nowait())
+        self.assertEqual(message["data"], second_queue.get_nowait())
+        self.assertTrue(other_queue.empty())
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_unsubscribe_closes_empty_connections(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        first_queue, second_queue = self.async_run_with_timeout(
+            self._subscribe("btcusdt@kline_1m", "btcusdt@kline_1h"))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.manager.unsubscribe("btcusdt@kline_1m", first_queue)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual({"method": "UNSUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 2}, sent_messages[-1])
+        self.assertEqual(1, len(self.manager.connections))
+
+        self.manager.unsubscribe("btcusdt@kline_1h", second_queue)
+        self.assertEqual(0, len(self.manager.connections))
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_candles_feeds_share_the_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        feeds = []
+        with patch.object(CandlesStreamManager, "get_instance", return_value=self.manager):
+            for trading_pair, interval in [("BTC-USDT", "1m"), ("ETH-USDT", "1m")]:
+                feeds.append(BinanceSpotCandles(trading_pair, interval, shared_stream=True))
+        for feed in feeds:
+            self.listening_tasks.append(self.ev_loop.create_task(feed.listen_for_shared_stream()))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, json.dumps(self.combined_message("btcusdt", "1m", 1672981200000, "10")))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, json.dumps(self.combined_message("ethusdt", "1m", 1672981200000, "20")))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, json.dumps(self.combined_message("btcusdt", "1m", 1672981260000, "11")))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual([10, 11], feeds[0].candles_df["close"].tolist())
+        self.assertEqual([20], feeds[1].candles_df["close"].tolist())
+
+        for task in self.listening_tasks:
+            task.cancel()
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        self.assertEqual(0, len(self.manager.connections))
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_connection_interruption_is_notified_to_subscribers(self, ws_connect_mock):
+        ws_connect_mock.side_effect = [ConnectionError("test error"), asyncio.Event().wait()]
+        queue, = self.async_run_with_timeout(self._subscribe("btcusdt@kline_1m"))
+
+        self.assertIsNone(self.async_run_with_timeout(queue.get()))
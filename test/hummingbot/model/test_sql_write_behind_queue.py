@@ -0,0 +1,97 @@
+import threading
+from typing import List
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.sql_manager = MagicMock()
+        self.written: List[int] = []
+
+    def _write(self, value: int):
+        def write(session):
+            self.written.append(value)
+        return write
+
+    def test_stop_writes_all_submitted_writes_in_order(self):
+        write_queue = SQLWriteBehindQueue(sql=self.sql_manager, flush_interval=60, max_batch_size=4)
+        write_queue.start()
+
+        for i in range(10):
+            write_queue.submit(self._write(i))
+        write_queue.stop()
+
+        self.assertFalse(write_queue.is_running)
+        self.assertEqual(list(range(10)), self.written)
+        metrics = write_queue.metrics
+        self.assertEqual(10, metrics.flushed_writes)
+        # Batches of 4, 4 and 2 writes
+        self.assertEqual(3, metrics.flushed_batches)
+        self.assertEqual(3, self.sql_manager.get_new_session.call_count)
+
+    def test_failed_batch_is_retried_one_write_per_transaction(self):
+        write_queue = SQLWriteBehindQueue(sql=self.sql_manager, flush_interval=60, max_batch_size=10)
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        write_queue.start()
+        write_queue.submit(self._write(1))
+        write_queue.submit(failing_write)
+        write_queue.submit(self._write(2))
+        write_queue.stop()
+
+        self.assertEqual([1, 1, 2], self.written)
+        self.assertEqual(2, write_queue.metrics.flushed_writes)
+        self.assertEqual(1, write_queue.metrics.failed_writes)
+
+    def test_commit_callbacks_called_once_for_committed_writes(self):
+        write_queue = SQLWriteBehindQueue(sql=self.sql_manager, flush_interval=60, max_batch_size=10)
+        committed: List[int] = []
+
+        def failing_write(session):
+            raise ValueError("Invalid record")
+
+        write_queue.start()
+        write_queue.submit(self._write(1), on_commit=lambda: committed.append(1))
+        write_queue.submit(failing_write, on_commit=lambda: committed.append(0))
+        write_queue.submit(self._write(2), on_commit=lambda: committed.append(2))
+        write_queue.stop()
+
+        # The first write ran twice (in the failed batch, then retried), but it was committed only once
+        self.assertEqual([1, 1, 2], self.written)
+        self.assertEqual([1, 2], committed)
+
+    def test_submit_blocks_when_the_queue_is_full(self):
+        write_queue = SQLWriteBehindQueue(sql=self.sql_manager, flush_interval=60, max_batch_size=1, max_queue_size=1)
+        write_started = threading.Event()
+        release_write = threading.Event()
+
+        def slow_write(session):
+            write_started.set()
+            release_write.wait()
+
+        write_queue.start()
+        write_queue.submit(slow_write)
+        write_started.wait()
+        write_queue.submit(self._write(1))
+
+        blocked_submit = threading.Thread(target=write_queue.submit, args=(self._write(2),))
+        blocked_submit.start()
+        blocked_submit.join(timeout=0.1)
+        self.assertTrue(blocked_submit.is_alive())
+
+        release_write.set()
+        blocked_submit.join()
+        write_queue.stop()
+
+        self.assertEqual([1, 2], self.written)
+        metrics = write_queue.metrics
+        self.assertEqual(1, metrics.blocked_submissions)
+        self.assertGreater(metrics.blocked_time, 0)
+        self.assertEqual(3, metrics.flushed_writes)
@@ -1049,3 +1049,68 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.006"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    def test_concurrent_pair_processing_places_orders(self):
+        self.clock.remove_iterator(self.strategy)
+        config_map_raw = deepcopy(self.config_map_raw)
+        config_map_raw.concurrent_pair_processing = True
+        self.strategy: CrossExchangeMarketMakingStrategy = CrossExchangeMarketMakingStrategy()
+        self.strategy.init_params(
+            config_map=ClientConfigAdapter(config_map_raw),
+            market_pairs=[self.market_pair],
+            logging_options=self.logging_options,
+        )
+        self.clock.add_iterator(self.strategy)
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+
+        self.assertEqual(1, len(self.strategy.active_maker_bids))
+        self.assertEqual(1, len(self.strategy.active_maker_asks))
+        status, quote_age = self.strategy.market_pair_processing_status(self.market_pair)
+        self.assertIsNotNone(quote_age)
+        self.assertIn("last run took", status)
+        self.assertIn("Processing: quotes updated", self.strategy.format_status())
+
+    def test_concurrent_pair_processing_isolates_slow_pairs(self):
+        config_map_raw = deepcopy(self.config_map_raw)
+        config_map_raw.concurrent_pair_processing = True
+        config_map_raw.pair_processing_timeout = 0.2
+        slow_pair = self.market_pair
+        fast_pair = MakerTakerMarketPair(
+            MarketTradingPairTuple(self.maker_market, "COINBETA-WETH", "COINBETA", "WETH"),
+            MarketTradingPairTuple(self.taker_market, *self.trading_pairs_taker),
+        )
+        strategy: CrossExchangeMarketMakingStrategy = CrossExchangeMarketMakingStrategy()
+        strategy.init_params(
+            config_map=ClientConfigAdapter(config_map_raw),
+            market_pairs=[slow_pair, fast_pair],
+            logging_options=self.logging_options,
+        )
+        processed_pairs = []
+
+        async def process_market_pair(timestamp, market_pair, active_orders):
+            processed_pairs.append(market_pair)
+            if market_pair is slow_pair:
+                await asyncio.sleep(10)
+            elif len(processed_pairs) > 3:
+                raise Exception("Fast pair failure")
+
+        strategy.process_market_pair = process_market_pair
+
+        for i in range(3):
+            self.async_run_with_timeout(strategy.main(self.start_timestamp + i))
+            self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        # The slow pair is not processed again while its processing is running
+        self.assertEqual([slow_pair, fast_pair, fast_pair, fast_pair], processed_pairs)
+        self.assertEqual(self.start_timestamp + 1, strategy._market_pair_processed_timestamps[fast_pair])
+        self.assertNotIn(slow_pair, strategy._market_pair_processed_timestamps)
+        self.assertIn("running", strategy.market_pair_processing_status(slow_pair)[0])
+
+        self.async_run_with_timeout(asyncio.sleep(0.2))
+
+        status, quote_age = strategy.market_pair_processing_status(slow_pair)
+        self.assertIsNone(quote_age)
+        self.assertEqual("not completed yet, last run took", status[:32])
+        self.assertGreaterEqual(strategy._market_pair_processing_latencies[slow_pair], 0.2)
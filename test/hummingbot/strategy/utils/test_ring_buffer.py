@@ -107,3 +107,44 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_statistics_of_large_buffer(self):
+        length = 40000
+        buffer = RingBuffer(length)
+        values = np.random.default_rng(12345).normal(1e6, 3, length * 2 + 100)
+
+        for value in values:
+            buffer.add_value(value)
+
+        window = values[-length:]
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), window))
+        self.assertEqual(window[0], buffer.get_first_value())
+        self.assertAlmostEqual(np.sum(window) / length, buffer.mean_value, 6)
+        self.assertAlmostEqual(np.var(window), buffer.variance, 6)
+        self.assertAlmostEqual(np.std(window), buffer.std_dev, 6)
+
+    def test_statistics_with_non_finite_values(self):
+        buffer = RingBuffer(3)
+        for value in [1, np.nan, 2]:
+            buffer.add_value(value)
+
+        self.assertTrue(np.isnan(buffer.mean_value))
+        self.assertTrue(np.isnan(buffer.variance))
+
+        buffer.add_value(3)
+        buffer.add_value(4)
+
+        self.assertEqual(9, buffer.sum_value)
+        self.assertEqual(3, buffer.mean_value)
+        self.assertAlmostEqual(2 / 3, buffer.variance)
+
+    def test_current_statistics_when_not_full(self):
+        self.assertTrue(np.isnan(self.buffer.current_mean))
+        for value in [1, 2, 6]:
+            self.buffer.add_value(value)
+
+        self.assertEqual(3, len(self.buffer))
+        self.assertEqual(9, self.buffer.sum_value)
+        self.assertEqual(3, self.buffer.current_mean)
+        self.assertAlmostEqual(np.var([1, 2, 6]), self.buffer.current_variance)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
@@ -0,0 +1,43 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+    BUFFER_LENGTH = 20
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_calculate_exponential_moving_average(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 5)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+
+        for i, sample in enumerate(samples):
+            indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - self.BUFFER_LENGTH):i + 1]
+            expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+    def test_calculate_after_sampling_length_change(self):
+        samples = np.random.normal(100, 10, self.BUFFER_LENGTH * 2)
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        indicator.sampling_length = self.BUFFER_LENGTH // 2
+        indicator.add_sample(100)
+
+        window = np.append(samples, 100)[-(self.BUFFER_LENGTH // 2):]
+        expected = pd.Series(window).ewm(span=self.BUFFER_LENGTH // 2, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.current_value, 8)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, processing_length=2)
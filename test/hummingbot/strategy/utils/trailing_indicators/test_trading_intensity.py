@@ -9,7 +9,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
-from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.common import PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
@@ -259,3 +259,52 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def register_exact_trades(self, indicator, timestamp, mid_price, a, b):
+        for price_level in [1, 2, 3, 4]:
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=mid_price + price_level,
+                amount=a * np.exp(-b * price_level),
+                type=TradeType.BUY,
+            ))
+
+    def test_removed_samples_not_included_in_estimation(self):
+        mid_price = float(self.price_delegate.get_price_by_type(PriceType.MidPrice))
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+
+        indicator.calculate(timestamp)
+        indicator.register_trade(OrderBookTradeEvent(
+            trading_pair="COINALPHAHBOT", timestamp=timestamp + 0.5, price=mid_price + 9, amount=5, type=TradeType.SELL
+        ))
+        indicator.calculate(timestamp + 1)
+        self.register_exact_trades(indicator, timestamp + 1.5, mid_price, 2, 0.1)
+        indicator.calculate(timestamp + 2)
+
+        self.assertTrue(indicator.is_sampling_buffer_full)
+        self.assertEqual([{"timestamp": timestamp + 2, "price": mid_price}, {"timestamp": timestamp + 1, "price": mid_price}],
+                         indicator.last_quotes)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(2, alpha, 6)
+        self.assertAlmostEqual(0.1, kappa, 6)
+
+    def test_estimation_rate_limited_by_fit_interval(self):
+        mid_price = float(self.price_delegate.get_price_by_type(PriceType.MidPrice))
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_interval=10)
+
+        indicator.calculate(timestamp)
+        self.register_exact_trades(indicator, timestamp + 0.5, mid_price, 2, 0.1)
+        indicator.calculate(timestamp + 1)
+        self.assertAlmostEqual(2, indicator.current_value[0], 10)
+
+        self.register_exact_trades(indicator, timestamp + 1.5, mid_price, 3, 0.2)
+        indicator.calculate(timestamp + 2)
+        self.assertAlmostEqual(2, indicator.current_value[0], 10)
+
+        indicator.calculate(timestamp + 11)
+        alpha, kappa = indicator.current_value
+        self.assertAlmostEqual(3, alpha, 10)
+        self.assertAlmostEqual(0.2, kappa, 10)